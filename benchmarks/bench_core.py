@@ -0,0 +1,340 @@
+"""
+Benchmarks das Funções do Core.
+
+Mede tempo (mínimo e mediana de várias repetições) e pico de memória
+alocada (tracemalloc) das funções de cinemática, torque, F_VS, ângulos de
+contato e espaçamento, em malhas de vários tamanhos e em varreduras de
+várias geometrias. Os resultados são gravados em JSON para comparar
+versões.
+
+Dimensões:
+    pontos     : tamanho da malha de θ (361, 10⁴, 10⁶, 10⁷)
+    geometrias : número de geometrias (r, L) avaliadas de uma vez
+                 (1, 100, 10 000), em uma malha de 361 pontos
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/bench_core.py --saida output/bench/atual.json
+    python benchmarks/bench_core.py --rapido --casos jerk torque
+    python benchmarks/bench_core.py --comparar output/bench/base.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from core import cinematica as cin
+from core import espacamento as esp
+from core import forcas_torque as ft
+from core.grade import AreaTrabalho, ThetaGrid
+from core.parametros import ParametrosMecanismo
+
+
+TAMANHOS = (361, 10_000, 1_000_000, 10_000_000)
+GEOMETRIAS = (1, 100, 10_000)
+TAMANHOS_RAPIDO = (361, 10_000)
+GEOMETRIAS_RAPIDO = (1, 100)
+
+P = ParametrosMecanismo()
+
+
+# ========================================================================
+# CASOS
+# ========================================================================
+# Cada caso recebe o tamanho e devolve a função (sem argumentos) a medir;
+# a preparação dos dados fica fora da medição.
+
+def _theta(n):
+    return np.linspace(0.0, 2 * np.pi, n)
+
+
+def _geometrias(g):
+    """Colunas (g, 1) de r e L variando ±10% em torno do padrão (mm)."""
+    rng = np.random.default_rng(0)
+    r = P.r_mm * rng.uniform(0.9, 1.1, (g, 1))
+    L = P.L_mm * rng.uniform(0.9, 1.1, (g, 1))
+    return r, L
+
+
+def caso_espaco(n):
+    theta = _theta(n)
+    return lambda: cin.espaco(theta, P.r_mm, P.L_mm, P.h_mm)
+
+
+def caso_velocidade(n):
+    theta = _theta(n)
+    return lambda: cin.velocidade(theta, 20.0, P.r_mm, P.L_mm)
+
+
+def caso_aceleracao(n):
+    theta = _theta(n)
+    return lambda: cin.aceleracao(theta, 20.0, P.r_mm, P.L_mm, 0.0)
+
+
+def caso_jerk(n):
+    theta = _theta(n)
+    return lambda: cin.jerk(theta, 20.0, 0.0, P.r_mm, P.L_mm, 0.0)
+
+
+def caso_F_VS(n):
+    theta_deg = np.linspace(0.0, 360.0, n)
+    return lambda: ft.construir_F_VS_variavel(theta_deg, *P.geometria_mm)
+
+
+def caso_torque(n):
+    theta_deg = np.linspace(0.0, 360.0, n)
+    F_VS, _, _, info = ft.construir_F_VS_variavel(theta_deg, *P.geometria_mm)
+    theta = np.deg2rad(theta_deg)
+    faixa = (info['theta_inicio'], info['theta_fim'])
+    return lambda: ft.torque(theta, P.r_m, P.L_m, P.h_m, P.m_haste_kg, P.m_biela_kg,
+                             P.P_haste, P.P_biela, F_VS, 20.0, faixa)
+
+
+def caso_torque_trabalho(n):
+    """Torque em regime de laço: ThetaGrid, saída e AreaTrabalho reaproveitadas."""
+    theta_deg = np.linspace(0.0, 360.0, n)
+    F_VS, _, _, info = ft.construir_F_VS_variavel(theta_deg, *P.geometria_mm)
+    grade, ws, tau = ThetaGrid.de_graus(theta_deg), AreaTrabalho(), np.empty(n)
+    faixa = (info['theta_inicio'], info['theta_fim'])
+    return lambda: ft.torque(grade, P.r_m, P.L_m, P.h_m, P.m_haste_kg, P.m_biela_kg,
+                             P.P_haste, P.P_biela, F_VS, 20.0, faixa, out=tau, trabalho=ws)
+
+
+def caso_espacamento(n):
+    # n = número de sementes no trecho (soja: ~13 sementes/m)
+    N = 13.0
+    return lambda: esp.calcular_espacamento(N, n / N)
+
+
+def caso_cinematica_geometrias(g):
+    """Velocidade, aceleração e jerk de g geometrias por broadcasting (g x 361)."""
+    theta = _theta(361)
+    r, L = _geometrias(g)
+
+    def rodar():
+        cin.velocidade(theta, 20.0, r, L)
+        cin.aceleracao(theta, 20.0, r, L, 0.0)
+        cin.jerk(theta, 20.0, 0.0, r, L, 0.0)
+    return rodar
+
+
+def caso_torque_geometrias(g):
+    """Torque de g geometrias por broadcasting (g x 361), F_VS fixo."""
+    theta_deg = np.linspace(0.0, 360.0, 361)
+    F_VS, _, _, info = ft.construir_F_VS_variavel(theta_deg, *P.geometria_mm)
+    theta = np.deg2rad(theta_deg)
+    r, L = _geometrias(g)
+    r, L = r / 1000, L / 1000
+    return lambda: ft.torque(theta, r, L, P.h_m, P.m_haste_kg, P.m_biela_kg,
+                             P.P_haste, P.P_biela, F_VS, 20.0)
+
+
+def caso_bases_grade_geometrias(g):
+    """Bases de cinemática e torque de g geometrias, uma a uma, na mesma ThetaGrid."""
+    grade = ThetaGrid.de_graus(np.linspace(0.0, 360.0, 361))
+    r, L = _geometrias(g)
+    pares = list(zip(r.ravel().tolist(), L.ravel().tolist()))
+
+    def rodar():
+        for ri, Li in pares:
+            cin.bases_cinematica(grade, ri, Li)
+            ft.bases_torque(grade, ri / 1000, Li / 1000, P.h_m)
+    return rodar
+
+
+def caso_theta_solo_geometrias(g):
+    """Ângulos de contato de g geometrias (um fsolve por geometria)."""
+    r, L = _geometrias(g)
+    pares = list(zip(r.ravel().tolist(), L.ravel().tolist()))
+    return lambda: [cin.encontrar_theta_solo(ri, Li, P.h_mm, P.altura_centro_mm) for ri, Li in pares]
+
+
+CASOS = {
+    'espaco': ('pontos', caso_espaco),
+    'velocidade': ('pontos', caso_velocidade),
+    'aceleracao': ('pontos', caso_aceleracao),
+    'jerk': ('pontos', caso_jerk),
+    'F_VS': ('pontos', caso_F_VS),
+    'torque': ('pontos', caso_torque),
+    'torque_trabalho': ('pontos', caso_torque_trabalho),
+    'espacamento': ('pontos', caso_espacamento),
+    'cinematica_geometrias': ('geometrias', caso_cinematica_geometrias),
+    'torque_geometrias': ('geometrias', caso_torque_geometrias),
+    'bases_grade_geometrias': ('geometrias', caso_bases_grade_geometrias),
+    'theta_solo_geometrias': ('geometrias', caso_theta_solo_geometrias),
+}
+
+
+# ========================================================================
+# MEDIÇÃO
+# ========================================================================
+
+def medir(funcao, repeticoes: int = 5, tempo_min_s: float = 0.05) -> dict:
+    """
+    Mede uma função sem argumentos.
+
+    O número de chamadas por repetição é calibrado para que cada repetição
+    dure ao menos `tempo_min_s`; o tempo por chamada é a razão entre os dois.
+    O pico de memória vem de uma chamada extra, separada da medição de
+    tempo (tracemalloc deixa as alocações mais lentas).
+
+    Retorna:
+        dict com 'chamadas', 'repeticoes', 'min_s', 'mediana_s', 'pico_memoria_bytes'
+    """
+    funcao()  # aquecimento (imports tardios, caches de ufuncs)
+
+    chamadas = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(chamadas):
+            funcao()
+        dt = time.perf_counter() - t0
+        if dt >= tempo_min_s or chamadas >= 1_000_000:
+            break
+        chamadas *= max(2, int(tempo_min_s / max(dt, 1e-9)))
+
+    amostras = [dt / chamadas]
+    for _ in range(repeticoes - 1):
+        t0 = time.perf_counter()
+        for _ in range(chamadas):
+            funcao()
+        amostras.append((time.perf_counter() - t0) / chamadas)
+
+    tracemalloc.start()
+    try:
+        funcao()
+        pico = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'chamadas': chamadas,
+        'repeticoes': repeticoes,
+        'min_s': min(amostras),
+        'mediana_s': statistics.median(amostras),
+        'pico_memoria_bytes': pico,
+    }
+
+
+def _commit_git() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=RAIZ,
+                              capture_output=True, text=True, timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ''
+
+
+def executar(casos, tamanhos, geometrias, repeticoes=5, tempo_min_s=0.05,
+             progresso=sys.stderr) -> dict:
+    """
+    Executa os casos pedidos em todas as dimensões.
+
+    Retorna:
+        dict com 'meta' (ambiente) e 'resultados' (um por caso e tamanho)
+    """
+    resultados = []
+    for nome in casos:
+        dimensao, construir = CASOS[nome]
+        for tamanho in (tamanhos if dimensao == 'pontos' else geometrias):
+            funcao = construir(tamanho)
+            medida = medir(funcao, repeticoes, tempo_min_s)
+            del funcao
+            elementos = tamanho if dimensao == 'pontos' else tamanho * 361
+            resultados.append({
+                'caso': nome,
+                'dimensao': dimensao,
+                'tamanho': tamanho,
+                **medida,
+                'ns_por_elemento': medida['min_s'] / elementos * 1e9,
+            })
+            if progresso:
+                print(f"{nome:<24} {dimensao:<10} {tamanho:>10}  "
+                      f"{medida['min_s'] * 1e3:>10.3f} ms  "
+                      f"{medida['pico_memoria_bytes'] / 2**20:>8.1f} MiB", file=progresso)
+
+    return {
+        'meta': {
+            'data': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'commit': _commit_git(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'plataforma': platform.platform(),
+            'processador': platform.processor() or platform.machine(),
+            'cpus': os.cpu_count(),
+        },
+        'resultados': resultados,
+    }
+
+
+def comparar(atual: dict, base: dict) -> list:
+    """
+    Razão de tempo (atual / base) para os pares caso/tamanho em comum.
+
+    Retorna:
+        lista de dicts com 'caso', 'tamanho', 'base_s', 'atual_s', 'razao'
+    """
+    indice = {(r['caso'], r['tamanho']): r for r in base['resultados']}
+    linhas = []
+    for r in atual['resultados']:
+        b = indice.get((r['caso'], r['tamanho']))
+        if b:
+            linhas.append({'caso': r['caso'], 'tamanho': r['tamanho'],
+                           'base_s': b['min_s'], 'atual_s': r['min_s'],
+                           'razao': r['min_s'] / b['min_s']})
+    return linhas
+
+
+# ========================================================================
+# LINHA DE COMANDO
+# ========================================================================
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmarks das funções do core.')
+    parser.add_argument('--casos', nargs='+', choices=list(CASOS), default=list(CASOS))
+    parser.add_argument('--tamanhos', type=int, nargs='+', help=f'malhas de θ (padrão {TAMANHOS})')
+    parser.add_argument('--geometrias', type=int, nargs='+', help=f'varreduras (padrão {GEOMETRIAS})')
+    parser.add_argument('--rapido', action='store_true',
+                        help=f'usa {TAMANHOS_RAPIDO} pontos e {GEOMETRIAS_RAPIDO} geometrias')
+    parser.add_argument('--repeticoes', type=int, default=5)
+    parser.add_argument('--tempo-min', type=float, default=0.05, help='duração mínima de cada repetição (s)')
+    parser.add_argument('--saida', help='grava o resultado em JSON')
+    parser.add_argument('--comparar', metavar='BASE', help='JSON de uma execução anterior')
+    args = parser.parse_args(argv)
+
+    tamanhos = args.tamanhos or (TAMANHOS_RAPIDO if args.rapido else TAMANHOS)
+    geometrias = args.geometrias or (GEOMETRIAS_RAPIDO if args.rapido else GEOMETRIAS)
+    resultado = executar(args.casos, tamanhos, geometrias, args.repeticoes, args.tempo_min)
+
+    if args.comparar:
+        with open(args.comparar, 'r', encoding='utf-8') as f:
+            linhas = comparar(resultado, json.load(f))
+        resultado['comparacao'] = {'base': args.comparar, 'linhas': linhas}
+        print("\nComparação (atual / base):", file=sys.stderr)
+        for l in linhas:
+            print(f"{l['caso']:<24} {l['tamanho']:>10}  {l['razao']:>6.2f}x", file=sys.stderr)
+
+    if args.saida:
+        Path(args.saida).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.saida, 'w', encoding='utf-8') as f:
+            json.dump(resultado, f, ensure_ascii=False, indent=2)
+        print(f"✓ Resultados salvos: {args.saida}", file=sys.stderr)
+    else:
+        json.dump(resultado, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
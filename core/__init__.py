@@ -1,33 +1,55 @@
 """
 Core - Módulo principal de cálculos do dosador de sementes.
 Contém toda a lógica de negócio: cinemática, forças, torque e espaçamento.
+
+Os submódulos são importados no primeiro acesso a um nome exportado
+(PEP 562); assim numpy e scipy só são carregados quando algum cálculo
+é de fato usado.
 """
 
-from .cinematica import (
-    espaco,
-    velocidade,
-    aceleracao,
-    jerk,
-    velocidade_angular,
-    omega_rpm,
-    encontrar_theta_solo,
-    y_solo_mm
-)
+from utils.importacao import exportacao_tardia
 
-from .forcas_torque import (
-    y_theta,
-    y_ddot_theta,
-    beta_theta,
-    a_biela_parallel,
-    forcas_FB_FM,
-    torque,
-    construir_F_VS_variavel
-)
+_EXPORTACOES = {
+    'espaco': '.cinematica',
+    'velocidade': '.cinematica',
+    'aceleracao': '.cinematica',
+    'jerk': '.cinematica',
+    'velocidade_angular': '.cinematica',
+    'omega_rpm': '.cinematica',
+    'encontrar_theta_solo': '.cinematica',
+    'y_solo_mm': '.cinematica',
+    'bases_cinematica': '.cinematica',
+    'ThetaGrid': '.grade',
+    'AreaTrabalho': '.grade',
+    'y_theta': '.forcas_torque',
+    'y_ddot_theta': '.forcas_torque',
+    'beta_theta': '.forcas_torque',
+    'a_biela_parallel': '.forcas_torque',
+    'forcas_FB_FM': '.forcas_torque',
+    'torque': '.forcas_torque',
+    'construir_F_VS_variavel': '.forcas_torque',
+    'bases_torque': '.forcas_torque',
+    'torque_de_bases': '.forcas_torque',
+    'sementes_por_metro': '.espacamento',
+    'calcular_espacamento': '.espacamento',
+    'Cultura': '.parametros',
+    'ParametrosMecanismo': '.parametros',
+    'catalogo_para_array': '.parametros',
+    'array_para_catalogo': '.parametros',
+    'mecanismos_para_array': '.parametros',
+    'SessaoAnalise': '.sessao',
+    'capacidade_campo': '.capacidade',
+    'horas_maquina': '.capacidade',
+    'maquinas_necessarias': '.capacidade',
+    'trabalho_acumulado': '.energia',
+    'energia_ciclo': '.energia',
+    'energia_por_hectare': '.energia',
+    'theta_solo': '.trajetoria',
+    'trajetoria_solo': '.trajetoria',
+    'analisar_rasgos': '.trajetoria',
+}
 
-from .espacamento import (
-    sementes_por_metro,
-    calcular_espacamento
-)
+__getattr__ = exportacao_tardia(__name__, _EXPORTACOES)
 
 __all__ = [
     # Cinemática
@@ -39,6 +61,9 @@ __all__ = [
     'omega_rpm',
     'encontrar_theta_solo',
     'y_solo_mm',
+    'bases_cinematica',
+    'ThetaGrid',
+    'AreaTrabalho',
     # Forças e Torque
     'y_theta',
     'y_ddot_theta',
@@ -47,7 +72,29 @@ __all__ = [
     'forcas_FB_FM',
     'torque',
     'construir_F_VS_variavel',
+    'bases_torque',
+    'torque_de_bases',
     # Espaçamento
     'sementes_por_metro',
     'calcular_espacamento',
+    # Parâmetros tipados
+    'Cultura',
+    'ParametrosMecanismo',
+    'catalogo_para_array',
+    'array_para_catalogo',
+    'mecanismos_para_array',
+    # Sessão
+    'SessaoAnalise',
+    # Capacidade de campo
+    'capacidade_campo',
+    'horas_maquina',
+    'maquinas_necessarias',
+    # Energia no eixo
+    'trabalho_acumulado',
+    'energia_ciclo',
+    'energia_por_hectare',
+    # Trajetória no solo
+    'theta_solo',
+    'trajetoria_solo',
+    'analisar_rasgos',
 ]
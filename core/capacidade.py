@@ -0,0 +1,108 @@
+"""
+Módulo de Capacidade de Campo da Semeadora.
+
+Kernels vetorizados (broadcasting do NumPy) para dimensionar a frota de
+semeadoras: capacidade de campo efetiva, horas-máquina para uma área e
+número de máquinas para cumprir a janela de plantio. Todos os argumentos
+aceitam escalares ou arrays com formas compatíveis, de modo que uma
+grade estado x cultura x espaçamento x velocidade x nº de linhas é
+avaliada em uma única chamada.
+
+Capacidade de campo efetiva:
+    C = v · (n_linhas · e) · η / 10        [ha/h]
+    (v em km/h e largura em m: v · largura = 1000 · v · largura m²/h)
+"""
+
+import numpy as np
+
+
+EFICIENCIA_PADRAO = 0.65   # fração do tempo efetivamente semeando (manobras, abastecimento)
+HORAS_DIA_PADRAO = 10.0    # horas de trabalho por dia
+
+
+def largura_trabalho(espacamento_m, n_linhas) -> np.ndarray:
+    """
+    Largura de trabalho da semeadora (m).
+
+    Parâmetros:
+        espacamento_m : espaçamento entre linhas (m)
+        n_linhas      : número de linhas da máquina
+    """
+    return np.multiply(espacamento_m, n_linhas, dtype=float)
+
+
+def capacidade_campo(velocidade_kmh, espacamento_m, n_linhas,
+                     eficiencia=EFICIENCIA_PADRAO) -> np.ndarray:
+    """
+    Capacidade de campo efetiva (ha/h).
+
+    Parâmetros:
+        velocidade_kmh : velocidade de plantio (km/h)
+        espacamento_m  : espaçamento entre linhas (m)
+        n_linhas       : número de linhas da máquina
+        eficiencia     : eficiência de campo (fração 0-1)
+
+    Retorna:
+        C : capacidade de campo (ha/h), com a forma do broadcasting dos argumentos
+    """
+    eficiencia = np.asarray(eficiencia, dtype=float)
+    if np.any((eficiencia <= 0) | (eficiencia > 1)):
+        raise ValueError("Eficiência de campo deve estar em (0, 1].")
+    largura = largura_trabalho(espacamento_m, n_linhas)
+    return np.multiply(velocidade_kmh, largura) * (eficiencia / 10.0)
+
+
+def horas_maquina(area_ha, capacidade_ha_h) -> np.ndarray:
+    """
+    Horas-máquina para semear uma área (h).
+
+    Parâmetros:
+        area_ha         : área a semear (ha)
+        capacidade_ha_h : capacidade de campo (ha/h)
+
+    Retorna:
+        horas : área / capacidade (NaN onde a capacidade é NaN)
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.divide(area_ha, capacidade_ha_h, dtype=float)
+
+
+def maquinas_necessarias(horas, janela_dias, horas_dia=HORAS_DIA_PADRAO) -> np.ndarray:
+    """
+    Número de máquinas para cumprir as horas dentro da janela de plantio.
+
+    Parâmetros:
+        horas       : horas-máquina necessárias (h)
+        janela_dias : duração da janela de plantio (dias)
+        horas_dia   : horas de trabalho por dia
+
+    Retorna:
+        maquinas : ceil(horas / (janela · horas_dia)), como float (NaN
+                   propagado); zero onde não há área
+    """
+    disponivel = np.multiply(janela_dias, horas_dia, dtype=float)
+    if np.any(disponivel <= 0):
+        raise ValueError("Janela de plantio e horas por dia devem ser positivas.")
+    return np.ceil(np.divide(horas, disponivel))
+
+
+def faixa_velocidades(velocidade_min_kmh, velocidade_max_kmh, passo_kmh) -> np.ndarray:
+    """
+    Velocidades de plantio de várias culturas em uma matriz.
+
+    Parâmetros:
+        velocidade_min_kmh, velocidade_max_kmh, passo_kmh : arrays (n_culturas,)
+
+    Retorna:
+        array (n_culturas, n_max) com min, min + passo, ..., max de cada
+        cultura, completado com NaN (passo 0 = só a velocidade mínima)
+    """
+    vmin = np.atleast_1d(np.asarray(velocidade_min_kmh, dtype=float))
+    vmax = np.atleast_1d(np.asarray(velocidade_max_kmh, dtype=float))
+    passo = np.atleast_1d(np.asarray(passo_kmh, dtype=float))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        n = np.where(passo > 0, np.floor((vmax - vmin) / passo + 1e-9), 0).astype(int) + 1
+    indice = np.arange(n.max())
+    velocidades = vmin[:, None] + indice * passo[:, None]
+    velocidades[indice >= n[:, None]] = np.nan
+    return velocidades
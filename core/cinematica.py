@@ -3,37 +3,57 @@ Módulo de Cinemática do Mecanismo de Dosagem de Sementes.
 
 Contém todas as funções relacionadas ao cálculo de posição, velocidade,
 aceleração e jerk da haste de perfuração em função do ângulo da manivela.
+
+O argumento `theta` (radianos) de todas as funções aceita também um
+ThetaGrid (core.grade): os senos e cossenos da malha são então calculados
+uma única vez e reaproveitados entre chamadas e geometrias.
 """
 
 import numpy as np
-from scipy.optimize import fsolve
+
+from .grade import AreaTrabalho, ThetaGrid, como_area, como_grade, forma_saida, resultado
+from .resultado import ResultadoPreguicoso
 
 
 # ========================================================================
 # POSIÇÃO (ESPAÇO)
 # ========================================================================
 
-def espaco(theta: np.ndarray, r: float, L: float, h: float) -> np.ndarray:
+def espaco(theta: np.ndarray, r: float, L: float, h: float,
+           out: np.ndarray = None, trabalho: AreaTrabalho = None) -> np.ndarray:
     """
     Calcula a posição y da haste de perfuração em função do ângulo theta.
     
     Referencial: centro da manivela.
     
     Parâmetros:
-        theta : array de ângulos em radianos
-        r     : raio da manivela (mm)
-        L     : comprimento da biela (mm)
-        h     : offset vertical (mm)
+        theta    : array de ângulos em radianos
+        r        : raio da manivela (mm)
+        L        : comprimento da biela (mm)
+        h        : offset vertical (mm)
+        out      : array de saída já alocado (opcional)
+        trabalho : AreaTrabalho para os temporários (opcional)
     
     Retorna:
         y : posição vertical da ponta da haste (mm)
     """
-    y = np.sqrt(L**2 - (r * np.sin(theta))**2) - r * np.cos(theta) + h
-    return y
+    g = como_grade(theta)
+    ws = como_area(trabalho)
+    forma = forma_saida(g, r, L, h)
+    y = np.empty(forma) if out is None else out
+    
+    # y = sqrt(L² - r² sin²θ) - r cosθ + h
+    np.sqrt(_inside(g, r, L, y), out=y)
+    t = ws('espaco.t', forma)
+    np.multiply(r, g.cos, out=t)
+    y -= t
+    y += h
+    return resultado(y, out)
 
 
-def y_solo_mm(theta: np.ndarray, r: float, L: float, h: float, 
-              altura_centro_m: float) -> np.ndarray:
+def y_solo_mm(theta: np.ndarray, r: float, L: float, h: float,
+              altura_centro_m: float,
+              out: np.ndarray = None, trabalho: AreaTrabalho = None) -> np.ndarray:
     """
     Posição da ponta da haste em relação ao SOLO (mm).
     
@@ -46,115 +66,220 @@ def y_solo_mm(theta: np.ndarray, r: float, L: float, h: float,
         theta           : array de ângulos em radianos
         r, L, h         : geometria (mm)
         altura_centro_m : altura do centro da manivela em relação ao solo (mm)
+        out, trabalho   : saída e temporários reaproveitáveis (ver espaco)
     
     Retorna:
         y_solo : posição em relação ao solo (mm)
     """
-    y_m = espaco(theta, r, L, h)
-    y_solo = altura_centro_m - y_m
+    y_solo = espaco(theta, r, L, h, out=out, trabalho=trabalho)
+    if np.ndim(y_solo) == 0:
+        return altura_centro_m - y_solo
+    np.subtract(altura_centro_m, y_solo, out=y_solo)
     return y_solo
 
 
+def _inside(g: ThetaGrid, r, L, out: np.ndarray) -> np.ndarray:
+    """out = L² - r² sin²θ (termo sob a raiz, comum a todas as derivadas)."""
+    np.multiply(r**2, g.sin_quad, out=out)
+    np.subtract(L**2, out, out=out)
+    return out
+
+
 # ========================================================================
 # VELOCIDADE
 # ========================================================================
 
-def velocidade(theta: np.ndarray, omega: float, r: float, L: float) -> np.ndarray:
+def velocidade(theta: np.ndarray, omega: float, r: float, L: float,
+               out: np.ndarray = None, trabalho: AreaTrabalho = None) -> np.ndarray:
     """
     Calcula a velocidade dy/dt da haste em função do ângulo theta.
     
     Parâmetros:
-        theta : array de ângulos em radianos
-        omega : velocidade angular da manivela (rad/s)
-        r     : raio da manivela (mm)
-        L     : comprimento da biela (mm)
+        theta         : array de ângulos em radianos
+        omega         : velocidade angular da manivela (rad/s)
+        r             : raio da manivela (mm)
+        L             : comprimento da biela (mm)
+        out, trabalho : saída e temporários reaproveitáveis (ver espaco)
     
     Retorna:
         dy_dt : velocidade vertical da haste (mm/s)
     """
-    s = np.sin(theta)
-    c = np.cos(theta)
-    inside = L**2 - r**2 * s**2
-    
-    dy_dt = r * s * (1 - (r * c) / np.sqrt(inside)) * omega
-    
-    return dy_dt
+    g = como_grade(theta)
+    ws = como_area(trabalho)
+    forma = forma_saida(g, omega, r, L)
+    dy_dt = np.empty(forma) if out is None else out
+    
+    raiz = _inside(g, r, L, ws('velocidade.raiz', forma))
+    np.sqrt(raiz, out=raiz)
+    
+    # dy/dt = r sinθ (1 - r cosθ / raiz) ω
+    np.multiply(r, g.cos, out=dy_dt)
+    dy_dt /= raiz
+    np.subtract(1, dy_dt, out=dy_dt)
+    dy_dt *= g.sin
+    dy_dt *= r * omega
+    
+    return resultado(dy_dt, out)
 
 
 # ========================================================================
 # ACELERAÇÃO
 # ========================================================================
 
-def aceleracao(theta: np.ndarray, omega: float, r: float, L: float, 
-               alpha: float = 0.0) -> np.ndarray:
+def aceleracao(theta: np.ndarray, omega: float, r: float, L: float,
+               alpha: float = 0.0,
+               out: np.ndarray = None, trabalho: AreaTrabalho = None) -> np.ndarray:
     """
     Calcula a aceleração d²y/dt² da haste em função do ângulo theta.
     
     Parâmetros:
-        theta : array de ângulos em radianos
-        omega : velocidade angular da manivela (rad/s)
-        r     : raio da manivela (mm)
-        L     : comprimento da biela (mm)
-        alpha : aceleração angular da manivela (rad/s²), padrão = 0
+        theta         : array de ângulos em radianos
+        omega         : velocidade angular da manivela (rad/s)
+        r             : raio da manivela (mm)
+        L             : comprimento da biela (mm)
+        alpha         : aceleração angular da manivela (rad/s²), padrão = 0
+        out, trabalho : saída e temporários reaproveitáveis (ver espaco)
     
     Retorna:
         d2y_dt2 : aceleração vertical da haste (mm/s²)
     """
-    s = np.sin(theta)
-    c = np.cos(theta)
-    s2 = np.sin(2 * theta)
-    c2 = np.cos(2 * theta)
-    
-    inside = L**2 - r**2 * s**2
-    
-    numerador = r**2 * (4 * inside * c2 + (r * s2)**2)
-    denominador = 4 * np.power(inside, 1.5)
-    
-    d2y_dt2 = (r * c - numerador / denominador) * omega**2
-    
-    if alpha != 0.0:
-        v = velocidade(theta, omega, r, L)
-        d2y_dt2 += v * alpha
-    
-    return d2y_dt2
+    g = como_grade(theta)
+    ws = como_area(trabalho)
+    forma = forma_saida(g, omega, r, L, alpha)
+    d2y_dt2 = np.empty(forma) if out is None else out
+    
+    inside = _inside(g, r, L, ws('aceleracao.inside', forma))
+    
+    # numerador = r² (4·inside·cos2θ + (r sin2θ)²)
+    numerador = ws('aceleracao.num', forma)
+    t = ws('aceleracao.t', forma)
+    np.multiply(inside, g.cos2, out=numerador)
+    numerador *= 4
+    np.multiply(r, g.sin2, out=t)
+    np.square(t, out=t)
+    numerador += t
+    numerador *= r**2
+    
+    # denominador = 4·inside^1.5
+    np.power(inside, 1.5, out=t)
+    t *= 4
+    numerador /= t
+    
+    np.multiply(r, g.cos, out=d2y_dt2)
+    d2y_dt2 -= numerador
+    d2y_dt2 *= omega**2
+    
+    if np.any(alpha != 0.0):
+        # d²y/dt² = y''(θ)·ω² + y'(θ)·α
+        v = velocidade(g, 1.0, r, L, out=ws('aceleracao.v', forma), trabalho=ws)
+        v *= alpha
+        d2y_dt2 += v
+    
+    return resultado(d2y_dt2, out)
 
 
 # ========================================================================
 # JERK
 # ========================================================================
 
-def jerk(theta: np.ndarray, omega: float, alpha: float, r: float, L: float, 
-         beta: float = 0.0) -> np.ndarray:
+def jerk(theta: np.ndarray, omega: float, alpha: float, r: float, L: float,
+         beta: float = 0.0,
+         out: np.ndarray = None, trabalho: AreaTrabalho = None) -> np.ndarray:
     """
     Calcula o jerk d³y/dt³ da haste em função do ângulo theta.
     
     Parâmetros:
-        theta : array de ângulos em radianos
-        omega : velocidade angular da manivela (rad/s)
-        alpha : aceleração angular da manivela (rad/s²)
-        r     : raio da manivela (mm)
-        L     : comprimento da biela (mm)
-        beta  : derivada da aceleração angular (rad/s³), padrão = 0
+        theta         : array de ângulos em radianos
+        omega         : velocidade angular da manivela (rad/s)
+        alpha         : aceleração angular da manivela (rad/s²)
+        r             : raio da manivela (mm)
+        L             : comprimento da biela (mm)
+        beta          : derivada da aceleração angular (rad/s³), padrão = 0
+        out, trabalho : saída e temporários reaproveitáveis (ver espaco)
     
     Retorna:
         d3y_dt3 : jerk vertical da haste (mm/s³)
     """
-    s = np.sin(theta)
-    s2 = np.sin(2 * theta)
-    c2 = np.cos(2 * theta)
-    
-    inside = L**2 - r**2 * s**2
+    g = como_grade(theta)
+    ws = como_area(trabalho)
+    forma = forma_saida(g, omega, alpha, r, L, beta)
+    d3y_dt3 = np.empty(forma) if out is None else out
+    
+    inside = _inside(g, r, L, ws('jerk.inside', forma))
+    
+    # termo1_num = r² sin2θ (16·inside² - 3 r² (4·inside·cos2θ + (r sin2θ)²))
+    termo1 = ws('jerk.termo1', forma)
+    t = ws('jerk.t', forma)
+    np.multiply(inside, g.cos2, out=termo1)
+    termo1 *= 4
+    np.multiply(r, g.sin2, out=t)
+    np.square(t, out=t)
+    termo1 += t
+    termo1 *= 3 * r**2
+    np.square(inside, out=t)
+    t *= 16
+    np.subtract(t, termo1, out=termo1)
+    termo1 *= g.sin2
+    termo1 *= r**2
+    
+    # termo1_den = 8·inside^2.5
+    np.power(inside, 2.5, out=t)
+    t *= 8
+    termo1 /= t
+    
+    # termo1 = termo1_num / termo1_den - r sinθ
+    np.multiply(r, g.sin, out=d3y_dt3)
+    np.subtract(termo1, d3y_dt3, out=d3y_dt3)
+    d3y_dt3 *= omega**3
+    
+    # d³y/dt³ = y'''(θ)·ω³ + 3·y''(θ)·ω·α + y'(θ)·β
+    if np.any(alpha != 0.0):
+        termo2 = aceleracao(g, 1.0, r, L, out=ws('jerk.termo2', forma), trabalho=ws)
+        termo2 *= 3 * omega * alpha
+        d3y_dt3 += termo2
+    if np.any(beta != 0.0):
+        termo3 = velocidade(g, 1.0, r, L, out=ws('jerk.termo3', forma), trabalho=ws)
+        termo3 *= beta
+        d3y_dt3 += termo3
+    
+    return resultado(d3y_dt3, out)
+
+
+# ========================================================================
+# BASES NORMALIZADAS (independentes de omega)
+# ========================================================================
+
+def bases_cinematica(theta: np.ndarray, r: float, L: float,
+                     out: dict = None, trabalho: AreaTrabalho = None) -> dict:
+    """
+    Curvas de velocidade, aceleração e jerk normalizadas por potências de omega.
     
-    termo1_num = r**2 * s2 * (16 * inside**2 - 3 * r**2 * (4 * inside * c2 + (r * s2)**2))
-    termo1_den = 8 * np.power(inside, 2.5)
-    termo1 = termo1_num / termo1_den
+    Com alpha = beta = 0:
+        velocidade = base['v'] * omega
+        aceleracao = base['a'] * omega**2
+        jerk       = base['j'] * omega**3
     
-    termo2 = 3 * aceleracao(theta, omega, r, L, alpha) * omega * alpha
-    termo3 = velocidade(theta, omega, r, L) * beta
+    Permite calcular a cinemática de várias culturas (omegas diferentes)
+    sobre a mesma geometria avaliando a trigonometria uma única vez.
     
-    d3y_dt3 = termo1 * omega**3 + termo2 + termo3
+    Parâmetros:
+        theta    : array de ângulos em radianos
+        r        : raio da manivela (mm)
+        L        : comprimento da biela (mm)
+        out      : dict com arrays 'v', 'a' e 'j' já alocados (opcional)
+        trabalho : AreaTrabalho para os temporários (opcional)
     
-    return d3y_dt3
+    Retorna:
+        dict com arrays 'v' (mm/rad), 'a' (mm/rad²) e 'j' (mm/rad³)
+    """
+    g = como_grade(theta)
+    ws = como_area(trabalho)
+    out = out if out is not None else {}
+    return {
+        'v': velocidade(g, 1.0, r, L, out=out.get('v'), trabalho=ws),
+        'a': aceleracao(g, 1.0, r, L, out=out.get('a'), trabalho=ws),
+        'j': jerk(g, 1.0, 0.0, r, L, out=out.get('j'), trabalho=ws),
+    }
 
 
 # ========================================================================
@@ -237,6 +362,9 @@ def encontrar_theta_solo(r: float, L: float, h: float,
             'descida' : ângulo quando a haste desce (graus)
             'subida'  : ângulo quando a haste sobe (graus)
     """
+    # scipy é importado só aqui: a maioria das análises não precisa do solver
+    from scipy.optimize import fsolve
+    
     def eq_solo(theta_rad):
         """Equação: y_solo(theta) = 0"""
         y_manivela = espaco(theta_rad, r, L, h)
@@ -261,14 +389,74 @@ def encontrar_theta_solo(r: float, L: float, h: float,
 # FUNÇÕES AUXILIARES
 # ========================================================================
 
+class ResultadoCinematica(ResultadoPreguicoso):
+    """
+    Cinemática completa calculada sob demanda (ver calcular_cinematica_completa).
+    
+    As derivadas geométricas y'(θ), y''(θ) e y'''(θ) são calculadas uma
+    única vez e combinadas com omega, alpha e beta:
+        velocidade = y'·ω
+        aceleracao = y''·ω² + y'·α
+        jerk       = y'''·ω³ + 3·y''·ω·α + y'·β
+    """
+    
+    __slots__ = ('_grade', '_trabalho', '_geometria', '_movimento')
+    
+    CAMPOS = ('theta_deg', 'theta_rad', 'posicao', 'velocidade', 'aceleracao', 'jerk')
+    
+    def __init__(self, grade: ThetaGrid, r, L, h, altura_centro, omega, alpha, beta):
+        super().__init__()
+        self._grade = grade
+        self._trabalho = AreaTrabalho()
+        self._geometria = (r, L, h, altura_centro)
+        self._movimento = (omega, alpha, beta)
+    
+    def _derivada(self, ordem: int) -> np.ndarray:
+        """Derivada de ordem 1, 2 ou 3 de y em relação a θ (ω = 1, α = β = 0)."""
+        g, ws = self._grade, self._trabalho
+        r, L = self._geometria[:2]
+        funcao = {1: lambda: velocidade(g, 1.0, r, L, trabalho=ws),
+                  2: lambda: aceleracao(g, 1.0, r, L, trabalho=ws),
+                  3: lambda: jerk(g, 1.0, 0.0, r, L, trabalho=ws)}[ordem]
+        return self._intermediario(('derivada', ordem), funcao)
+    
+    def _calcular(self, nome: str):
+        g = self._grade
+        omega, alpha, beta = self._movimento
+        if nome == 'theta_deg':
+            self._guardar(theta_deg=g.deg)
+        elif nome == 'theta_rad':
+            self._guardar(theta_rad=g.rad)
+        elif nome == 'posicao':
+            self._guardar(posicao=y_solo_mm(g, *self._geometria, trabalho=self._trabalho))
+        elif nome == 'velocidade':
+            self._guardar(velocidade=self._derivada(1) * omega)
+        elif nome == 'aceleracao':
+            acel = self._derivada(2) * omega**2
+            if alpha != 0.0:
+                acel += self._derivada(1) * alpha
+            self._guardar(aceleracao=acel)
+        elif nome == 'jerk':
+            jer = self._derivada(3) * omega**3
+            if alpha != 0.0:
+                jer += 3 * self._derivada(2) * omega * alpha
+            if beta != 0.0:
+                jer += self._derivada(1) * beta
+            self._guardar(jerk=jer)
+
+
 def calcular_cinematica_completa(theta_deg: np.ndarray, r: float, L: float, h: float,
-                                 altura_centro: float, omega: float, 
-                                 alpha: float = 0.0, beta: float = 0.0) -> dict:
+                                 altura_centro: float, omega: float,
+                                 alpha: float = 0.0, beta: float = 0.0) -> ResultadoCinematica:
     """
-    Calcula toda a cinemática (posição, velocidade, aceleração, jerk) de uma vez.
+    Cinemática completa (posição, velocidade, aceleração, jerk) sob demanda.
+    
+    Nada é calculado aqui: cada grandeza é calculada no primeiro acesso
+    (ver ResultadoCinematica), então quem só lê a posição não paga pelas
+    derivadas.
     
     Parâmetros:
-        theta_deg      : array de ângulos em graus
+        theta_deg      : array de ângulos em graus (ou ThetaGrid)
         r, L, h        : geometria (mm)
         altura_centro  : altura do centro da manivela (mm)
         omega          : velocidade angular (rad/s)
@@ -276,20 +464,8 @@ def calcular_cinematica_completa(theta_deg: np.ndarray, r: float, L: float, h: f
         beta           : derivada da aceleração (rad/s³)
     
     Retorna:
-        dict com arrays: 'posicao', 'velocidade', 'aceleracao', 'jerk'
+        ResultadoCinematica, acessado como dict: 'theta_deg', 'theta_rad',
+        'posicao', 'velocidade', 'aceleracao', 'jerk'
     """
-    theta_rad = np.deg2rad(theta_deg)
-    
-    pos = y_solo_mm(theta_rad, r, L, h, altura_centro)
-    vel = velocidade(theta_rad, omega, r, L)
-    acel = aceleracao(theta_rad, omega, r, L, alpha)
-    jer = jerk(theta_rad, omega, alpha, r, L, beta)
-    
-    return {
-        'theta_deg': theta_deg,
-        'theta_rad': theta_rad,
-        'posicao': pos,
-        'velocidade': vel,
-        'aceleracao': acel,
-        'jerk': jer
-    }
+    grade = theta_deg if isinstance(theta_deg, ThetaGrid) else ThetaGrid.de_graus(theta_deg)
+    return ResultadoCinematica(grade, r, L, h, altura_centro, omega, alpha, beta)
@@ -0,0 +1,93 @@
+"""
+Módulo de Energia no Eixo da Manivela.
+
+Converte curvas de torque τ(θ) em energia. O trabalho acumulado
+W(θ) = ∫ τ dθ é integrado pela regra dos trapézios em uma única passada
+(np.cumsum ao longo do último eixo), então uma matriz de curvas
+(culturas x velocidades x θ) é integrada de uma vez.
+
+Cada volta da manivela abre uma cova (ver cinematica.velocidade_angular),
+então, com N sementes por metro linear e espaçamento e entre linhas:
+
+    E_ha = W_ciclo · N · (10 000 / e) / 3,6·10⁶      [kWh/ha]
+
+Aqui τ é o torque fornecido pelo acionamento. O torque de
+forcas_torque.torque() é o da carga sobre o eixo, com o sinal oposto
+(ver SessaoAnalise.energia_ciclo).
+
+Sem atrito e com ω constante, as parcelas de inércia e de peso se anulam
+em uma volta completa e o trabalho líquido é só o do solo (F_VS). Um
+acionamento que não devolve energia ao eixo gasta o trabalho positivo
+∫ max(τ, 0) dθ, que é o padrão aqui (regenerativo=False).
+"""
+
+import numpy as np
+
+from .grade import como_grade
+
+
+J_POR_KWH = 3.6e6
+M2_POR_HA = 10000.0
+
+
+def trabalho_acumulado(theta, tau, out: np.ndarray = None) -> np.ndarray:
+    """
+    Trabalho acumulado W(θ) = ∫ τ dθ pela regra dos trapézios (J).
+
+    Parâmetros:
+        theta : malha crescente em radianos (ou ThetaGrid), forma (T,)
+        tau   : torque (N·m), forma (..., T)
+        out   : array de saída com a forma de tau (opcional)
+
+    Retorna:
+        W : array (..., T) com W[..., 0] = 0
+    """
+    rad = como_grade(theta).rad
+    tau = np.asarray(tau, dtype=float)
+    if tau.shape[-1:] != rad.shape:
+        raise ValueError(f"Torque com forma {tau.shape}, esperado (..., {len(rad)}).")
+    W = np.empty(tau.shape) if out is None else out
+
+    # Área de cada trapézio, depois soma acumulada no mesmo array
+    W[..., 0] = 0.0
+    np.add(tau[..., 1:], tau[..., :-1], out=W[..., 1:])
+    W[..., 1:] *= 0.5 * np.diff(rad)
+    np.cumsum(W[..., 1:], axis=-1, out=W[..., 1:])
+    return W
+
+
+def energia_ciclo(theta, tau, regenerativo: bool = False) -> np.ndarray:
+    """
+    Energia no eixo em uma volta da manivela (J).
+
+    Parâmetros:
+        theta        : malha em radianos (ou ThetaGrid) cobrindo 360°
+        tau          : torque do acionamento (N·m), forma (..., T)
+        regenerativo : se True, trabalho líquido ∫ τ dθ; se False, só a
+                       parte positiva (o eixo não recebe energia de volta)
+
+    Retorna:
+        energia por ciclo, forma (...)
+    """
+    rad = como_grade(theta).rad
+    if not np.isclose(rad[-1] - rad[0], 2 * np.pi):
+        raise ValueError("A malha de ângulos deve cobrir uma volta completa (360°).")
+    if not regenerativo:
+        tau = np.maximum(tau, 0.0)
+    return trabalho_acumulado(theta, tau)[..., -1]
+
+
+def energia_por_hectare(energia_ciclo_J, sementes_por_metro, espacamento_m) -> np.ndarray:
+    """
+    Energia no eixo por hectare semeado (kWh/ha).
+
+    Parâmetros:
+        energia_ciclo_J    : energia por volta da manivela (J)
+        sementes_por_metro : sementes (covas) por metro linear
+        espacamento_m      : espaçamento entre linhas (m)
+
+    Retorna:
+        E_ha com a forma do broadcasting dos argumentos
+    """
+    covas_ha = np.multiply(sementes_por_metro, M2_POR_HA) / np.asarray(espacamento_m, dtype=float)
+    return np.multiply(energia_ciclo_J, covas_ha) / J_POR_KWH
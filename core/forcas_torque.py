@@ -2,54 +2,96 @@
 Módulo de Forças e Torque do Mecanismo de Dosagem de Sementes.
 
 Contém cálculos relacionados às forças na biela, manivela e torque no eixo.
+
+Assim como em core.cinematica, `theta` aceita um ThetaGrid (core.grade)
+no lugar do array em radianos.
 """
 
 import numpy as np
 
+from .grade import AreaTrabalho, ThetaGrid, como_area, como_grade, forma_saida, resultado
+from .resultado import ResultadoPreguicoso
+
 
 # ========================================================================
 # FUNÇÕES GEOMÉTRICAS E CINEMÁTICAS AUXILIARES
 # ========================================================================
 
-def y_theta(theta: np.ndarray, r: float, L: float, h: float) -> np.ndarray:
+def y_theta(theta: np.ndarray, r: float, L: float, h: float,
+            out: np.ndarray = None, trabalho: AreaTrabalho = None) -> np.ndarray:
     """
     Posição vertical da ponta da haste (referencial do CENTRO da manivela).
     
     Parâmetros:
-        theta : array em radianos
-        r, L, h : geometria em metros
+        theta         : array em radianos
+        r, L, h       : geometria em metros
+        out, trabalho : saída e temporários reaproveitáveis (opcionais)
     
     Retorna:
         y : posição vertical em metros
     """
-    return np.sqrt(L**2 - r**2 * np.sin(theta)**2) - r * np.cos(theta) + h
+    g = como_grade(theta)
+    ws = como_area(trabalho)
+    forma = forma_saida(g, r, L, h)
+    y = np.empty(forma) if out is None else out
+    
+    np.multiply(r**2, g.sin_quad, out=y)
+    np.subtract(L**2, y, out=y)
+    np.sqrt(y, out=y)
+    t = ws('y_theta.t', forma)
+    np.multiply(r, g.cos, out=t)
+    y -= t
+    y += h
+    return resultado(y, out)
 
 
-def y_ddot_theta(theta: np.ndarray, r: float, L: float, omega: float) -> np.ndarray:
+def y_ddot_theta(theta: np.ndarray, r: float, L: float, omega: float,
+                 out: np.ndarray = None, trabalho: AreaTrabalho = None) -> np.ndarray:
     """
     Aceleração vertical da ponta da haste: y¨(theta).
     
     Assume alpha = 0 (velocidade angular constante).
     
     Parâmetros:
-        theta : array em radianos
-        r, L  : geometria em metros
-        omega : velocidade angular em rad/s
+        theta         : array em radianos
+        r, L          : geometria em metros
+        omega         : velocidade angular em rad/s
+        out, trabalho : saída e temporários reaproveitáveis (opcionais)
     
     Retorna:
         y_ddot : aceleração vertical em m/s²
     """
-    s = np.sin(theta)
-    c = np.cos(theta)
-    inside = L**2 - r**2 * s**2
-    
-    num1 = r * c
-    num2 = (r**2 * (4 * inside * np.cos(2*theta) + (r * np.sin(2*theta))**2)) / (4 * inside**(1.5))
-    
-    return (num1 - num2) * omega**2
+    g = como_grade(theta)
+    ws = como_area(trabalho)
+    forma = forma_saida(g, r, L, omega)
+    y_ddot = np.empty(forma) if out is None else out
+    
+    inside = ws('y_ddot.inside', forma)
+    np.multiply(r**2, g.sin_quad, out=inside)
+    np.subtract(L**2, inside, out=inside)
+    
+    # num2 = r² (4·inside·cos2θ + (r sin2θ)²) / (4·inside^1.5)
+    num2 = ws('y_ddot.num2', forma)
+    t = ws('y_ddot.t', forma)
+    np.multiply(inside, g.cos2, out=num2)
+    num2 *= 4
+    np.multiply(r, g.sin2, out=t)
+    np.square(t, out=t)
+    num2 += t
+    num2 *= r**2
+    np.power(inside, 1.5, out=t)
+    t *= 4
+    num2 /= t
+    
+    # num1 = r cosθ
+    np.multiply(r, g.cos, out=y_ddot)
+    y_ddot -= num2
+    y_ddot *= omega**2
+    return resultado(y_ddot, out)
 
 
-def beta_theta(theta: np.ndarray, r: float, L: float) -> np.ndarray:
+def beta_theta(theta: np.ndarray, r: float, L: float,
+               out: np.ndarray = None, trabalho: AreaTrabalho = None) -> np.ndarray:
     """
     Ângulo da biela com a vertical (beta(theta)).
     
@@ -58,21 +100,34 @@ def beta_theta(theta: np.ndarray, r: float, L: float) -> np.ndarray:
         sin beta = r sin theta / L
     
     Parâmetros:
-        theta : array em radianos
-        r, L  : geometria em metros
+        theta         : array em radianos
+        r, L          : geometria em metros
+        out, trabalho : saída e temporários reaproveitáveis (opcionais)
     
     Retorna:
         beta : ângulo em radianos
     """
-    s = np.sin(theta)
-    inside = L**2 - r**2 * s**2
-    cos_beta = np.sqrt(inside) / L
-    sin_beta = r * s / L
-    return np.arctan2(sin_beta, cos_beta)
+    g = como_grade(theta)
+    ws = como_area(trabalho)
+    forma = forma_saida(g, r, L)
+    cos_beta, sin_beta = _cos_sin_beta(g, r, L, ws('beta.cos', forma), ws('beta.sin', forma))
+    return np.arctan2(sin_beta, cos_beta, out=out)
 
 
-def a_biela_parallel(theta: np.ndarray, r: float, L: float, h: float, 
-                     omega: float) -> np.ndarray:
+def _cos_sin_beta(g: ThetaGrid, r, L, cos_out: np.ndarray, sin_out: np.ndarray) -> tuple:
+    """(cos beta, sin beta) pelas relações acima, sem arctan2."""
+    np.multiply(r**2, g.sin_quad, out=cos_out)
+    np.subtract(L**2, cos_out, out=cos_out)
+    np.sqrt(cos_out, out=cos_out)
+    cos_out /= L
+    np.multiply(r, g.sin, out=sin_out)
+    sin_out /= L
+    return cos_out, sin_out
+
+
+def a_biela_parallel(theta: np.ndarray, r: float, L: float, h: float,
+                     omega: float,
+                     out: np.ndarray = None, trabalho: AreaTrabalho = None) -> np.ndarray:
     """
     Componente da aceleração do CG da biela ao longo do seu eixo (a_biela,||).
     
@@ -80,36 +135,37 @@ def a_biela_parallel(theta: np.ndarray, r: float, L: float, h: float,
     onde A é o ponto na manivela e B é o ponto na haste.
     
     Parâmetros:
-        theta : array em radianos
-        r, L, h : geometria em metros
-        omega : velocidade angular em rad/s
+        theta         : array em radianos
+        r, L, h       : geometria em metros
+        omega         : velocidade angular em rad/s
+        out, trabalho : saída e temporários reaproveitáveis (opcionais)
     
     Retorna:
         a_parallel : aceleração paralela ao eixo da biela em m/s²
     """
-    s = np.sin(theta)
-    c = np.cos(theta)
-    
-    # Aceleração do ponto A (manivela)
-    aA_x = -omega**2 * r * s
-    aA_y = -omega**2 * r * c
-    
-    # Aceleração do ponto B (haste) – somente y
-    aB_y = y_ddot_theta(theta, r, L, omega)
-    aB_x = 0.0
-    
-    # Aceleração do CG da biela
-    aCG_x = 0.5 * (aA_x + aB_x)
-    aCG_y = 0.5 * (aA_y + aB_y)
-    
-    # Versor ao longo da biela
-    beta = beta_theta(theta, r, L)
-    e_b_x = np.sin(beta)
-    e_b_y = np.cos(beta)
-    
-    # Componente paralela à biela
-    a_parallel = aCG_x * e_b_x + aCG_y * e_b_y
-    return a_parallel
+    g = como_grade(theta)
+    ws = como_area(trabalho)
+    forma = forma_saida(g, r, L, omega)
+    a_parallel = np.empty(forma) if out is None else out
+    
+    # Aceleração do ponto A (manivela): aA = -ω² r (sinθ, cosθ)
+    # Aceleração do ponto B (haste) – somente y: aB = y¨(θ)
+    # 2·aCG_y = aA_y + aB_y
+    aCG_y = y_ddot_theta(g, r, L, omega, out=ws('a_par.aCG_y', forma), trabalho=ws)
+    t = ws('a_par.t', forma)
+    np.multiply(omega**2 * r, g.cos, out=t)
+    aCG_y -= t
+    
+    # Versor ao longo da biela: (sin beta, cos beta)
+    e_b_y, e_b_x = _cos_sin_beta(g, r, L, ws('a_par.cos', forma), ws('a_par.sin', forma))
+    
+    # Componente paralela à biela: aCG_x·e_b_x + aCG_y·e_b_y, com 2·aCG_x = aA_x
+    np.multiply(aCG_y, e_b_y, out=a_parallel)
+    np.multiply(omega**2 * r, g.sin, out=t)
+    t *= e_b_x
+    a_parallel -= t
+    a_parallel *= 0.5
+    return resultado(a_parallel, out)
 
 
 # ========================================================================
@@ -121,7 +177,8 @@ def forcas_FB_FM(theta: np.ndarray,
                  m_haste: float, m_biela: float,
                  P_haste: float, P_biela: float,
                  F_VS_arr: np.ndarray,
-                 omega: float) -> tuple:
+                 omega: float,
+                 out: tuple = None, trabalho: AreaTrabalho = None) -> tuple:
     """
     Calcula F_B(theta) e F_M(theta) - forças na biela e na manivela.
     
@@ -134,38 +191,43 @@ def forcas_FB_FM(theta: np.ndarray,
         P_haste, P_biela : pesos (N)
         F_VS_arr : força vertical do solo F_VS(theta) (N)
         omega    : velocidade angular da manivela (rad/s)
+        out      : tupla (F_B, F_M) de arrays já alocados (opcional)
+        trabalho : AreaTrabalho para os temporários (opcional)
     
     Retorna:
         (F_B, F_M) : tupla com arrays de forças (N)
     """
-    theta = np.array(theta, dtype=float)
+    g = como_grade(theta)
+    ws = como_area(trabalho)
+    forma = forma_saida(g, r, L, omega, F_VS_arr)
+    F_B, F_M = (np.empty(forma), np.empty(forma)) if out is None else out
     
     # 1) Aceleração da ponta da haste (a_B = y¨(theta))
-    aB = y_ddot_theta(theta, r, L, omega)
+    y_ddot_theta(g, r, L, omega, out=F_B, trabalho=ws)
     
     # 2) Força vertical no pino B: F_B,y = m_haste*aB - P_haste + F_VS(theta)
-    F_B_y = m_haste * aB - P_haste + F_VS_arr
+    F_B *= m_haste
+    F_B -= P_haste
+    F_B += F_VS_arr
     
     # 3) cos(beta) para projetar
-    s = np.sin(theta)
-    inside = L**2 - r**2 * s**2
-    root = np.sqrt(inside)
-    cos_beta = root / L
+    cos_beta, _ = _cos_sin_beta(g, r, L, ws('forcas.cos', forma), ws('forcas.sin', forma))
     
     # Força axial na biela no pino B (módulo)
-    F_B = F_B_y / cos_beta
+    F_B /= cos_beta
     
     # 4) Componente da aceleração do CG da biela ao longo dela
-    a_b_par = a_biela_parallel(theta, r, L, h, omega)
+    a_biela_parallel(g, r, L, h, omega, out=F_M, trabalho=ws)
     
     # 5) Componente do peso da biela ao longo dela
-    beta = beta_theta(theta, r, L)
-    P_b_par = P_biela * np.cos(beta)
+    P_b_par = np.multiply(P_biela, cos_beta, out=cos_beta)
     
     # 6) Força que a manivela faz na biela no pino A
-    F_M = m_biela * a_b_par - F_B - P_b_par
+    F_M *= m_biela
+    F_M -= F_B
+    F_M -= P_b_par
     
-    return F_B, F_M
+    return resultado(F_B, out), resultado(F_M, out)
 
 
 # ========================================================================
@@ -178,7 +240,8 @@ def torque(theta: np.ndarray,
            P_haste: float, P_biela: float,
            F_VS: np.ndarray,
            omega: float,
-           F_VS_theta_range_deg: tuple = None) -> np.ndarray:
+           F_VS_theta_range_deg: tuple = None,
+           out: np.ndarray = None, trabalho: AreaTrabalho = None) -> np.ndarray:
     """
     Calcula o torque tau(theta) no eixo da manivela, desconsiderando atrito.
     
@@ -191,61 +254,138 @@ def torque(theta: np.ndarray,
         omega                : velocidade angular (rad/s)
         F_VS_theta_range_deg : tupla (theta_min, theta_max) para aplicar F_VS,
                                ou None para aplicar em todo o intervalo
+        out, trabalho        : saída e temporários reaproveitáveis (opcionais)
     
     Retorna:
         tau : torque no eixo da manivela (N·m)
     """
-    theta = np.array(theta, dtype=float)
+    g = como_grade(theta)
+    ws = como_area(trabalho)
     
     # Aplicar F_VS somente no intervalo pedido (se fornecido)
     if F_VS_theta_range_deg is not None:
-        theta_min_deg, theta_max_deg = F_VS_theta_range_deg
-        theta_deg = np.rad2deg(theta)
-        mask = (theta_deg >= theta_min_deg) & (theta_deg <= theta_max_deg)
-        
-        F_VS_arr = np.zeros_like(theta)
-        if np.isscalar(F_VS):
-            F_VS_arr[mask] = F_VS
-        else:
-            F_VS_arr[mask] = F_VS[mask]
+        mask = g.faixa(*F_VS_theta_range_deg)
+        F_VS_arr = ws('torque.F_VS', g.shape)
+        F_VS_arr.fill(0.0)
+        np.copyto(F_VS_arr, F_VS, where=mask)
     else:
-        if np.isscalar(F_VS):
-            F_VS_arr = np.full_like(theta, F_VS)
-        else:
-            F_VS_arr = F_VS
+        # escalar ou array: entra por broadcasting em F_B,y
+        F_VS_arr = F_VS
     
-    # 1) Aceleração da ponta da haste
-    aB = y_ddot_theta(theta, r, L, omega)
+    forma = forma_saida(g, r, L, omega, F_VS_arr)
+    tau = np.empty(forma) if out is None else out
     
-    # 2) Força vertical no pino B (biela na haste)
-    F_B_y = m_haste * aB - P_haste + F_VS_arr
+    # 1-6) Forças no pino B (F_B) e no pino A (F_M)
+    _, F_M = forcas_FB_FM(g, r, L, h, m_haste, m_biela, P_haste, P_biela,
+                          F_VS_arr, omega,
+                          out=(ws('torque.F_B', forma), ws('torque.F_M', forma)),
+                          trabalho=ws)
     
-    # 3) cos(beta) para projetar
-    s = np.sin(theta)
-    inside = L**2 - r**2 * s**2
-    root = np.sqrt(inside)
-    cos_beta = root / L
+    # 7) Ângulo entre manivela e biela: phi = theta - beta
+    #    sin(phi) = sin theta · cos beta - cos theta · sin beta
+    cos_beta, sin_beta = _cos_sin_beta(g, r, L, ws('torque.cos', forma), ws('torque.sin', forma))
+    np.multiply(g.sin, cos_beta, out=tau)
+    sin_beta *= g.cos
+    tau -= sin_beta
     
-    # Força axial na biela no pino B (módulo)
-    F_B = F_B_y / cos_beta
+    # 8) Torque: tau = r * F_M * sin(phi)
+    tau *= F_M
+    tau *= r
     
-    # 4) Componente da aceleração do CG da biela ao longo dela
-    a_b_par = a_biela_parallel(theta, r, L, h, omega)
+    return resultado(tau, out)
+
+
+# ========================================================================
+# BASES DE TORQUE (independentes de omega, massas e F_VS)
+# ========================================================================
+
+BASES_TORQUE = ('aB', 'a_par', 'cos_beta', 'cos_ang', 'sin_phi')
+
+
+def bases_torque(theta: np.ndarray, r: float, L: float, h: float,
+                 out: dict = None, trabalho: AreaTrabalho = None) -> dict:
+    """
+    Termos puramente geométricos das forças e do torque.
     
-    # 5) Componente do peso da biela ao longo dela
-    beta = beta_theta(theta, r, L)
-    P_b_par = P_biela * np.cos(beta)
+    As acelerações são lineares em omega², então podem ser guardadas
+    normalizadas e reaproveitadas para qualquer omega, massa ou F_VS
+    (ver torque_de_bases).
     
-    # 6) Força que a manivela faz na biela no pino A (ao longo da biela)
-    F_M = m_biela * a_b_par - F_B - P_b_par
+    Parâmetros:
+        theta    : array em radianos
+        r, L, h  : geometria em metros
+        out      : dict com os arrays de BASES_TORQUE já alocados (opcional)
+        trabalho : AreaTrabalho para os temporários (opcional)
     
-    # 7) Ângulo entre manivela e biela: phi = theta - beta
-    phi = theta - beta
+    Retorna:
+        dict com arrays:
+            'aB'       : y¨(theta) / omega²
+            'a_par'    : a_biela,|| / omega²
+            'cos_beta' : projeção da força axial da biela na vertical
+            'cos_ang'  : cos(beta), projeção do peso da biela
+            'sin_phi'  : sin(theta - beta)
+    """
+    g = como_grade(theta)
+    ws = como_area(trabalho)
+    forma = forma_saida(g, r, L, h)
+    if out is None:
+        out = {nome: np.empty(forma) for nome in BASES_TORQUE}
+    
+    y_ddot_theta(g, r, L, 1.0, out=out['aB'], trabalho=ws)
+    a_biela_parallel(g, r, L, h, 1.0, out=out['a_par'], trabalho=ws)
+    cos_beta, sin_beta = _cos_sin_beta(g, r, L, out['cos_beta'], ws('bases.sin', forma))
+    np.copyto(out['cos_ang'], cos_beta)
+    np.multiply(g.sin, cos_beta, out=out['sin_phi'])
+    sin_beta *= g.cos
+    out['sin_phi'] -= sin_beta
+    return out
+
+
+def torque_de_bases(bases: dict, r: float,
+                    m_haste: float, m_biela: float,
+                    P_haste: float, P_biela: float,
+                    F_VS_arr, omega: float,
+                    out: tuple = None, trabalho: AreaTrabalho = None) -> tuple:
+    """
+    Forças e torque a partir das bases geométricas (ver bases_torque).
     
-    # 8) Torque: tau = r * F_M * sin(phi)
-    tau = r * F_M * np.sin(phi)
+    Equivalente a forcas_FB_FM() + torque() sem recalcular a trigonometria.
+    
+    Parâmetros:
+        bases            : resultado de bases_torque()
+        r                : raio da manivela (m)
+        m_haste, m_biela : massas (kg)
+        P_haste, P_biela : pesos (N)
+        F_VS_arr         : força vertical do solo, escalar ou array (N)
+        omega            : velocidade angular (rad/s)
+        out              : tupla (F_B, F_M, tau) de arrays já alocados (opcional)
+        trabalho         : AreaTrabalho para os temporários (opcional)
     
-    return tau
+    Retorna:
+        (F_B, F_M, tau) : arrays de forças (N) e torque (N·m)
+    """
+    ws = como_area(trabalho)
+    w2 = omega**2
+    forma = np.broadcast_shapes(np.shape(bases['aB']), np.shape(w2), np.shape(F_VS_arr))
+    F_B, F_M, tau = tuple(np.empty(forma) for _ in range(3)) if out is None else out
+    
+    # F_B = (m_haste·aB·ω² - P_haste + F_VS) / cos_beta
+    np.multiply(bases['aB'], m_haste * w2, out=F_B)
+    F_B -= P_haste
+    F_B += F_VS_arr
+    F_B /= bases['cos_beta']
+    
+    # F_M = m_biela·a_par·ω² - F_B - P_biela·cos_ang
+    np.multiply(bases['a_par'], m_biela * w2, out=F_M)
+    F_M -= F_B
+    t = ws('torque_de_bases.t', np.shape(bases['cos_ang']))
+    np.multiply(bases['cos_ang'], P_biela, out=t)
+    F_M -= t
+    
+    # tau = r·F_M·sin_phi
+    np.multiply(F_M, bases['sin_phi'], out=tau)
+    tau *= r
+    return resultado(F_B, out), resultado(F_M, out), resultado(tau, out)
 
 
 # ========================================================================
@@ -253,7 +393,8 @@ def torque(theta: np.ndarray,
 # ========================================================================
 
 def construir_F_VS_variavel(theta_deg: np.ndarray, r: float, L: float, h: float,
-                            altura_centro: float) -> tuple:
+                            altura_centro: float, y_solo_mm: np.ndarray = None,
+                            out: np.ndarray = None, trabalho: AreaTrabalho = None) -> tuple:
     """
     Constrói F_VS(θ) variável por partes, conforme modelo do solo.
     
@@ -262,24 +403,38 @@ def construir_F_VS_variavel(theta_deg: np.ndarray, r: float, L: float, h: float,
              = 0             fora desse intervalo
     
     Parâmetros:
-        theta_deg     : array de ângulos em graus
+        theta_deg     : array de ângulos em graus (ou ThetaGrid)
         r, L, h       : geometria (mm)
         altura_centro : altura do centro da manivela (mm)
+        y_solo_mm     : posição da haste em relação ao solo já calculada na
+                        mesma malha (mm), ex: cin.y_solo_mm; calculada se None
+        out, trabalho : saída (F_VS) e temporários reaproveitáveis (opcionais)
     
     Retorna:
         (F_VS_array, F_max, theta_pico, info_dict)
     """
-    # Converter para radianos e metros
-    theta_rad = np.deg2rad(theta_deg)
-    r_m = r / 1000.0
-    L_m = L / 1000.0
-    h_m = h / 1000.0
-    altura_m = altura_centro / 1000.0
-    
-    # Calcular posição em relação ao solo
-    y_m = y_theta(theta_rad, r_m, L_m, h_m)
-    y_solo_m = altura_m - y_m
-    y_mm = y_solo_m * 1000.0
+    if isinstance(theta_deg, ThetaGrid):
+        grade = theta_deg
+        theta_deg = grade.deg
+    else:
+        grade = ThetaGrid._temporaria(deg=theta_deg)
+    ws = como_area(trabalho)
+    
+    if y_solo_mm is not None:
+        y_mm = np.asarray(y_solo_mm, dtype=float)
+        if y_mm.shape != np.shape(theta_deg):
+            raise ValueError(f"y_solo_mm com forma {y_mm.shape}, esperado {np.shape(theta_deg)}.")
+    else:
+        # Converter para metros
+        r_m = r / 1000.0
+        L_m = L / 1000.0
+        h_m = h / 1000.0
+        altura_m = altura_centro / 1000.0
+        
+        # Calcular posição em relação ao solo
+        y_mm = y_theta(grade, r_m, L_m, h_m, out=ws('F_VS.y', grade.shape), trabalho=ws)
+        np.subtract(altura_m, y_mm, out=y_mm)
+        y_mm *= 1000.0
     
     # Constantes
     THETA_INICIO = 123.28
@@ -287,11 +442,12 @@ def construir_F_VS_variavel(theta_deg: np.ndarray, r: float, L: float, h: float,
     Y_ALVO_MM = -47.15
     
     # Encontrar θ onde y(θ) = Y_ALVO_MM
-    mask_intervalo = (theta_deg >= THETA_INICIO) & (theta_deg <= THETA_FIM)
-    idx_candidatos = np.where(mask_intervalo & (y_mm <= Y_ALVO_MM))[0]
+    mascara = ws('F_VS.mascara', grade.shape, bool)
+    np.less_equal(y_mm, Y_ALVO_MM, out=mascara)
+    mascara &= grade.faixa(THETA_INICIO, THETA_FIM)
     
-    if len(idx_candidatos) > 0:
-        idx_pico = idx_candidatos[0]
+    if mascara.any():
+        idx_pico = mascara.argmax()
         theta_pico_deg = theta_deg[idx_pico]
     else:
         theta_pico_deg = THETA_FIM
@@ -301,19 +457,24 @@ def construir_F_VS_variavel(theta_deg: np.ndarray, r: float, L: float, h: float,
     k = 134.10 * 6.17 * np.pi * (25.4 / 94.3)**2 / 1000.0
     
     # Construir F_VS
-    F_VS_full = np.zeros_like(theta_deg, dtype=float)
-    F_eq = k * (y_mm**2)
+    F_VS_full = np.empty(grade.shape) if out is None else out
+    F_VS_full.fill(0.0)
+    F_eq = ws('F_VS.F_eq', grade.shape)
+    np.square(y_mm, out=F_eq)
+    F_eq *= k
     
     # Parte crescente
-    mask_cresc = (theta_deg >= THETA_INICIO) & (theta_deg <= theta_pico_deg)
-    F_VS_full[mask_cresc] = F_eq[mask_cresc]
+    mask_cresc = np.less_equal(theta_deg, theta_pico_deg, out=mascara)
+    mask_cresc &= grade.faixa(THETA_INICIO, np.inf)
+    np.copyto(F_VS_full, F_eq, where=mask_cresc)
     
     # Valor máximo constante
     F_max_const = k * (Y_ALVO_MM**2)
     
     # Parte constante
-    mask_const = (theta_deg > theta_pico_deg) & (theta_deg <= THETA_FIM)
-    F_VS_full[mask_const] = F_max_const
+    mask_const = np.greater(theta_deg, theta_pico_deg, out=mascara)
+    mask_const &= grade.faixa(-np.inf, THETA_FIM)
+    np.copyto(F_VS_full, F_max_const, where=mask_const)
     
     info = {
         'theta_inicio': THETA_INICIO,
@@ -331,14 +492,48 @@ def construir_F_VS_variavel(theta_deg: np.ndarray, r: float, L: float, h: float,
 # FUNÇÕES AUXILIARES
 # ========================================================================
 
+class ResultadoForcas(ResultadoPreguicoso):
+    """
+    Forças e torque calculados sob demanda (ver calcular_forcas_completas).
+    
+    As bases geométricas (bases_torque) são o intermediário comum: são
+    calculadas no primeiro acesso a F_B, F_M ou torque, e as três
+    grandezas saem juntas de torque_de_bases().
+    """
+    
+    __slots__ = ('_grade', '_geometria', '_dinamica')
+    
+    CAMPOS = ('theta_deg', 'theta_rad', 'F_B', 'F_M', 'torque')
+    
+    def __init__(self, grade: ThetaGrid, r, L, h, m_haste, m_biela, g, F_VS, omega):
+        super().__init__()
+        self._grade = grade
+        self._geometria = (r, L, h)
+        self._dinamica = (m_haste, m_biela, m_haste * g, m_biela * g, F_VS, omega)
+    
+    def _calcular(self, nome: str):
+        g = self._grade
+        if nome == 'theta_deg':
+            self._guardar(theta_deg=g.deg)
+        elif nome == 'theta_rad':
+            self._guardar(theta_rad=g.rad)
+        else:
+            bases = self._intermediario('bases', lambda: bases_torque(g, *self._geometria))
+            F_B, F_M, tau = torque_de_bases(bases, self._geometria[0], *self._dinamica)
+            self._guardar(F_B=F_B, F_M=F_M, torque=tau)
+
+
 def calcular_forcas_completas(theta_deg: np.ndarray, r: float, L: float, h: float,
                               m_haste: float, m_biela: float, g: float,
-                              F_VS: np.ndarray, omega: float) -> dict:
+                              F_VS: np.ndarray, omega: float) -> ResultadoForcas:
     """
-    Calcula todas as forças e torque de uma vez.
+    Forças e torque sob demanda.
+    
+    Nada é calculado aqui: as grandezas são calculadas no primeiro acesso
+    (ver ResultadoForcas).
     
     Parâmetros:
-        theta_deg        : array de ângulos em graus
+        theta_deg        : array de ângulos em graus (ou ThetaGrid)
         r, L, h          : geometria (m)
         m_haste, m_biela : massas (kg)
         g                : aceleração da gravidade (m/s²)
@@ -346,23 +541,8 @@ def calcular_forcas_completas(theta_deg: np.ndarray, r: float, L: float, h: floa
         omega            : velocidade angular (rad/s)
     
     Retorna:
-        dict com arrays: 'F_B', 'F_M', 'torque'
+        ResultadoForcas, acessado como dict: 'theta_deg', 'theta_rad',
+        'F_B', 'F_M', 'torque'
     """
-    theta_rad = np.deg2rad(theta_deg)
-    
-    P_haste = m_haste * g
-    P_biela = m_biela * g
-    
-    F_B, F_M = forcas_FB_FM(theta_rad, r, L, h, m_haste, m_biela, 
-                            P_haste, P_biela, F_VS, omega)
-    
-    tau = torque(theta_rad, r, L, h, m_haste, m_biela, 
-                 P_haste, P_biela, F_VS, omega)
-    
-    return {
-        'theta_deg': theta_deg,
-        'theta_rad': theta_rad,
-        'F_B': F_B,
-        'F_M': F_M,
-        'torque': tau
-    }
+    grade = theta_deg if isinstance(theta_deg, ThetaGrid) else ThetaGrid.de_graus(theta_deg)
+    return ResultadoForcas(grade, r, L, h, m_haste, m_biela, g, F_VS, omega)
@@ -0,0 +1,202 @@
+"""
+Módulo de Malha de Ângulos.
+
+ThetaGrid guarda uma malha de ângulos da manivela (graus e radianos) e
+calcula sob demanda, uma única vez, os termos trigonométricos usados pelas
+funções de cinemática e de forças. Como esses termos só dependem da
+malha, varreduras com milhares de geometrias sobre a mesma malha não
+recalculam nenhum seno ou cosseno.
+
+Todas as funções de core.cinematica e core.forcas_torque que recebem
+`theta` (radianos) aceitam também um ThetaGrid.
+
+AreaTrabalho guarda os arrays temporários dessas funções (argumento
+`trabalho=`). Junto com `out=`, permite repetir uma avaliação em laço sem
+alocar memória a cada iteração.
+"""
+
+import numpy as np
+
+
+class ThetaGrid:
+    """
+    Malha de ângulos com termos trigonométricos em cache.
+
+    Parâmetros:
+        rad : ângulos em radianos
+        deg : ângulos em graus (informe um dos dois)
+
+    Atributos (calculados no primeiro acesso, somente leitura):
+        rad, deg        : ângulos
+        sin, cos        : sin θ, cos θ
+        sin2, cos2      : sin 2θ, cos 2θ
+        sin_quad        : sin² θ
+    """
+
+    __slots__ = ('_rad', '_deg', '_cache')
+
+    def __init__(self, rad=None, deg=None):
+        if (rad is None) == (deg is None):
+            raise ValueError("Informe 'rad' ou 'deg' (exatamente um).")
+        self._rad = None if rad is None else self._congelar(np.array(rad, dtype=float))
+        self._deg = None if deg is None else self._congelar(np.array(deg, dtype=float))
+        self._cache = {}
+
+    @classmethod
+    def _temporaria(cls, rad=None, deg=None) -> "ThetaGrid":
+        """Malha sobre o array do chamador, sem cópia (uso interno de uma chamada)."""
+        grade = cls.__new__(cls)
+        grade._rad = None if rad is None else np.asarray(rad, dtype=float)
+        grade._deg = None if deg is None else np.asarray(deg, dtype=float)
+        grade._cache = {}
+        return grade
+
+    @classmethod
+    def de_graus(cls, theta_deg) -> "ThetaGrid":
+        return cls(deg=theta_deg)
+
+    @classmethod
+    def de_radianos(cls, theta_rad) -> "ThetaGrid":
+        return cls(rad=theta_rad)
+
+    @staticmethod
+    def _congelar(arr: np.ndarray) -> np.ndarray:
+        if isinstance(arr, np.ndarray):  # escalares numpy já são imutáveis
+            arr.flags.writeable = False
+        return arr
+
+    def _termo(self, nome: str, calcular):
+        valor = self._cache.get(nome)
+        if valor is None:
+            valor = self._cache[nome] = self._congelar(calcular())
+        return valor
+
+    # --------------------------------------------------------------------
+    # Ângulos
+    # --------------------------------------------------------------------
+
+    @property
+    def rad(self) -> np.ndarray:
+        if self._rad is None:
+            self._rad = self._congelar(np.deg2rad(self._deg))
+        return self._rad
+
+    @property
+    def deg(self) -> np.ndarray:
+        if self._deg is None:
+            self._deg = self._congelar(np.rad2deg(self._rad))
+        return self._deg
+
+    # --------------------------------------------------------------------
+    # Termos trigonométricos
+    # --------------------------------------------------------------------
+
+    @property
+    def sin(self) -> np.ndarray:
+        return self._termo('sin', lambda: np.sin(self.rad))
+
+    @property
+    def cos(self) -> np.ndarray:
+        return self._termo('cos', lambda: np.cos(self.rad))
+
+    @property
+    def sin2(self) -> np.ndarray:
+        return self._termo('sin2', lambda: np.sin(2 * self.rad))
+
+    @property
+    def cos2(self) -> np.ndarray:
+        return self._termo('cos2', lambda: np.cos(2 * self.rad))
+
+    @property
+    def sin_quad(self) -> np.ndarray:
+        return self._termo('sin_quad', lambda: self.sin**2)
+
+    def faixa(self, theta_min_deg: float, theta_max_deg: float) -> np.ndarray:
+        """Máscara theta_min_deg <= θ <= theta_max_deg (graus), em cache por faixa."""
+        return self._termo(('faixa', float(theta_min_deg), float(theta_max_deg)),
+                           lambda: (self.deg >= theta_min_deg) & (self.deg <= theta_max_deg))
+
+    # --------------------------------------------------------------------
+    # Protocolo de array
+    # --------------------------------------------------------------------
+
+    @property
+    def shape(self) -> tuple:
+        return (self._rad if self._rad is not None else self._deg).shape
+
+    def __len__(self) -> int:
+        return len(self._rad if self._rad is not None else self._deg)
+
+    def __array__(self, dtype=None, copy=None):
+        # np.asarray(grade) devolve os ângulos em radianos
+        return self.rad if dtype is None else self.rad.astype(dtype)
+
+    def __repr__(self) -> str:
+        deg = self.deg
+        return f"ThetaGrid({len(self)} pontos, {deg.min():g}° a {deg.max():g}°)" if deg.size else "ThetaGrid(vazia)"
+
+
+def como_grade(theta) -> ThetaGrid:
+    """
+    ThetaGrid de `theta`: o próprio objeto, ou uma malha temporária
+    (radianos) quando `theta` é um array ou escalar.
+    """
+    if isinstance(theta, ThetaGrid):
+        return theta
+    return ThetaGrid._temporaria(rad=theta)
+
+
+# ========================================================================
+# ÁREA DE TRABALHO
+# ========================================================================
+
+class AreaTrabalho:
+    """
+    Arrays temporários reaproveitados entre chamadas das funções de core.
+
+    Cada buffer é identificado por (nome, forma, dtype) e alocado uma única
+    vez; chamadas seguintes com a mesma malha e geometria reutilizam a
+    mesma memória. Os buffers são sobrescritos a cada chamada, então uma
+    AreaTrabalho não deve ser compartilhada entre threads.
+    """
+
+    __slots__ = ('_buffers',)
+
+    def __init__(self):
+        self._buffers = {}
+
+    def __call__(self, nome: str, forma: tuple, dtype=float) -> np.ndarray:
+        chave = (nome, forma, dtype)
+        buf = self._buffers.get(chave)
+        if buf is None:
+            buf = self._buffers[chave] = np.empty(forma, dtype=dtype)
+        return buf
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(b.nbytes for b in self._buffers.values())
+
+    def limpar(self):
+        self._buffers.clear()
+
+
+def como_area(trabalho) -> AreaTrabalho:
+    """A própria AreaTrabalho, ou uma nova (descartada ao fim da chamada) se None."""
+    return trabalho if trabalho is not None else AreaTrabalho()
+
+
+def resultado(arr: np.ndarray, out):
+    """
+    Valor devolvido pelos kernels: o próprio `out`, se informado; senão
+    `arr`, ou um escalar NumPy (np.float64) quando a forma é () (theta e
+    parâmetros escalares), como nas versões sem malha.
+    """
+    return arr if out is not None or arr.ndim else arr[()]
+
+
+def forma_saida(grade: ThetaGrid, *parametros) -> tuple:
+    """Forma do resultado: malha combinada (broadcasting) com os parâmetros."""
+    return np.broadcast_shapes(grade.shape, *(np.shape(p) for p in parametros))
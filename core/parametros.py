@@ -0,0 +1,302 @@
+"""
+Módulo de Parâmetros Tipados do Dosador de Sementes.
+
+Contém objetos imutáveis (e hasheáveis) para as culturas e para os
+parâmetros do mecanismo, validados uma única vez no carregamento.
+Ambos podem ser convertidos em arrays estruturados do NumPy, para que
+um catálogo inteiro seja passado a kernels vetorizados ou usado como
+chave de cache.
+"""
+
+from dataclasses import dataclass, astuple, fields
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+
+from .espacamento import sementes_por_metro
+from .cinematica import velocidade_angular
+
+
+# Número máximo de opções de espaçamento entre linhas guardadas no array
+# estruturado (posições não usadas ficam com NaN)
+MAX_ESPACAMENTOS = 4
+
+DTYPE_CULTURA = np.dtype([
+    ('nome', 'U32'),
+    ('espacamentos_m', 'f8', (MAX_ESPACAMENTOS,)),
+    ('densidade_min', 'f8'),
+    ('densidade_max', 'f8'),
+    ('densidade_passo', 'f8'),
+    ('velocidade_min_kmh', 'f8'),
+    ('velocidade_max_kmh', 'f8'),
+    ('velocidade_passo_kmh', 'f8'),
+    ('germinacao_min', 'f8'),
+    ('germinacao_max', 'f8'),
+    ('germinacao_passo', 'f8'),
+])
+
+DTYPE_MECANISMO = np.dtype([
+    ('r_mm', 'f8'),
+    ('L_mm', 'f8'),
+    ('h_mm', 'f8'),
+    ('altura_centro_mm', 'f8'),
+    ('m_haste_kg', 'f8'),
+    ('m_biela_kg', 'f8'),
+    ('g', 'f8'),
+])
+
+
+# ========================================================================
+# CULTURA
+# ========================================================================
+
+@dataclass(frozen=True, slots=True)
+class Cultura:
+    """
+    Dados de plantio de uma cultura (equivalente a uma entrada de culturas.yaml).
+
+    Atributos:
+        nome                 : nome normalizado (sem acentos, minúsculas)
+        espacamentos_m       : opções de espaçamento entre linhas (m)
+        densidade_min/max    : densidade de plantio (plantas/ha)
+        densidade_passo      : passo da densidade (plantas/ha)
+        velocidade_min/max_kmh : velocidade de plantio (km/h)
+        velocidade_passo_kmh : passo da velocidade (km/h)
+        germinacao_min/max   : taxa de germinação (fração 0-1)
+        germinacao_passo     : passo da germinação (fração)
+    """
+    nome: str
+    espacamentos_m: Tuple[float, ...]
+    densidade_min: float
+    densidade_max: float
+    densidade_passo: float
+    velocidade_min_kmh: float
+    velocidade_max_kmh: float
+    velocidade_passo_kmh: float
+    germinacao_min: float
+    germinacao_max: float
+    germinacao_passo: float
+
+    def __post_init__(self):
+        if not self.nome:
+            raise ValueError("Cultura sem nome.")
+        if len(self.espacamentos_m) > MAX_ESPACAMENTOS:
+            raise ValueError(f"Cultura '{self.nome}': no máximo {MAX_ESPACAMENTOS} "
+                             f"opções de espaçamento entre linhas.")
+        if any(e <= 0 for e in self.espacamentos_m):
+            raise ValueError(f"Cultura '{self.nome}': espaçamentos devem ser positivos.")
+        for campo, vmin, vmax in (
+            ("plant_density_per_hectare", self.densidade_min, self.densidade_max),
+            ("planting_speed_kmh", self.velocidade_min_kmh, self.velocidade_max_kmh),
+            ("germination_rate", self.germinacao_min, self.germinacao_max),
+        ):
+            if not (0 < vmin <= vmax):
+                raise ValueError(f"Cultura '{self.nome}': bloco '{campo}' precisa ter "
+                                 f"0 < min <= max (recebido {vmin}, {vmax}).")
+        if self.germinacao_max > 1:
+            raise ValueError(f"Cultura '{self.nome}': germinação deve estar entre 0 e 1.")
+
+    @classmethod
+    def de_dict(cls, nome: str, dados: dict) -> "Cultura":
+        """
+        Cria uma Cultura a partir de uma entrada de carregar_culturas().
+
+        Parâmetros:
+            nome  : nome da cultura
+            dados : dict com 'row_spacing_m', 'plant_density_per_hectare',
+                    'planting_speed_kmh' e 'germination_rate'
+
+        Retorna:
+            Cultura validada
+        """
+        def bloco(chave):
+            b = dados.get(chave, {})
+            if not isinstance(b, dict) or not all(k in b for k in ("min", "max")):
+                raise ValueError(f"Cultura '{nome}': bloco '{chave}' precisa ter chaves 'min' e 'max'.")
+            return float(b["min"]), float(b["max"]), float(b.get("step", 0.0))
+
+        dens = bloco("plant_density_per_hectare")
+        vel = bloco("planting_speed_kmh")
+        germ = list(bloco("germination_rate"))
+
+        # Normaliza germinação para fração (caso venha em %)
+        for i in range(3):
+            if germ[i] > 1:
+                germ[i] /= 100.0
+
+        return cls(
+            nome=nome,
+            espacamentos_m=tuple(float(x) for x in dados.get("row_spacing_m", ())),
+            densidade_min=dens[0], densidade_max=dens[1], densidade_passo=dens[2],
+            velocidade_min_kmh=vel[0], velocidade_max_kmh=vel[1], velocidade_passo_kmh=vel[2],
+            germinacao_min=germ[0], germinacao_max=germ[1], germinacao_passo=germ[2],
+        )
+
+    @property
+    def sementes_por_metro(self) -> float:
+        """Número de sementes por metro linear."""
+        return sementes_por_metro(self.densidade_min, self.densidade_max,
+                                  self.germinacao_min, self.germinacao_max)
+
+    def omega(self, vt_kmh: float = None) -> float:
+        """
+        Velocidade angular da manivela (rad/s).
+
+        Parâmetros:
+            vt_kmh : velocidade do trator (km/h); usa a máxima da cultura se None
+        """
+        if vt_kmh is None:
+            vt_kmh = self.velocidade_max_kmh
+        return velocidade_angular(vt_kmh, self.sementes_por_metro)
+
+    def para_registro(self) -> np.ndarray:
+        """Converte a cultura em um array estruturado de 1 elemento (DTYPE_CULTURA)."""
+        return catalogo_para_array([self])
+
+
+def catalogo_para_array(culturas: Iterable[Cultura]) -> np.ndarray:
+    """
+    Converte um catálogo de culturas em um array estruturado contíguo.
+
+    Parâmetros:
+        culturas : iterável de Cultura (ou dict nome -> Cultura)
+
+    Retorna:
+        array com dtype DTYPE_CULTURA, um registro por cultura
+    """
+    if isinstance(culturas, dict):
+        culturas = culturas.values()
+    culturas = list(culturas)
+
+    arr = np.zeros(len(culturas), dtype=DTYPE_CULTURA)
+    max_nome = DTYPE_CULTURA['nome'].itemsize // 4
+    for i, c in enumerate(culturas):
+        # O numpy truncaria o nome em silêncio, mudando a chave do catálogo
+        if len(c.nome) > max_nome:
+            raise ValueError(f"Nome de cultura com mais de {max_nome} caracteres: '{c.nome}'.")
+        espac = np.full(MAX_ESPACAMENTOS, np.nan)
+        espac[:len(c.espacamentos_m)] = c.espacamentos_m
+        arr[i] = (c.nome, espac, c.densidade_min, c.densidade_max, c.densidade_passo,
+                  c.velocidade_min_kmh, c.velocidade_max_kmh, c.velocidade_passo_kmh,
+                  c.germinacao_min, c.germinacao_max, c.germinacao_passo)
+    return arr
+
+
+def array_para_catalogo(arr: np.ndarray) -> Dict[str, Cultura]:
+    """
+    Operação inversa de catalogo_para_array.
+
+    Retorna:
+        dict nome -> Cultura
+    """
+    out = {}
+    for reg in arr:
+        espac = tuple(float(x) for x in reg['espacamentos_m'] if not np.isnan(x))
+        out[str(reg['nome'])] = Cultura(
+            str(reg['nome']), espac,
+            *(float(reg[c]) for c in DTYPE_CULTURA.names[2:])
+        )
+    return out
+
+
+# ========================================================================
+# MECANISMO
+# ========================================================================
+
+@dataclass(frozen=True, slots=True)
+class ParametrosMecanismo:
+    """
+    Geometria e massas do mecanismo biela-manivela.
+
+    Atributos:
+        r_mm             : raio da manivela (mm)
+        L_mm             : comprimento da biela (mm)
+        h_mm             : offset vertical da haste (mm)
+        altura_centro_mm : altura do centro da manivela em relação ao solo (mm)
+        m_haste_kg       : massa da haste (kg)
+        m_biela_kg       : massa da biela (kg)
+        g                : aceleração da gravidade (m/s²)
+    """
+    r_mm: float = 84.01
+    L_mm: float = 210.0
+    h_mm: float = 347.46
+    altura_centro_mm: float = 591.47
+    m_haste_kg: float = 1.16094
+    m_biela_kg: float = 0.75022
+    g: float = 9.81
+
+    def __post_init__(self):
+        for f in fields(self):
+            valor = getattr(self, f.name)
+            if not isinstance(valor, (int, float)) or isinstance(valor, bool):
+                raise ValueError(f"Parâmetro '{f.name}' deve ser numérico (recebido {valor!r}).")
+            # Converte inteiros para float sem quebrar o frozen
+            object.__setattr__(self, f.name, float(valor))
+        if self.r_mm <= 0 or self.L_mm <= 0:
+            raise ValueError("r e L devem ser positivos.")
+        if self.L_mm <= self.r_mm:
+            raise ValueError(f"Biela (L={self.L_mm} mm) deve ser maior que a manivela "
+                             f"(r={self.r_mm} mm).")
+        if self.m_haste_kg < 0 or self.m_biela_kg < 0:
+            raise ValueError("Massas não podem ser negativas.")
+
+    # Geometria em metros (usada pelo módulo de forças)
+    @property
+    def r_m(self) -> float:
+        return self.r_mm / 1000.0
+
+    @property
+    def L_m(self) -> float:
+        return self.L_mm / 1000.0
+
+    @property
+    def h_m(self) -> float:
+        return self.h_mm / 1000.0
+
+    @property
+    def P_haste(self) -> float:
+        """Peso da haste (N)."""
+        return self.m_haste_kg * self.g
+
+    @property
+    def P_biela(self) -> float:
+        """Peso da biela (N)."""
+        return self.m_biela_kg * self.g
+
+    @property
+    def geometria_mm(self) -> Tuple[float, float, float, float]:
+        """Tupla (r, L, h, altura_centro) em mm."""
+        return self.r_mm, self.L_mm, self.h_mm, self.altura_centro_mm
+
+    @classmethod
+    def de_config(cls, config: dict) -> "ParametrosMecanismo":
+        """
+        Cria os parâmetros a partir do dicionário de config.yaml (seção 'mechanics').
+
+        Chaves ausentes usam os valores padrão do projeto.
+        """
+        mec = config.get("mechanics", {}) if config else {}
+        mapa = {
+            "crank_radius_mm": "r_mm",
+            "rod_length_mm": "L_mm",
+            "offset_h_mm": "h_mm",
+            "center_height_mm": "altura_centro_mm",
+            "punch_mass_kg": "m_haste_kg",
+            "rod_mass_kg": "m_biela_kg",
+            "gravity_ms2": "g",
+        }
+        kwargs = {campo: mec[chave] for chave, campo in mapa.items() if chave in mec}
+        return cls(**kwargs)
+
+    def para_registro(self) -> np.ndarray:
+        """Converte os parâmetros em um array estruturado de 1 elemento."""
+        return np.array([astuple(self)], dtype=DTYPE_MECANISMO)
+
+
+def mecanismos_para_array(parametros: Iterable[ParametrosMecanismo]) -> np.ndarray:
+    """
+    Converte uma coleção de parâmetros em um array estruturado contíguo.
+
+    Útil para varreduras: cada coluna (ex: arr['r_mm']) é um vetor contíguo.
+    """
+    return np.array([astuple(p) for p in parametros], dtype=DTYPE_MECANISMO)
@@ -0,0 +1,83 @@
+"""
+Módulo de Resultados Calculados sob Demanda.
+
+ResultadoPreguicoso é a base dos objetos devolvidos por
+calcular_cinematica_completa() e calcular_forcas_completas(). Cada
+grandeza só é calculada no primeiro acesso, e os resultados
+intermediários (malha, bases geométricas) são calculados uma única vez e
+compartilhados entre as grandezas.
+
+O objeto se comporta como um dict somente leitura (res['torque'],
+dict(res), res.keys()) e também aceita acesso por atributo
+(res.torque). Os arrays devolvidos não são cópias: são marcados como
+somente leitura e compartilhados entre os acessos.
+"""
+
+from collections.abc import Mapping
+
+import numpy as np
+
+
+class ResultadoPreguicoso(Mapping):
+    """
+    Mapeamento somente leitura com valores calculados no primeiro acesso.
+
+    Subclasses definem CAMPOS (nomes públicos, na ordem de iteração) e
+    _calcular(nome), que deve guardar o valor pedido com _guardar()
+    (podendo guardar outros calculados junto).
+    """
+
+    __slots__ = ('_valores',)
+
+    CAMPOS: tuple = ()
+
+    def __init__(self):
+        self._valores = {}
+
+    def _calcular(self, nome: str):
+        raise NotImplementedError
+
+    def _guardar(self, **valores):
+        for nome, valor in valores.items():
+            if isinstance(valor, np.ndarray):
+                valor.flags.writeable = False
+            self._valores[nome] = valor
+
+    def _intermediario(self, nome: str, calcular):
+        """Valor interno (não listado em CAMPOS) calculado uma única vez."""
+        if nome not in self._valores:
+            self._valores[nome] = calcular()
+        return self._valores[nome]
+
+    # --------------------------------------------------------------------
+    # Protocolo de Mapping
+    # --------------------------------------------------------------------
+
+    def __getitem__(self, nome: str):
+        if nome not in self.CAMPOS:
+            raise KeyError(nome)
+        if nome not in self._valores:
+            self._calcular(nome)
+        return self._valores[nome]
+
+    def __iter__(self):
+        return iter(self.CAMPOS)
+
+    def __len__(self) -> int:
+        return len(self.CAMPOS)
+
+    def __contains__(self, nome) -> bool:
+        return nome in self.CAMPOS
+
+    def __getattr__(self, nome: str):
+        # Chamado só quando o atributo não existe: res.torque == res['torque']
+        if nome in type(self).CAMPOS:
+            return self[nome]
+        raise AttributeError(f"'{type(self).__name__}' não tem o atributo '{nome}'")
+
+    def calculados(self) -> tuple:
+        """Campos já calculados (na ordem de CAMPOS)."""
+        return tuple(nome for nome in self.CAMPOS if nome in self._valores)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(calculados={list(self.calculados())})"
@@ -0,0 +1,323 @@
+"""
+Módulo de Sessão de Análise.
+
+Uma SessaoAnalise concentra o conjunto de parâmetros do mecanismo, os
+caches de resultados intermediários e as configurações de saída. Cada
+requisição pode criar a sua própria sessão; os métodos não alteram
+estado global e podem ser chamados de várias threads ao mesmo tempo.
+"""
+
+from dataclasses import replace
+from typing import Callable, Dict, Hashable
+
+import numpy as np
+
+from . import cinematica as cin
+from . import energia
+from . import forcas_torque as ft
+from .grade import ThetaGrid
+from .parametros import Cultura, ParametrosMecanismo
+from utils.cache import CacheLRU, chave_geometria, malha_fixa
+from utils.perfil import etapa, perfilar
+
+
+# Malhas de ângulos padrão (graus) usadas pelas análises do menu
+THETA_CINEMATICA_DEG = malha_fixa(np.arange(0.0, 361.0, 1.0))
+THETA_TORQUE_DEG = malha_fixa(np.linspace(0.0, 360.0, 361))
+
+
+class SessaoAnalise:
+    """
+    Sessão de análise thread-safe.
+
+    Parâmetros:
+        parametros : ParametrosMecanismo (usa o padrão do projeto se None)
+        output_dir : diretório de saída dos gráficos
+        mostrar    : se True, exibe os gráficos
+        salvar     : se True, salva os gráficos
+        cache      : CacheLRU compartilhado de resultados (cria um novo se None)
+
+    Os parâmetros são imutáveis: para mudar a geometria use com_parametros(),
+    que devolve uma nova sessão (a original continua válida).
+    """
+
+    def __init__(self, parametros: ParametrosMecanismo = None,
+                 output_dir: str = 'output/images',
+                 mostrar: bool = False, salvar: bool = True,
+                 cache: CacheLRU = None):
+        self._parametros = parametros if parametros is not None else ParametrosMecanismo()
+        self.output_dir = output_dir
+        self.mostrar = mostrar
+        self.salvar = salvar
+        self._cache = cache if cache is not None else CacheLRU()
+
+    @property
+    def parametros(self) -> ParametrosMecanismo:
+        return self._parametros
+
+    def com_parametros(self, **alteracoes) -> "SessaoAnalise":
+        """
+        Retorna uma nova sessão com parâmetros alterados.
+
+        O cache é compartilhado, pois suas chaves incluem os parâmetros.
+        """
+        return SessaoAnalise(replace(self._parametros, **alteracoes),
+                             self.output_dir, self.mostrar, self.salvar,
+                             self._cache)
+
+    # --------------------------------------------------------------------
+    # Cache
+    # --------------------------------------------------------------------
+
+    def _memo(self, chave: Hashable, calcular: Callable):
+        """
+        Busca `chave` no cache ou calcula e armazena (ver CacheLRU).
+
+        O cálculo é medido como a etapa chave[0] (ver utils.perfil).
+        """
+        def medir():
+            with etapa(chave[0]):
+                return calcular()
+        return self._cache.obter_ou_calcular(chave, medir)
+
+    @property
+    def cache(self) -> CacheLRU:
+        return self._cache
+
+    def tamanho_cache(self) -> int:
+        """Número de resultados intermediários em cache."""
+        return len(self._cache)
+
+    def estatisticas_cache(self) -> dict:
+        """Acertos, falhas e ocupação do cache (ver CacheLRU.estatisticas)."""
+        return self._cache.estatisticas()
+
+    def limpar_cache(self):
+        self._cache.limpar()
+
+    # --------------------------------------------------------------------
+    # Análises
+    # --------------------------------------------------------------------
+
+    def grade(self, theta_deg: np.ndarray = THETA_CINEMATICA_DEG) -> ThetaGrid:
+        """ThetaGrid da malha (compartilhado por todas as geometrias)."""
+        return self._memo(chave_geometria('grade', theta_deg=theta_deg),
+                          lambda: ThetaGrid.de_graus(theta_deg))
+
+    def theta_solo(self) -> dict:
+        """Ângulos de contato com o solo da geometria atual (graus)."""
+        p = self._parametros
+        return self._memo(chave_geometria('theta_solo', *p.geometria_mm),
+                          lambda: cin.encontrar_theta_solo(*p.geometria_mm))
+
+    def posicao_solo(self, theta_deg: np.ndarray = THETA_CINEMATICA_DEG) -> np.ndarray:
+        """Posição da ponta da haste em relação ao solo (mm)."""
+        p = self._parametros
+        return self._memo(chave_geometria('y_solo', *p.geometria_mm, theta_deg=theta_deg),
+                          lambda: cin.y_solo_mm(self.grade(theta_deg), *p.geometria_mm))
+
+    def bases_cinematica(self, theta_deg: np.ndarray = THETA_CINEMATICA_DEG) -> dict:
+        """Cinemática normalizada por omega (ver cin.bases_cinematica)."""
+        p = self._parametros
+        return self._memo(chave_geometria('bases_cinematica', p.r_mm, p.L_mm, theta_deg=theta_deg),
+                          lambda: cin.bases_cinematica(self.grade(theta_deg), p.r_mm, p.L_mm))
+
+    def bases_torque(self, theta_deg: np.ndarray = THETA_TORQUE_DEG) -> dict:
+        """Termos geométricos de forças e torque (ver ft.bases_torque)."""
+        p = self._parametros
+        return self._memo(chave_geometria('bases_torque', p.r_m, p.L_m, p.h_m, theta_deg=theta_deg),
+                          lambda: ft.bases_torque(self.grade(theta_deg), p.r_m, p.L_m, p.h_m))
+
+    @perfilar('cinematica')
+    def cinematica(self, culturas: Dict[str, Cultura],
+                   theta_deg: np.ndarray = THETA_CINEMATICA_DEG,
+                   alpha: float = 0.0, beta: float = 0.0,
+                   omegas: Dict[str, float] = None) -> dict:
+        """
+        Cinemática da haste para cada cultura (por padrão, na velocidade máxima de plantio).
+
+        Parâmetros:
+            culturas  : dict nome -> Cultura
+            theta_deg : malha de ângulos (graus)
+            alpha     : aceleração angular da manivela (rad/s²)
+            beta      : derivada da aceleração angular (rad/s³)
+            omegas    : dict nome -> omega (rad/s) que substitui o da cultura;
+                        nomes presentes só aqui entram sem Cultura
+
+        Retorna:
+            dict com 'theta_deg', 'theta_solo', 'y_solo', 'omegas' e os dicts
+            'velocidades', 'aceleracoes', 'jerks' no formato de plot_cinematica
+        """
+        p = self._parametros
+        grade = self.grade(theta_deg)
+        bases = self.bases_cinematica(theta_deg)
+
+        velocidades, aceleracoes, jerks, omegas_usados = {}, {}, {}, {}
+        omegas = omegas or {}
+        for nome in {**culturas, **omegas}:
+            omega = omegas[nome] if nome in omegas else culturas[nome].omega()
+            rpm = cin.omega_rpm(omega)
+            omegas_usados[nome] = omega
+
+            if alpha == 0.0 and beta == 0.0:
+                v = bases['v'] * omega
+                a = bases['a'] * omega**2
+                j = bases['j'] * omega**3
+            else:
+                v = cin.velocidade(grade, omega, p.r_mm, p.L_mm)
+                a = cin.aceleracao(grade, omega, p.r_mm, p.L_mm, alpha)
+                j = cin.jerk(grade, omega, alpha, p.r_mm, p.L_mm, beta)
+
+            velocidades[nome] = {'velocidade': v, 'omega_rpm': rpm}
+            aceleracoes[nome] = {'aceleracao': a, 'omega_rpm': rpm}
+            jerks[nome] = {'jerk': j, 'omega_rpm': rpm}
+
+        return {
+            'theta_deg': theta_deg,
+            'theta_solo': self.theta_solo(),
+            'y_solo': self.posicao_solo(theta_deg),
+            'omegas': omegas_usados,
+            'velocidades': velocidades,
+            'aceleracoes': aceleracoes,
+            'jerks': jerks,
+        }
+
+    def modelo_F_VS(self, theta_deg: np.ndarray = THETA_TORQUE_DEG) -> tuple:
+        """Modelo F_VS variável da geometria atual (ver construir_F_VS_variavel)."""
+        p = self._parametros
+        y_mm = self.posicao_solo(theta_deg)
+        return self._memo(chave_geometria('F_VS', *p.geometria_mm, theta_deg=theta_deg),
+                          lambda: ft.construir_F_VS_variavel(theta_deg, *p.geometria_mm, y_solo_mm=y_mm))
+
+    def _F_VS(self, F_VS_config: dict, theta_deg: np.ndarray) -> tuple:
+        """Resolve F_VS_config em (F_VS, theta_range, info)."""
+        tipo = F_VS_config['tipo']
+        if tipo == 'zero':
+            return np.zeros_like(theta_deg, dtype=float), None, None
+        if tipo == 'constante':
+            return np.full_like(theta_deg, F_VS_config['valor'], dtype=float), None, None
+        if tipo == 'variavel':
+            F_VS, _, _, info = self.modelo_F_VS(theta_deg)
+            return F_VS, (info['theta_inicio'], info['theta_fim']), info
+        raise ValueError(f"Tipo de F_VS inválido: '{tipo}'. Use 'zero', 'constante' ou 'variavel'.")
+
+    @perfilar('torque')
+    def torque(self, omega: float, F_VS_config: dict,
+               theta_deg: np.ndarray = THETA_TORQUE_DEG) -> dict:
+        """
+        Forças e torque no eixo da manivela.
+
+        Parâmetros:
+            omega       : velocidade angular (rad/s)
+            F_VS_config : {'tipo': 'zero'} | {'tipo': 'constante', 'valor': N}
+                          | {'tipo': 'variavel'}
+            theta_deg   : malha de ângulos (graus)
+
+        Retorna:
+            dict com 'theta_deg', 'F_VS', 'F_B', 'F_M', 'torque', 'theta_range',
+            'info' (modelo F_VS ou None) e 'estatisticas'
+        """
+        p = self._parametros
+        F_VS, theta_range, info = self._F_VS(F_VS_config, theta_deg)
+
+        F_B, F_M, tau = ft.torque_de_bases(self.bases_torque(theta_deg), p.r_m,
+                                           p.m_haste_kg, p.m_biela_kg,
+                                           p.P_haste, p.P_biela, F_VS, omega)
+
+        return {
+            'theta_deg': theta_deg,
+            'omega': omega,
+            'F_VS': F_VS,
+            'F_B': F_B,
+            'F_M': F_M,
+            'torque': tau,
+            'theta_range': theta_range,
+            'info': info,
+            'estatisticas': estatisticas_torque(theta_deg, tau, F_B, F_M),
+        }
+
+    @perfilar('torque_lote')
+    def torque_lote(self, omegas, F_VS_config: dict,
+                    theta_deg: np.ndarray = THETA_TORQUE_DEG) -> list:
+        """
+        Forças e torque para várias velocidades em uma única avaliação.
+
+        As bases são combinadas com omega² em forma matricial (n_omega x n_theta),
+        o que equivale a chamar torque() para cada omega.
+
+        Retorna:
+            lista de dicts no formato de torque(), um por omega
+        """
+        p = self._parametros
+        omegas = np.asarray(omegas, dtype=float).reshape(-1)
+        F_VS, theta_range, info = self._F_VS(F_VS_config, theta_deg)
+
+        F_B, F_M, tau = ft.torque_de_bases(self.bases_torque(theta_deg), p.r_m,
+                                           p.m_haste_kg, p.m_biela_kg,
+                                           p.P_haste, p.P_biela, F_VS, omegas[:, None])
+
+        return [{
+            'theta_deg': theta_deg,
+            'omega': float(omega),
+            'F_VS': F_VS,
+            'F_B': F_B[i],
+            'F_M': F_M[i],
+            'torque': tau[i],
+            'theta_range': theta_range,
+            'info': info,
+            'estatisticas': estatisticas_torque(theta_deg, tau[i], F_B[i], F_M[i]),
+        } for i, omega in enumerate(omegas)]
+
+    @perfilar('energia_ciclo')
+    def energia_ciclo(self, omegas, F_VS_config: dict,
+                      theta_deg: np.ndarray = THETA_TORQUE_DEG,
+                      regenerativo: bool = False) -> np.ndarray:
+        """
+        Energia no eixo por volta da manivela para várias velocidades (J).
+
+        As curvas de torque de todos os omegas são montadas de uma vez, como
+        em torque_lote(), e integradas juntas (ver core.energia).
+
+        Parâmetros:
+            omegas       : velocidades angulares (rad/s), qualquer forma
+            F_VS_config  : como em torque()
+            theta_deg    : malha de ângulos cobrindo 360° (graus)
+            regenerativo : ver energia.energia_ciclo
+
+        Retorna:
+            array com a forma de omegas
+        """
+        p = self._parametros
+        omegas = np.asarray(omegas, dtype=float)
+        F_VS, _, _ = self._F_VS(F_VS_config, theta_deg)
+
+        _, _, tau = ft.torque_de_bases(self.bases_torque(theta_deg), p.r_m,
+                                       p.m_haste_kg, p.m_biela_kg,
+                                       p.P_haste, p.P_biela, F_VS, omegas[..., None])
+        # τ de torque_de_bases é o torque da carga sobre o eixo (∫ τ dθ = -trabalho
+        # do solo); o acionamento fornece -τ
+        np.negative(tau, out=tau)
+        return energia.energia_ciclo(self.grade(theta_deg), tau, regenerativo)
+
+
+def estatisticas_torque(theta_deg: np.ndarray, tau: np.ndarray,
+                        F_B: np.ndarray, F_M: np.ndarray) -> dict:
+    """
+    Máximos em módulo do torque e das forças e os ângulos onde ocorrem.
+
+    Retorna:
+        dict com 'tau_max_abs', 'tau_max', 'theta_tau_max', 'FB_max_abs',
+        'theta_FB_max', 'FM_max_abs', 'theta_FM_max'
+    """
+    idx_tau = int(np.argmax(np.abs(tau)))
+    idx_FB = int(np.argmax(np.abs(F_B)))
+    idx_FM = int(np.argmax(np.abs(F_M)))
+    return {
+        'tau_max_abs': float(abs(tau[idx_tau])),
+        'tau_max': float(tau[idx_tau]),
+        'theta_tau_max': float(theta_deg[idx_tau]),
+        'FB_max_abs': float(abs(F_B[idx_FB])),
+        'theta_FB_max': float(theta_deg[idx_FB]),
+        'FM_max_abs': float(abs(F_M[idx_FM])),
+        'theta_FM_max': float(theta_deg[idx_FM]),
+    }
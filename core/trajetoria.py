@@ -0,0 +1,301 @@
+"""
+Módulo de Trajetória da Haste no Referencial do Solo.
+
+A cinemática de core.cinematica só descreve o movimento vertical da haste
+em relação à máquina. No campo, enquanto a ponta está enterrada (entre os
+ângulos de descida e de subida de encontrar_theta_solo), ela também anda
+na horizontal com a velocidade do trator e rasga a cova:
+
+    x(θ) = v_t · (θ - θ_descida) / ω          y(θ) = y_solo(θ)
+
+    arrasto     = v_t · (θ_subida - θ_descida) / ω
+    comprimento = arrasto + largura da ponta
+    alongamento = comprimento / largura da ponta      (1 = cova redonda)
+
+Os ângulos de contato saem em forma fechada (sem fsolve): elevando ao
+quadrado espaco(θ) = altura_centro, com c = altura_centro - h,
+
+    cos θ = (L² - r² - c²) / (2·r·c)
+
+então milhares de geometrias são resolvidas de uma vez. Todas as funções
+aceitam escalares ou arrays com formas compatíveis (broadcasting);
+analisar_rasgos() monta a grade geometria x cultura x velocidade.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from .capacidade import faixa_velocidades
+from .cinematica import velocidade, velocidade_angular, y_solo_mm
+from .grade import resultado
+from .parametros import DTYPE_MECANISMO, mecanismos_para_array
+
+
+LARGURA_PONTA_PADRAO_MM = 25.4   # diâmetro da ponta da haste (1")
+MM_S_POR_KMH = 1000.0 / 3.6
+
+
+# ========================================================================
+# KERNELS (broadcasting)
+# ========================================================================
+
+def theta_solo(r, L, h, altura_centro) -> tuple:
+    """
+    Ângulos de contato com o solo em forma fechada (graus).
+
+    Equivalente a encontrar_theta_solo(), vetorizado.
+
+    Parâmetros:
+        r, L, h       : geometria (mm)
+        altura_centro : altura do centro da manivela em relação ao solo (mm)
+
+    Retorna:
+        (descida, subida) : com a forma do broadcasting dos argumentos
+                            (np.float64 para argumentos escalares):
+                              - NaN onde a haste nunca chega ao solo
+                                (L + r + h < altura_centro);
+                              - 0 e 360 onde ela nunca sai do solo
+                                (L - r + h > altura_centro), ou seja, a
+                                volta inteira conta como tempo enterrada
+    """
+    r = np.asarray(r, dtype=float)
+    L = np.asarray(L, dtype=float)
+    c = np.subtract(altura_centro, h, dtype=float)
+    nunca = c > L + r
+    sempre = c < L - r
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cos_t = (L * L - r * r - c * c) / (2 * r * c)
+    # Raiz espúria introduzida ao elevar ao quadrado: lado esquerdo negativo
+    espuria = c + r * cos_t < 0
+    descida = np.degrees(np.arccos(np.clip(cos_t, -1.0, 1.0)))
+    descida = np.where(sempre, 0.0, np.where(nunca | espuria, np.nan, descida))
+    return resultado(descida, None), resultado(360.0 - descida, None)
+
+
+def profundidade_maxima(r, L, h, altura_centro) -> np.ndarray:
+    """Profundidade máxima da ponta (mm, positiva), em θ = 180°; 0 se não enterra."""
+    return np.maximum(np.add(L, r) + np.subtract(h, altura_centro), 0.0)
+
+
+def rasgo(r, L, h, altura_centro, vt_kmh, omega,
+          largura_ponta_mm=LARGURA_PONTA_PADRAO_MM) -> dict:
+    """
+    Tempo no solo, arrasto horizontal e alongamento da cova.
+
+    Parâmetros:
+        r, L, h          : geometria (mm)
+        altura_centro    : altura do centro da manivela (mm)
+        vt_kmh           : velocidade do trator (km/h)
+        omega            : velocidade angular da manivela (rad/s)
+        largura_ponta_mm : largura da ponta na direção do deslocamento (mm)
+
+    Retorna:
+        dict de arrays (forma do broadcasting dos argumentos):
+            'theta_descida', 'theta_subida' : ângulos de contato (graus; ver
+                                              theta_solo)
+            'tempo_solo_s'                  : tempo com a ponta enterrada
+            'arrasto_mm'                    : deslocamento horizontal no solo
+            'comprimento_mm'                : comprimento da cova na superfície
+            'alongamento'                   : comprimento / largura da ponta
+            'angulo_entrada_deg'            : inclinação da trajetória em
+                                              relação à vertical na descida
+    """
+    descida, subida = theta_solo(r, L, h, altura_centro)
+    omega = np.asarray(omega, dtype=float)
+    vx = np.multiply(vt_kmh, MM_S_POR_KMH)                       # mm/s
+
+    tempo = np.deg2rad(subida - descida) / omega
+    arrasto = vx * tempo
+    comprimento = arrasto + largura_ponta_mm
+    # Velocidade vertical da ponta no contato (mm/s, referencial da máquina)
+    vy = velocidade(np.deg2rad(descida), omega, r, L)
+
+    return {
+        'theta_descida': descida,
+        'theta_subida': subida,
+        'tempo_solo_s': tempo,
+        'arrasto_mm': arrasto,
+        'comprimento_mm': comprimento,
+        'alongamento': comprimento / largura_ponta_mm,
+        'angulo_entrada_deg': np.degrees(np.arctan2(vx, np.abs(vy))),
+    }
+
+
+def trajetoria_solo(r, L, h, altura_centro, vt_kmh, omega, n_pontos: int = 50) -> tuple:
+    """
+    Trajetória da ponta enterrada no referencial do solo.
+
+    Parâmetros:
+        r, L, h, altura_centro, vt_kmh, omega : como em rasgo()
+        n_pontos                              : pontos entre a descida e a subida
+
+    Retorna:
+        (x_mm, y_mm) : arrays (..., n_pontos); x a partir do ponto de entrada
+                       e y em relação ao solo (negativo = enterrado)
+    """
+    descida, subida = theta_solo(r, L, h, altura_centro)
+    forma = np.broadcast_shapes(np.shape(descida), np.shape(vt_kmh), np.shape(omega))
+
+    def col(v):
+        return np.broadcast_to(v, forma)[..., None]
+
+    s = np.linspace(0.0, 1.0, n_pontos)
+    passo = np.deg2rad(col(subida) - col(descida)) * s                # θ - θ_descida
+    theta = np.deg2rad(col(descida)) + passo
+    y = y_solo_mm(theta, col(r), col(L), col(h), col(altura_centro))
+    x = col(np.multiply(vt_kmh, MM_S_POR_KMH)) * passo / col(omega)
+    return x, y
+
+
+# ========================================================================
+# GRADE GEOMETRIA x CULTURA x VELOCIDADE
+# ========================================================================
+
+@dataclass(frozen=True, slots=True)
+class Rasgos:
+    """
+    Resultado de analisar_rasgos().
+
+    Atributos:
+        geometrias         : array estruturado DTYPE_MECANISMO (G,)
+        culturas           : nomes das culturas (C,)
+        velocidades_kmh    : velocidades do trator (C, V), NaN completa
+        omega_rad_s        : velocidade angular da manivela (C, V)
+        theta_descida      : ângulo de descida (G,); NaN = não enterra,
+                             0 = nunca sai do solo (ver theta_solo)
+        theta_subida       : ângulo de subida (G,)
+        profundidade_mm    : profundidade máxima (G,)
+        tempo_solo_s       : tempo com a ponta enterrada (G, C, V)
+        arrasto_mm         : deslocamento horizontal no solo (G, C, V)
+        comprimento_mm     : comprimento da cova (G, C, V)
+        alongamento        : comprimento / largura da ponta (G, C, V)
+        angulo_entrada_deg : inclinação na descida (G, C, V)
+        x_mm, y_mm         : trajetórias (G, C, V, P), ou None
+    """
+    geometrias: np.ndarray
+    culturas: tuple
+    velocidades_kmh: np.ndarray
+    omega_rad_s: np.ndarray
+    theta_descida: np.ndarray
+    theta_subida: np.ndarray
+    profundidade_mm: np.ndarray
+    tempo_solo_s: np.ndarray
+    arrasto_mm: np.ndarray
+    comprimento_mm: np.ndarray
+    alongamento: np.ndarray
+    angulo_entrada_deg: np.ndarray
+    x_mm: np.ndarray = None
+    y_mm: np.ndarray = None
+
+    def _indices(self) -> tuple:
+        """Índices (g, c, v) das combinações com velocidade definida."""
+        forma = (len(self.geometrias),) + self.velocidades_kmh.shape
+        validas = np.broadcast_to(~np.isnan(self.velocidades_kmh), forma)
+        return np.nonzero(validas)
+
+    def tabela(self) -> dict:
+        """
+        Uma linha por combinação (geometria, cultura, velocidade).
+
+        Geometrias que não chegam ao solo ficam com NaN nas métricas.
+
+        Retorna:
+            dict coluna -> array 1D (formato de data.resultados)
+        """
+        g, c, v = self._indices()
+        colunas = {nome: self.geometrias[nome][g]
+                   for nome in ('r_mm', 'L_mm', 'h_mm', 'altura_centro_mm')}
+        colunas.update({
+            'cultura': np.asarray(self.culturas)[c],
+            'velocidade_kmh': self.velocidades_kmh[c, v],
+            'omega_rad_s': self.omega_rad_s[c, v],
+            'theta_descida': self.theta_descida[g],
+            'theta_subida': self.theta_subida[g],
+            'profundidade_mm': self.profundidade_mm[g],
+        })
+        for nome in ('tempo_solo_s', 'arrasto_mm', 'comprimento_mm', 'alongamento',
+                     'angulo_entrada_deg'):
+            colunas[nome] = getattr(self, nome)[g, c, v]
+        return colunas
+
+    def trajetorias(self) -> dict:
+        """
+        Trajetórias em formato longo, na ordem das linhas de tabela().
+
+        Retorna:
+            dict com 'linha' (índice da linha em tabela()), 'x_mm' e 'y_mm'
+        """
+        if self.x_mm is None:
+            raise ValueError("Trajetórias não calculadas (use n_pontos > 0).")
+        g, c, v = self._indices()
+        n_pontos = self.x_mm.shape[-1]
+        return {
+            'linha': np.repeat(np.arange(len(g)), n_pontos),
+            'x_mm': self.x_mm[g, c, v].ravel(),
+            'y_mm': self.y_mm[g, c, v].ravel(),
+        }
+
+
+def analisar_rasgos(geometrias, culturas: dict, velocidades_kmh=None,
+                    largura_ponta_mm: float = LARGURA_PONTA_PADRAO_MM,
+                    n_pontos: int = 0) -> Rasgos:
+    """
+    Rasgo da cova para todas as combinações de geometria, cultura e velocidade.
+
+    Parâmetros:
+        geometrias       : iterável de ParametrosMecanismo ou array DTYPE_MECANISMO
+        culturas         : dict nome -> Cultura (ω de cada cultura e velocidade)
+        velocidades_kmh  : velocidades do trator (V,) para todas as culturas;
+                           padrão: a faixa de plantio de cada cultura
+        largura_ponta_mm : largura da ponta da haste (mm)
+        n_pontos         : pontos de cada trajetória (0 = sem trajetórias)
+
+    Retorna:
+        Rasgos com os arrays da grade (G, C, V)
+    """
+    if not (isinstance(geometrias, np.ndarray) and geometrias.dtype == DTYPE_MECANISMO):
+        geometrias = mecanismos_para_array(geometrias)
+    geometrias = np.atleast_1d(geometrias)
+    if len(geometrias) == 0 or not culturas:
+        raise ValueError("Informe ao menos uma geometria e uma cultura.")
+    if largura_ponta_mm <= 0:
+        raise ValueError("Largura da ponta deve ser positiva.")
+
+    lista = list(culturas.values())
+    if velocidades_kmh is None:
+        velocidades = faixa_velocidades([c.velocidade_min_kmh for c in lista],
+                                        [c.velocidade_max_kmh for c in lista],
+                                        [c.velocidade_passo_kmh for c in lista])
+    else:
+        velocidades = np.atleast_1d(np.asarray(velocidades_kmh, dtype=float))
+        if np.any(velocidades <= 0):
+            raise ValueError("Velocidades devem ser positivas.")
+        velocidades = np.tile(velocidades, (len(lista), 1))
+    N = np.array([c.sementes_por_metro for c in lista])
+    omegas = velocidade_angular(velocidades, N[:, None])               # (C, V)
+
+    r, L, h, alt = (geometrias[campo][:, None, None]
+                    for campo in ('r_mm', 'L_mm', 'h_mm', 'altura_centro_mm'))  # (G, 1, 1)
+    metricas = rasgo(r, L, h, alt, velocidades, omegas, largura_ponta_mm)      # (G, C, V)
+    x = y = None
+    if n_pontos:
+        x, y = trajetoria_solo(r, L, h, alt, velocidades, omegas, n_pontos)  # (G, C, V, P)
+
+    forma = metricas['arrasto_mm'].shape
+    return Rasgos(
+        geometrias=geometrias,
+        culturas=tuple(culturas),
+        velocidades_kmh=velocidades,
+        omega_rad_s=omegas,
+        theta_descida=metricas['theta_descida'][:, 0, 0],
+        theta_subida=metricas['theta_subida'][:, 0, 0],
+        profundidade_mm=profundidade_maxima(r, L, h, alt)[:, 0, 0],
+        tempo_solo_s=np.broadcast_to(metricas['tempo_solo_s'], forma),
+        arrasto_mm=metricas['arrasto_mm'],
+        comprimento_mm=metricas['comprimento_mm'],
+        alongamento=metricas['alongamento'],
+        angulo_entrada_deg=metricas['angulo_entrada_deg'],
+        x_mm=x,
+        y_mm=y,
+    )
@@ -0,0 +1,368 @@
+"""
+Módulo de Validação Numérica (precisão x custo).
+
+Compara modos de avaliação da cinemática e do torque com curvas de
+referência de alta precisão:
+
+    - Curvas de referência: mpmath (50 dígitos) se instalado, senão
+      numpy.longdouble. São calculadas por uma formulação independente
+      das fórmulas fechadas do core: y = u - r·cos θ + h com u = √(L² - r² sin² θ),
+      e as derivadas de u obtidas por recorrência a partir de u² = L² - r² sin² θ.
+    - Modos: funções registradas com registrar_modo() que devolvem as
+      grandezas 'y', 'v', 'a', 'j' e 'tau' para (theta, geometria, omega,
+      estado), onde estado é um dict próprio de cada avaliação.
+      O relatório traz erro máximo, erro RMS e vazão (pontos/s) de cada modo.
+    - Derivadas: confere por diferenças finitas, no tempo, que velocidade,
+      aceleração e jerk (inclusive com alpha e beta) derivam de espaco().
+
+Uso:
+    python -m core.validacao --saida output/validacao.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict
+
+import numpy as np
+
+from . import cinematica as cin
+from . import forcas_torque as ft
+from .grade import AreaTrabalho, ThetaGrid
+from .parametros import ParametrosMecanismo
+
+
+GRANDEZAS = ('y', 'v', 'a', 'j', 'tau')
+
+# F_VS constante usado nas comparações de torque (N)
+F_VS_VALIDACAO = 150.0
+
+
+# ========================================================================
+# CURVAS DE REFERÊNCIA
+# ========================================================================
+
+def _referencia_pontos(theta, r, L, h, m_haste, m_biela, g, omega, F_VS, m):
+    """
+    Grandezas de referência com as funções matemáticas do namespace `m`.
+
+    Unidades: r, L, h em mm para a cinemática; o torque usa metros.
+    Com omega = 1, 'v', 'a' e 'j' são as derivadas em θ.
+    """
+    s, c = m.sin(theta), m.cos(theta)
+    I = L * L - r * r * s * s
+    u = m.sqrt(I)
+    s2 = 2 * s * c
+    c2 = c * c - s * s
+    # u² = I  =>  u·u' = -r²·s·c;  u·u'' + u'² = -r²·cos 2θ;  u·u''' + 3·u'·u'' = 2·r²·sin 2θ
+    u1 = -r * r * s * c / u
+    u2 = -(r * r * c2 + u1 * u1) / u
+    u3 = (2 * r * r * s2 - 3 * u1 * u2) / u
+    y = u - r * c + h
+    y1 = u1 + r * s
+    y2 = u2 + r * c
+    y3 = u3 - r * s
+
+    # Torque (SI): mesmas hipóteses de ft.torque, com y'' da recorrência
+    k = 1 / m.mil
+    rm = r * k
+    sin_b = rm * s / (L * k)
+    cos_b = u / L
+    aB = y2 * k * omega * omega
+    F_B = (m_haste * aB - m_haste * g + F_VS) / cos_b
+    a_par = 0.5 * (-omega * omega * rm * s) * sin_b + 0.5 * (-omega * omega * rm * c + aB) * cos_b
+    F_M = m_biela * a_par - F_B - m_biela * g * cos_b
+    sin_phi = s * cos_b - c * sin_b
+    tau = rm * F_M * sin_phi
+
+    return {'y': y, 'v': y1 * omega, 'a': y2 * omega**2, 'j': y3 * omega**3, 'tau': tau}
+
+
+class _NumpyLongdouble:
+    sin, cos, sqrt = np.sin, np.cos, np.sqrt
+    mil = np.longdouble(1000)
+
+
+def precisao_referencia() -> str:
+    """'mpmath' se o pacote estiver instalado, senão 'longdouble'."""
+    try:
+        import mpmath  # noqa: F401
+        return 'mpmath'
+    except ImportError:
+        return 'longdouble'
+
+
+def curvas_referencia(theta: np.ndarray, parametros: ParametrosMecanismo,
+                      omega: float = 1.0, precisao: str = None) -> Dict[str, np.ndarray]:
+    """
+    Curvas de referência de alta precisão para uma geometria.
+
+    Parâmetros:
+        theta      : ângulos em radianos (float64; cada valor é tomado como exato)
+        parametros : ParametrosMecanismo
+        omega      : velocidade angular (rad/s)
+        precisao   : 'mpmath' | 'longdouble' (padrão: a melhor disponível)
+
+    Retorna:
+        dict grandeza -> array float64 (arredondado da referência)
+    """
+    p = parametros
+    precisao = precisao or precisao_referencia()
+    args = (p.r_mm, p.L_mm, p.h_mm, p.m_haste_kg, p.m_biela_kg, p.g, omega, F_VS_VALIDACAO)
+
+    if precisao == 'longdouble':
+        ld = [np.longdouble(a) for a in args]
+        res = _referencia_pontos(np.asarray(theta, dtype=np.longdouble), *ld, _NumpyLongdouble)
+        return {k: np.asarray(v, dtype=float) for k, v in res.items()}
+
+    if precisao != 'mpmath':
+        raise ValueError(f"Precisão inválida: '{precisao}'. Use 'mpmath' ou 'longdouble'.")
+    import mpmath
+
+    class _Mp:
+        sin, cos, sqrt = mpmath.sin, mpmath.cos, mpmath.sqrt
+        mil = mpmath.mpf(1000)
+
+    saida = {k: np.empty(len(theta)) for k in GRANDEZAS}
+    with mpmath.workdps(50):
+        mp_args = [mpmath.mpf(float(a)) for a in args]
+        for i, t in enumerate(np.asarray(theta, dtype=float)):
+            res = _referencia_pontos(mpmath.mpf(float(t)), *mp_args, _Mp)
+            for k in GRANDEZAS:
+                saida[k][i] = float(res[k])
+    return saida
+
+
+# ========================================================================
+# MODOS DE AVALIAÇÃO
+# ========================================================================
+
+MODOS: Dict[str, Callable] = {}
+
+
+def registrar_modo(nome: str):
+    """
+    Decorador que registra um modo de avaliação.
+
+    O modo recebe (theta, parametros, omega, estado) e devolve um dict com
+    as grandezas de GRANDEZAS que sabe calcular. `estado` é um dict vazio
+    criado por avaliar_modos() para cada modo, onde ele pode guardar o que
+    reaproveita entre chamadas (nada é compartilhado entre avaliações).
+    """
+    def decorador(funcao):
+        MODOS[nome] = funcao
+        return funcao
+    return decorador
+
+
+@registrar_modo('direto')
+def _modo_direto(theta, p, omega, estado):
+    return {
+        'y': cin.espaco(theta, p.r_mm, p.L_mm, p.h_mm),
+        'v': cin.velocidade(theta, omega, p.r_mm, p.L_mm),
+        'a': cin.aceleracao(theta, omega, p.r_mm, p.L_mm),
+        'j': cin.jerk(theta, omega, 0.0, p.r_mm, p.L_mm),
+        'tau': ft.torque(theta, p.r_m, p.L_m, p.h_m, p.m_haste_kg, p.m_biela_kg,
+                         p.P_haste, p.P_biela, F_VS_VALIDACAO, omega),
+    }
+
+
+@registrar_modo('bases')
+def _modo_bases(theta, p, omega, estado):
+    bc = cin.bases_cinematica(theta, p.r_mm, p.L_mm)
+    bt = ft.bases_torque(theta, p.r_m, p.L_m, p.h_m)
+    _, _, tau = ft.torque_de_bases(bt, p.r_m, p.m_haste_kg, p.m_biela_kg,
+                                   p.P_haste, p.P_biela, F_VS_VALIDACAO, omega)
+    return {'v': bc['v'] * omega, 'a': bc['a'] * omega**2, 'j': bc['j'] * omega**3, 'tau': tau}
+
+
+@registrar_modo('trabalho')
+def _modo_trabalho(theta, p, omega, estado):
+    # Mesma malha das chamadas anteriores: reaproveita ThetaGrid, temporários e saídas
+    if estado.get('theta') is not theta:
+        estado.update(theta=theta, grade=ThetaGrid(rad=theta), ws=AreaTrabalho(),
+                      saida={k: np.empty(np.shape(theta)) for k in GRANDEZAS})
+    g, ws, saida = estado['grade'], estado['ws'], estado['saida']
+    cin.espaco(g, p.r_mm, p.L_mm, p.h_mm, out=saida['y'], trabalho=ws)
+    cin.velocidade(g, omega, p.r_mm, p.L_mm, out=saida['v'], trabalho=ws)
+    cin.aceleracao(g, omega, p.r_mm, p.L_mm, out=saida['a'], trabalho=ws)
+    cin.jerk(g, omega, 0.0, p.r_mm, p.L_mm, out=saida['j'], trabalho=ws)
+    ft.torque(g, p.r_m, p.L_m, p.h_m, p.m_haste_kg, p.m_biela_kg,
+              p.P_haste, p.P_biela, F_VS_VALIDACAO, omega, out=saida['tau'], trabalho=ws)
+    return saida
+
+
+# ========================================================================
+# RELATÓRIO DE PRECISÃO x CUSTO
+# ========================================================================
+
+def geometrias_amostra(n: int = 5, semente: int = 0) -> list:
+    """Geometria padrão mais n-1 variações aleatórias de r e L (±10%)."""
+    base = ParametrosMecanismo()
+    rng = np.random.default_rng(semente)
+    amostra = [base]
+    for _ in range(n - 1):
+        fr, fL = rng.uniform(0.9, 1.1, 2)
+        amostra.append(ParametrosMecanismo(r_mm=base.r_mm * fr, L_mm=base.L_mm * fL))
+    return amostra
+
+
+def _vazao(funcao, theta, p, omega, tempo_min_s):
+    funcao(theta, p, omega)
+    chamadas, inicio = 0, time.perf_counter()
+    while True:
+        funcao(theta, p, omega)
+        chamadas += 1
+        dt = time.perf_counter() - inicio
+        if dt >= tempo_min_s:
+            return chamadas * len(theta) / dt
+
+
+def avaliar_modos(modos=None, geometrias=None, n_pontos: int = 721, omega: float = 20.0,
+                  n_vazao: int = 100_000, tempo_min_s: float = 0.1, precisao: str = None) -> dict:
+    """
+    Erro de cada modo em relação às curvas de referência e sua vazão.
+
+    Parâmetros:
+        modos      : nomes dos modos (todos os registrados se None)
+        geometrias : lista de ParametrosMecanismo (geometrias_amostra() se None)
+        n_pontos   : tamanho da malha de θ usada na comparação
+        omega      : velocidade angular (rad/s)
+        n_vazao    : tamanho da malha usada para medir a vazão
+        precisao   : precisão das curvas de referência
+
+    Retorna:
+        dict com 'precisao', 'modos' (nome -> {grandeza -> erros}, 'pontos_por_s')
+    """
+    modos = list(modos or MODOS)
+    geometrias = geometrias or geometrias_amostra()
+    precisao = precisao or precisao_referencia()
+    theta = np.linspace(0.0, 2 * np.pi, n_pontos)
+    referencias = [curvas_referencia(theta, p, omega, precisao) for p in geometrias]
+
+    relatorio = {}
+    for nome in modos:
+        funcao = partial(MODOS[nome], estado={})
+        erros = {}
+        for p, ref in zip(geometrias, referencias):
+            for k, valor in funcao(theta, p, omega).items():
+                dif = np.asarray(valor, dtype=float) - ref[k]
+                escala = np.max(np.abs(ref[k]))
+                e = erros.setdefault(k, {'max_abs': 0.0, 'max_rel': 0.0, 'rms_rel': 0.0})
+                e['max_abs'] = max(e['max_abs'], float(np.max(np.abs(dif))))
+                e['max_rel'] = max(e['max_rel'], float(np.max(np.abs(dif)) / escala))
+                e['rms_rel'] = max(e['rms_rel'], float(np.sqrt(np.mean(dif**2)) / escala))
+        vazao = _vazao(funcao, np.linspace(0.0, 2 * np.pi, n_vazao), geometrias[0], omega, tempo_min_s)
+        relatorio[nome] = {'erros': erros, 'pontos_por_s': vazao}
+
+    return {'precisao': precisao, 'n_pontos': n_pontos, 'n_geometrias': len(geometrias),
+            'omega': omega, 'modos': relatorio}
+
+
+def escolher_modo(relatorio: dict, tolerancia_rel: float, grandezas=GRANDEZAS) -> str:
+    """
+    Modo mais rápido cujo erro relativo máximo fica abaixo da tolerância.
+
+    Só considera modos que calculam todas as `grandezas` pedidas.
+    """
+    aptos = [
+        (dados['pontos_por_s'], nome)
+        for nome, dados in relatorio['modos'].items()
+        if all(k in dados['erros'] and dados['erros'][k]['max_rel'] <= tolerancia_rel
+               for k in grandezas)
+    ]
+    if not aptos:
+        raise ValueError(f"Nenhum modo atende à tolerância {tolerancia_rel:g} para {list(grandezas)}.")
+    return max(aptos)[1]
+
+
+# ========================================================================
+# CONSISTÊNCIA DAS DERIVADAS
+# ========================================================================
+
+def verificar_derivadas(parametros: ParametrosMecanismo = None, omega: float = 20.0,
+                        alpha: float = 3.0, beta: float = -40.0, n_pontos: int = 73) -> dict:
+    """
+    Confere velocidade, aceleração e jerk contra diferenças finitas de espaco().
+
+    O ângulo segue θ(t) = θ0 + ω·t + α·t²/2 + β·t³/6, e y(t) = espaco(θ(t))
+    é derivado numericamente no tempo em t = 0 (diferenças centradas,
+    calculadas em longdouble).
+
+    Retorna:
+        dict grandeza -> erro relativo máximo (em relação ao máximo da curva)
+    """
+    p = parametros or ParametrosMecanismo()
+    theta0 = np.linspace(0.0, 2 * np.pi, n_pontos, endpoint=False)
+    t0 = theta0.astype(np.longdouble)
+
+    def y(t):
+        t = np.longdouble(t)
+        th = t0 + omega * t + alpha * t**2 / 2 + beta * t**3 / 6
+        L, r = np.longdouble(p.L_mm), np.longdouble(p.r_mm)
+        return np.sqrt(L**2 - (r * np.sin(th))**2) - r * np.cos(th) + p.h_mm
+
+    dt = 1e-4 / omega
+    fd = {
+        'v': (y(dt) - y(-dt)) / (2 * dt),
+        'a': (y(dt) - 2 * y(0) + y(-dt)) / dt**2,
+        'j': (y(2 * dt) - 2 * y(dt) + 2 * y(-dt) - y(-2 * dt)) / (2 * dt**3),
+    }
+    analitico = {
+        'v': cin.velocidade(theta0, omega, p.r_mm, p.L_mm),
+        'a': cin.aceleracao(theta0, omega, p.r_mm, p.L_mm, alpha),
+        'j': cin.jerk(theta0, omega, alpha, p.r_mm, p.L_mm, beta),
+    }
+    return {k: float(np.max(np.abs(analitico[k] - fd[k].astype(float))) / np.max(np.abs(analitico[k])))
+            for k in fd}
+
+
+# ========================================================================
+# LINHA DE COMANDO
+# ========================================================================
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m core.validacao',
+                                     description='Precisão x custo dos modos de avaliação.')
+    parser.add_argument('--modos', nargs='+', help='modos (padrão: todos)')
+    parser.add_argument('--geometrias', type=int, default=5)
+    parser.add_argument('--pontos', type=int, default=721)
+    parser.add_argument('--omega', type=float, default=20.0)
+    parser.add_argument('--precisao', choices=('mpmath', 'longdouble'))
+    parser.add_argument('--tolerancia', type=float, default=1e-9,
+                        help='tolerância relativa para sugerir o modo mais rápido')
+    parser.add_argument('--grandezas', nargs='+', choices=GRANDEZAS, default=['v', 'a', 'j', 'tau'],
+                        help='grandezas exigidas do modo sugerido')
+    parser.add_argument('--saida', help='grava o relatório em JSON')
+    args = parser.parse_args(argv)
+
+    relatorio = avaliar_modos(args.modos, geometrias_amostra(args.geometrias), args.pontos,
+                              args.omega, precisao=args.precisao)
+    relatorio['derivadas'] = verificar_derivadas(omega=args.omega)
+    try:
+        relatorio['modo_sugerido'] = escolher_modo(relatorio, args.tolerancia, args.grandezas)
+    except ValueError as e:
+        relatorio['modo_sugerido'] = None
+        print(f"⚠️  {e}", file=sys.stderr)
+
+    print(f"Referência: {relatorio['precisao']}", file=sys.stderr)
+    for nome, dados in relatorio['modos'].items():
+        erros = '  '.join(f"{k}={e['max_rel']:.1e}" for k, e in dados['erros'].items())
+        print(f"{nome:<12} {dados['pontos_por_s'] / 1e6:>8.1f} Mpts/s  {erros}", file=sys.stderr)
+    print("Diferenças finitas: " + '  '.join(f"{k}={v:.1e}" for k, v in relatorio['derivadas'].items()),
+          file=sys.stderr)
+
+    texto = json.dumps(relatorio, ensure_ascii=False, indent=2)
+    if args.saida:
+        Path(args.saida).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.saida).write_text(texto, encoding='utf-8')
+    else:
+        print(texto)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,17 +1,39 @@
 """
 Módulo de Dados - Processamento e carregamento de dados externos.
 
-Contém funções para trabalhar com dados do IBGE e outras fontes.
+Contém funções para trabalhar com dados do IBGE e outras fontes, e para
+exportar os resultados das análises em formato colunar.
+
+Carregamento tardio (PEP 562): pandas só é importado quando uma
+função de dados é acessada.
 """
 
-from .ibge_loader import (
-    carregar_dados_ibge,
-    processar_tabela_sintese,
-    processar_tabela_estados
-)
+from utils.importacao import exportacao_tardia
+
+_EXPORTACOES = {
+    'carregar_dados_ibge': '.ibge_loader',
+    'processar_tabela_sintese': '.ibge_loader',
+    'processar_tabela_estados': '.ibge_loader',
+    'carregar_tabela_nivel': '.ibge_loader',
+    'ler_pam': '.sidra',
+    'abrir_pam': '.armazem',
+    'estimar_demanda': '.demanda',
+    'estimar_energia': '.demanda',
+    'gravar_resultados': '.resultados',
+    'ler_resultados': '.resultados',
+}
+
+__getattr__ = exportacao_tardia(__name__, _EXPORTACOES)
 
 __all__ = [
     'carregar_dados_ibge',
     'processar_tabela_sintese',
     'processar_tabela_estados',
+    'carregar_tabela_nivel',
+    'ler_pam',
+    'abrir_pam',
+    'estimar_demanda',
+    'estimar_energia',
+    'gravar_resultados',
+    'ler_resultados',
 ]
@@ -0,0 +1,277 @@
+"""
+Módulo de Agregação por Nível Geográfico.
+
+Soma valores municipais (ou estaduais) por município, microrregião,
+estado ou região com np.bincount sobre códigos inteiros de grupo, em vez
+de um groupby do pandas a cada consulta.
+
+IndiceGeografico é montado uma vez a partir dos códigos IBGE da unidade
+base e guarda, para cada nível acima, o índice denso do grupo de cada
+unidade. Os níveis seguem a hierarquia dos códigos do IBGE:
+
+    município (7 dígitos) -> UF: código // 100000
+    UF (2 dígitos)        -> região: código // 10
+    microrregião (5 dígitos, começa pelo código da UF) -> UF: código // 1000
+
+A microrregião não pode ser deduzida do código do município: é preciso
+informar a tabela município -> microrregião (ver ler_microrregioes).
+
+Uma soma por (grupo, cultura) é um único bincount sobre
+grupo * n_culturas + cultura, que já devolve todas as culturas juntas.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from . import sidra
+from .ibge_loader import normalizar_uf
+
+
+NIVEIS = ('municipio', 'microrregiao', 'uf', 'regiao')
+
+# Nome da coluna com o nome do grupo em cada nível
+ROTULOS = {
+    'municipio': 'Município',
+    'microrregiao': 'Microrregião',
+    'uf': 'Estado',
+    'regiao': 'Região',
+}
+
+# Divisor que leva o código IBGE de um nível ao código do nível acima
+_DIVISORES = {
+    ('municipio', 'uf'): 100000,
+    ('municipio', 'regiao'): 1000000,
+    ('microrregiao', 'uf'): 1000,
+    ('microrregiao', 'regiao'): 10000,
+    ('uf', 'regiao'): 10,
+}
+
+
+def _validar_nivel(nivel: str):
+    if nivel not in NIVEIS:
+        raise ValueError(f"Nível inválido: '{nivel}'. Use {NIVEIS}.")
+
+
+def ler_microrregioes(origem) -> pd.DataFrame:
+    """
+    Tabela município -> microrregião.
+
+    Parâmetros:
+        origem : caminho de um CSV ou DataFrame com as colunas
+                 cod_municipio, cod_microrregiao e microrregiao (nome)
+
+    Retorna:
+        DataFrame com essas três colunas (códigos inteiros)
+    """
+    tabela = pd.read_csv(origem) if isinstance(origem, (str, Path)) else origem
+    colunas = ['cod_municipio', 'cod_microrregiao', 'microrregiao']
+    faltando = set(colunas) - set(tabela.columns)
+    if faltando:
+        raise ValueError(f"Colunas ausentes na tabela de microrregiões: {sorted(faltando)}")
+    return tabela[colunas].astype({'cod_municipio': 'int32', 'cod_microrregiao': 'int32'})
+
+
+# ========================================================================
+# ÍNDICE
+# ========================================================================
+
+class IndiceGeografico:
+    """
+    Índice de grupos de cada nível geográfico para somas com bincount.
+
+    Parâmetros:
+        codigos       : códigos IBGE das unidades base (repetidos são ignorados)
+        base          : nível das unidades base ('municipio' ou 'uf', por exemplo)
+        microrregioes : tabela de ler_microrregioes() (habilita o nível
+                        'microrregiao' quando a base é 'municipio')
+        nomes         : dict código -> nome das unidades base (opcional)
+    """
+
+    __slots__ = ('base', 'codigos', '_grupos', '_nomes')
+
+    def __init__(self, codigos, base: str = 'municipio', microrregioes=None, nomes=None):
+        _validar_nivel(base)
+        self.base = base
+        self.codigos = np.unique(np.asarray(codigos, dtype=np.int64))
+        self._grupos = {}
+        self._nomes = {base: dict(nomes or {})}
+
+        ufs = sidra.tabela_ufs()
+        self._nomes['uf'] = ufs['nome'].to_dict()
+        self._nomes['regiao'] = dict(zip(ufs['cod_regiao'].astype(int), ufs['regiao']))
+
+        micro = None
+        if microrregioes is not None and base == 'municipio':
+            micro = ler_microrregioes(microrregioes)
+            self._nomes['microrregiao'] = dict(zip(micro['cod_microrregiao'], micro['microrregiao']))
+
+        for nivel in NIVEIS[NIVEIS.index(base):]:
+            if nivel == base:
+                pais = self.codigos
+            elif nivel == 'microrregiao':
+                if micro is None:
+                    continue
+                pais = self._microrregiao(micro)
+            else:
+                pais = self.codigos // _DIVISORES[(base, nivel)]
+
+            if nivel in ('uf', 'regiao'):
+                # Todos os estados e regiões, mesmo sem dados (tabelas completas)
+                todos = np.array(sorted(self._nomes[nivel]), dtype=np.int64)
+                self._grupos[nivel] = (np.searchsorted(todos, pais), todos)
+            else:
+                grupos, inverso = np.unique(pais, return_inverse=True)
+                self._grupos[nivel] = (inverso, grupos)
+
+    def _microrregiao(self, micro: pd.DataFrame) -> np.ndarray:
+        mapa = micro.drop_duplicates('cod_municipio').set_index('cod_municipio')['cod_microrregiao']
+        pais = mapa.reindex(self.codigos).to_numpy()
+        if np.isnan(pais.astype(float)).any():
+            sem = self.codigos[np.isnan(pais.astype(float))][:5].tolist()
+            raise ValueError(f"Municípios sem microrregião na tabela: {sem}")
+        return pais.astype(np.int64)
+
+    @property
+    def niveis(self) -> tuple:
+        return tuple(self._grupos)
+
+    def _grupo(self, nivel: str) -> tuple:
+        _validar_nivel(nivel)
+        if nivel not in self._grupos:
+            if nivel == 'microrregiao':
+                raise ValueError("Nível 'microrregiao' exige a tabela de microrregiões "
+                                 "(ver ler_microrregioes).")
+            raise ValueError(f"Nível '{nivel}' abaixo da base '{self.base}'.")
+        return self._grupos[nivel]
+
+    def grupos(self, nivel: str) -> pd.DataFrame:
+        """Códigos e nomes dos grupos de `nivel`, na ordem das linhas de somar()."""
+        codigos = self._grupo(nivel)[1]
+        nomes = self._nomes.get(nivel, {})
+        return pd.DataFrame({'codigo': codigos,
+                             ROTULOS[nivel]: [nomes.get(int(c), str(c)) for c in codigos]})
+
+    def posicoes(self, codigos) -> np.ndarray:
+        """Posição de cada código (da unidade base) no índice."""
+        codigos = np.asarray(codigos, dtype=np.int64)
+        pos = np.searchsorted(self.codigos, codigos)
+        fora = (pos == len(self.codigos)) | (self.codigos[np.minimum(pos, len(self.codigos) - 1)] != codigos)
+        if fora.any():
+            raise ValueError(f"Códigos fora do índice: {np.unique(codigos[fora])[:5].tolist()}")
+        return pos
+
+    def somar(self, posicoes: np.ndarray, valores: np.ndarray, nivel: str,
+              categorias: np.ndarray = None, n_categorias: int = 1) -> np.ndarray:
+        """
+        Soma valores por grupo de `nivel` (e por categoria) em um único bincount.
+
+        Parâmetros:
+            posicoes     : posição da unidade base de cada linha (ver posicoes())
+            valores      : valor de cada linha (NA conta como zero)
+            nivel        : nível do agrupamento
+            categorias   : código da categoria de cada linha (ex: cultura), 0..n-1
+            n_categorias : número de categorias
+
+        Retorna:
+            array (n_grupos, n_categorias)
+        """
+        inverso, codigos = self._grupo(nivel)
+        indice = inverso[posicoes]
+        if categorias is not None:
+            indice = indice * n_categorias + categorias
+        soma = np.bincount(indice, weights=np.nan_to_num(np.asarray(valores, dtype=float)),
+                           minlength=len(codigos) * n_categorias)
+        return soma.reshape(len(codigos), n_categorias)
+
+    def subir(self, matriz: np.ndarray, nivel: str) -> np.ndarray:
+        """
+        Leva uma matriz por unidade base (n_unidades, n_colunas), na ordem
+        de `codigos`, para o nível `nivel`.
+        """
+        matriz = np.asarray(matriz, dtype=float)
+        n_colunas = matriz.shape[1]
+        posicoes = np.repeat(np.arange(len(self.codigos)), n_colunas)
+        colunas = np.tile(np.arange(n_colunas), len(self.codigos))
+        return self.somar(posicoes, matriz.ravel(), nivel, colunas, n_colunas)
+
+
+# ========================================================================
+# TABELAS POR NÍVEL
+# ========================================================================
+
+def _tabela(indice: IndiceGeografico, nivel: str, culturas: list, somas: np.ndarray) -> pd.DataFrame:
+    """Tabela no formato de processar_tabela_estados(), com a coluna 'codigo'."""
+    tabela = indice.grupos(nivel)
+    inteiros = np.round(somas).astype(int)
+    for j, cultura in enumerate(culturas):
+        tabela[cultura] = inteiros[:, j]
+    if nivel == 'uf':
+        tabela['uf_norm'] = normalizar_uf(tabela['Estado'])
+    tabela['Total'] = inteiros.sum(axis=1)
+    return tabela
+
+
+def indice_pam(pam: pd.DataFrame, microrregioes=None) -> IndiceGeografico:
+    """IndiceGeografico dos municípios de uma tabela de ler_pam()."""
+    nomes = (pam[['cod_municipio', 'municipio']].drop_duplicates('cod_municipio')
+                .astype({'municipio': str}))
+    return IndiceGeografico(nomes['cod_municipio'], 'municipio', microrregioes,
+                            dict(zip(nomes['cod_municipio'], nomes['municipio'])))
+
+
+def tabela_nivel_pam(pam: pd.DataFrame, nivel: str = 'uf', ano: int = None,
+                     variavel: str = sidra.AREA_PLANTADA, indice: IndiceGeografico = None,
+                     microrregioes=None) -> pd.DataFrame:
+    """
+    Tabela da PAM somada por nível geográfico, uma coluna por cultura.
+
+    Parâmetros:
+        pam           : resultado de ler_pam()
+        nivel         : um de NIVEIS
+        ano           : ano (padrão: o mais recente)
+        variavel      : variável somada (padrão: área plantada)
+        indice        : IndiceGeografico já montado (reaproveitado entre chamadas)
+        microrregioes : tabela de ler_microrregioes() (para o nível 'microrregiao')
+
+    Retorna:
+        DataFrame com codigo, nome do grupo (coluna ROTULOS[nivel]), uma
+        coluna inteira por cultura e Total (e uf_norm no nível 'uf')
+    """
+    _validar_nivel(nivel)
+    ano = int(pam['ano'].max()) if ano is None else ano
+    sel = pam[(pam['ano'] == ano) & (pam['variavel'] == variavel)]
+    if sel.empty:
+        raise ValueError(f"Sem dados de '{variavel}' para o ano {ano}.")
+    indice = indice or indice_pam(pam, microrregioes)
+
+    # Códigos das culturas, já na ordem de CULTURAS
+    nomes = sidra._nome_curto(pd.Series(sel['cultura'].cat.categories))
+    culturas = sidra._ordenar_culturas(set(nomes[sel['cultura'].cat.codes.unique()]))
+    de_categoria = np.array([culturas.index(n) if n in culturas else -1 for n in nomes])
+
+    somas = indice.somar(indice.posicoes(sel['cod_municipio'].to_numpy()),
+                         sel['valor'].to_numpy(), nivel,
+                         de_categoria[sel['cultura'].cat.codes.to_numpy()], len(culturas))
+    return _tabela(indice, nivel, culturas, somas)
+
+
+def tabela_nivel_estados(tabela_estados: pd.DataFrame, nivel: str = 'regiao') -> pd.DataFrame:
+    """
+    Tabela por estado (processar_tabela_estados) somada por 'uf' ou 'regiao'.
+
+    Retorna:
+        DataFrame no mesmo formato de tabela_nivel_pam()
+    """
+    ufs = sidra.tabela_ufs()
+    codigos = pd.Series(ufs.index, index=normalizar_uf(ufs['nome']))
+    cod_uf = codigos.reindex(tabela_estados['uf_norm']).to_numpy()
+    if np.isnan(cod_uf.astype(float)).any():
+        raise ValueError("Estados não reconhecidos na tabela.")
+
+    culturas = [c for c in tabela_estados.columns if c not in ('Estado', 'uf_norm', 'Total')]
+    indice = IndiceGeografico(cod_uf, 'uf')
+    matriz = np.zeros((len(indice.codigos), len(culturas)))
+    np.add.at(matriz, indice.posicoes(cod_uf), tabela_estados[culturas].to_numpy(dtype=float))
+    return _tabela(indice, nivel, culturas, indice.subir(matriz, nivel))
@@ -0,0 +1,332 @@
+"""
+Módulo de Armazenamento Colunar da PAM, Particionado por Ano e Cultura.
+
+Reler o CSV da PAM a cada execução custa segundos; o armazém guarda o
+resultado de ler_pam() já compacto, em um diretório por partição:
+
+    raiz/
+        _meta.json
+        ano=2023/cultura=Soja/
+            cod_municipio.npy  cod_uf.npy  municipio.npy
+            variavel.npy  unidade.npy  valor.npy
+
+Ano e cultura são as chaves de partição (não são gravados como coluna).
+As colunas categóricas são gravadas como códigos inteiros e as
+categorias ficam em _meta.json, comuns a todas as partições.
+
+Na leitura, os filtros de ano e cultura escolhem as partições antes de
+abrir qualquer arquivo, e o filtro de variável é avaliado sobre os
+códigos antes de ler as demais colunas. Os .npy são abertos com
+memory-map, então uma consulta de uma cultura em um ano lê só as
+páginas dessa partição.
+
+O formato é o mesmo 'npy' de data.resultados (sem dependências); Parquet
+ou Feather exigiriam pyarrow.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from . import sidra
+from .resultados import trocar_diretorio
+
+
+VERSAO = 1
+ARQUIVO_META = '_meta.json'
+COLUNAS = ('cod_municipio', 'cod_uf', 'municipio', 'variavel', 'unidade', 'valor')
+
+
+def _nome_particao(ano: int, cultura: str) -> str:
+    return f'ano={ano}/cultura={cultura}'
+
+
+# ========================================================================
+# ESCRITA
+# ========================================================================
+
+def _verificar_destino(destino: Path):
+    """Só substitui um diretório vazio ou um armazém anterior (_meta.json com partições)."""
+    if not destino.exists():
+        return
+    if not destino.is_dir():
+        raise ValueError(f"'{destino}' já existe e não é um diretório.")
+    try:
+        with open(destino / ARQUIVO_META, 'r', encoding='utf-8') as f:
+            armazem = 'particoes' in json.load(f)
+    except (OSError, ValueError):
+        armazem = False
+    if not armazem and any(destino.iterdir()):
+        raise ValueError(f"'{destino}' não está vazio e não é um armazém da PAM; "
+                         f"escolha outro diretório.")
+
+
+def gravar_armazem(pam: pd.DataFrame, raiz, origem: dict = None) -> str:
+    """
+    Grava o resultado de ler_pam() como armazém particionado.
+
+    Parâmetros:
+        pam    : DataFrame longo de data.sidra.ler_pam()
+        raiz   : diretório do armazém; um armazém anterior é substituído,
+                 qualquer outro diretório não vazio é recusado
+        origem : descrição do CSV de origem (vai para os metadados)
+
+    Retorna:
+        caminho gravado
+    """
+    faltando = set(COLUNAS) | {'ano', 'cultura'}
+    faltando -= set(pam.columns)
+    if faltando:
+        raise ValueError(f"Colunas ausentes para o armazém: {sorted(faltando)}")
+
+    categorias = {c: pam[c].cat.categories.tolist() for c in sidra.CATEGORICAS}
+    curtas = {nome: sidra.CULTURAS_SIDRA.get(nome, nome) for nome in categorias['cultura']}
+    codigos = {c: pam[c].cat.codes.to_numpy() for c in sidra.CATEGORICAS}
+
+    destino = Path(raiz)
+    _verificar_destino(destino)
+    destino.parent.mkdir(parents=True, exist_ok=True)
+    particoes = {}
+
+    # Grava em diretório temporário e renomeia: leitores nunca veem meio armazém
+    tmp = Path(tempfile.mkdtemp(prefix='.tmp_', dir=destino.parent))
+    try:
+        grupos = pd.DataFrame({'ano': pam['ano'].to_numpy(), 'cultura': codigos['cultura']})
+        for (ano, i_cultura), linhas in grupos.groupby(['ano', 'cultura'], sort=True).indices.items():
+            cultura = curtas[categorias['cultura'][i_cultura]]
+            nome = _nome_particao(int(ano), cultura)
+            pasta = tmp / nome
+            pasta.mkdir(parents=True)
+            for coluna in COLUNAS:
+                valores = codigos[coluna] if coluna in codigos else pam[coluna].to_numpy()
+                np.save(pasta / f'{coluna}.npy', np.ascontiguousarray(valores[linhas]))
+            particoes[nome] = {'ano': int(ano), 'cultura': cultura, 'n_linhas': len(linhas)}
+
+        meta = {
+            'versao': VERSAO,
+            'colunas': list(COLUNAS),
+            'categorias': {c: categorias[c] for c in ('municipio', 'variavel', 'unidade')},
+            'culturas': {curta: nome for nome, curta in curtas.items()},
+            'particoes': particoes,
+            'origem': origem,
+        }
+        with open(tmp / ARQUIVO_META, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
+        trocar_diretorio(tmp, destino)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    return str(destino)
+
+
+# ========================================================================
+# LEITURA
+# ========================================================================
+
+class ArmazemPAM:
+    """
+    Armazém da PAM aberto para leitura.
+
+    Só _meta.json é lido na abertura; as colunas de cada partição são
+    mapeadas em memória no primeiro acesso e reaproveitadas depois.
+    """
+
+    __slots__ = ('raiz', 'meta', '_mapas')
+
+    def __init__(self, raiz):
+        self.raiz = Path(raiz)
+        caminho_meta = self.raiz / ARQUIVO_META
+        if not caminho_meta.is_file():
+            raise ValueError(f"'{raiz}' não é um armazém da PAM (sem {ARQUIVO_META}).")
+        with open(caminho_meta, 'r', encoding='utf-8') as f:
+            self.meta = json.load(f)
+        if self.meta.get('versao') != VERSAO:
+            raise ValueError(f"Versão do armazém incompatível: {self.meta.get('versao')} (esperada {VERSAO}).")
+        self._mapas = {}
+
+    @property
+    def anos(self) -> list:
+        return sorted({p['ano'] for p in self.meta['particoes'].values()})
+
+    @property
+    def culturas(self) -> list:
+        return sidra._ordenar_culturas({p['cultura'] for p in self.meta['particoes'].values()})
+
+    def ano_ou_recente(self, ano: int = None) -> int:
+        """
+        Ano pedido, validado, ou o mais recente do armazém.
+
+        Parâmetros:
+            ano : ano desejado (None = o mais recente)
+        """
+        if ano is None:
+            return self.anos[-1]
+        if ano not in self.anos:
+            raise ValueError(f"Ano {ano} não encontrado no armazém. Disponíveis: {self.anos}")
+        return ano
+
+    def particoes(self, anos=None, culturas=None) -> list:
+        """Nomes das partições que atendem aos filtros (sem abrir arquivos)."""
+        if culturas is not None:
+            # Aceita o nome curto ou o nome do SIDRA
+            culturas = {sidra.CULTURAS_SIDRA.get(c, c) for c in culturas}
+        return [nome for nome, p in self.meta['particoes'].items()
+                if (anos is None or p['ano'] in anos)
+                and (culturas is None or p['cultura'] in culturas)]
+
+    def coluna(self, particao: str, nome: str) -> np.ndarray:
+        """Coluna de uma partição, mapeada em memória (somente leitura)."""
+        chave = (particao, nome)
+        if chave not in self._mapas:
+            if nome not in COLUNAS:
+                raise ValueError(f"Coluna inexistente: '{nome}'. Disponíveis: {list(COLUNAS)}")
+            self._mapas[chave] = np.load(self.raiz / particao / f'{nome}.npy', mmap_mode='r')
+        return self._mapas[chave]
+
+    def _linhas(self, particao: str, variaveis) -> np.ndarray:
+        """Máscara das linhas da partição com as variáveis pedidas (None = todas)."""
+        if variaveis is None:
+            return None
+        categorias = self.meta['categorias']['variavel']
+        codigos = [categorias.index(v) for v in variaveis if v in categorias]
+        return np.isin(self.coluna(particao, 'variavel'), codigos)
+
+    def ler(self, anos=None, culturas=None, variaveis=None) -> pd.DataFrame:
+        """
+        Lê as linhas que atendem aos filtros, no formato de ler_pam().
+
+        Parâmetros:
+            anos      : anos a ler (None = todos)
+            culturas  : culturas a ler, pelo nome curto ou do SIDRA (None = todas)
+            variaveis : variáveis a ler (None = todas)
+
+        Retorna:
+            DataFrame longo com as mesmas colunas e tipos de ler_pam()
+            (linhas agrupadas por ano e cultura)
+        """
+        nomes = self.particoes(anos, culturas)
+        if not nomes:
+            raise ValueError("Nenhuma partição do armazém corresponde aos filtros.")
+
+        partes = {c: [] for c in ('ano', 'cultura') + COLUNAS}
+        nomes_sidra = self.meta['culturas']
+        ordem_culturas = sorted(nomes_sidra.values())
+        for nome in nomes:
+            p = self.meta['particoes'][nome]
+            mascara = self._linhas(nome, variaveis)
+            for coluna in COLUNAS:
+                valores = self.coluna(nome, coluna)
+                partes[coluna].append(valores[mascara] if mascara is not None else np.asarray(valores))
+            n = len(partes['valor'][-1])
+            partes['ano'].append(np.full(n, p['ano'], dtype=np.int16))
+            partes['cultura'].append(np.full(n, ordem_culturas.index(nomes_sidra[p['cultura']]),
+                                             dtype=np.int8))
+
+        colunas = {c: np.concatenate(v) for c, v in partes.items()}
+        categorias = {**self.meta['categorias'], 'cultura': ordem_culturas}
+        return pd.DataFrame({
+            'ano': colunas['ano'],
+            'cod_municipio': colunas['cod_municipio'],
+            'cod_uf': colunas['cod_uf'],
+            **{c: pd.Categorical.from_codes(colunas[c], categorias[c]) for c in sidra.CATEGORICAS},
+            'valor': colunas['valor'],
+        })
+
+    # --------------------------------------------------------------------
+    # Consultas no formato de ibge_loader
+    # --------------------------------------------------------------------
+
+    def top_estados(self, cultura: str = None, ano: int = None, n: int = 10,
+                    variavel: str = sidra.AREA_PLANTADA) -> pd.DataFrame:
+        """
+        Top N estados de uma cultura (ou do total) em um ano.
+
+        Lê só as partições do ano (e da cultura) e soma por UF com
+        bincount, sem montar a tabela longa.
+
+        Parâmetros:
+            cultura  : nome da cultura; None = total de todas as culturas
+            ano      : ano (padrão: o mais recente)
+            n        : número de estados no ranking
+            variavel : variável somada (padrão: área plantada)
+
+        Retorna:
+            DataFrame com Estado e a cultura (ou 'Total'), ordenado
+        """
+        ano = self.ano_ou_recente(ano)
+        if cultura is not None and cultura not in self.culturas:
+            raise ValueError(f"Cultura '{cultura}' não encontrada na PAM. Disponíveis: {self.culturas}")
+        nomes = self.particoes([ano], None if cultura is None else [cultura])
+
+        ufs = sidra.tabela_ufs()
+        soma = np.zeros(int(ufs.index.max()) + 1)
+        for nome in nomes:
+            mascara = self._linhas(nome, [variavel])
+            valor = self.coluna(nome, 'valor')[mascara]
+            cod_uf = self.coluna(nome, 'cod_uf')[mascara]
+            soma += np.bincount(cod_uf, weights=np.nan_to_num(valor), minlength=len(soma))
+
+        coluna = cultura or 'Total'
+        area = np.round(soma[ufs.index.to_numpy()]).astype(int)
+        # argsort estável sobre -valores: empates mantêm a ordem das UFs
+        ordem = np.argsort(-area, kind='stable')[:n]
+        return pd.DataFrame({'Estado': ufs['nome'].to_numpy()[ordem], coluna: area[ordem]})
+
+    def tabela_estados(self, ano: int = None, variavel: str = sidra.AREA_PLANTADA) -> pd.DataFrame:
+        """Tabela por estado de um ano (ver data.sidra.tabela_estados_pam)."""
+        ano = self.ano_ou_recente(ano)
+        return sidra.tabela_estados_pam(self.ler([ano], variaveis=[variavel]), ano, variavel)
+
+    def tabela_sintese(self, ano: int = None) -> pd.DataFrame:
+        """Síntese nacional de um ano (ver data.sidra.tabela_sintese_pam)."""
+        ano = self.ano_ou_recente(ano)
+        return sidra.tabela_sintese_pam(self.ler([ano]), ano)
+
+
+# ========================================================================
+# ABERTURA A PARTIR DO CSV
+# ========================================================================
+
+def _origem(caminho_csv, opcoes: dict) -> dict:
+    info = os.stat(caminho_csv)
+    return {'arquivo': str(Path(caminho_csv).resolve()), 'tamanho': info.st_size,
+            'mtime_ns': info.st_mtime_ns, 'opcoes': opcoes}
+
+
+def abrir_pam(caminho_csv=None, raiz=None, **opcoes) -> ArmazemPAM:
+    """
+    Abre o armazém da PAM, criando-o a partir do CSV quando necessário.
+
+    O armazém é reaproveitado enquanto o CSV de origem não mudar (mesmo
+    caminho, tamanho e data de modificação, e mesmas opções de leitura);
+    caso contrário é regravado com ler_pam().
+
+    Parâmetros:
+        caminho_csv : exportação CSV da PAM (None = só abrir o armazém)
+        raiz        : diretório do armazém (None = caminho_csv já é o armazém)
+        **opcoes    : sep, decimal, encoding (repassados a ler_pam)
+
+    Retorna:
+        ArmazemPAM
+    """
+    if raiz is None:
+        if caminho_csv is None:
+            raise ValueError("Informe o CSV da PAM ou o diretório do armazém.")
+        return ArmazemPAM(caminho_csv)
+    if caminho_csv is None:
+        return ArmazemPAM(raiz)
+
+    origem = _origem(caminho_csv, opcoes)
+    try:
+        armazem = ArmazemPAM(raiz)
+        if armazem.meta.get('origem') == origem:
+            return armazem
+    except ValueError:
+        pass
+    gravar_armazem(sidra.ler_pam(caminho_csv, **opcoes), raiz, origem)
+    return ArmazemPAM(raiz)
@@ -0,0 +1,330 @@
+"""
+Módulo de Estimativa de Demanda de Semeadoras.
+
+Cruza a área plantada por estado e cultura (ibge_loader ou PAM) com as
+faixas de plantio de cada cultura (culturas.yaml: espaçamentos entre
+linhas e velocidades) e com o número de linhas da máquina, usando os
+kernels de core.capacidade.
+
+Toda a grade é avaliada de uma vez, por broadcasting, com os eixos:
+
+    S : estado          C : cultura          E : opção de espaçamento
+    V : velocidade      R : número de linhas da máquina
+
+As culturas têm números diferentes de espaçamentos e de velocidades; as
+posições que sobram ficam com NaN (ver catalogo_para_array e
+faixa_velocidades) e são descartadas em Demanda.tabela(). Culturas do
+IBGE sem entrada em culturas.yaml (ex: Amendoim) ficam de fora.
+
+estimar_energia() usa os mesmos eixos (sem R) para a energia no eixo da
+manivela: as curvas de torque de todas as culturas e velocidades saem de
+uma única avaliação (SessaoAnalise.energia_ciclo, core.energia) e a
+energia por hectare é multiplicada pela área de cada estado.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from core.capacidade import (EFICIENCIA_PADRAO, HORAS_DIA_PADRAO, capacidade_campo,
+                             faixa_velocidades, horas_maquina, maquinas_necessarias)
+from core.energia import energia_por_hectare
+
+
+N_LINHAS_PADRAO = (7, 9, 11, 13, 15, 17)
+JANELA_PADRAO_DIAS = 30.0
+
+
+@dataclass(frozen=True, slots=True)
+class Demanda:
+    """
+    Resultado de estimar_demanda(): arrays da grade completa.
+
+    Atributos:
+        estados         : nomes dos estados (S,)
+        culturas        : nomes das culturas no IBGE (C,)
+        area_ha         : área plantada (S, C)
+        espacamentos_m  : opções de espaçamento (C, E), NaN completa
+        velocidades_kmh : velocidades de plantio (C, V), NaN completa
+        n_linhas        : números de linhas avaliados (R,)
+        janela_dias     : janela de plantio de cada cultura (C,)
+        capacidade_ha_h : capacidade de campo (C, E, V, R)
+        horas_maquina   : horas-máquina (S, C, E, V, R)
+        maquinas        : máquinas necessárias na janela (S, C, E, V, R)
+    """
+    estados: tuple
+    culturas: tuple
+    area_ha: np.ndarray
+    espacamentos_m: np.ndarray
+    velocidades_kmh: np.ndarray
+    n_linhas: np.ndarray
+    janela_dias: np.ndarray
+    capacidade_ha_h: np.ndarray
+    horas_maquina: np.ndarray
+    maquinas: np.ndarray
+
+    def tabela(self) -> pd.DataFrame:
+        """
+        Grade em formato longo, uma linha por combinação válida.
+
+        Retorna:
+            DataFrame com Estado, cultura, espacamento_m, velocidade_kmh,
+            n_linhas, area_ha, capacidade_ha_h, horas_maquina e maquinas
+        """
+        s, c, e, v, r = np.nonzero(~np.isnan(self.horas_maquina))
+        return pd.DataFrame({
+            'Estado': np.asarray(self.estados)[s],
+            'cultura': np.asarray(self.culturas)[c],
+            'espacamento_m': self.espacamentos_m[c, e],
+            'velocidade_kmh': self.velocidades_kmh[c, v],
+            'n_linhas': self.n_linhas[r],
+            'area_ha': self.area_ha[s, c],
+            'capacidade_ha_h': self.capacidade_ha_h[c, e, v, r],
+            'horas_maquina': self.horas_maquina[s, c, e, v, r],
+            'maquinas': self.maquinas[s, c, e, v, r].astype(int),
+        })
+
+    def resumo(self) -> pd.DataFrame:
+        """
+        Faixa de máquinas por estado e cultura (melhor e pior configuração).
+
+        Retorna:
+            DataFrame com Estado, cultura, area_ha, maquinas_min,
+            maquinas_max e horas_maquina_min
+        """
+        eixos = (2, 3, 4)
+        s, c = np.indices(self.area_ha.shape).reshape(2, -1)
+        return pd.DataFrame({
+            'Estado': np.asarray(self.estados)[s],
+            'cultura': np.asarray(self.culturas)[c],
+            'area_ha': self.area_ha.ravel(),
+            'maquinas_min': np.nanmin(self.maquinas, axis=eixos).ravel().astype(int),
+            'maquinas_max': np.nanmax(self.maquinas, axis=eixos).ravel().astype(int),
+            'horas_maquina_min': np.nanmin(self.horas_maquina, axis=eixos).ravel(),
+        })
+
+
+@dataclass(frozen=True, slots=True)
+class Energia:
+    """
+    Resultado de estimar_energia(): energia no eixo da manivela por estado.
+
+    Atributos:
+        estados         : nomes dos estados (S,)
+        culturas        : nomes das culturas no IBGE (C,)
+        area_ha         : área plantada (S, C)
+        espacamentos_m  : opções de espaçamento (C, E), NaN completa
+        velocidades_kmh : velocidades de plantio (C, V), NaN completa
+        omega_rad_s     : velocidade angular da manivela (C, V)
+        energia_ciclo_J : energia por volta da manivela (C, V)
+        energia_kwh_ha  : energia por hectare (C, E, V)
+        energia_kwh     : energia para semear a área do estado (S, C, E, V)
+    """
+    estados: tuple
+    culturas: tuple
+    area_ha: np.ndarray
+    espacamentos_m: np.ndarray
+    velocidades_kmh: np.ndarray
+    omega_rad_s: np.ndarray
+    energia_ciclo_J: np.ndarray
+    energia_kwh_ha: np.ndarray
+    energia_kwh: np.ndarray
+
+    def tabela(self) -> pd.DataFrame:
+        """
+        Grade em formato longo, uma linha por combinação válida.
+
+        Retorna:
+            DataFrame com Estado, cultura, espacamento_m, velocidade_kmh,
+            omega_rad_s, area_ha, energia_ciclo_J, energia_kwh_ha e energia_kwh
+        """
+        s, c, e, v = np.nonzero(~np.isnan(self.energia_kwh))
+        return pd.DataFrame({
+            'Estado': np.asarray(self.estados)[s],
+            'cultura': np.asarray(self.culturas)[c],
+            'espacamento_m': self.espacamentos_m[c, e],
+            'velocidade_kmh': self.velocidades_kmh[c, v],
+            'omega_rad_s': self.omega_rad_s[c, v],
+            'area_ha': self.area_ha[s, c],
+            'energia_ciclo_J': self.energia_ciclo_J[c, v],
+            'energia_kwh_ha': self.energia_kwh_ha[c, e, v],
+            'energia_kwh': self.energia_kwh[s, c, e, v],
+        })
+
+    def resumo(self) -> pd.DataFrame:
+        """
+        Faixa de energia por estado e cultura (menor e maior configuração).
+
+        Retorna:
+            DataFrame com Estado, cultura, area_ha, kwh_ha_min, kwh_ha_max,
+            mwh_min e mwh_max
+        """
+        s, c = np.indices(self.area_ha.shape).reshape(2, -1)
+        mwh = self.energia_kwh / 1000.0
+        return pd.DataFrame({
+            'Estado': np.asarray(self.estados)[s],
+            'cultura': np.asarray(self.culturas)[c],
+            'area_ha': self.area_ha.ravel(),
+            'kwh_ha_min': np.nanmin(self.energia_kwh_ha, axis=(1, 2))[c],
+            'kwh_ha_max': np.nanmax(self.energia_kwh_ha, axis=(1, 2))[c],
+            'mwh_min': np.nanmin(mwh, axis=(2, 3)).ravel(),
+            'mwh_max': np.nanmax(mwh, axis=(2, 3)).ravel(),
+        })
+
+    def tabela_estados(self) -> pd.DataFrame:
+        """
+        Energia por estado (MWh), no formato de processar_tabela_estados().
+
+        Cada cultura usa a média das suas configurações (espaçamento x
+        velocidade) válidas.
+
+        Retorna:
+            DataFrame com Estado, uma coluna por cultura e Total
+        """
+        mwh = np.nanmean(self.energia_kwh, axis=(2, 3)) / 1000.0   # (S, C)
+        df = pd.DataFrame(mwh, columns=list(self.culturas))
+        df.insert(0, 'Estado', list(self.estados))
+        df['Total'] = mwh.sum(axis=1)
+        return df
+
+
+def _por_cultura(valor, nomes: list, padrao: float) -> np.ndarray:
+    """Escalar ou dict cultura -> valor, como array (C,)."""
+    from utils.config_loader import normalizar_nome
+
+    if not isinstance(valor, dict):
+        return np.full(len(nomes), float(padrao if valor is None else valor))
+    valor = {normalizar_nome(k): float(v) for k, v in valor.items()}
+    return np.array([valor.get(normalizar_nome(n), padrao) for n in nomes], dtype=float)
+
+
+def _alinhar(tabela_estados, catalogo) -> tuple:
+    """
+    Culturas da tabela por estado que têm entrada no catálogo.
+
+    Retorna:
+        (tabela_estados, nomes das colunas, lista de Cultura na mesma ordem)
+    """
+    from utils.config_loader import carregar_catalogo_culturas, normalizar_nome
+
+    if tabela_estados is None:
+        from .ibge_loader import processar_tabela_estados
+        tabela_estados = processar_tabela_estados()
+    if catalogo is None:
+        catalogo = carregar_catalogo_culturas()
+    catalogo = {normalizar_nome(k): v for k, v in catalogo.items()}
+
+    culturas = [c for c in tabela_estados.columns
+                if c not in ('Estado', 'uf_norm', 'Total', 'codigo')
+                and normalizar_nome(c) in catalogo]
+    if not culturas:
+        raise ValueError("Nenhuma cultura da tabela tem dados de plantio no catálogo.")
+    return tabela_estados, culturas, [catalogo[normalizar_nome(c)] for c in culturas]
+
+
+def _faixas(cultura_cat: list) -> tuple:
+    """Espaçamentos (C, E) e velocidades (C, V) das culturas, completados com NaN."""
+    from core.parametros import catalogo_para_array
+
+    registros = catalogo_para_array(cultura_cat)
+    velocidades = faixa_velocidades(registros['velocidade_min_kmh'],
+                                    registros['velocidade_max_kmh'],
+                                    registros['velocidade_passo_kmh'])
+    return registros['espacamentos_m'], velocidades
+
+
+def estimar_demanda(tabela_estados: pd.DataFrame = None, catalogo: dict = None,
+                    n_linhas=N_LINHAS_PADRAO, janela_dias=JANELA_PADRAO_DIAS,
+                    horas_dia: float = HORAS_DIA_PADRAO,
+                    eficiencia: float = EFICIENCIA_PADRAO) -> Demanda:
+    """
+    Capacidade de campo, horas-máquina e máquinas por estado e cultura.
+
+    Parâmetros:
+        tabela_estados : tabela por estado (padrão: processar_tabela_estados();
+                         também aceita as tabelas da PAM)
+        catalogo       : dict nome -> Cultura (padrão: culturas.yaml)
+        n_linhas       : números de linhas da semeadora a avaliar
+        janela_dias    : janela de plantio (dias), escalar ou dict cultura -> dias
+        horas_dia      : horas de trabalho por dia
+        eficiencia     : eficiência de campo (fração 0-1)
+
+    Retorna:
+        Demanda com os arrays da grade (S, C, E, V, R)
+    """
+    tabela_estados, culturas, cultura_cat = _alinhar(tabela_estados, catalogo)
+
+    n_linhas = np.atleast_1d(np.asarray(n_linhas, dtype=float))
+    if np.any(n_linhas < 1):
+        raise ValueError("Número de linhas deve ser >= 1.")
+    espacamentos, velocidades = _faixas(cultura_cat)                  # (C, E), (C, V)
+    janela = _por_cultura(janela_dias, [c.nome for c in cultura_cat],
+                          JANELA_PADRAO_DIAS)                         # (C,)
+    area = tabela_estados[culturas].to_numpy(dtype=float)             # (S, C)
+
+    capacidade = capacidade_campo(velocidades[:, None, :, None],
+                                  espacamentos[:, :, None, None],
+                                  n_linhas, eficiencia)               # (C, E, V, R)
+    horas = horas_maquina(area[:, :, None, None, None], capacidade)   # (S, C, E, V, R)
+    maquinas = maquinas_necessarias(horas, janela[:, None, None, None], horas_dia)
+
+    return Demanda(
+        estados=tuple(tabela_estados['Estado']),
+        culturas=tuple(culturas),
+        area_ha=area,
+        espacamentos_m=espacamentos,
+        velocidades_kmh=velocidades,
+        n_linhas=n_linhas.astype(int),
+        janela_dias=janela,
+        capacidade_ha_h=capacidade,
+        horas_maquina=horas,
+        maquinas=maquinas,
+    )
+
+
+def estimar_energia(tabela_estados: pd.DataFrame = None, catalogo: dict = None,
+                    parametros=None, F_VS_config: dict = None,
+                    regenerativo: bool = False) -> Energia:
+    """
+    Energia no eixo da manivela por hectare e por estado.
+
+    Parâmetros:
+        tabela_estados : tabela por estado (ver estimar_demanda)
+        catalogo       : dict nome -> Cultura (padrão: culturas.yaml)
+        parametros     : ParametrosMecanismo (padrão do projeto se None)
+        F_VS_config    : modelo da força do solo, como em SessaoAnalise.torque
+                         (padrão: {'tipo': 'variavel'})
+        regenerativo   : ver core.energia.energia_ciclo
+
+    Retorna:
+        Energia com os arrays da grade (S, C, E, V)
+    """
+    from core.cinematica import velocidade_angular
+    from core.sessao import SessaoAnalise
+
+    tabela_estados, culturas, cultura_cat = _alinhar(tabela_estados, catalogo)
+    espacamentos, velocidades = _faixas(cultura_cat)                  # (C, E), (C, V)
+    N = np.array([c.sementes_por_metro for c in cultura_cat])        # (C,)
+    area = tabela_estados[culturas].to_numpy(dtype=float)             # (S, C)
+
+    omegas = velocidade_angular(velocidades, N[:, None])              # (C, V)
+    # NaN das velocidades que sobram vira 0 no torque; descartado abaixo
+    ciclo = SessaoAnalise(parametros).energia_ciclo(np.nan_to_num(omegas),
+                                                    F_VS_config or {'tipo': 'variavel'},
+                                                    regenerativo=regenerativo)
+    ciclo[np.isnan(omegas)] = np.nan
+    kwh_ha = energia_por_hectare(ciclo[:, None, :], N[:, None, None],
+                                 espacamentos[:, :, None])            # (C, E, V)
+
+    return Energia(
+        estados=tuple(tabela_estados['Estado']),
+        culturas=tuple(culturas),
+        area_ha=area,
+        espacamentos_m=espacamentos,
+        velocidades_kmh=velocidades,
+        omega_rad_s=omegas,
+        energia_ciclo_J=ciclo,
+        energia_kwh_ha=kwh_ha,
+        energia_kwh=area[:, :, None, None] * kwh_ha,
+    )
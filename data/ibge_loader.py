@@ -2,10 +2,35 @@
 Módulo de Dados do IBGE.
 
 Carrega e processa dados de produção agrícola do IBGE.
+
+As tabelas são montadas uma única vez por processo (lru_cache) e cada
+chamada recebe uma cópia (27 linhas): alterar a cópia não afeta o cache,
+com ou sem o Copy-on-Write do pandas. Os rankings por cultura (e pelo total) também
+são pré-calculados, então obter_top_estados() é só um recorte de N linhas.
 """
 
+import os
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
-from unidecode import unidecode
+
+
+CULTURAS = ["Amendoim", "Soja", "Milho", "Sorgo", "Algodão", "Girassol", "Feijão"]
+
+
+def normalizar_uf(nomes: pd.Series) -> pd.Series:
+    """
+    Normaliza nomes de estados para cruzamento (ex: "São Paulo" -> "SAO PAULO").
+    
+    Vetorizado: decomposição Unicode NFKD, remoção dos acentos (não ASCII)
+    e caixa alta, sem chamada Python por linha.
+    """
+    return (nomes.str.strip()
+                 .str.normalize('NFKD')
+                 .str.encode('ascii', errors='ignore')
+                 .str.decode('ascii')
+                 .str.upper())
 
 
 def processar_tabela_sintese():
@@ -16,6 +41,11 @@ def processar_tabela_sintese():
         DataFrame com colunas: Produtos, Área plantada, Área colhida,
         Quantidade produzida, Rendimento médio, Valor da produção
     """
+    return _tabela_sintese().copy()
+
+
+@lru_cache(maxsize=None)
+def _tabela_sintese():
     t1 = pd.DataFrame({
         "Produtos": ["Amendoim", "Soja", "Milho", "Sorgo", "Algodão", "Girassol", "Feijão"],
         "Área plantada (Hectares)": [286112, 46208798, 21436837, 1382091, 1990451, 59889, 2739357],
@@ -36,6 +66,11 @@ def processar_tabela_estados():
     Retorna:
         DataFrame com colunas: Estado, Amendoim, Soja, Milho, Sorgo, Algodão, Girassol, Feijão
     """
+    return _tabela_estados().copy()
+
+
+@lru_cache(maxsize=None)
+def _tabela_estados():
     dados_estados = {
         "Estado": [
             "Rondônia", "Acre", "Amazonas", "Roraima", "Pará", "Amapá", "Tocantins", "Maranhão", "Piauí", "Ceará",
@@ -59,25 +94,113 @@ def processar_tabela_estados():
         t2[col] = pd.to_numeric(t2[col], errors="coerce").fillna(0).astype(int)
     
     # Normaliza nomes (para cruzar com shapes do IBGE/Geobr)
-    t2["uf_norm"] = t2["Estado"].str.strip().apply(lambda x: unidecode(x).upper())
+    t2["uf_norm"] = normalizar_uf(t2["Estado"])
     
     # Adiciona coluna de total
-    cult_cols = ["Amendoim", "Soja", "Milho", "Sorgo", "Algodão", "Girassol", "Feijão"]
-    t2["Total"] = t2[cult_cols].sum(axis=1)
+    t2["Total"] = t2[CULTURAS].sum(axis=1)
     
     return t2
 
 
-def carregar_dados_ibge():
+@lru_cache(maxsize=None)
+def _ranking(coluna: str) -> pd.DataFrame:
+    """Estado e `coluna` de _tabela_estados(), em ordem decrescente de `coluna`."""
+    t2 = _tabela_estados()
+    # argsort estável sobre -valores: empates mantêm a ordem original
+    ordem = np.argsort(-t2[coluna].to_numpy(), kind='stable')
+    return t2[["Estado", coluna]].take(ordem)
+
+
+def carregar_dados_ibge(caminho_pam=None, ano=None, armazem=None):
     """
     Carrega ambas as tabelas do IBGE.
     
+    Parâmetros:
+        caminho_pam : exportação CSV da PAM/SIDRA (ver data.sidra) ou
+                      diretório de um armazém já gravado; se None (e sem
+                      armazem), usa as tabelas embutidas
+        ano         : ano das tabelas da PAM (padrão: o mais recente)
+        armazem     : diretório do armazém colunar (ver data.armazem),
+                      criado a partir do CSV na primeira chamada
+    
     Retorna:
         tupla (tabela_sintese, tabela_estados)
     """
+    if armazem is not None or (caminho_pam is not None and os.path.isdir(caminho_pam)):
+        from .armazem import abrir_pam
+        pam = abrir_pam(caminho_pam, armazem)
+        return pam.tabela_sintese(ano), pam.tabela_estados(ano)
+    if caminho_pam is not None:
+        from . import sidra
+        pam = sidra.ler_pam(caminho_pam, anos=None if ano is None else [ano])
+        return sidra.tabela_sintese_pam(pam, ano), sidra.tabela_estados_pam(pam, ano)
     return processar_tabela_sintese(), processar_tabela_estados()
 
 
+def carregar_tabela_nivel(nivel='uf', caminho_pam=None, ano=None, armazem=None,
+                          microrregioes=None):
+    """
+    Carrega a área plantada por cultura somada em um nível geográfico.
+    
+    Sem PAM, usa a tabela embutida por estado (níveis 'uf' e 'regiao');
+    com a PAM (CSV ou armazém), soma os municípios em qualquer nível
+    (ver data.agregacao).
+    
+    Parâmetros:
+        nivel         : 'municipio', 'microrregiao', 'uf' ou 'regiao'
+        caminho_pam   : exportação CSV da PAM ou diretório de um armazém
+        ano           : ano dos dados da PAM (padrão: o mais recente)
+        armazem       : diretório do armazém colunar (ver carregar_dados_ibge)
+        microrregioes : CSV ou DataFrame município -> microrregião
+    
+    Retorna:
+        DataFrame com codigo, nome do grupo, uma coluna por cultura e Total
+    """
+    from . import agregacao
+    
+    if caminho_pam is None and armazem is None:
+        if nivel not in ('uf', 'regiao'):
+            raise ValueError(f"Nível '{nivel}' exige os dados municipais da PAM (caminho_pam).")
+        return agregacao.tabela_nivel_estados(_tabela_estados(), nivel)
+    
+    from . import sidra
+    if armazem is not None or os.path.isdir(caminho_pam):
+        from .armazem import abrir_pam
+        arm = abrir_pam(caminho_pam, armazem)
+        ano = arm.ano_ou_recente(ano)
+        pam = arm.ler([ano], variaveis=[sidra.AREA_PLANTADA])
+    else:
+        pam = sidra.ler_pam(caminho_pam, anos=None if ano is None else [ano],
+                            variaveis=[sidra.AREA_PLANTADA])
+    return agregacao.tabela_nivel_pam(pam, nivel, ano, microrregioes=microrregioes)
+
+
+def carregar_tabelas_nivel(nivel='uf', caminho_pam=None, anos=None, armazem=None,
+                           microrregioes=None):
+    """
+    Tabelas de carregar_tabela_nivel() para vários anos, lendo a PAM uma vez.
+    
+    Parâmetros:
+        nivel, caminho_pam, armazem, microrregioes : ver carregar_tabela_nivel
+        anos : anos desejados (None = todos os anos da PAM)
+    
+    Retorna:
+        dict ano -> tabela, em ordem de ano; sem PAM, {None: tabela embutida}
+    """
+    if caminho_pam is None and armazem is None:
+        return {None: carregar_tabela_nivel(nivel)}
+    
+    from . import agregacao, sidra
+    if armazem is not None or os.path.isdir(caminho_pam):
+        from .armazem import abrir_pam
+        pam = abrir_pam(caminho_pam, armazem).ler(anos, variaveis=[sidra.AREA_PLANTADA])
+    else:
+        pam = sidra.ler_pam(caminho_pam, anos=anos, variaveis=[sidra.AREA_PLANTADA])
+    indice = agregacao.indice_pam(pam, microrregioes)
+    return {ano: agregacao.tabela_nivel_pam(pam, nivel, ano, indice=indice)
+            for ano in sorted(set(pam['ano'].tolist()))}
+
+
 def obter_top_estados(cultura, n=10):
     """
     Retorna os top N estados por área plantada para uma cultura específica.
@@ -89,13 +212,10 @@ def obter_top_estados(cultura, n=10):
     Retorna:
         DataFrame com Estado e área plantada, ordenado
     """
-    t2 = processar_tabela_estados()
-    
-    if cultura not in t2.columns:
-        raise ValueError(f"Cultura '{cultura}' não encontrada. Disponíveis: {list(t2.columns[1:-2])}")
+    if cultura not in CULTURAS:
+        raise ValueError(f"Cultura '{cultura}' não encontrada. Disponíveis: {CULTURAS}")
     
-    top = t2[["Estado", cultura]].sort_values(cultura, ascending=False).head(n)
-    return top
+    return _top(cultura, n)
 
 
 def obter_top_estados_total(n=10):
@@ -108,6 +228,8 @@ def obter_top_estados_total(n=10):
     Retorna:
         DataFrame com Estado e Total, ordenado
     """
-    t2 = processar_tabela_estados()
-    top = t2[["Estado", "Total"]].sort_values("Total", ascending=False).head(n)
-    return top
+    return _top("Total", n)
+
+
+def _top(coluna: str, n: int) -> pd.DataFrame:
+    return _ranking(coluna).head(n).copy()
@@ -0,0 +1,369 @@
+"""
+Módulo de Exportação de Resultados em Formato Colunar.
+
+Grava as curvas calculadas (θ, posição, velocidade, aceleração, jerk,
+F_VS, F_B, F_M, τ) e os parâmetros que as geraram, para que ferramentas
+externas leiam os números sem refazer as contas.
+
+Os dados ficam em formato "longo": uma linha por ângulo, agrupadas em
+segmentos contíguos (ex: uma cultura ou uma geometria) e ordenadas por θ
+dentro de cada segmento. Os limites dos segmentos ficam nos metadados, o
+que permite ler só um segmento e só uma faixa de ângulos.
+
+Formatos:
+    'npy'     : diretório com um .npy por coluna + _meta.json
+                (sem compressão, lido com memory-map)
+    'npz'     : arquivo .npz comprimido (cada coluna é lida sob demanda)
+    'parquet' : requer pyarrow (um row group por segmento, comprimido)
+    'hdf5'    : requer h5py (datasets comprimidos e em blocos)
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Sequence
+
+import numpy as np
+
+
+FORMATOS = ('npy', 'npz', 'parquet', 'hdf5')
+ARQUIVO_META = '_meta.json'
+
+
+# ========================================================================
+# MONTAGEM DAS TABELAS
+# ========================================================================
+
+def _empilhar(segmentos: Dict[str, Dict[str, np.ndarray]]) -> tuple:
+    """
+    Concatena segmentos {nome: {coluna: array}} em colunas únicas.
+
+    Retorna:
+        (colunas, limites) onde limites = {nome: [inicio, fim]}
+    """
+    nomes_colunas = None
+    partes: Dict[str, List[np.ndarray]] = {}
+    limites = {}
+    inicio = 0
+    for nome, cols in segmentos.items():
+        if nomes_colunas is None:
+            nomes_colunas = list(cols)
+            partes = {c: [] for c in nomes_colunas}
+        elif list(cols) != nomes_colunas:
+            raise ValueError(f"Segmento '{nome}' com colunas diferentes: {list(cols)}")
+        n = len(cols[nomes_colunas[0]])
+        for c in nomes_colunas:
+            arr = np.asarray(cols[c], dtype=float)
+            if arr.shape != (n,):
+                raise ValueError(f"Coluna '{c}' do segmento '{nome}' com tamanho {arr.shape}, esperado ({n},).")
+            partes[c].append(arr)
+        limites[nome] = [inicio, inicio + n]
+        inicio += n
+
+    colunas = {c: np.concatenate(v) for c, v in partes.items()}
+    return colunas, limites
+
+
+def tabela_cinematica(res: dict, parametros=None) -> tuple:
+    """
+    Converte o resultado de SessaoAnalise.cinematica() em tabela colunar.
+
+    Retorna:
+        (colunas, metadados) com um segmento por cultura
+    """
+    segmentos = {}
+    for nome in res['velocidades']:
+        segmentos[nome] = {
+            'theta_deg': res['theta_deg'],
+            'posicao_mm': res['y_solo'],
+            'velocidade_mm_s': res['velocidades'][nome]['velocidade'],
+            'aceleracao_mm_s2': res['aceleracoes'][nome]['aceleracao'],
+            'jerk_mm_s3': res['jerks'][nome]['jerk'],
+        }
+    colunas, limites = _empilhar(segmentos)
+    meta = {
+        'tipo': 'cinematica',
+        'segmentos': limites,
+        'omegas_rad_s': {k: float(v) for k, v in res['omegas'].items()},
+        'theta_solo': {k: float(v) for k, v in res['theta_solo'].items()},
+    }
+    if parametros is not None:
+        meta['parametros'] = _parametros_dict(parametros)
+    return colunas, meta
+
+
+def tabela_torque(resultados: Dict[str, dict], parametros=None) -> tuple:
+    """
+    Converte resultados de SessaoAnalise.torque() em tabela colunar.
+
+    Parâmetros:
+        resultados : dict nome do segmento -> resultado de torque()
+                     (ex: {'soja': ..., 'milho': ...} ou {'omega=20': ...})
+        parametros : ParametrosMecanismo usado (opcional, vai para os metadados)
+
+    Retorna:
+        (colunas, metadados) com um segmento por resultado
+    """
+    segmentos = {
+        nome: {
+            'theta_deg': r['theta_deg'],
+            'F_VS_N': r['F_VS'],
+            'F_B_N': r['F_B'],
+            'F_M_N': r['F_M'],
+            'torque_Nm': r['torque'],
+        }
+        for nome, r in resultados.items()
+    }
+    colunas, limites = _empilhar(segmentos)
+    meta = {
+        'tipo': 'torque',
+        'segmentos': limites,
+        'omegas_rad_s': {k: float(r['omega']) for k, r in resultados.items()},
+        'modelo_fvs': {k: r['info'] for k, r in resultados.items() if r.get('info')},
+    }
+    if parametros is not None:
+        meta['parametros'] = _parametros_dict(parametros)
+    return colunas, meta
+
+
+def tabela_varredura(linhas: Sequence[dict]) -> tuple:
+    """
+    Converte as linhas de uma varredura (uma por combinação) em colunas.
+
+    Retorna:
+        (colunas, metadados) com um único segmento 'varredura'
+    """
+    if not linhas:
+        raise ValueError("Varredura vazia.")
+    colunas = {c: np.array([l[c] for l in linhas], dtype=float) for c in linhas[0]}
+    return colunas, {'tipo': 'varredura', 'segmentos': {'varredura': [0, len(linhas)]}}
+
+
+def _parametros_dict(parametros) -> dict:
+    from dataclasses import asdict
+    return asdict(parametros)
+
+
+# ========================================================================
+# ESCRITA
+# ========================================================================
+
+def gravar_resultados(caminho: str, colunas: Dict[str, np.ndarray], metadados: dict,
+                      formato: str = 'npy') -> str:
+    """
+    Grava uma tabela colunar com seus metadados.
+
+    Parâmetros:
+        caminho   : diretório ('npy') ou arquivo ('npz', 'parquet', 'hdf5')
+        colunas   : dict nome -> array 1D (todas do mesmo tamanho)
+        metadados : dict serializável em JSON; deve conter 'segmentos'
+        formato   : um de FORMATOS
+
+    Retorna:
+        caminho gravado
+    """
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato inválido: '{formato}'. Use {FORMATOS}.")
+    tamanhos = {len(v) for v in colunas.values()}
+    if len(tamanhos) != 1:
+        raise ValueError("Todas as colunas devem ter o mesmo tamanho.")
+    metadados = {**metadados, 'colunas': list(colunas), 'n_linhas': tamanhos.pop()}
+    metadados.setdefault('segmentos', {'todos': [0, metadados['n_linhas']]})
+
+    destino = Path(caminho)
+    destino.parent.mkdir(parents=True, exist_ok=True)
+    return {
+        'npy': _gravar_npy,
+        'npz': _gravar_npz,
+        'parquet': _gravar_parquet,
+        'hdf5': _gravar_hdf5,
+    }[formato](destino, colunas, metadados)
+
+
+def _verificar_destino_npy(destino: Path):
+    """Só substitui um diretório vazio ou uma exportação anterior (com _meta.json)."""
+    if not destino.exists():
+        return
+    if not destino.is_dir():
+        raise ValueError(f"'{destino}' já existe e não é um diretório.")
+    if not (destino / ARQUIVO_META).exists() and any(destino.iterdir()):
+        raise ValueError(f"'{destino}' não está vazio e não é uma exportação anterior "
+                         f"(sem {ARQUIVO_META}); escolha outro caminho.")
+
+
+def trocar_diretorio(novo: Path, destino: Path):
+    """
+    Põe o diretório `novo` no lugar de `destino`.
+
+    O diretório antigo é renomeado para o lado antes do os.replace e só é
+    apagado depois da troca; se a troca falhar, ele volta para o lugar.
+    """
+    if not destino.exists():
+        os.replace(novo, destino)
+        return
+    lixo = Path(tempfile.mkdtemp(prefix='.old_', dir=destino.parent))
+    antigo = lixo / destino.name
+    os.replace(destino, antigo)
+    try:
+        os.replace(novo, destino)
+    except BaseException:
+        os.replace(antigo, destino)
+        shutil.rmtree(lixo, ignore_errors=True)
+        raise
+    shutil.rmtree(lixo, ignore_errors=True)
+
+
+def _gravar_npy(destino: Path, colunas, meta) -> str:
+    _verificar_destino_npy(destino)
+    # Grava em diretório temporário e renomeia: leitores nunca veem meio arquivo
+    tmp = Path(tempfile.mkdtemp(prefix='.tmp_', dir=destino.parent))
+    try:
+        for nome, arr in colunas.items():
+            np.save(tmp / f'{nome}.npy', np.ascontiguousarray(arr))
+        with open(tmp / ARQUIVO_META, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2, default=float)
+        trocar_diretorio(tmp, destino)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    return str(destino)
+
+
+def _gravar_npz(destino: Path, colunas, meta) -> str:
+    tmp = destino.with_name(destino.name + '.tmp.npz')
+    np.savez_compressed(tmp, __meta__=np.array(json.dumps(meta, default=float)), **colunas)
+    os.replace(tmp, destino)
+    return str(destino)
+
+
+def _gravar_parquet(destino: Path, colunas, meta) -> str:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Formato 'parquet' requer pyarrow (pip install pyarrow).")
+
+    tabela = pa.table(colunas)
+    tabela = tabela.replace_schema_metadata({'meta': json.dumps(meta, default=float)})
+    # Um row group por segmento: leitores pulam os segmentos que não pedem
+    with pq.ParquetWriter(str(destino), tabela.schema, compression='zstd') as w:
+        for inicio, fim in meta['segmentos'].values():
+            w.write_table(tabela.slice(inicio, fim - inicio))
+    return str(destino)
+
+
+def _gravar_hdf5(destino: Path, colunas, meta) -> str:
+    try:
+        import h5py
+    except ImportError:
+        raise ImportError("Formato 'hdf5' requer h5py (pip install h5py).")
+
+    with h5py.File(destino, 'w') as f:
+        f.attrs['meta'] = json.dumps(meta, default=float)
+        for nome, arr in colunas.items():
+            f.create_dataset(nome, data=arr, compression='gzip', shuffle=True,
+                             chunks=(min(len(arr), 65536),) if len(arr) else None)
+    return str(destino)
+
+
+# ========================================================================
+# LEITURA
+# ========================================================================
+
+def _detectar_formato(caminho: Path) -> str:
+    if caminho.is_dir():
+        return 'npy'
+    sufixo = caminho.suffix.lower()
+    if sufixo == '.npz':
+        return 'npz'
+    if sufixo in ('.parquet', '.pq'):
+        return 'parquet'
+    if sufixo in ('.h5', '.hdf5'):
+        return 'hdf5'
+    raise ValueError(f"Não foi possível detectar o formato de '{caminho}'.")
+
+
+def ler_metadados(caminho: str) -> dict:
+    """Lê somente os metadados de um resultado gravado."""
+    caminho = Path(caminho)
+    formato = _detectar_formato(caminho)
+    if formato == 'npy':
+        with open(caminho / ARQUIVO_META, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    if formato == 'npz':
+        with np.load(caminho) as z:
+            return json.loads(str(z['__meta__']))
+    if formato == 'parquet':
+        import pyarrow.parquet as pq
+        return json.loads(pq.read_schema(str(caminho)).metadata[b'meta'])
+    import h5py
+    with h5py.File(caminho, 'r') as f:
+        return json.loads(f.attrs['meta'])
+
+
+def ler_resultados(caminho: str, colunas: Iterable[str] = None, segmento: str = None,
+                   theta_min: float = None, theta_max: float = None) -> Dict[str, np.ndarray]:
+    """
+    Lê colunas de um resultado gravado, opcionalmente recortando.
+
+    Parâmetros:
+        caminho   : diretório ou arquivo gravado por gravar_resultados
+        colunas   : colunas desejadas (todas se None)
+        segmento  : nome do segmento (ex: 'soja'); todos se None
+        theta_min : ângulo inicial (graus), exige segmento e coluna 'theta_deg'
+        theta_max : ângulo final (graus), idem
+
+    Retorna:
+        dict coluna -> array. No formato 'npy' os arrays são views
+        somente leitura sobre arquivos mapeados em memória (sem cópia).
+    """
+    caminho = Path(caminho)
+    formato = _detectar_formato(caminho)
+    meta = ler_metadados(caminho)
+    colunas = list(colunas) if colunas is not None else meta['colunas']
+    desconhecidas = set(colunas) - set(meta['colunas'])
+    if desconhecidas:
+        raise ValueError(f"Colunas inexistentes: {sorted(desconhecidas)}. Disponíveis: {meta['colunas']}")
+
+    if segmento is not None:
+        if segmento not in meta['segmentos']:
+            raise ValueError(f"Segmento '{segmento}' não encontrado. Disponíveis: {list(meta['segmentos'])}")
+        inicio, fim = meta['segmentos'][segmento]
+    else:
+        inicio, fim = 0, meta['n_linhas']
+
+    if theta_min is not None or theta_max is not None:
+        if segmento is None and len(meta['segmentos']) > 1:
+            raise ValueError("Recorte por θ exige 'segmento' (θ só é ordenado dentro de cada segmento).")
+        theta = _ler_intervalo(caminho, formato, 'theta_deg', inicio, fim)
+        i0 = np.searchsorted(theta, theta_min, 'left') if theta_min is not None else 0
+        i1 = np.searchsorted(theta, theta_max, 'right') if theta_max is not None else len(theta)
+        inicio, fim = inicio + int(i0), inicio + int(i1)
+
+    return {c: _ler_intervalo(caminho, formato, c, inicio, fim) for c in colunas}
+
+
+def _ler_intervalo(caminho: Path, formato: str, coluna: str, inicio: int, fim: int) -> np.ndarray:
+    """Lê apenas as linhas [inicio, fim) de uma coluna."""
+    if formato == 'npy':
+        return np.load(caminho / f'{coluna}.npy', mmap_mode='r')[inicio:fim]
+    if formato == 'npz':
+        with np.load(caminho) as z:
+            return z[coluna][inicio:fim]
+    if formato == 'parquet':
+        import pyarrow.parquet as pq
+        arquivo = pq.ParquetFile(str(caminho))
+        # Lê só os row groups que cruzam o intervalo
+        partes, base = [], 0
+        for i in range(arquivo.num_row_groups):
+            n = arquivo.metadata.row_group(i).num_rows
+            if base < fim and base + n > inicio:
+                col = arquivo.read_row_group(i, columns=[coluna]).column(0).to_numpy()
+                partes.append(col[max(inicio - base, 0):min(fim - base, n)])
+            base += n
+        return np.concatenate(partes) if partes else np.empty(0)
+    import h5py
+    with h5py.File(caminho, 'r') as f:
+        return f[coluna][inicio:fim]
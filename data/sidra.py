@@ -0,0 +1,280 @@
+"""
+Módulo de Ingestão da PAM (Produção Agrícola Municipal) do IBGE/SIDRA.
+
+Lê exportações CSV da tabela 5457 do SIDRA (formato longo: uma linha por
+município, ano, variável e produto) em blocos, com tipos explícitos e
+colunas categóricas, de modo que a memória usada dependa do tamanho do
+resultado compacto e não do texto do arquivo. Os valores especiais do
+IBGE são tratados na leitura:
+
+    "-"              : zero absoluto (não resultante de arredondamento)
+    "...", "..", "X" : dado não aplicável, não disponível ou suprimido (NA)
+
+A partir da tabela longa, tabela_estados_pam() e tabela_sintese_pam()
+produzem DataFrames no mesmo formato de processar_tabela_estados() e
+processar_tabela_sintese(), consumidos pelas funções de plot_ibge.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from .ibge_loader import CULTURAS, normalizar_uf
+
+
+# ========================================================================
+# TABELAS DE REFERÊNCIA
+# ========================================================================
+
+# (código IBGE, sigla, nome, código da região, região)
+UFS = (
+    (11, 'RO', 'Rondônia', 1, 'Norte'),
+    (12, 'AC', 'Acre', 1, 'Norte'),
+    (13, 'AM', 'Amazonas', 1, 'Norte'),
+    (14, 'RR', 'Roraima', 1, 'Norte'),
+    (15, 'PA', 'Pará', 1, 'Norte'),
+    (16, 'AP', 'Amapá', 1, 'Norte'),
+    (17, 'TO', 'Tocantins', 1, 'Norte'),
+    (21, 'MA', 'Maranhão', 2, 'Nordeste'),
+    (22, 'PI', 'Piauí', 2, 'Nordeste'),
+    (23, 'CE', 'Ceará', 2, 'Nordeste'),
+    (24, 'RN', 'Rio Grande do Norte', 2, 'Nordeste'),
+    (25, 'PB', 'Paraíba', 2, 'Nordeste'),
+    (26, 'PE', 'Pernambuco', 2, 'Nordeste'),
+    (27, 'AL', 'Alagoas', 2, 'Nordeste'),
+    (28, 'SE', 'Sergipe', 2, 'Nordeste'),
+    (29, 'BA', 'Bahia', 2, 'Nordeste'),
+    (31, 'MG', 'Minas Gerais', 3, 'Sudeste'),
+    (32, 'ES', 'Espírito Santo', 3, 'Sudeste'),
+    (33, 'RJ', 'Rio de Janeiro', 3, 'Sudeste'),
+    (35, 'SP', 'São Paulo', 3, 'Sudeste'),
+    (41, 'PR', 'Paraná', 4, 'Sul'),
+    (42, 'SC', 'Santa Catarina', 4, 'Sul'),
+    (43, 'RS', 'Rio Grande do Sul', 4, 'Sul'),
+    (50, 'MS', 'Mato Grosso do Sul', 5, 'Centro-Oeste'),
+    (51, 'MT', 'Mato Grosso', 5, 'Centro-Oeste'),
+    (52, 'GO', 'Goiás', 5, 'Centro-Oeste'),
+    (53, 'DF', 'Distrito Federal', 5, 'Centro-Oeste'),
+)
+
+# Nome do produto no SIDRA -> nome curto usado no projeto
+CULTURAS_SIDRA = {
+    'Amendoim (em casca)': 'Amendoim',
+    'Soja (em grão)': 'Soja',
+    'Milho (em grão)': 'Milho',
+    'Sorgo (em grão)': 'Sorgo',
+    'Algodão herbáceo (em caroço)': 'Algodão',
+    'Girassol (em grão)': 'Girassol',
+    'Feijão (em grão)': 'Feijão',
+}
+
+# Cabeçalho do SIDRA -> nome interno
+COLUNAS_SIDRA = {
+    'Município (Código)': 'cod_municipio',
+    'Município': 'municipio',
+    'Ano': 'ano',
+    'Variável': 'variavel',
+    'Produto das lavouras temporárias e permanentes': 'cultura',
+    'Unidade de Medida': 'unidade',
+    'Valor': 'valor',
+}
+
+AREA_PLANTADA = 'Área plantada ou destinada à colheita'
+AREA_COLHIDA = 'Área colhida'
+QUANTIDADE = 'Quantidade produzida'
+VALOR = 'Valor da produção'
+
+ZERO_ABSOLUTO = '-'
+SEM_DADO = ('...', '..', 'X')
+
+CATEGORICAS = ('municipio', 'variavel', 'cultura', 'unidade')
+
+
+def tabela_ufs() -> pd.DataFrame:
+    """UFs indexadas pelo código IBGE: sigla, nome, cod_regiao, regiao."""
+    ufs = pd.DataFrame(UFS, columns=['cod_uf', 'sigla', 'nome', 'cod_regiao', 'regiao'])
+    return ufs.astype({'cod_uf': 'int8', 'cod_regiao': 'int8'}).set_index('cod_uf')
+
+
+# ========================================================================
+# LEITURA EM BLOCOS
+# ========================================================================
+
+def _linha_cabecalho(caminho, encoding: str) -> int:
+    """Número da linha do cabeçalho (as exportações do SIDRA têm um preâmbulo)."""
+    with open(caminho, encoding=encoding) as f:
+        for i, linha in enumerate(f):
+            if 'Município (Código)' in linha:
+                return i
+            if i > 50:
+                break
+    raise ValueError(f"Cabeçalho da PAM (coluna 'Município (Código)') não encontrado em {caminho}.")
+
+
+def _valores(texto: pd.Series, decimal: str) -> pd.Series:
+    """Converte a coluna Valor: '-' -> 0, '...'/'..'/'X' -> NA."""
+    texto = texto.str.strip()
+    if decimal != '.':
+        texto = texto.str.replace('.', '', regex=False).str.replace(decimal, '.', regex=False)
+    texto = texto.mask(texto == ZERO_ABSOLUTO, '0')
+    return pd.to_numeric(texto.mask(texto.isin(SEM_DADO)), errors='coerce').astype('float64')
+
+
+def _compactar(bloco: pd.DataFrame, decimal: str, anos, culturas, variaveis) -> pd.DataFrame:
+    bloco = bloco.rename(columns=COLUNAS_SIDRA)
+
+    # Rodapé ("Fonte: IBGE ...") e linhas sem código de município são descartados
+    cod = pd.to_numeric(bloco['cod_municipio'], errors='coerce')
+    ano = pd.to_numeric(bloco['ano'], errors='coerce')
+    manter = cod.notna() & ano.notna()
+    if anos is not None:
+        manter &= ano.isin(anos)
+    if culturas is not None:
+        manter &= bloco['cultura'].isin(culturas) | bloco['cultura'].map(CULTURAS_SIDRA).isin(culturas)
+    if variaveis is not None:
+        manter &= bloco['variavel'].isin(variaveis)
+    bloco, cod, ano = bloco[manter], cod[manter], ano[manter]
+
+    compacto = pd.DataFrame({
+        'ano': ano.astype('int16'),
+        'cod_municipio': cod.astype('int32'),
+        'cod_uf': (cod // 100000).astype('int8'),
+    })
+    for coluna in CATEGORICAS:
+        compacto[coluna] = bloco[coluna].astype('category')
+    compacto['valor'] = _valores(bloco['valor'], decimal)
+    return compacto
+
+
+def _concatenar(partes: list) -> pd.DataFrame:
+    """Junta os blocos unindo as categorias (concat simples voltaria a object)."""
+    if not partes:
+        raise ValueError("Nenhuma linha da PAM corresponde aos filtros.")
+    colunas = {}
+    for coluna in partes[0].columns:
+        if coluna in CATEGORICAS:
+            unidas = union_categoricals([p[coluna] for p in partes], sort_categories=True)
+            colunas[coluna] = pd.Categorical(unidas)
+        else:
+            colunas[coluna] = np.concatenate([p[coluna].to_numpy() for p in partes])
+    return pd.DataFrame(colunas)
+
+
+def ler_pam(caminho, tamanho_bloco: int = 100_000, anos=None, culturas=None,
+            variaveis=None, sep: str = ',', decimal: str = '.',
+            encoding: str = 'utf-8') -> pd.DataFrame:
+    """
+    Lê uma exportação CSV da PAM (SIDRA, tabela 5457) em blocos.
+
+    Parâmetros:
+        caminho       : arquivo CSV (formato longo do SIDRA)
+        tamanho_bloco : linhas lidas por vez (limita a memória do texto)
+        anos          : anos a manter (None = todos)
+        culturas      : culturas a manter, pelo nome do SIDRA ou curto (None = todas)
+        variaveis     : variáveis a manter (None = todas)
+        sep, decimal  : separador de campos e separador decimal do arquivo
+        encoding      : codificação do arquivo
+
+    Retorna:
+        DataFrame longo com colunas ano (int16), cod_municipio (int32),
+        cod_uf (int8), municipio, variavel, cultura, unidade (categóricas)
+        e valor (float64, NA quando o IBGE não informa)
+    """
+    caminho = Path(caminho)
+    faltando = None
+    partes = []
+    leitor = pd.read_csv(caminho, sep=sep, encoding=encoding,
+                         skiprows=_linha_cabecalho(caminho, encoding),
+                         usecols=lambda c: c in COLUNAS_SIDRA,
+                         dtype=str, keep_default_na=False,
+                         chunksize=tamanho_bloco)
+    with leitor:
+        for bloco in leitor:
+            if faltando is None:
+                faltando = set(COLUNAS_SIDRA) - set(bloco.columns)
+                if faltando:
+                    raise ValueError(f"Colunas ausentes na PAM: {sorted(faltando)}")
+            partes.append(_compactar(bloco, decimal, anos, culturas, variaveis))
+    return _concatenar([p for p in partes if len(p)])
+
+
+# ========================================================================
+# TABELAS NO FORMATO DE ibge_loader
+# ========================================================================
+
+def _nome_curto(cultura: pd.Series) -> pd.Series:
+    return cultura.astype(str).map(lambda nome: CULTURAS_SIDRA.get(nome, nome))
+
+
+def _ordenar_culturas(nomes) -> list:
+    conhecidas = [c for c in CULTURAS if c in nomes]
+    return conhecidas + sorted(set(nomes) - set(conhecidas))
+
+
+def tabela_estados_pam(pam: pd.DataFrame, ano: int = None,
+                       variavel: str = AREA_PLANTADA) -> pd.DataFrame:
+    """
+    Tabela por estado no formato de processar_tabela_estados().
+
+    Parâmetros:
+        pam      : resultado de ler_pam()
+        ano      : ano da tabela (padrão: o mais recente)
+        variavel : variável somada por estado (padrão: área plantada)
+
+    Retorna:
+        DataFrame com Estado, uma coluna inteira por cultura, uf_norm e
+        Total, com as 27 UFs (zero onde não há produção)
+    """
+    ano = int(pam['ano'].max()) if ano is None else ano
+    sel = pam[(pam['ano'] == ano) & (pam['variavel'] == variavel)]
+    if sel.empty:
+        raise ValueError(f"Sem dados de '{variavel}' para o ano {ano}.")
+
+    largura = (sel.assign(cultura=_nome_curto(sel['cultura']))
+                  .pivot_table(index='cod_uf', columns='cultura', values='valor',
+                               aggfunc='sum', observed=True))
+    culturas = _ordenar_culturas(largura.columns)
+    ufs = tabela_ufs()
+    largura = largura.reindex(index=ufs.index, columns=culturas).fillna(0).round().astype(int)
+
+    t2 = pd.DataFrame({'Estado': ufs['nome'].to_numpy()})
+    for cultura in culturas:
+        t2[cultura] = largura[cultura].to_numpy()
+    t2['uf_norm'] = normalizar_uf(t2['Estado'])
+    t2['Total'] = t2[culturas].sum(axis=1)
+    return t2
+
+
+def tabela_sintese_pam(pam: pd.DataFrame, ano: int = None) -> pd.DataFrame:
+    """
+    Síntese nacional por cultura no formato de processar_tabela_sintese().
+
+    O rendimento médio é recalculado a partir dos totais (quantidade /
+    área colhida) e o valor da produção é convertido de mil R$ para R$.
+
+    Parâmetros:
+        pam : resultado de ler_pam()
+        ano : ano da síntese (padrão: o mais recente)
+    """
+    ano = int(pam['ano'].max()) if ano is None else ano
+    sel = pam[pam['ano'] == ano]
+    totais = (sel.assign(cultura=_nome_curto(sel['cultura']))
+                 .pivot_table(index='cultura', columns='variavel', values='valor',
+                              aggfunc='sum', observed=True)
+                 .reindex(columns=[AREA_PLANTADA, AREA_COLHIDA, QUANTIDADE, VALOR])
+                 .fillna(0))
+    totais = totais.reindex(_ordenar_culturas(totais.index))
+
+    colhida = totais[AREA_COLHIDA].to_numpy()
+    quantidade = totais[QUANTIDADE].to_numpy()
+    rendimento = np.divide(quantidade * 1000, colhida, out=np.zeros_like(colhida), where=colhida > 0)
+    return pd.DataFrame({
+        "Produtos": totais.index.to_list(),
+        "Área plantada (Hectares)": totais[AREA_PLANTADA].round().astype(int).to_numpy(),
+        "Área colhida (Hectares)": colhida.round().astype(int),
+        "Quantidade produzida (Toneladas)": quantidade.round().astype(int),
+        "Rendimento médio (kg/ha)": rendimento.round().astype(int),
+        "Valor da produção (R$)": (totais[VALOR] * 1000).round().astype('int64').to_numpy(),
+    })
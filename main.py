@@ -5,39 +5,36 @@ DOSADOR DE SEMENTES - Sistema Principal
 Interface de linha de comando para análise cinemática, cálculo de torque
 e visualização de dados de plantio.
 
+Sem argumentos, abre o menu interativo. Com argumentos, executa a CLI
+não interativa (ver pipeline/cli.py), ex.:
+
+    python main.py torque --cultura soja --resumo
+
 Autor: José Gabriel
 Projeto: TCC - Dosador de Sementes
 """
 
 import os
-import numpy as np
+import sys
 
-# Importações dos módulos do projeto
-from core import cinematica as cin
-from core import forcas_torque as ft
-from core import espacamento as esp
-from data import ibge_loader
-from visualization import (
-    plot_cinematica, plot_torque, plot_espacamento, plot_ibge
-)
-from utils import config_loader
+# Importações dos módulos do projeto (tardias: numpy, scipy, pandas e
+# matplotlib só são carregados quando uma análise os usa)
+from utils.importacao import modulo_tardio
+
+cin = modulo_tardio('core.cinematica')
+esp = modulo_tardio('core.espacamento')
+ibge_loader = modulo_tardio('data.ibge_loader')
+plot_cinematica = modulo_tardio('visualization.plot_cinematica')
+plot_torque = modulo_tardio('visualization.plot_torque')
+plot_espacamento = modulo_tardio('visualization.plot_espacamento')
+plot_ibge = modulo_tardio('visualization.plot_ibge')
+config_loader = modulo_tardio('utils.config_loader')
 
 
 # ========================================================================
 # CONSTANTES GLOBAIS (Configuração padrão)
 # ========================================================================
 
-# Geometria do mecanismo (mm)
-R_MM = 84.01
-L_MM = 210.0
-H_MM = 347.46
-ALTURA_CENTRO_MM = 591.47
-
-# Massas e gravidade
-M_HASTE_KG = 1.16094
-M_BIELA_KG = 0.75022
-G_MS2 = 9.81
-
 # Condições cinemáticas
 ALPHA_DEFAULT = 0.0
 BETA_DEFAULT = 0.0
@@ -45,6 +42,20 @@ BETA_DEFAULT = 0.0
 # Diretório de saída
 OUTPUT_DIR = "output/images"
 
+# Sessão usada pelo menu interativo (parâmetros padrão do mecanismo), criada
+# no primeiro uso. Os parâmetros são imutáveis: o menu de configuração troca
+# a sessão inteira.
+SESSAO = None
+
+
+def obter_sessao():
+    """Retorna a sessão do menu, criando-a na primeira chamada."""
+    global SESSAO
+    if SESSAO is None:
+        from core.sessao import SessaoAnalise
+        SESSAO = SessaoAnalise(output_dir=OUTPUT_DIR)
+    return SESSAO
+
 
 # ========================================================================
 # MENU PRINCIPAL
@@ -76,8 +87,8 @@ def menu_cinematica():
 
     # Carregar culturas
     try:
-        culturas_yaml = config_loader.carregar_culturas()
-        culturas_disponiveis = list(culturas_yaml.keys())
+        catalogo = config_loader.carregar_catalogo_culturas()
+        culturas_disponiveis = list(catalogo.keys())
 
         print("\nCulturas disponíveis:")
         for i, cult in enumerate(culturas_disponiveis, 1):
@@ -102,7 +113,7 @@ def menu_cinematica():
 
         # Executar análise
         print("\n🔄 Processando análise cinemática...")
-        executar_analise_cinematica(culturas_selecionadas, culturas_yaml)
+        executar_analise_cinematica(culturas_selecionadas, catalogo)
 
     except Exception as e:
         print(f"❌ Erro: {e}")
@@ -152,19 +163,15 @@ def menu_torque():
 
         elif opcao_omega == '2':
             # Carregar culturas e mostrar velocidades
-            culturas_yaml = config_loader.carregar_culturas()
+            catalogo = config_loader.carregar_catalogo_culturas()
 
             print("\n📊 Velocidades angulares por cultura:")
             print("-" * 60)
 
             omegas_culturas = {}
-            for nome, dados in culturas_yaml.items():
-                vt_max = dados['planting_speed_kmh']['max']
-                dens = dados['plant_density_per_hectare']
-                germ = dados['germination_rate']
-
-                N = cin.sementes_por_metro(dens['min'], dens['max'], germ['min'], germ['max'])
-                omega = cin.velocidade_angular(vt_max, N)
+            for nome, cultura in catalogo.items():
+                vt_max = cultura.velocidade_max_kmh
+                omega = cultura.omega()
                 omega_rpm = cin.omega_rpm(omega)
 
                 omegas_culturas[nome] = omega
@@ -214,18 +221,16 @@ def menu_espacamento():
     print("-" * 60)
 
     try:
-        culturas_yaml = config_loader.carregar_culturas()
+        catalogo = config_loader.carregar_catalogo_culturas()
 
         # Preparar dados para cálculo
         culturas_dict = {}
-        for nome, dados in culturas_yaml.items():
-            dens = dados['plant_density_per_hectare']
-            germ = dados['germination_rate']
+        for nome, cultura in catalogo.items():
             culturas_dict[nome] = {
-                'dens_min': dens['min'],
-                'dens_max': dens['max'],
-                'germ_min': germ['min'],
-                'germ_max': germ['max']
+                'dens_min': cultura.densidade_min,
+                'dens_max': cultura.densidade_max,
+                'germ_min': cultura.germinacao_min,
+                'germ_max': cultura.germinacao_max
             }
 
         distancia = float(input("\nDistância a analisar (metros) [padrão: 3.0]: ") or "3.0")
@@ -246,7 +251,7 @@ def menu_espacamento():
         mostrar = input("Exibir gráfico? (s/n): ").strip().lower() == 's'
 
         plot_espacamento.plotar_distribuicao_sementes(
-            espacamentos, distancia, OUTPUT_DIR, mostrar, salvar
+            espacamentos, distancia, obter_sessao().output_dir, mostrar, salvar
         )
 
     except Exception as e:
@@ -270,26 +275,27 @@ def menu_ibge():
         if opcao == '1':
             t1, _ = ibge_loader.carregar_dados_ibge()
             mostrar = input("Exibir gráfico? (s/n): ").strip().lower() == 's'
-            plot_ibge.plotar_area_culturas(t1, OUTPUT_DIR, mostrar, True)
+            plot_ibge.plotar_area_culturas(t1, obter_sessao().output_dir, mostrar, True)
 
         elif opcao == '2':
             cultura = input("Nome da cultura (ex: Soja): ").strip()
             n = int(input("Número de estados no ranking [10]: ") or "10")
             top = ibge_loader.obter_top_estados(cultura, n)
             mostrar = input("Exibir gráfico? (s/n): ").strip().lower() == 's'
-            plot_ibge.plotar_ranking_estados(top, cultura, OUTPUT_DIR, mostrar, True)
+            plot_ibge.plotar_ranking_estados(top, cultura, obter_sessao().output_dir, mostrar, True)
 
         elif opcao == '3':
-            _, t2 = ibge_loader.carregar_dados_ibge()
+            nivel = input("Nível (uf/regiao) [uf]: ").strip() or 'uf'
+            t2 = ibge_loader.carregar_tabela_nivel(nivel)
             cultura = input("Nome da cultura (ex: Soja): ").strip()
             mostrar = input("Exibir gráfico? (s/n): ").strip().lower() == 's'
-            plot_ibge.plotar_mapa_cultura(t2, cultura, output_dir=OUTPUT_DIR,
-                                         mostrar=mostrar, salvar=True)
+            plot_ibge.plotar_mapa_cultura(t2, cultura, output_dir=obter_sessao().output_dir,
+                                         mostrar=mostrar, salvar=True, nivel=nivel)
 
         elif opcao == '4':
             _, t2 = ibge_loader.carregar_dados_ibge()
             mostrar = input("Exibir gráfico? (s/n): ").strip().lower() == 's'
-            plot_ibge.plotar_mapa_total(t2, output_dir=OUTPUT_DIR,
+            plot_ibge.plotar_mapa_total(t2, output_dir=obter_sessao().output_dir,
                                        mostrar=mostrar, salvar=True)
 
     except Exception as e:
@@ -300,63 +306,42 @@ def menu_ibge():
 # EXECUTORES DE ANÁLISE
 # ========================================================================
 
-def executar_analise_cinematica(culturas, culturas_yaml):
+def executar_analise_cinematica(culturas, catalogo):
     """Executa análise cinemática completa."""
 
-    # Malha de ângulos
-    theta_deg = np.arange(0.0, 361.0, 1.0)
-    theta_rad = np.deg2rad(theta_deg)
-
-    # Encontrar ângulos de contato com solo
-    theta_solo = cin.encontrar_theta_solo(R_MM, L_MM, H_MM, ALTURA_CENTRO_MM)
+    res = obter_sessao().cinematica({nome: catalogo[nome] for nome in culturas},
+                           alpha=ALPHA_DEFAULT, beta=BETA_DEFAULT)
+    theta_deg = res['theta_deg']
+    theta_solo = res['theta_solo']
+    y_solo = res['y_solo']
 
     print(f"\n✓ Ângulo de descida: {theta_solo['descida']:.2f}°")
     print(f"✓ Ângulo de subida: {theta_solo['subida']:.2f}°")
 
-    # Calcular posição (independe da cultura)
-    y_solo = cin.y_solo_mm(theta_rad, R_MM, L_MM, H_MM, ALTURA_CENTRO_MM)
-
-    # Calcular para cada cultura
-    velocidades_dict = {}
-    aceleracoes_dict = {}
-    jerks_dict = {}
-
     for cultura in culturas:
-        dados = culturas_yaml[cultura]
-        vt_max = dados['planting_speed_kmh']['max']
-
-        dens = dados['plant_density_per_hectare']
-        germ = dados['germination_rate']
-
-        N = cin.sementes_por_metro(dens['min'], dens['max'], germ['min'], germ['max'])
-        omega = cin.velocidade_angular(vt_max, N)
-        omega_rpm_val = cin.omega_rpm(omega)
-
+        omega = res['omegas'][cultura]
         print(f"\n{cultura.upper()}:")
-        print(f"  Velocidade: {vt_max:.1f} km/h")
-        print(f"  Omega: {omega:.2f} rad/s ({omega_rpm_val:.0f} RPM)")
-
-        v = cin.velocidade(theta_rad, omega, R_MM, L_MM)
-        a = cin.aceleracao(theta_rad, omega, R_MM, L_MM, ALPHA_DEFAULT)
-        j = cin.jerk(theta_rad, omega, ALPHA_DEFAULT, R_MM, L_MM, BETA_DEFAULT)
+        print(f"  Velocidade: {catalogo[cultura].velocidade_max_kmh:.1f} km/h")
+        print(f"  Omega: {omega:.2f} rad/s ({cin.omega_rpm(omega):.0f} RPM)")
 
-        velocidades_dict[cultura] = {'velocidade': v, 'omega_rpm': omega_rpm_val}
-        aceleracoes_dict[cultura] = {'aceleracao': a, 'omega_rpm': omega_rpm_val}
-        jerks_dict[cultura] = {'jerk': j, 'omega_rpm': omega_rpm_val}
+    velocidades_dict = res['velocidades']
+    aceleracoes_dict = res['aceleracoes']
+    jerks_dict = res['jerks']
 
     # Gerar gráficos
     salvar = input("\nSalvar gráficos? (s/n): ").strip().lower() == 's'
     mostrar = input("Exibir gráficos? (s/n): ").strip().lower() == 's'
+    output_dir = obter_sessao().output_dir
 
-    plot_cinematica.plotar_posicao(theta_deg, y_solo, theta_solo, OUTPUT_DIR, mostrar, salvar)
-    plot_cinematica.plotar_velocidade(theta_deg, velocidades_dict, theta_solo, OUTPUT_DIR, mostrar, salvar)
-    plot_cinematica.plotar_aceleracao(theta_deg, aceleracoes_dict, theta_solo, OUTPUT_DIR, mostrar, salvar)
-    plot_cinematica.plotar_jerk(theta_deg, jerks_dict, theta_solo, OUTPUT_DIR, mostrar, salvar)
+    plot_cinematica.plotar_posicao(theta_deg, y_solo, theta_solo, output_dir, mostrar, salvar)
+    plot_cinematica.plotar_velocidade(theta_deg, velocidades_dict, theta_solo, output_dir, mostrar, salvar)
+    plot_cinematica.plotar_aceleracao(theta_deg, aceleracoes_dict, theta_solo, output_dir, mostrar, salvar)
+    plot_cinematica.plotar_jerk(theta_deg, jerks_dict, theta_solo, output_dir, mostrar, salvar)
 
     if len(culturas) > 1:
         plot_cinematica.plotar_cinematica_completa(
             theta_deg, y_solo, velocidades_dict, aceleracoes_dict, jerks_dict,
-            theta_solo, OUTPUT_DIR, mostrar, salvar
+            theta_solo, output_dir, mostrar, salvar
         )
 
     print("\n✅ Análise cinemática concluída!")
@@ -365,35 +350,11 @@ def executar_analise_cinematica(culturas, culturas_yaml):
 def executar_analise_torque(omega, F_VS_config):
     """Executa análise de torque e forças."""
 
-    # Converter geometria para metros
-    r_m = R_MM / 1000.0
-    L_m = L_MM / 1000.0
-    h_m = H_MM / 1000.0
-
-    # Pesos
-    P_haste = M_HASTE_KG * G_MS2
-    P_biela = M_BIELA_KG * G_MS2
-
-    # Malha de ângulos
-    theta_deg = np.linspace(0.0, 360.0, 361)
-    theta_rad = np.deg2rad(theta_deg)
-
-    # Construir F_VS
-    theta_range = None
-    theta_pico = None
-    F_max_info = None
-
-    if F_VS_config['tipo'] == 'zero':
-        F_VS = np.zeros_like(theta_deg)
-    elif F_VS_config['tipo'] == 'constante':
-        F_VS = np.full_like(theta_deg, F_VS_config['valor'])
-    else:  # variável (modelo completo)
-        F_VS, F_max_const, theta_pico, info = ft.construir_F_VS_variavel(
-            theta_deg, R_MM, L_MM, H_MM, ALTURA_CENTRO_MM
-        )
-        theta_range = (info['theta_inicio'], info['theta_fim'])
-        F_max_info = F_max_const
+    res = obter_sessao().torque(omega, F_VS_config)
+    theta_deg = res['theta_deg']
+    info = res['info']
 
+    if info is not None:
         print(f"\n📐 Parâmetros do modelo F_VS:")
         print(f"  θ início: {info['theta_inicio']:.2f}°")
         print(f"  θ pico: {info['theta_pico']:.2f}°")
@@ -401,52 +362,26 @@ def executar_analise_torque(omega, F_VS_config):
         print(f"  F_VS máximo: {info['F_max']:.2f} N")
         print(f"  Profundidade alvo: {info['y_alvo_mm']:.2f} mm")
 
-    # Calcular forças
-    F_B, F_M = ft.forcas_FB_FM(theta_rad, r_m, L_m, h_m,
-                                M_HASTE_KG, M_BIELA_KG,
-                                P_haste, P_biela, F_VS, omega)
-
-    # Calcular torque
-    tau = ft.torque(theta_rad, r_m, L_m, h_m,
-                    M_HASTE_KG, M_BIELA_KG,
-                    P_haste, P_biela, F_VS, omega)
-
     # Estatísticas
-    tau_max_abs = np.max(np.abs(tau))
-    idx_max = np.argmax(np.abs(tau))
-    tau_max = tau[idx_max]
-    theta_max = theta_deg[idx_max]
-
-    FB_max_abs = np.max(np.abs(F_B))
-    idx_FB = np.argmax(np.abs(F_B))
-    theta_FB = theta_deg[idx_FB]
-
-    FM_max_abs = np.max(np.abs(F_M))
-    idx_FM = np.argmax(np.abs(F_M))
-    theta_FM = theta_deg[idx_FM]
+    est = res['estatisticas']
 
     print(f"\n📊 RESULTADOS:")
-    print(f"  Torque máximo (|τ|): {tau_max_abs:.4f} N·m")
-    print(f"    em θ = {theta_max:.2f}° (τ = {tau_max:.4f} N·m)")
-    print(f"\n  F_B máximo: {FB_max_abs:.2f} N em θ = {theta_FB:.2f}°")
-    print(f"  F_M máximo: {FM_max_abs:.2f} N em θ = {theta_FM:.2f}°")
+    print(f"  Torque máximo (|τ|): {est['tau_max_abs']:.4f} N·m")
+    print(f"    em θ = {est['theta_tau_max']:.2f}° (τ = {est['tau_max']:.4f} N·m)")
+    print(f"\n  F_B máximo: {est['FB_max_abs']:.2f} N em θ = {est['theta_FB_max']:.2f}°")
+    print(f"  F_M máximo: {est['FM_max_abs']:.2f} N em θ = {est['theta_FM_max']:.2f}°")
 
     # Gerar gráficos
     salvar = input("\nSalvar gráficos? (s/n): ").strip().lower() == 's'
     mostrar = input("Exibir gráficos? (s/n): ").strip().lower() == 's'
 
-    # Preparar informações para o plot
-    if F_VS_config['tipo'] == 'variavel':
-        plot_info = {
-            'theta_range': theta_range,
-            'theta_pico': theta_pico,
-            'F_max': F_max_info
-        }
-    else:
-        plot_info = None
+    F_max_info = info['F_max'] if info is not None else None
+    theta_range = res['theta_range']
 
-    plot_torque.plotar_torque(theta_deg, tau, theta_range, F_max_info, OUTPUT_DIR, mostrar, salvar)
-    plot_torque.plotar_forcas(theta_deg, F_B, F_M, theta_range, OUTPUT_DIR, mostrar, salvar)
+    plot_torque.plotar_torque(theta_deg, res['torque'], theta_range, F_max_info,
+                              obter_sessao().output_dir, mostrar, salvar)
+    plot_torque.plotar_forcas(theta_deg, res['F_B'], res['F_M'], theta_range,
+                              obter_sessao().output_dir, mostrar, salvar)
 
     print("\n✅ Análise de torque concluída!")
 
@@ -468,18 +403,21 @@ def menu_configurar_parametros():
     print("CONFIGURAÇÃO DE PARÂMETROS DO MECANISMO")
     print("=" * 60)
 
-    global R_MM, L_MM, H_MM, ALTURA_CENTRO_MM, M_HASTE_KG, M_BIELA_KG
+    global SESSAO
 
     try:
+        p = obter_sessao().parametros
+        novos = {}
+
         print("\n📐 PARÂMETROS ATUAIS:")
         print(f"\n  GEOMETRIA:")
-        print(f"    r (raio da manivela):      {R_MM:.2f} mm")
-        print(f"    L (comprimento da biela):  {L_MM:.2f} mm")
-        print(f"    h (altura da haste):       {H_MM:.2f} mm")
-        print(f"    Altura do centro:          {ALTURA_CENTRO_MM:.2f} mm")
+        print(f"    r (raio da manivela):      {p.r_mm:.2f} mm")
+        print(f"    L (comprimento da biela):  {p.L_mm:.2f} mm")
+        print(f"    h (altura da haste):       {p.h_mm:.2f} mm")
+        print(f"    Altura do centro:          {p.altura_centro_mm:.2f} mm")
         print(f"\n  MASSAS:")
-        print(f"    m_haste:                   {M_HASTE_KG:.5f} kg")
-        print(f"    m_biela:                   {M_BIELA_KG:.5f} kg")
+        print(f"    m_haste:                   {p.m_haste_kg:.5f} kg")
+        print(f"    m_biela:                   {p.m_biela_kg:.5f} kg")
 
         print("\n" + "-" * 60)
         print("O que deseja configurar?")
@@ -497,21 +435,21 @@ def menu_configurar_parametros():
             print("PARÂMETROS GEOMÉTRICOS")
             print("-" * 60)
 
-            resposta = input(f"\nRaio da manivela r (mm) [{R_MM:.2f}]: ").strip()
+            resposta = input(f"\nRaio da manivela r (mm) [{p.r_mm:.2f}]: ").strip()
             if resposta:
-                R_MM = float(resposta)
+                novos['r_mm'] = float(resposta)
 
-            resposta = input(f"Comprimento da biela L (mm) [{L_MM:.2f}]: ").strip()
+            resposta = input(f"Comprimento da biela L (mm) [{p.L_mm:.2f}]: ").strip()
             if resposta:
-                L_MM = float(resposta)
+                novos['L_mm'] = float(resposta)
 
-            resposta = input(f"Altura da haste h (mm) [{H_MM:.2f}]: ").strip()
+            resposta = input(f"Altura da haste h (mm) [{p.h_mm:.2f}]: ").strip()
             if resposta:
-                H_MM = float(resposta)
+                novos['h_mm'] = float(resposta)
 
-            resposta = input(f"Altura do centro (mm) [{ALTURA_CENTRO_MM:.2f}]: ").strip()
+            resposta = input(f"Altura do centro (mm) [{p.altura_centro_mm:.2f}]: ").strip()
             if resposta:
-                ALTURA_CENTRO_MM = float(resposta)
+                novos['altura_centro_mm'] = float(resposta)
 
             print("\n✓ Parâmetros geométricos atualizados!")
 
@@ -520,31 +458,35 @@ def menu_configurar_parametros():
             print("MASSAS")
             print("-" * 60)
 
-            resposta = input(f"\nMassa da haste m_haste (kg) [{M_HASTE_KG:.5f}]: ").strip()
+            resposta = input(f"\nMassa da haste m_haste (kg) [{p.m_haste_kg:.5f}]: ").strip()
             if resposta:
-                M_HASTE_KG = float(resposta)
+                novos['m_haste_kg'] = float(resposta)
 
-            resposta = input(f"Massa da biela m_biela (kg) [{M_BIELA_KG:.5f}]: ").strip()
+            resposta = input(f"Massa da biela m_biela (kg) [{p.m_biela_kg:.5f}]: ").strip()
             if resposta:
-                M_BIELA_KG = float(resposta)
+                novos['m_biela_kg'] = float(resposta)
 
             print("\n✓ Massas atualizadas!")
 
+        # Valida o conjunto completo uma única vez
+        SESSAO = obter_sessao().com_parametros(**novos)
+        p = SESSAO.parametros
+
         print("\n" + "=" * 60)
         print("✅ Configuração concluída!")
         print("=" * 60)
         print("\n📋 NOVOS PARÂMETROS:")
-        print(f"  r = {R_MM:.2f} mm")
-        print(f"  L = {L_MM:.2f} mm")
-        print(f"  h = {H_MM:.2f} mm")
-        print(f"  altura_centro = {ALTURA_CENTRO_MM:.2f} mm")
-        print(f"  m_haste = {M_HASTE_KG:.5f} kg")
-        print(f"  m_biela = {M_BIELA_KG:.5f} kg")
+        print(f"  r = {p.r_mm:.2f} mm")
+        print(f"  L = {p.L_mm:.2f} mm")
+        print(f"  h = {p.h_mm:.2f} mm")
+        print(f"  altura_centro = {p.altura_centro_mm:.2f} mm")
+        print(f"  m_haste = {p.m_haste_kg:.5f} kg")
+        print(f"  m_biela = {p.m_biela_kg:.5f} kg")
 
         input("\nPressione ENTER para continuar...")
 
-    except ValueError:
-        print("\n❌ Erro: valor inválido! Use números.")
+    except ValueError as e:
+        print(f"\n❌ Erro: valor inválido! {e}")
     except Exception as e:
         print(f"\n❌ Erro: {e}")
 
@@ -705,4 +647,7 @@ def main():
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        from pipeline import cli
+        sys.exit(cli.main())
     main()
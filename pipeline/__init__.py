@@ -0,0 +1,7 @@
+"""
+Pipeline - Execução não interativa das análises.
+
+Contém a interface de linha de comando por subcomandos, para uso em lote,
+CI e servidores, sem nenhuma leitura de stdin, e o servidor HTTP local
+(pipeline.servidor) que responde consultas sem reiniciar o interpretador.
+"""
@@ -0,0 +1,682 @@
+"""
+Interface de Linha de Comando Não Interativa.
+
+Subcomandos:
+    kinematics : cinemática da haste por cultura
+    torque     : forças e torque no eixo da manivela
+    spacing    : distribuição de sementes por cultura
+    ibge       : tabelas e rankings de área plantada do IBGE
+    demanda    : capacidade de campo e máquinas por estado e cultura
+    energia    : energia no eixo da manivela por hectare e por estado
+    rasgo      : trajetória da haste no solo e alongamento da cova
+    sweep      : varredura de geometrias/velocidades (máximos de torque)
+    batch      : executa um manifesto de jobs (ver pipeline/lote.py)
+
+Todos os resultados são escritos em JSON (padrão) ou CSV, no stdout ou em
+arquivo (--saida). Gráficos só são gerados com --graficos DIR e nunca são
+exibidos na tela. Nada é lido do stdin. As curvas de kinematics, torque e
+sweep podem ser gravadas em formato colunar com --exportar (ver
+data/resultados.py).
+
+Exemplos:
+    python main.py torque --cultura soja --fvs variavel --resumo
+    python main.py sweep --r 80 84.01 88 --omega 20 30 --formato csv
+    python main.py kinematics --resumo --exportar output/cinematica
+    python main.py torque --graficos out --perfil perfil.json
+    python main.py sweep --r 80 84.01 88 --omega 20 30 --cache-disco output/cache
+"""
+
+import argparse
+import contextlib
+import csv
+import itertools
+import json
+import os
+import sys
+from dataclasses import asdict, replace
+
+import numpy as np
+
+from utils.perfil import Perfilador, etapa, perfilar
+
+
+# ========================================================================
+# SAÍDA
+# ========================================================================
+
+def _json_padrao(obj):
+    """Conversão de tipos do NumPy para JSON."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Tipo não serializável: {type(obj).__name__}")
+
+
+def escrever_resultado(dados: dict, tabela: dict, formato: str, saida: str):
+    """
+    Escreve o resultado de um subcomando.
+
+    Parâmetros:
+        dados   : estrutura completa (formato JSON)
+        tabela  : dict coluna -> sequência, todas do mesmo tamanho (formato CSV)
+        formato : 'json' ou 'csv'
+        saida   : caminho do arquivo ou '-' para stdout
+    """
+    f = sys.stdout if saida == '-' else open(saida, 'w', encoding='utf-8', newline='')
+    try:
+        if formato == 'json':
+            json.dump(dados, f, default=_json_padrao, ensure_ascii=False)
+            f.write('\n')
+        else:
+            colunas = list(tabela.keys())
+            w = csv.writer(f)
+            w.writerow(colunas)
+            for linha in zip(*(tabela[c] for c in colunas)):
+                w.writerow([_json_padrao(v) if isinstance(v, np.generic) else v for v in linha])
+    finally:
+        if f is not sys.stdout:
+            f.close()
+
+
+def _exportar(args, colunas: dict, metadados: dict):
+    """Grava a tabela colunar em --exportar no formato --exportar-formato."""
+    from data import resultados
+    caminho = resultados.gravar_resultados(args.exportar, colunas, metadados,
+                                           args.exportar_formato)
+    print(f"✓ Resultados exportados: {caminho}")
+
+
+def _cache_disco(args):
+    """CacheDisco de --cache-disco (None se o cache em disco não foi pedido)."""
+    if not args.cache_disco:
+        return None
+    from utils.cache_disco import CacheDisco
+    return CacheDisco(args.cache_disco, int(args.cache_disco_max_mb * 2**20))
+
+
+# Argumentos que só mudam o destino da saída, não o resultado
+_ARGS_SEM_EFEITO = {'func', 'formato', 'saida', 'perfil', 'cache_disco', 'cache_disco_max_mb'}
+
+
+def _chave_comando(args) -> dict:
+    """Parâmetros que determinam o resultado de um subcomando (chave do cache em disco)."""
+    from utils import config_loader
+    from utils.cache_disco import impressao_arquivo
+
+    chave = {k: v for k, v in vars(args).items() if k not in _ARGS_SEM_EFEITO}
+    # Conteúdo dos arquivos de configuração, não apenas o caminho
+    chave['config'] = impressao_arquivo(args.config) if args.config else None
+    chave['culturas_yaml'] = impressao_arquivo(args.culturas_yaml or config_loader.CAMINHO_CULTURAS_YAML)
+    return chave
+
+
+@perfilar('importacao_graficos')
+def _preparar_graficos():
+    """Importa os módulos de gráficos com backend não interativo."""
+    import matplotlib
+    matplotlib.use('Agg')
+    from visualization import plot_cinematica, plot_torque, plot_espacamento, plot_ibge
+    return plot_cinematica, plot_torque, plot_espacamento, plot_ibge
+
+
+# ========================================================================
+# PARÂMETROS COMUNS
+# ========================================================================
+
+def _parametros(args, campos=('r_mm', 'L_mm', 'h_mm', 'altura_centro_mm',
+                                'm_haste_kg', 'm_biela_kg')):
+    """Monta ParametrosMecanismo a partir de --config e das flags de geometria."""
+    from core.parametros import ParametrosMecanismo
+    from utils import config_loader
+
+    base = (config_loader.carregar_parametros_mecanismo(args.config)
+            if args.config else ParametrosMecanismo())
+    alteracoes = {campo: getattr(args, campo) for campo in campos
+                  if getattr(args, campo, None) is not None}
+    return replace(base, **alteracoes)
+
+
+def _catalogo(args, nomes=None):
+    """Carrega o catálogo de culturas, filtrado por `nomes` (se informado)."""
+    from utils import config_loader
+
+    catalogo = config_loader.carregar_catalogo_culturas(args.culturas_yaml)
+    if not nomes:
+        return catalogo
+    selecionadas = {}
+    for nome in nomes:
+        chave = config_loader.normalizar_nome(nome)
+        if chave not in catalogo:
+            raise ValueError(f"Cultura '{nome}' não encontrada. Disponíveis: {list(catalogo)}")
+        selecionadas[chave] = catalogo[chave]
+    return selecionadas
+
+
+def _positivo(valor: str) -> float:
+    """Tipo do argparse para valores reais estritamente positivos."""
+    x = float(valor)
+    if not x > 0:
+        raise argparse.ArgumentTypeError(f"deve ser positivo: {valor}")
+    return x
+
+
+def _passo_grade(valor: str) -> float:
+    """Tipo do argparse para o passo da malha de θ, em (0, 90] graus (como no servidor)."""
+    x = _positivo(valor)
+    if x > 90:
+        raise argparse.ArgumentTypeError(f"deve estar em (0, 90] graus: {valor}")
+    return x
+
+
+def _adicionar_geometria(p, multiplos=False):
+    """Flags de geometria/massas (listas de valores quando `multiplos`)."""
+    nargs = '+' if multiplos else None
+    g = p.add_argument_group('mecanismo')
+    g.add_argument('--r', dest='r_mm', type=float, nargs=nargs, help='raio da manivela (mm)')
+    g.add_argument('--L', dest='L_mm', type=float, nargs=nargs, help='comprimento da biela (mm)')
+    g.add_argument('--h', dest='h_mm', type=float, nargs=nargs, help='offset vertical (mm)')
+    g.add_argument('--altura-centro', dest='altura_centro_mm', type=float, nargs=nargs,
+                   help='altura do centro da manivela (mm)')
+    g.add_argument('--m-haste', dest='m_haste_kg', type=float, help='massa da haste (kg)')
+    g.add_argument('--m-biela', dest='m_biela_kg', type=float, help='massa da biela (kg)')
+
+
+def _config_fvs(args) -> dict:
+    if args.fvs == 'constante':
+        if args.fvs_valor is None:
+            raise ValueError("--fvs constante exige --fvs-valor.")
+        return {'tipo': 'constante', 'valor': args.fvs_valor}
+    return {'tipo': args.fvs}
+
+
+# ========================================================================
+# SUBCOMANDOS
+# ========================================================================
+
+def cmd_kinematics(args):
+    from core.sessao import SessaoAnalise
+
+    sessao = SessaoAnalise(_parametros(args))
+    catalogo = _catalogo(args, args.culturas)
+    theta_deg = np.arange(0.0, 360.0 + args.passo / 2, args.passo)
+    res = sessao.cinematica(catalogo, theta_deg)
+
+    culturas = {
+        nome: {
+            'omega_rad_s': res['omegas'][nome],
+            'omega_rpm': res['velocidades'][nome]['omega_rpm'],
+            'v_max_abs_mm_s': float(np.max(np.abs(res['velocidades'][nome]['velocidade']))),
+            'a_max_abs_mm_s2': float(np.max(np.abs(res['aceleracoes'][nome]['aceleracao']))),
+            'j_max_abs_mm_s3': float(np.max(np.abs(res['jerks'][nome]['jerk']))),
+        }
+        for nome in catalogo
+    }
+    dados = {
+        'parametros': asdict(sessao.parametros),
+        'theta_solo': res['theta_solo'],
+        'profundidade_max_mm': float(np.min(res['y_solo'])),
+        'culturas': culturas,
+    }
+
+    tabela = {'theta_deg': res['theta_deg'], 'y_solo_mm': res['y_solo']}
+    for nome in catalogo:
+        tabela[f'v_{nome}'] = res['velocidades'][nome]['velocidade']
+        tabela[f'a_{nome}'] = res['aceleracoes'][nome]['aceleracao']
+        tabela[f'j_{nome}'] = res['jerks'][nome]['jerk']
+    if not args.resumo:
+        dados['curvas'] = tabela
+
+    if args.exportar:
+        from data import resultados
+        _exportar(args, *resultados.tabela_cinematica(res, sessao.parametros))
+
+    if args.graficos:
+        plot_cinematica, _, _, _ = _preparar_graficos()
+        ts = res['theta_solo']
+        plot_cinematica.plotar_posicao(res['theta_deg'], res['y_solo'], ts, args.graficos, False, True)
+        plot_cinematica.plotar_velocidade(res['theta_deg'], res['velocidades'], ts, args.graficos, False, True)
+        plot_cinematica.plotar_aceleracao(res['theta_deg'], res['aceleracoes'], ts, args.graficos, False, True)
+        plot_cinematica.plotar_jerk(res['theta_deg'], res['jerks'], ts, args.graficos, False, True)
+
+    return dados, tabela
+
+
+def _omega(args):
+    if args.omega is not None:
+        return args.omega
+    if args.cultura:
+        cultura = next(iter(_catalogo(args, [args.cultura]).values()))
+        return cultura.omega(args.vt)
+    return 20.0
+
+
+def cmd_torque(args):
+    from core.sessao import SessaoAnalise
+
+    sessao = SessaoAnalise(_parametros(args))
+    omega = _omega(args)
+    res = sessao.torque(omega, _config_fvs(args))
+
+    dados = {
+        'parametros': asdict(sessao.parametros),
+        'omega_rad_s': omega,
+        'fvs': _config_fvs(args),
+        'modelo_fvs': res['info'],
+        'estatisticas': res['estatisticas'],
+    }
+    tabela = {k: res[k] for k in ('theta_deg', 'F_VS', 'F_B', 'F_M', 'torque')}
+    if not args.resumo:
+        dados['curvas'] = tabela
+
+    if args.exportar:
+        from data import resultados
+        _exportar(args, *resultados.tabela_torque({f'omega={omega:g}': res}, sessao.parametros))
+
+    if args.graficos:
+        _, plot_torque, _, _ = _preparar_graficos()
+        F_max = res['info']['F_max'] if res['info'] else None
+        plot_torque.plotar_torque(res['theta_deg'], res['torque'], res['theta_range'], F_max,
+                                  args.graficos, False, True)
+        plot_torque.plotar_forcas(res['theta_deg'], res['F_B'], res['F_M'], res['theta_range'],
+                                  args.graficos, False, True)
+
+    return dados, tabela
+
+
+def cmd_spacing(args):
+    from core import espacamento as esp
+
+    catalogo = _catalogo(args, args.culturas)
+    culturas_dict = {
+        nome: {'dens_min': c.densidade_min, 'dens_max': c.densidade_max,
+               'germ_min': c.germinacao_min, 'germ_max': c.germinacao_max}
+        for nome, c in catalogo.items()
+    }
+    espacamentos = esp.calcular_espacamento_culturas(culturas_dict, args.distancia)
+
+    dados = {'distancia_m': args.distancia, 'culturas': {
+        nome: {k: v for k, v in r.items() if args.posicoes or k != 'posicoes_m'}
+        for nome, r in espacamentos.items()
+    }}
+    tabela = {
+        'cultura': list(espacamentos),
+        'sementes_por_metro': [r['sementes_por_metro'] for r in espacamentos.values()],
+        'sementes_total': [r['sementes_total'] for r in espacamentos.values()],
+        'espacamento_cm': [r['espacamento_cm'] for r in espacamentos.values()],
+    }
+
+    if args.graficos:
+        _, _, plot_espacamento, _ = _preparar_graficos()
+        plot_espacamento.plotar_distribuicao_sementes(espacamentos, args.distancia,
+                                                      args.graficos, False, True)
+
+    return dados, tabela
+
+
+def cmd_ibge(args):
+    from data import ibge_loader
+
+    if args.atlas:
+        # Um mapa por cultura e ano, figura única por processo (visualization.atlas)
+        from visualization import atlas
+        tabelas = ibge_loader.carregar_tabelas_nivel(args.nivel or 'uf', args.pam,
+                                                     None if args.ano is None else [args.ano],
+                                                     args.armazem, args.microrregioes)
+        arquivos = atlas.gerar_atlas(tabelas, None if args.cultura is None else [args.cultura],
+                                     args.nivel or 'uf', args.graficos or 'output/images/atlas',
+                                     processos=args.processos)
+        return {'tabela': 'atlas', 'arquivos': arquivos}, {'arquivo': arquivos}
+
+    if args.nivel and args.tabela != 'sintese':
+        # Somas por nível geográfico (índice de grupos de data.agregacao)
+        df = ibge_loader.carregar_tabela_nivel(args.nivel, args.pam, args.ano, args.armazem,
+                                               args.microrregioes)
+        if args.tabela == 'top':
+            coluna = args.cultura or 'Total'
+            if coluna not in df.columns:
+                raise ValueError(f"Cultura '{coluna}' não encontrada.")
+            df = (df[[df.columns[1], coluna]]
+                  .sort_values(coluna, ascending=False, kind='stable').head(args.n))
+    elif args.armazem or (args.pam and os.path.isdir(args.pam)):
+        # Armazém colunar: só as partições do ano (e da cultura) são lidas
+        from data.armazem import abrir_pam
+        pam = abrir_pam(args.pam, args.armazem)
+        if args.tabela == 'sintese':
+            df = pam.tabela_sintese(args.ano)
+        elif args.tabela == 'estados':
+            df = pam.tabela_estados(args.ano)
+        else:
+            df = pam.top_estados(args.cultura, args.ano, args.n)
+    elif args.pam:
+        # Tabelas montadas a partir da exportação da PAM (SIDRA)
+        sintese, estados = ibge_loader.carregar_dados_ibge(args.pam, args.ano)
+        coluna = args.cultura or 'Total'
+        if args.tabela == 'top' and coluna not in estados.columns:
+            raise ValueError(f"Cultura '{coluna}' não encontrada na PAM.")
+        df = {'sintese': sintese, 'estados': estados}.get(args.tabela)
+        if df is None:
+            df = (estados[['Estado', coluna]]
+                  .sort_values(coluna, ascending=False, kind='stable').head(args.n))
+    elif args.tabela == 'sintese':
+        df = ibge_loader.processar_tabela_sintese()
+    elif args.tabela == 'estados':
+        df = ibge_loader.processar_tabela_estados()
+    elif args.cultura:
+        df = ibge_loader.obter_top_estados(args.cultura, args.n)
+    else:
+        df = ibge_loader.obter_top_estados_total(args.n)
+
+    tabela = {c: df[c].tolist() for c in df.columns}
+    dados = {'tabela': args.tabela, 'registros': df.to_dict(orient='records')}
+
+    if args.graficos:
+        _, _, _, plot_ibge = _preparar_graficos()
+        if args.tabela == 'sintese':
+            plot_ibge.plotar_area_culturas(df, args.graficos, False, True)
+        elif args.tabela == 'top' and args.cultura:
+            plot_ibge.plotar_ranking_estados(df, args.cultura, args.graficos, False, True)
+
+    return dados, tabela
+
+
+def cmd_sweep(args):
+    from core.sessao import SessaoAnalise
+
+    # Geometria varrida pelas listas; massas e demais valores fixos
+    base = _parametros(args, campos=('m_haste_kg', 'm_biela_kg'))
+    eixos = {
+        'r_mm': args.r_mm or [base.r_mm],
+        'L_mm': args.L_mm or [base.L_mm],
+        'h_mm': args.h_mm or [base.h_mm],
+        'altura_centro_mm': args.altura_centro_mm or [base.altura_centro_mm],
+    }
+    omegas = args.omega or [20.0]
+    fvs = _config_fvs(args)
+
+    def calcular_linha(s, omega):
+        ts = s.theta_solo()
+        est = s.torque(omega, fvs)['estatisticas']
+        p = s.parametros
+        return {'r_mm': p.r_mm, 'L_mm': p.L_mm, 'h_mm': p.h_mm, 'altura_centro_mm': p.altura_centro_mm,
+                'omega_rad_s': omega,
+                'theta_descida': ts['descida'], 'theta_subida': ts['subida'],
+                **est}
+
+    # Com --cache-disco, cada combinação é guardada separadamente: ao ampliar
+    # a varredura, só as combinações novas são calculadas
+    cache = _cache_disco(args)
+    sessao = SessaoAnalise(base)
+    linhas = []
+    for r, L, h, alt in itertools.product(*eixos.values()):
+        s = sessao.com_parametros(r_mm=r, L_mm=L, h_mm=h, altura_centro_mm=alt)
+        for omega in omegas:
+            if cache is None:
+                linhas.append(calcular_linha(s, omega))
+            else:
+                chave = {'parametros': asdict(s.parametros), 'omega': omega, 'fvs': fvs}
+                linhas.append(cache.obter_ou_calcular('sweep', chave,
+                                                      lambda s=s, omega=omega: calcular_linha(s, omega)))
+
+    tabela = {c: [linha[c] for linha in linhas] for c in (linhas[0] if linhas else {})}
+    dados = {'fvs': fvs, 'massas': {'m_haste_kg': base.m_haste_kg, 'm_biela_kg': base.m_biela_kg},
+             'resultados': linhas}
+
+    if args.exportar and linhas:
+        from data import resultados
+        colunas, meta = resultados.tabela_varredura(linhas)
+        _exportar(args, colunas, {**meta, 'fvs': fvs, 'massas': dados['massas']})
+    return dados, tabela
+
+
+def cmd_rasgo(args):
+    from core.trajetoria import analisar_rasgos
+
+    # Geometrias = produto das listas de --r/--L/--h/--altura-centro (como em sweep)
+    base = _parametros(args, campos=('m_haste_kg', 'm_biela_kg'))
+    eixos = [getattr(args, campo) or [getattr(base, campo)]
+             for campo in ('r_mm', 'L_mm', 'h_mm', 'altura_centro_mm')]
+    geometrias = [replace(base, r_mm=r, L_mm=L, h_mm=h, altura_centro_mm=alt)
+                  for r, L, h, alt in itertools.product(*eixos)]
+    resultado = analisar_rasgos(geometrias, _catalogo(args, args.culturas), args.vt,
+                                args.largura_ponta, args.trajetorias)
+
+    colunas = resultado.tabela()
+    tabela = {c: v.tolist() for c, v in colunas.items()}
+    dados = {'largura_ponta_mm': args.largura_ponta, 'n_combinacoes': len(colunas['r_mm'])}
+    if not args.resumo:
+        dados['resultados'] = [dict(zip(tabela, linha)) for linha in zip(*tabela.values())]
+        if args.trajetorias:
+            dados['trajetorias'] = {c: v.tolist() for c, v in resultado.trajetorias().items()}
+
+    if args.exportar:
+        _exportar(args, colunas, {'largura_ponta_mm': args.largura_ponta})
+    return dados, tabela
+
+
+def cmd_demanda(args):
+    from data import demanda, ibge_loader
+    from utils import config_loader
+
+    _, estados = ibge_loader.carregar_dados_ibge(args.pam, args.ano, args.armazem)
+    resultado = demanda.estimar_demanda(estados,
+                                        config_loader.carregar_catalogo_culturas(args.culturas_yaml),
+                                        args.linhas, args.janela, args.horas_dia, args.eficiencia)
+    # --resumo: faixa de máquinas por estado e cultura em vez da grade completa
+    df = resultado.resumo() if args.resumo else resultado.tabela()
+
+    tabela = {c: df[c].tolist() for c in df.columns}
+    dados = {'n_linhas': resultado.n_linhas.tolist(), 'janela_dias': args.janela,
+             'horas_dia': args.horas_dia, 'eficiencia': args.eficiencia,
+             'registros': df.to_dict(orient='records')}
+    return dados, tabela
+
+
+def cmd_energia(args):
+    from data import demanda, ibge_loader
+    from utils import config_loader
+
+    _, estados = ibge_loader.carregar_dados_ibge(args.pam, args.ano, args.armazem)
+    resultado = demanda.estimar_energia(estados,
+                                        config_loader.carregar_catalogo_culturas(args.culturas_yaml),
+                                        _parametros(args), _config_fvs(args), args.regenerativo)
+    df = {'estados': resultado.tabela_estados, 'culturas': resultado.resumo,
+          'completa': resultado.tabela}[args.tabela]()
+
+    tabela = {c: df[c].tolist() for c in df.columns}
+    dados = {'tabela': args.tabela, 'parametros': asdict(_parametros(args)),
+             'fvs': _config_fvs(args), 'regenerativo': args.regenerativo,
+             'registros': df.to_dict(orient='records')}
+    return dados, tabela
+
+
+def cmd_batch(args):
+    from pipeline import lote
+
+    relatorio = lote.executar_manifesto(lote.carregar_manifesto(args.manifesto),
+                                        max_workers=args.workers,
+                                        output_dir=args.graficos or 'output/lote')
+    tabela = {'id': [], 'status': [], 'erro': []}
+    campos = sorted({k for j in relatorio['jobs'] for k in j.get('resumo', {})})
+    for c in campos:
+        tabela[c] = []
+    for job in relatorio['jobs']:
+        tabela['id'].append(job['id'])
+        tabela['status'].append(job['status'])
+        tabela['erro'].append(job.get('erro', ''))
+        for c in campos:
+            tabela[c].append(job.get('resumo', {}).get(c, ''))
+    return relatorio, tabela
+
+
+# ========================================================================
+# PARSER
+# ========================================================================
+
+def construir_parser() -> argparse.ArgumentParser:
+    """Cria o parser com todos os subcomandos."""
+    parser = argparse.ArgumentParser(
+        prog='main.py',
+        description='Semeadura por puncionamento - análises não interativas.')
+
+    comum = argparse.ArgumentParser(add_help=False)
+    comum.add_argument('--config', help='config.yaml com os parâmetros do mecanismo')
+    comum.add_argument('--culturas-yaml', help='culturas.yaml alternativo')
+    comum.add_argument('--formato', choices=('json', 'csv'), default='json')
+    comum.add_argument('--saida', default='-', help="arquivo de saída ('-' = stdout)")
+    comum.add_argument('--graficos', metavar='DIR', help='salva os gráficos em DIR')
+    comum.add_argument('--resumo', action='store_true',
+                       help='JSON apenas com valores escalares (sem curvas)')
+    comum.add_argument('--perfil', '--profile', metavar='ARQUIVO',
+                       help='grava em JSON o tempo e a memória de cada etapa')
+    comum.add_argument('--cache-disco', metavar='DIR',
+                       help='reaproveita resultados de execuções anteriores guardados em DIR')
+    comum.add_argument('--cache-disco-max-mb', type=float, default=512.0,
+                       help='tamanho máximo do cache em disco (MB)')
+
+    exportacao = argparse.ArgumentParser(add_help=False)
+    exportacao.add_argument('--exportar', metavar='CAMINHO',
+                            help='grava as curvas em formato colunar (diretório ou arquivo)')
+    exportacao.add_argument('--exportar-formato', choices=('npy', 'npz', 'parquet', 'hdf5'),
+                            default='npy', help='npy = diretório mapeável em memória (padrão)')
+
+    sub = parser.add_subparsers(dest='comando', required=True)
+
+    p = sub.add_parser('kinematics', parents=[comum, exportacao], help='cinemática da haste')
+    _adicionar_geometria(p)
+    p.add_argument('--culturas', nargs='+', help='culturas (padrão: todas)')
+    p.add_argument('--passo', type=_passo_grade, default=1.0, help='passo da malha de θ (graus)')
+    p.set_defaults(func=cmd_kinematics)
+
+    p = sub.add_parser('torque', parents=[comum, exportacao], help='forças e torque')
+    _adicionar_geometria(p)
+    g = p.add_mutually_exclusive_group()
+    g.add_argument('--omega', type=float, help='velocidade angular (rad/s); padrão 20')
+    g.add_argument('--cultura', help='usa ω da cultura (velocidade máxima ou --vt)')
+    p.add_argument('--vt', type=float, help='velocidade do trator (km/h) com --cultura')
+    p.add_argument('--fvs', choices=('zero', 'constante', 'variavel'), default='variavel')
+    p.add_argument('--fvs-valor', type=float, help='F_VS constante (N)')
+    p.set_defaults(func=cmd_torque)
+
+    p = sub.add_parser('spacing', parents=[comum], help='distribuição de sementes')
+    p.add_argument('--culturas', nargs='+', help='culturas (padrão: todas)')
+    p.add_argument('--distancia', type=_positivo, default=3.0, help='distância analisada (m)')
+    p.add_argument('--posicoes', action='store_true', help='inclui as posições no JSON')
+    p.set_defaults(func=cmd_spacing)
+
+    p = sub.add_parser('ibge', parents=[comum], help='dados de área plantada do IBGE')
+    p.add_argument('--tabela', choices=('sintese', 'estados', 'top'), default='sintese')
+    p.add_argument('--cultura', help='cultura do ranking (com --tabela top)')
+    p.add_argument('-n', type=int, default=10, help='tamanho do ranking')
+    p.add_argument('--pam', metavar='CSV', help='exportação da PAM/SIDRA (tabela 5457) '
+                                                 'no lugar das tabelas embutidas')
+    p.add_argument('--armazem', metavar='DIR', help='armazém colunar da PAM: criado a partir de '
+                                                     '--pam na primeira vez e reaproveitado depois')
+    p.add_argument('--ano', type=int, help='ano dos dados da PAM (padrão: o mais recente)')
+    p.add_argument('--nivel', choices=('municipio', 'microrregiao', 'uf', 'regiao'),
+                   help='nível geográfico das tabelas estados/top (município e '
+                        'microrregião exigem --pam)')
+    p.add_argument('--microrregioes', metavar='CSV',
+                   help='tabela município -> microrregião (para --nivel microrregiao)')
+    p.add_argument('--atlas', action='store_true',
+                   help='gera os mapas de todas as culturas (e anos da PAM) em lote')
+    p.add_argument('--processos', type=int, help='processos do atlas (padrão: núcleos da CPU)')
+    p.set_defaults(func=cmd_ibge)
+
+    p = sub.add_parser('rasgo', parents=[comum, exportacao],
+                       help='trajetória da haste no solo e alongamento da cova')
+    _adicionar_geometria(p, multiplos=True)
+    p.add_argument('--culturas', nargs='+', help='culturas (padrão: todas)')
+    p.add_argument('--vt', type=float, nargs='+',
+                   help='velocidades do trator (km/h); padrão: faixa de cada cultura')
+    p.add_argument('--largura-ponta', type=float, default=25.4, help='largura da ponta (mm)')
+    p.add_argument('--trajetorias', type=int, default=0, metavar='N',
+                   help='inclui as trajetórias com N pontos cada')
+    p.set_defaults(func=cmd_rasgo)
+
+    p = sub.add_parser('demanda', parents=[comum],
+                       help='capacidade de campo, horas-máquina e máquinas por estado')
+    p.add_argument('--linhas', type=int, nargs='+', default=[7, 9, 11, 13, 15, 17],
+                   help='números de linhas da semeadora')
+    p.add_argument('--janela', type=float, default=30.0, help='janela de plantio (dias)')
+    p.add_argument('--horas-dia', type=float, default=10.0, help='horas de trabalho por dia')
+    p.add_argument('--eficiencia', type=float, default=0.65, help='eficiência de campo (0-1)')
+    p.add_argument('--pam', metavar='CSV', help='área da PAM/SIDRA no lugar da tabela embutida')
+    p.add_argument('--armazem', metavar='DIR', help='armazém colunar da PAM (ver ibge --armazem)')
+    p.add_argument('--ano', type=int, help='ano dos dados da PAM (padrão: o mais recente)')
+    p.set_defaults(func=cmd_demanda)
+
+    p = sub.add_parser('energia', parents=[comum],
+                       help='energia no eixo da manivela por hectare e por estado')
+    _adicionar_geometria(p)
+    p.add_argument('--tabela', choices=('estados', 'culturas', 'completa'), default='estados',
+                   help='MWh por estado, faixa por estado e cultura, ou a grade completa')
+    p.add_argument('--fvs', choices=('zero', 'constante', 'variavel'), default='variavel')
+    p.add_argument('--fvs-valor', type=float, help='F_VS constante (N)')
+    p.add_argument('--regenerativo', action='store_true',
+                   help='desconta o torque negativo (trabalho líquido por volta)')
+    p.add_argument('--pam', metavar='CSV', help='área da PAM/SIDRA no lugar da tabela embutida')
+    p.add_argument('--armazem', metavar='DIR', help='armazém colunar da PAM (ver ibge --armazem)')
+    p.add_argument('--ano', type=int, help='ano dos dados da PAM (padrão: o mais recente)')
+    p.set_defaults(func=cmd_energia)
+
+    p = sub.add_parser('sweep', parents=[comum, exportacao], help='varredura de geometrias e ω')
+    _adicionar_geometria(p, multiplos=True)
+    p.add_argument('--omega', type=float, nargs='+', help='velocidades angulares (rad/s)')
+    p.add_argument('--fvs', choices=('zero', 'constante', 'variavel'), default='variavel')
+    p.add_argument('--fvs-valor', type=float, help='F_VS constante (N)')
+    p.set_defaults(func=cmd_sweep)
+
+    p = sub.add_parser('batch', parents=[comum], help='executa um manifesto YAML/JSON')
+    p.add_argument('manifesto', help='arquivo do manifesto')
+    p.add_argument('--workers', type=int, help='número de threads')
+    p.set_defaults(func=cmd_batch)
+
+    return parser
+
+
+# Subcomandos cujo resultado completo pode vir do cache em disco
+# (sweep guarda cada combinação em separado, ver cmd_sweep)
+COMANDOS_CACHEAVEIS = ('kinematics', 'torque', 'spacing')
+
+
+def _executar(args):
+    """Executa o subcomando, usando o cache em disco quando possível."""
+    cache = _cache_disco(args)
+    # Gráficos e exportação são efeitos colaterais: exigem o cálculo
+    efeitos = args.graficos or getattr(args, 'exportar', None)
+    if cache is None or args.comando not in COMANDOS_CACHEAVEIS or efeitos:
+        return args.func(args)
+    return cache.obter_ou_calcular(args.comando, _chave_comando(args), lambda: args.func(args))
+
+
+def main(argv=None) -> int:
+    """
+    Ponto de entrada da CLI.
+
+    Retorna:
+        código de saída (0 = sucesso, 1 = erro na análise)
+    """
+    args = construir_parser().parse_args(argv)
+    perfil = Perfilador() if args.perfil else contextlib.nullcontext()
+    try:
+        with perfil:
+            # Mensagens de progresso (ex: "✓ Gráfico salvo") vão para o stderr,
+            # para não misturar com o resultado no stdout
+            with contextlib.redirect_stdout(sys.stderr), etapa('comando'):
+                dados, tabela = _executar(args)
+            with etapa('saida'):
+                escrever_resultado(dados, tabela, args.formato, args.saida)
+    except (ValueError, KeyError, OSError, ArithmeticError) as e:
+        # ArithmeticError: divisões por zero de entradas degeneradas
+        # (ex: spacing com uma distância menor que um espaçamento)
+        print(f"Erro: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if args.perfil:
+            perfil.gravar(args.perfil)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
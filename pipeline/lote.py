@@ -0,0 +1,289 @@
+"""
+Execução em Lote a partir de um Manifesto (YAML ou JSON).
+
+Um manifesto lista muitas análises; elas são executadas em paralelo
+compartilhando um único cache de resultados intermediários (ângulos de
+contato, cinemática normalizada, bases de torque e perfis F_VS), de modo
+que cada geometria é calculada uma só vez, qualquer que seja o número de
+jobs que a usam. Uma falha afeta apenas o próprio job.
+
+Formato do manifesto:
+
+    padrao:                      # valores aplicados a todos os jobs
+      geometria: {r_mm: 84.01, L_mm: 210.0}
+      fvs: {tipo: variavel}
+    jobs:
+      - id: soja-r80
+        analise: torque          # torque | kinematics
+        cultura: soja            # ou culturas: [soja, milho] (um job por cultura)
+        geometria: {r_mm: 80.0}
+        omega: {politica: cultura, vt_kmh: 6.0}   # cultura | fixo
+        fvs: {tipo: constante, valor: 150}
+        graficos: [torque, forcas]
+
+Chaves de 'geometria': as de ParametrosMecanismo (r_mm, L_mm, h_mm,
+altura_centro_mm, m_haste_kg, m_biela_kg, g).
+"""
+
+import copy
+import json
+import os
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+
+# Gráficos disponíveis por tipo de análise
+GRAFICOS = {
+    'kinematics': ('posicao', 'velocidade', 'aceleracao', 'jerk'),
+    'torque': ('torque', 'forcas'),
+}
+
+
+# ========================================================================
+# MANIFESTO
+# ========================================================================
+
+def carregar_manifesto(caminho: str) -> dict:
+    """
+    Lê um manifesto YAML (.yaml/.yml) ou JSON.
+
+    Retorna:
+        dict com as chaves 'padrao' (opcional) e 'jobs'
+    """
+    with open(caminho, 'r', encoding='utf-8') as f:
+        if str(caminho).lower().endswith(('.yaml', '.yml')):
+            import yaml
+            manifesto = yaml.safe_load(f)
+        else:
+            manifesto = json.load(f)
+
+    if not isinstance(manifesto, dict) or not isinstance(manifesto.get('jobs'), list):
+        raise ValueError("Manifesto inválido: esperava chave 'jobs' contendo uma lista.")
+    return manifesto
+
+
+def _mesclar(base: dict, extra: dict) -> dict:
+    """Mescla dicts em profundidade (valores de `extra` prevalecem)."""
+    out = copy.deepcopy(base)
+    for k, v in (extra or {}).items():
+        if isinstance(v, dict) and isinstance(out.get(k), dict):
+            out[k] = _mesclar(out[k], v)
+        else:
+            out[k] = copy.deepcopy(v)
+    return out
+
+
+def expandir_jobs(manifesto: dict) -> List[dict]:
+    """
+    Aplica os valores padrão e expande 'culturas' em um job por cultura.
+
+    Jobs sem 'id' recebem 'job-<n>'; ids repetidos recebem sufixo.
+    """
+    padrao = manifesto.get('padrao', {}) or {}
+    jobs = []
+    for n, bruto in enumerate(manifesto['jobs']):
+        job = _mesclar(padrao, bruto)
+        job.setdefault('id', f'job-{n}')
+        culturas = job.pop('culturas', None)
+        if culturas:
+            for c in culturas:
+                jobs.append({**job, 'id': f"{job['id']}-{c}", 'cultura': c})
+        else:
+            jobs.append(job)
+
+    # Ids gerados também contam como usados: o sufixo cresce até achar um livre
+    usados, sufixos = set(), {}
+    for job in jobs:
+        base = jid = str(job['id'])
+        while jid in usados:
+            sufixos[base] = sufixos.get(base, 0) + 1
+            jid = f'{base}-{sufixos[base]}'
+        usados.add(jid)
+        job['id'] = jid
+    return jobs
+
+
+# ========================================================================
+# EXECUÇÃO DE UM JOB
+# ========================================================================
+
+def _omega(job: dict, catalogo: dict) -> float:
+    """Resolve a política de velocidade angular do job (rad/s)."""
+    from utils.config_loader import normalizar_nome
+
+    politica = dict(job.get('omega') or {})
+    tipo = politica.get('politica', 'cultura' if job.get('cultura') else 'fixo')
+    if tipo == 'fixo':
+        return float(politica.get('valor', 20.0))
+    if tipo == 'cultura':
+        nome = normalizar_nome(str(job.get('cultura', '')))
+        if nome not in catalogo:
+            raise ValueError(f"Cultura '{job.get('cultura')}' não encontrada. "
+                             f"Disponíveis: {list(catalogo)}")
+        return catalogo[nome].omega(politica.get('vt_kmh'))
+    raise ValueError(f"Política de omega inválida: '{tipo}'. Use 'cultura' ou 'fixo'.")
+
+
+def _executar_job(job: dict, sessao_base, catalogo: dict) -> dict:
+    """Calcula um job e devolve o resumo (sem gráficos)."""
+    from utils.config_loader import normalizar_nome
+
+    analise = job.get('analise', 'torque')
+    if analise not in GRAFICOS:
+        raise ValueError(f"Análise inválida: '{analise}'. Use {list(GRAFICOS)}.")
+    sessao = sessao_base.com_parametros(**(job.get('geometria') or {}))
+
+    if analise == 'torque':
+        omega = _omega(job, catalogo)
+        res = sessao.torque(omega, job.get('fvs') or {'tipo': 'variavel'})
+        resumo = {'omega_rad_s': omega, **res['estatisticas']}
+    else:
+        nome = normalizar_nome(str(job.get('cultura', '')))
+        if nome not in catalogo:
+            raise ValueError(f"Job kinematics exige 'cultura' válida (recebido {job.get('cultura')!r}).")
+        res = sessao.cinematica({nome: catalogo[nome]}, omegas={nome: _omega(job, catalogo)})
+        resumo = {
+            'omega_rad_s': res['omegas'][nome],
+            'theta_descida': res['theta_solo']['descida'],
+            'theta_subida': res['theta_solo']['subida'],
+            'v_max_abs_mm_s': float(np.max(np.abs(res['velocidades'][nome]['velocidade']))),
+            'a_max_abs_mm_s2': float(np.max(np.abs(res['aceleracoes'][nome]['aceleracao']))),
+            'j_max_abs_mm_s3': float(np.max(np.abs(res['jerks'][nome]['jerk']))),
+        }
+    return {'resumo': resumo, 'resultado': res, 'analise': analise}
+
+
+def _gerar_graficos(job: dict, saida: dict, output_dir: str):
+    """Gera os gráficos pedidos pelo job (sempre na thread principal)."""
+    pedidos = job.get('graficos') or []
+    if not pedidos:
+        return []
+    invalidos = set(pedidos) - set(GRAFICOS[saida['analise']])
+    if invalidos:
+        raise ValueError(f"Gráficos inválidos para '{saida['analise']}': {sorted(invalidos)}")
+
+    import matplotlib
+    matplotlib.use('Agg')
+    from visualization import plot_cinematica, plot_torque
+
+    res = saida['resultado']
+    destino = os.path.join(output_dir, job['id'])
+    if saida['analise'] == 'torque':
+        F_max = res['info']['F_max'] if res['info'] else None
+        if 'torque' in pedidos:
+            plot_torque.plotar_torque(res['theta_deg'], res['torque'], res['theta_range'],
+                                      F_max, destino, False, True)
+        if 'forcas' in pedidos:
+            plot_torque.plotar_forcas(res['theta_deg'], res['F_B'], res['F_M'],
+                                      res['theta_range'], destino, False, True)
+    else:
+        ts = res['theta_solo']
+        funcoes = {
+            'posicao': lambda: plot_cinematica.plotar_posicao(
+                res['theta_deg'], res['y_solo'], ts, destino, False, True),
+            'velocidade': lambda: plot_cinematica.plotar_velocidade(
+                res['theta_deg'], res['velocidades'], ts, destino, False, True),
+            'aceleracao': lambda: plot_cinematica.plotar_aceleracao(
+                res['theta_deg'], res['aceleracoes'], ts, destino, False, True),
+            'jerk': lambda: plot_cinematica.plotar_jerk(
+                res['theta_deg'], res['jerks'], ts, destino, False, True),
+        }
+        for nome in pedidos:
+            funcoes[nome]()
+    return [os.path.join(destino, f) for f in sorted(os.listdir(destino))]
+
+
+# ========================================================================
+# EXECUÇÃO DO MANIFESTO
+# ========================================================================
+
+def executar_manifesto(manifesto: dict, max_workers: int = None,
+                       output_dir: str = 'output/lote',
+                       sessao_base=None, catalogo: Dict = None) -> dict:
+    """
+    Executa todos os jobs de um manifesto em paralelo.
+
+    Parâmetros:
+        manifesto   : dict (ver carregar_manifesto)
+        max_workers : número de threads (padrão do ThreadPoolExecutor se None)
+        output_dir  : diretório base dos gráficos (um subdiretório por job)
+        sessao_base : SessaoAnalise cujo cache é compartilhado entre os jobs
+        catalogo    : dict nome -> Cultura (carrega culturas.yaml se None)
+
+    Retorna:
+        dict com 'jobs' (lista com 'id', 'status' = 'ok' | 'erro', 'resumo'
+        ou 'erro', 'duracao_s') e 'estatisticas' do lote
+    """
+    from core.sessao import SessaoAnalise
+    from utils import config_loader
+
+    if sessao_base is None:
+        sessao_base = SessaoAnalise()
+    if catalogo is None:
+        catalogo = config_loader.carregar_catalogo_culturas()
+
+    jobs = expandir_jobs(manifesto)
+    inicio = time.perf_counter()
+    calculos_antes = sessao_base.estatisticas_cache()['falhas']
+
+    def rodar(job):
+        t0 = time.perf_counter()
+        try:
+            saida = _executar_job(job, sessao_base, catalogo)
+            return {'id': job['id'], 'status': 'ok', '_saida': saida,
+                    'duracao_s': time.perf_counter() - t0}
+        except Exception as e:
+            return {'id': job['id'], 'status': 'erro', 'erro': f'{type(e).__name__}: {e}',
+                    'detalhes': traceback.format_exc(limit=3),
+                    'duracao_s': time.perf_counter() - t0}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        resultados = list(pool.map(rodar, jobs))
+
+    # pyplot não é thread-safe: gráficos são gerados sequencialmente
+    for job, res in zip(jobs, resultados):
+        saida = res.pop('_saida', None)
+        if saida is None:
+            continue
+        res['resumo'] = saida['resumo']
+        try:
+            arquivos = _gerar_graficos(job, saida, output_dir)
+            if arquivos:
+                res['graficos'] = arquivos
+        except Exception as e:
+            res['status'] = 'erro'
+            res['erro'] = f'Gráficos: {type(e).__name__}: {e}'
+
+    n_ok = sum(r['status'] == 'ok' for r in resultados)
+    return {
+        'jobs': resultados,
+        'estatisticas': {
+            'total': len(resultados),
+            'ok': n_ok,
+            'erro': len(resultados) - n_ok,
+            'intermediarios_calculados': sessao_base.estatisticas_cache()['falhas'] - calculos_antes,
+            'duracao_s': time.perf_counter() - inicio,
+        },
+    }
+
+
+def executar_arquivo(caminho: str, saida: str = None, **kwargs) -> dict:
+    """
+    Carrega e executa um manifesto; opcionalmente grava o relatório em JSON.
+
+    Parâmetros:
+        caminho : arquivo do manifesto
+        saida   : arquivo JSON do relatório (não grava se None)
+        kwargs  : repassados para executar_manifesto
+    """
+    relatorio = executar_manifesto(carregar_manifesto(caminho), **kwargs)
+    if saida:
+        Path(saida).parent.mkdir(parents=True, exist_ok=True)
+        with open(saida, 'w', encoding='utf-8') as f:
+            json.dump(relatorio, f, ensure_ascii=False, indent=2, default=float)
+    return relatorio
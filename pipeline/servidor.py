@@ -0,0 +1,427 @@
+"""
+Servidor HTTP Local das Análises.
+
+Mantém o interpretador e os módulos carregados entre requisições e expõe
+as análises do `core` como endpoints JSON (ou NPZ binário com
+`formato=npz`):
+
+    GET/POST /theta_solo  ângulos de contato com o solo
+    GET/POST /cinematica  curvas de posição, velocidade, aceleração e jerk
+    GET/POST /torque      curvas de forças e torque
+    GET/POST /envelope    máximos de torque e cinemática na faixa de
+                          velocidades de plantio de uma cultura
+    GET      /saude       estado do servidor e do cache
+
+Os parâmetros vêm da query string ou de um corpo JSON (POST): as chaves de
+geometria de ParametrosMecanismo (r_mm, L_mm, h_mm, altura_centro_mm,
+m_haste_kg, m_biela_kg), 'passo' (graus), 'omega' ou 'cultura' (+ 'vt'),
+'fvs' e 'fvs_valor'.
+
+Requisições de torque concorrentes com a mesma geometria e o mesmo modelo
+de F_VS são agrupadas (micro-lote) e avaliadas em uma única operação
+vetorizada. Respostas repetidas saem de um cache LRU (utils.cache).
+
+Uso:
+    python -m pipeline.servidor --porta 8765
+"""
+
+import argparse
+import io
+import json
+import queue
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+
+CAMPOS_GEOMETRIA = ('r_mm', 'L_mm', 'h_mm', 'altura_centro_mm', 'm_haste_kg', 'm_biela_kg')
+
+
+# ========================================================================
+# MICRO-LOTE
+# ========================================================================
+
+class MicroLote:
+    """
+    Agrupa pedidos concorrentes e os avalia em lote.
+
+    Pedidos que chegam dentro de `janela_s` após o primeiro formam um lote;
+    dentro do lote, os pedidos com a mesma chave são passados juntos para
+    `avaliar(chave, itens)`, que deve devolver um resultado por item.
+
+    Parâmetros:
+        avaliar  : função (chave, lista de itens) -> lista de resultados
+        janela_s : tempo máximo de espera por novos pedidos (s)
+        max_lote : número máximo de pedidos por lote
+    """
+
+    def __init__(self, avaliar, janela_s: float = 0.002, max_lote: int = 256):
+        self._avaliar = avaliar
+        self.janela_s = janela_s
+        self.max_lote = max_lote
+        self._fila = queue.Queue()
+        self.lotes = 0
+        self.pedidos = 0
+        self._thread = threading.Thread(target=self._laco, name='micro-lote', daemon=True)
+        self._thread.start()
+
+    def submeter(self, chave, item) -> Future:
+        futuro = Future()
+        self._fila.put((chave, item, futuro))
+        return futuro
+
+    def fechar(self):
+        self._fila.put(None)
+        self._thread.join()
+
+    def _laco(self):
+        while True:
+            primeiro = self._fila.get()
+            if primeiro is None:
+                return
+            lote = [primeiro]
+            prazo = time.monotonic() + self.janela_s
+            while len(lote) < self.max_lote:
+                restante = prazo - time.monotonic()
+                if restante <= 0:
+                    break
+                try:
+                    pedido = self._fila.get(timeout=restante)
+                except queue.Empty:
+                    break
+                if pedido is None:
+                    self._fila.put(None)
+                    break
+                lote.append(pedido)
+
+            grupos = defaultdict(list)
+            for chave, item, futuro in lote:
+                grupos[chave].append((item, futuro))
+            for chave, pedidos in grupos.items():
+                try:
+                    resultados = self._avaliar(chave, [item for item, _ in pedidos])
+                    for (_, futuro), res in zip(pedidos, resultados):
+                        futuro.set_result(res)
+                except Exception as e:
+                    for _, futuro in pedidos:
+                        futuro.set_exception(e)
+            self.lotes += 1
+            self.pedidos += len(lote)
+
+
+# ========================================================================
+# SERVIÇO (independente de HTTP)
+# ========================================================================
+
+def _float(params: dict, chave: str, padrao=None):
+    valor = params.get(chave, padrao)
+    if valor is None:
+        return None
+    try:
+        return float(valor)
+    except (TypeError, ValueError):
+        raise ValueError(f"Parâmetro '{chave}' deve ser numérico (recebido {valor!r}).")
+
+
+class ServicoAnalise:
+    """
+    Atende as consultas a partir de dicts de parâmetros.
+
+    Parâmetros:
+        sessao      : SessaoAnalise base (cria uma nova se None)
+        catalogo    : dict nome -> Cultura (carrega culturas.yaml se None)
+        tamanho_max : tamanho do cache LRU de respostas
+        janela_s    : janela do micro-lote de torque (s)
+    """
+
+    def __init__(self, sessao=None, catalogo=None, tamanho_max: int = 512,
+                 janela_s: float = 0.002):
+        from core.sessao import SessaoAnalise
+        from utils import config_loader
+        from utils.cache import CacheLRU
+
+        self.sessao = sessao if sessao is not None else SessaoAnalise()
+        self.catalogo = catalogo if catalogo is not None else config_loader.carregar_catalogo_culturas()
+        self.cache = CacheLRU(tamanho_max)
+        self.lote_torque = MicroLote(self._avaliar_torque, janela_s)
+
+    def fechar(self):
+        self.lote_torque.fechar()
+
+    # --------------------------------------------------------------------
+    # Parâmetros
+    # --------------------------------------------------------------------
+
+    def _geometria(self, params: dict) -> tuple:
+        return tuple(sorted((c, _float(params, c)) for c in CAMPOS_GEOMETRIA if c in params))
+
+    def _sessao(self, geometria: tuple):
+        return self.sessao.com_parametros(**dict(geometria)) if geometria else self.sessao
+
+    def _grade(self, params: dict):
+        from core.sessao import THETA_TORQUE_DEG
+        from utils.cache import malha_fixa
+
+        passo = _float(params, 'passo', 1.0)
+        if passo == 1.0:
+            return THETA_TORQUE_DEG
+        if not 0 < passo <= 90:
+            raise ValueError(f"'passo' deve estar em (0, 90] graus (recebido {passo}).")
+        return malha_fixa(np.arange(0.0, 360.0 + passo / 2, passo))
+
+    def _cultura(self, params: dict):
+        from utils.config_loader import normalizar_nome
+
+        nome = normalizar_nome(str(params['cultura']))
+        if nome not in self.catalogo:
+            raise ValueError(f"Cultura '{params['cultura']}' não encontrada. "
+                             f"Disponíveis: {list(self.catalogo)}")
+        return nome, self.catalogo[nome]
+
+    def _omega(self, params: dict) -> float:
+        if 'omega' in params:
+            return _float(params, 'omega')
+        if 'cultura' in params:
+            return self._cultura(params)[1].omega(_float(params, 'vt'))
+        return 20.0
+
+    def _fvs(self, params: dict) -> tuple:
+        tipo = params.get('fvs', 'variavel')
+        if tipo == 'constante':
+            return (('tipo', 'constante'), ('valor', _float(params, 'fvs_valor', 0.0)))
+        return (('tipo', tipo),)
+
+    # --------------------------------------------------------------------
+    # Consultas
+    # --------------------------------------------------------------------
+
+    def _avaliar_torque(self, chave: tuple, omegas: list) -> list:
+        geometria, fvs, passo = chave
+        sessao = self._sessao(geometria)
+        return sessao.torque_lote(omegas, dict(fvs), self._grade({'passo': passo}))
+
+    def theta_solo(self, params: dict) -> dict:
+        sessao = self._sessao(self._geometria(params))
+        return {'parametros': _registro(sessao), **sessao.theta_solo()}
+
+    def torque(self, params: dict) -> tuple:
+        geometria = self._geometria(params)
+        chave = (geometria, self._fvs(params), _float(params, 'passo', 1.0))
+        self._grade(params)  # valida o passo antes de entrar no lote
+        res = self.lote_torque.submeter(chave, self._omega(params)).result()
+
+        dados = {
+            'parametros': _registro(self._sessao(geometria)),
+            'omega_rad_s': res['omega'],
+            'modelo_fvs': res['info'],
+            'estatisticas': res['estatisticas'],
+        }
+        curvas = {k: res[k] for k in ('theta_deg', 'F_VS', 'F_B', 'F_M', 'torque')}
+        return dados, curvas
+
+    def cinematica(self, params: dict) -> tuple:
+        sessao = self._sessao(self._geometria(params))
+        theta_deg = self._grade(params)
+        nome = self._cultura(params)[0] if 'cultura' in params else 'omega'
+        res = sessao.cinematica({}, theta_deg, omegas={nome: self._omega(params)})
+
+        dados = {
+            'parametros': _registro(sessao),
+            'omega_rad_s': res['omegas'][nome],
+            'theta_solo': res['theta_solo'],
+        }
+        curvas = {
+            'theta_deg': theta_deg,
+            'y_solo': res['y_solo'],
+            'velocidade': res['velocidades'][nome]['velocidade'],
+            'aceleracao': res['aceleracoes'][nome]['aceleracao'],
+            'jerk': res['jerks'][nome]['jerk'],
+        }
+        return dados, curvas
+
+    def envelope(self, params: dict) -> tuple:
+        """Máximos ao longo da faixa de velocidades do trator de uma cultura."""
+        from core import cinematica as cin
+
+        nome, cultura = self._cultura(params)
+        geometria = self._geometria(params)
+        sessao = self._sessao(geometria)
+        theta_deg = self._grade(params)
+
+        vt = np.arange(cultura.velocidade_min_kmh,
+                       cultura.velocidade_max_kmh + cultura.velocidade_passo_kmh / 2,
+                       cultura.velocidade_passo_kmh)
+        omegas = np.array([cultura.omega(v) for v in vt])
+        res = sessao.torque_lote(omegas, dict(self._fvs(params)), theta_deg)
+        bases = sessao.bases_cinematica(theta_deg)
+
+        curvas = {
+            'vt_kmh': vt,
+            'omega_rad_s': omegas,
+            'omega_rpm': cin.omega_rpm(omegas),
+            'tau_max_abs': np.array([r['estatisticas']['tau_max_abs'] for r in res]),
+            'FB_max_abs': np.array([r['estatisticas']['FB_max_abs'] for r in res]),
+            'v_max_abs_mm_s': np.max(np.abs(bases['v'])) * omegas,
+            'a_max_abs_mm_s2': np.max(np.abs(bases['a'])) * omegas**2,
+            'j_max_abs_mm_s3': np.max(np.abs(bases['j'])) * omegas**3,
+        }
+        dados = {'parametros': _registro(sessao), 'cultura': nome,
+                 'theta_solo': sessao.theta_solo()}
+        return dados, curvas
+
+    def consultar(self, rota: str, params: dict) -> tuple:
+        """
+        Responde a uma consulta com cache.
+
+        Retorna:
+            (corpo em bytes, content-type)
+        """
+        formato = params.get('formato', 'json')
+        if formato not in ('json', 'npz'):
+            raise ValueError(f"Formato inválido: '{formato}'. Use 'json' ou 'npz'.")
+        chave = (rota, tuple(sorted((k, str(v)) for k, v in params.items())))
+        return self.cache.obter_ou_calcular(chave, lambda: self._responder(rota, params, formato))
+
+    def _responder(self, rota: str, params: dict, formato: str) -> tuple:
+        if rota == 'theta_solo':
+            dados, curvas = self.theta_solo(params), {}
+        else:
+            dados, curvas = getattr(self, rota)(params)
+
+        if formato == 'npz':
+            buffer = io.BytesIO()
+            np.savez(buffer, __meta__=np.array(json.dumps(dados, default=_json_padrao)), **curvas)
+            return buffer.getvalue(), 'application/octet-stream'
+        corpo = {**dados, 'curvas': curvas} if curvas else dados
+        return (json.dumps(corpo, ensure_ascii=False, default=_json_padrao).encode('utf-8'),
+                'application/json; charset=utf-8')
+
+    def saude(self) -> dict:
+        return {
+            'status': 'ok',
+            'cache_respostas': self.cache.estatisticas(),
+            'cache_intermediarios': self.sessao.estatisticas_cache(),
+            'micro_lote': {'lotes': self.lote_torque.lotes, 'pedidos': self.lote_torque.pedidos},
+        }
+
+
+def _registro(sessao) -> dict:
+    from dataclasses import asdict
+    return asdict(sessao.parametros)
+
+
+def _json_padrao(obj):
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f'Objeto não serializável: {type(obj).__name__}')
+
+
+# ========================================================================
+# HTTP
+# ========================================================================
+
+ROTAS = ('theta_solo', 'cinematica', 'torque', 'envelope')
+
+
+class _Manipulador(BaseHTTPRequestHandler):
+    server_version = 'PunchSeeder/1.0'
+
+    def _responder(self, status: int, corpo: bytes, tipo: str):
+        self.send_response(status)
+        self.send_header('Content-Type', tipo)
+        self.send_header('Content-Length', str(len(corpo)))
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def _erro(self, status: int, mensagem: str):
+        corpo = json.dumps({'erro': mensagem}, ensure_ascii=False).encode('utf-8')
+        self._responder(status, corpo, 'application/json; charset=utf-8')
+
+    def _atender(self, params: dict):
+        rota = urlparse(self.path).path.strip('/')
+        servico = self.server.servico
+        if rota == 'saude':
+            corpo = json.dumps(servico.saude()).encode('utf-8')
+            return self._responder(200, corpo, 'application/json; charset=utf-8')
+        if rota not in ROTAS:
+            return self._erro(404, f"Rota desconhecida: '/{rota}'. Disponíveis: {list(ROTAS)}")
+        try:
+            corpo, tipo = servico.consultar(rota, params)
+        except (ValueError, KeyError) as e:
+            return self._erro(400, str(e))
+        except Exception as e:
+            # Sem isso o cliente só veria a conexão cair, sem resposta HTTP
+            self.log_error('Erro interno em /%s: %r', rota, e)
+            return self._erro(500, f'Erro interno: {type(e).__name__}: {e}')
+        self._responder(200, corpo, tipo)
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        self._atender({k: v[-1] for k, v in query.items()})
+
+    def do_POST(self):
+        tamanho = int(self.headers.get('Content-Length') or 0)
+        try:
+            params = json.loads(self.rfile.read(tamanho) or b'{}')
+        except json.JSONDecodeError as e:
+            return self._erro(400, f'JSON inválido: {e}')
+        if not isinstance(params, dict):
+            return self._erro(400, 'O corpo deve ser um objeto JSON.')
+        self._atender(params)
+
+    def log_message(self, formato, *args):
+        if not self.server.silencioso:
+            super().log_message(formato, *args)
+
+
+def criar_servidor(host: str = '127.0.0.1', porta: int = 8765,
+                   servico: ServicoAnalise = None, silencioso: bool = False) -> ThreadingHTTPServer:
+    """
+    Cria (sem iniciar) o servidor HTTP.
+
+    Parâmetros:
+        host, porta : endereço de escuta (porta 0 = porta livre qualquer)
+        servico     : ServicoAnalise (cria um novo se None)
+        silencioso  : se True, não registra as requisições no stderr
+    """
+    servidor = ThreadingHTTPServer((host, porta), _Manipulador)
+    servidor.daemon_threads = True
+    servidor.servico = servico if servico is not None else ServicoAnalise()
+    servidor.silencioso = silencioso
+    return servidor
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m pipeline.servidor',
+                                     description='Servidor HTTP local das análises.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--porta', type=int, default=8765)
+    parser.add_argument('--cache', type=int, default=512, help='respostas no cache LRU')
+    parser.add_argument('--janela-ms', type=float, default=2.0, help='janela do micro-lote (ms)')
+    parser.add_argument('--silencioso', action='store_true')
+    args = parser.parse_args(argv)
+
+    servico = ServicoAnalise(tamanho_max=args.cache, janela_s=args.janela_ms / 1000)
+    servidor = criar_servidor(args.host, args.porta, servico, args.silencioso)
+    print(f"Servidor em http://{args.host}:{servidor.server_address[1]} (Ctrl+C para sair)",
+          file=sys.stderr)
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+        servico.fechar()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
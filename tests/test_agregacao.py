@@ -0,0 +1,83 @@
+"""
+Testes das somas por nível geográfico (data.agregacao).
+"""
+
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from data import agregacao, ibge_loader, sidra
+from pipeline import cli
+
+AMOSTRA = os.path.join(RAIZ, 'tests', 'dados', 'pam_amostra.csv')
+MICRO = os.path.join(RAIZ, 'tests', 'dados', 'microrregioes_amostra.csv')
+
+
+def test_somas_iguais_ao_groupby():
+    pam = sidra.ler_pam(AMOSTRA)
+    indice = agregacao.indice_pam(pam, MICRO)
+    assert indice.niveis == agregacao.NIVEIS
+
+    sel = pam[(pam['ano'] == 2022) & (pam['variavel'] == sidra.AREA_PLANTADA)]
+    micro = agregacao.ler_microrregioes(MICRO).set_index('cod_municipio')['cod_microrregiao']
+    chaves = {'municipio': sel['cod_municipio'], 'microrregiao': sel['cod_municipio'].map(micro),
+              'uf': sel['cod_uf'], 'regiao': sel['cod_uf'] // 10}
+    for nivel, chave in chaves.items():
+        tabela = agregacao.tabela_nivel_pam(pam, nivel, 2022, indice=indice)
+        esperado = (sel.assign(chave=chave.to_numpy(), cultura=sidra._nome_curto(sel['cultura']))
+                       .pivot_table(index='chave', columns='cultura', values='valor',
+                                    aggfunc='sum', observed=True).fillna(0).round())
+        obtido = tabela.set_index('codigo').loc[esperado.index, esperado.columns]
+        np.testing.assert_array_equal(obtido.to_numpy(), esperado.to_numpy())
+
+    # Nível 'uf' completo (27 UFs) e igual à tabela por estado da PAM
+    uf = agregacao.tabela_nivel_pam(pam, 'uf', 2023, indice=indice)
+    pd.testing.assert_frame_equal(uf.drop(columns='codigo'), sidra.tabela_estados_pam(pam, 2023))
+    assert agregacao.tabela_nivel_pam(pam, 'microrregiao', 2023, indice=indice) \
+        .set_index('Microrregião').loc['Alto Teles Pires', 'Soja'] > 0
+
+
+def test_tabela_embutida_por_regiao():
+    t2 = ibge_loader.processar_tabela_estados()
+    regioes = ibge_loader.carregar_tabela_nivel('regiao')
+    assert regioes['Região'].tolist() == ['Norte', 'Nordeste', 'Sudeste', 'Sul', 'Centro-Oeste']
+    for cultura in ibge_loader.CULTURAS + ['Total']:
+        assert regioes[cultura].sum() == t2[cultura].sum()
+    assert regioes.set_index('Região').loc['Sul', 'Soja'] == 5773424 + 814633 + 6708397
+
+    uf = ibge_loader.carregar_tabela_nivel('uf')
+    pd.testing.assert_frame_equal(uf.drop(columns='codigo'), t2)
+    with pytest.raises(ValueError):
+        ibge_loader.carregar_tabela_nivel('municipio')
+
+
+def test_indice_exige_microrregioes_e_codigos_conhecidos():
+    indice = agregacao.IndiceGeografico([4106902, 4113700, 5107925])
+    assert 'microrregiao' not in indice.niveis
+    with pytest.raises(ValueError):
+        indice.somar(np.array([0]), np.array([1.0]), 'microrregiao')
+    with pytest.raises(ValueError):
+        indice.posicoes([3550308])
+
+    # subir(): matriz por município -> UF, várias colunas em um bincount
+    somas = indice.subir(np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]), 'uf')
+    grupos = indice.grupos('uf').set_index('codigo')
+    assert len(grupos) == 27
+    np.testing.assert_array_equal(somas[grupos.index.get_loc(41)], [4.0, 6.0])
+    np.testing.assert_array_equal(somas[grupos.index.get_loc(51)], [5.0, 6.0])
+
+
+def test_cli_ibge_por_nivel(tmp_path):
+    import json
+    saida = tmp_path / 'top.json'
+    assert cli.main(['ibge', '--pam', AMOSTRA, '--nivel', 'microrregiao', '--microrregioes', MICRO,
+                     '--tabela', 'top', '--cultura', 'Soja', '-n', '2', '--saida', str(saida)]) == 0
+    registros = json.loads(saida.read_text(encoding='utf-8'))['registros']
+    assert registros[0]['Microrregião'] == 'Alto Teles Pires'
+    assert len(registros) == 2
@@ -0,0 +1,89 @@
+"""
+Testes do armazém colunar particionado da PAM (data.armazem).
+"""
+
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from data import armazem, ibge_loader, sidra
+from pipeline import cli
+
+AMOSTRA = os.path.join(RAIZ, 'tests', 'dados', 'pam_amostra.csv')
+ORDEM = ['ano', 'cod_municipio', 'variavel', 'cultura']
+
+
+def test_ida_e_volta_e_particoes(tmp_path):
+    pam = sidra.ler_pam(AMOSTRA)
+    arm = armazem.abrir_pam(AMOSTRA, tmp_path / 'pam')
+    assert arm.anos == [2022, 2023]
+    assert (arm.ano_ou_recente(), arm.ano_ou_recente(2022)) == (2023, 2022)
+    with pytest.raises(ValueError):
+        arm.ano_ou_recente(1999)
+    assert arm.particoes([2023], ['Soja (em grão)']) == ['ano=2023/cultura=Soja']
+
+    lido = arm.ler().sort_values(ORDEM, kind='stable').reset_index(drop=True)
+    pd.testing.assert_frame_equal(lido, pam.sort_values(ORDEM, kind='stable').reset_index(drop=True))
+
+    # Colunas mapeadas em memória, somente leitura
+    valor = arm.coluna('ano=2023/cultura=Soja', 'valor')
+    assert isinstance(valor, np.memmap) and not valor.flags.writeable
+
+    for ano in arm.anos:
+        pd.testing.assert_frame_equal(arm.tabela_estados(ano), sidra.tabela_estados_pam(pam, ano))
+        pd.testing.assert_frame_equal(arm.tabela_sintese(ano), sidra.tabela_sintese_pam(pam, ano))
+
+
+def test_top_estados_e_reaproveitamento(tmp_path):
+    raiz = tmp_path / 'pam'
+    arm = armazem.abrir_pam(AMOSTRA, raiz)
+    estados = arm.tabela_estados(2023)
+    for cultura in ('Soja', None):
+        coluna = cultura or 'Total'
+        esperado = (estados[['Estado', coluna]]
+                    .sort_values(coluna, ascending=False, kind='stable').head(4))
+        top = arm.top_estados(cultura, 2023, n=4)
+        assert top['Estado'].tolist() == esperado['Estado'].tolist()
+        assert top[coluna].tolist() == esperado[coluna].tolist()
+
+    # Mesmo CSV: o armazém é reaberto sem regravar
+    marca = os.stat(raiz / armazem.ARQUIVO_META).st_mtime_ns
+    armazem.abrir_pam(AMOSTRA, raiz)
+    assert os.stat(raiz / armazem.ARQUIVO_META).st_mtime_ns == marca
+
+    sintese, estados_loader = ibge_loader.carregar_dados_ibge(str(raiz))
+    pd.testing.assert_frame_equal(estados_loader, estados)
+
+
+def test_nao_apaga_diretorio_alheio(tmp_path):
+    alheio = tmp_path / 'minhas_coisas'
+    alheio.mkdir()
+    (alheio / 'tese.txt').write_text('x')
+    with pytest.raises(ValueError):
+        armazem.abrir_pam(AMOSTRA, alheio)
+    assert (alheio / 'tese.txt').exists()
+
+    # Armazém anterior é substituído, sem sobras no diretório pai
+    raiz = tmp_path / 'pam'
+    pam = sidra.ler_pam(AMOSTRA)
+    armazem.gravar_armazem(pam, raiz)
+    armazem.gravar_armazem(pam, raiz)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['minhas_coisas', 'pam']
+
+
+def test_cli_ibge_com_armazem(tmp_path):
+    import json
+    raiz = tmp_path / 'pam'
+    saida = tmp_path / 'top.json'
+    argumentos = ['ibge', '--tabela', 'top', '--cultura', 'Milho', '-n', '3', '--saida', str(saida)]
+    assert cli.main(argumentos + ['--pam', AMOSTRA, '--armazem', str(raiz)]) == 0
+    primeiro = json.loads(saida.read_text(encoding='utf-8'))['registros']
+    assert cli.main(argumentos + ['--pam', str(raiz)]) == 0
+    assert json.loads(saida.read_text(encoding='utf-8'))['registros'] == primeiro
+    assert len(primeiro) == 3
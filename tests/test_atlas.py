@@ -0,0 +1,50 @@
+"""
+Testes do atlas coroplético em lote (visualization.atlas), com polígonos
+sintéticos (só exige matplotlib).
+"""
+
+import sys
+import os
+
+import numpy as np
+import pytest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from visualization import atlas
+
+
+def _grade_quadrados(n=3):
+    """n x n quadrados; o do centro com um buraco."""
+    poligonos = []
+    for i in range(n):
+        for j in range(n):
+            externo = np.array([[i, j], [i + 1, j], [i + 1, j + 1], [i, j + 1], [i, j]], dtype=float)
+            aneis = [externo]
+            if (i, j) == (n // 2, n // 2):
+                aneis.append(np.array([[i + .3, j + .3], [i + .3, j + .7], [i + .7, j + .7],
+                                       [i + .7, j + .3], [i + .3, j + .3]]))
+            poligonos.append(aneis)
+    return poligonos
+
+
+def test_atlas_em_processo_unico_e_em_pool(tmp_path):
+    poligonos = _grade_quadrados()
+    rng = np.random.default_rng(0)
+    mapas = [{'valores': rng.random(9) * 1000, 'titulo': f'mapa {i}',
+              'arquivo': tmp_path / 'serie' / f'mapa_{i}.png'} for i in range(4)]
+    serie = atlas.renderizar_atlas(poligonos, mapas, processos=1, dpi=40)
+    paralelo = atlas.renderizar_atlas(
+        poligonos, [{**m, 'arquivo': tmp_path / 'pool' / os.path.basename(m['arquivo'])} for m in mapas],
+        processos=2, dpi=40)
+    assert [os.path.basename(a) for a in serie] == [os.path.basename(a) for a in paralelo]
+    for a, b in zip(serie, paralelo):
+        with open(a, 'rb') as fa, open(b, 'rb') as fb:
+            conteudo = fa.read()
+            assert conteudo[:8] == b'\x89PNG\r\n\x1a\n'
+            assert conteudo == fb.read()  # figura reaproveitada == figura nova
+
+    with pytest.raises(ValueError):
+        atlas.renderizar_atlas(poligonos, [{'valores': np.ones(3), 'titulo': 'x',
+                                            'arquivo': tmp_path / 'x.png'}])
@@ -0,0 +1,73 @@
+"""
+Testes do cache LRU em memória (utils.cache).
+"""
+
+import sys
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from core import forcas_torque as ft
+from core.sessao import SessaoAnalise, THETA_TORQUE_DEG
+from utils import cache as cache_mod
+from utils.cache import CacheLRU, chave_geometria
+
+
+def test_lru_remove_o_menos_usado():
+    cache = CacheLRU(2)
+    for chave in ('a', 'b', 'a', 'c'):
+        cache.obter_ou_calcular(chave, lambda: np.zeros(3))
+    assert 'a' in cache and 'c' in cache and 'b' not in cache
+    est = cache.estatisticas()
+    assert (est['acertos'], est['falhas'], est['remocoes']) == (1, 3, 1)
+    assert not cache.obter_ou_calcular('a', lambda: None).flags.writeable
+
+
+def test_calculo_unico_sob_concorrencia():
+    cache = CacheLRU()
+    chamadas = []
+
+    def lento():
+        chamadas.append(threading.get_ident())
+        time.sleep(0.05)
+        return 1
+
+    with ThreadPoolExecutor(8) as pool:
+        assert set(pool.map(lambda _: cache.obter_ou_calcular('k', lento), range(8))) == {1}
+    assert len(chamadas) == 1
+
+
+def test_chave_depende_da_geometria_e_da_grade():
+    theta = np.arange(0.0, 361.0)
+    assert chave_geometria('y', 1.0, 2.0, theta_deg=theta) == chave_geometria('y', 1.0, 2.0, theta_deg=theta.copy())
+    assert chave_geometria('y', 1.0, 2.0, theta_deg=theta) != chave_geometria('y', 1.0, 2.5, theta_deg=theta)
+    assert chave_geometria('y', 1.0, 2.0, theta_deg=theta) != chave_geometria('y', 1.0, 2.0, theta_deg=theta[:-1])
+    with pytest.raises(ValueError):
+        chave_geometria('y', 1.0, theta_deg=np.array([]))
+
+
+def test_descritor_de_malha_fixa_calculado_uma_vez(monkeypatch):
+    malhas = (cache_mod.malha_fixa(np.arange(0.0, 361.0)), THETA_TORQUE_DEG)
+    esperados = [cache_mod.descritor_grade(m) for m in malhas]
+    monkeypatch.setattr(cache_mod.hashlib, 'blake2b', None)  # nova passada falharia
+    assert [cache_mod.descritor_grade(m) for m in malhas] == esperados
+
+
+def test_sessao_reaproveita_posicao_no_F_VS():
+    sessao = SessaoAnalise()
+    sessao.cinematica({})
+    antes = sessao.estatisticas_cache()
+    F_VS, F_max, theta_pico, _ = sessao.modelo_F_VS()
+    depois = sessao.estatisticas_cache()
+    assert depois['acertos'] == antes['acertos'] + 1  # y_solo veio do cache
+
+    F_ref, F_max_ref, pico_ref, _ = ft.construir_F_VS_variavel(THETA_TORQUE_DEG, *sessao.parametros.geometria_mm)
+    np.testing.assert_allclose(F_VS, F_ref, rtol=1e-12)
+    assert theta_pico == pico_ref and F_max == F_max_ref
@@ -0,0 +1,94 @@
+"""
+Testes do cache em disco endereçado por conteúdo (utils.cache_disco).
+"""
+
+import sys
+import os
+import json
+
+import numpy as np
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from pipeline import cli
+from utils import cache_disco
+from utils.cache_disco import CacheDisco
+
+
+def test_ida_e_volta_sem_pickle(tmp_path):
+    cache = CacheDisco(tmp_path)
+    valor = ({'curva': np.linspace(0, 1, 5), 'info': None, 3: [1, 'a', 2.5]}, {'t': (1.0, 2.0)})
+    assert cache.obter_ou_calcular('x', {'a': 1}, lambda: valor) is valor
+
+    lido = cache.obter_ou_calcular('x', {'a': 1}, lambda: None)
+    np.testing.assert_array_equal(lido[0]['curva'], valor[0]['curva'])
+    assert lido[0][3] == [1, 'a', 2.5] and lido[1] == {'t': (1.0, 2.0)}
+    assert (cache.acertos, cache.falhas) == (1, 1)
+    assert not list(tmp_path.rglob('.tmp_*'))
+
+
+def test_chave_muda_com_codigo(tmp_path, monkeypatch):
+    chave = cache_disco.chave_conteudo('torque', {'omega': 20.0})
+    monkeypatch.setattr(cache_disco, 'impressao_codigo', lambda: 'outra versão')
+    assert cache_disco.chave_conteudo('torque', {'omega': 20.0}) != chave
+
+
+def test_remocao_por_tamanho_e_entrada_corrompida(tmp_path):
+    cache = CacheDisco(tmp_path, tamanho_max_bytes=40_000)
+    for i in range(10):
+        cache.obter_ou_calcular('x', {'i': i}, lambda: np.zeros(1000))
+    assert cache.tamanho_bytes() <= 40_000
+    assert cache.estatisticas()['entradas'] < 10
+
+    chave = cache_disco.chave_conteudo('x', {'i': 9})
+    cache._caminho(chave).write_bytes(b'truncado')
+    assert cache.ler(chave) is None
+    assert not cache._caminho(chave).exists()
+
+
+def test_limpar_so_apaga_entradas_do_cache(tmp_path):
+    alheios = [tmp_path / 'geometrias' / 'uf.npz', tmp_path / 'ab' / 'dados.npz',
+               tmp_path / 'ab' / ('cd' + '0' * 62 + '.npz')]
+    for arquivo in alheios:
+        arquivo.parent.mkdir(exist_ok=True)
+        arquivo.write_bytes(b'x' * 100)
+    cache = CacheDisco(tmp_path)
+    cache.gravar(cache_disco.chave_conteudo('x', {}), np.zeros(10))
+    assert cache.estatisticas()['entradas'] == 1
+    cache.limpar()
+    assert cache.estatisticas()['entradas'] == 0
+    assert all(arquivo.exists() for arquivo in alheios)
+
+
+def test_impressao_inclui_cli_e_config():
+    arquivos = [a.relative_to(cache_disco.RAIZ_PROJETO).as_posix()
+                for padrao in cache_disco.ARQUIVOS_CODIGO
+                for a in cache_disco.RAIZ_PROJETO.glob(padrao)]
+    assert {'pipeline/cli.py', 'utils/config_loader.py', 'core/sessao.py'} <= set(arquivos)
+
+
+def test_gravar_sem_percorrer_diretorio(tmp_path, monkeypatch):
+    cache = CacheDisco(tmp_path, tamanho_max_bytes=10**9)
+    cache.gravar('ab' * 32, np.zeros(10))
+
+    def proibido(self):
+        raise AssertionError('diretório percorrido abaixo do limite')
+    monkeypatch.setattr(CacheDisco, '_entradas', proibido)
+    for i in range(20):
+        cache.obter_ou_calcular('x', {'i': i}, lambda: np.zeros(100))
+    monkeypatch.undo()
+    assert cache._total == cache.tamanho_bytes()
+    # Reaberto: o total é lido do disco
+    assert CacheDisco(tmp_path)._total == cache._total
+
+
+def test_cli_sweep_reaproveita_combinacoes(tmp_path):
+    base = ['sweep', '--omega', '20', '--resumo', '--cache-disco', str(tmp_path / 'cache')]
+    assert cli.main([*base, '--r', '80', '--saida', str(tmp_path / 'a.json')]) == 0
+    assert cli.main([*base, '--r', '80', '84.01', '--saida', str(tmp_path / 'b.json')]) == 0
+    assert CacheDisco(tmp_path / 'cache').estatisticas()['entradas'] == 2
+
+    a = json.loads((tmp_path / 'a.json').read_text(encoding='utf-8'))
+    b = json.loads((tmp_path / 'b.json').read_text(encoding='utf-8'))
+    assert b['resultados'][0] == a['resultados'][0]
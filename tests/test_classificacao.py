@@ -0,0 +1,68 @@
+"""
+Testes da classificação para mapas (visualization.classificacao).
+"""
+
+import sys
+import os
+import itertools
+
+import numpy as np
+import pytest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from visualization import classificacao as cl
+
+
+def _soma_quadrados(valores, limites):
+    classes = cl.classes(valores, limites)
+    return sum(((valores[classes == c] - valores[classes == c].mean()) ** 2).sum()
+               for c in np.unique(classes))
+
+
+def test_jenks_igual_a_busca_exaustiva():
+    rng = np.random.default_rng(3)
+    for _ in range(20):
+        valores = np.round(rng.gamma(1.5, 100, 14))
+        k = int(rng.integers(2, 5))
+        distintos = np.unique(valores)
+        melhor = min(
+            _soma_quadrados(valores, np.r_[distintos[0], distintos[np.array(cortes) - 1], distintos[-1]])
+            for cortes in itertools.combinations(range(1, len(distintos)), k - 1))
+        limites = cl.quebras_jenks(valores, k)
+        assert len(limites) == k + 1
+        assert _soma_quadrados(valores, limites) == pytest.approx(melhor, rel=1e-9, abs=1e-9)
+
+
+def test_quantis_amostra_e_casos_limite():
+    np.testing.assert_allclose(cl.quebras_quantis(np.arange(101.0), 4), [0, 25, 50, 75, 100])
+    # Muitos zeros: limites repetidos são fundidos
+    assert cl.quebras_quantis(np.r_[np.zeros(90), np.arange(10.0)], 5)[0] == 0.0
+    # Menos valores distintos que classes
+    np.testing.assert_array_equal(cl.quebras_jenks([1, 1, 2, 3, 3], 5), [1, 2, 3])
+
+    rng = np.random.default_rng(0)
+    valores = np.r_[np.zeros(2000), rng.lognormal(8, 2, 4000), np.nan]
+    limites = cl.quebras_jenks(valores, 5, amostra=500)
+    assert limites[0] == 0.0 and limites[-1] == np.nanmax(valores)
+    assert np.all(np.diff(limites) > 0)
+    with pytest.raises(ValueError):
+        cl.quebras_jenks([np.nan], 3)
+
+
+def test_cache_e_norma():
+    valores = np.random.default_rng(1).random(300) * 1000
+    antes = cl.estatisticas_cache()['acertos']
+    a = cl.quebras(valores, 'FisherJenks', 4, 'teste')
+    b = cl.quebras(valores.copy(), 'fisherjenks', 4, 'teste')
+    assert a is b and not a.flags.writeable
+    assert cl.estatisticas_cache()['acertos'] == antes + 1
+    with pytest.raises(ValueError):
+        cl.quebras(valores, 'NaturalBreaks', 4)
+
+    # BoundaryNorm com a mesma convenção de classes() (limite na classe de baixo)
+    from matplotlib.colors import ListedColormap
+    cores = ListedColormap(['r', 'g', 'b', 'k'][:len(a) - 1])
+    teste = np.r_[valores, a]
+    np.testing.assert_array_equal(np.asarray(cl.norma(a, cores)(teste)), cl.classes(teste, a))
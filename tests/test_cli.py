@@ -0,0 +1,78 @@
+"""
+Testes da CLI não interativa (pipeline.cli).
+"""
+
+import sys
+import os
+import csv
+import json
+import subprocess
+
+import pytest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from pipeline import cli
+
+
+def _rodar_json(tmp_path, *argv):
+    saida = tmp_path / 'saida.json'
+    assert cli.main([*argv, '--saida', str(saida)]) == 0
+    return json.loads(saida.read_text(encoding='utf-8'))
+
+
+def test_torque_resumo(tmp_path):
+    dados = _rodar_json(tmp_path, 'torque', '--omega', '20', '--resumo')
+    assert dados['estatisticas']['tau_max_abs'] == pytest.approx(12.0015, abs=1e-4)
+    assert 'curvas' not in dados
+
+
+def test_kinematics_curvas(tmp_path):
+    dados = _rodar_json(tmp_path, 'kinematics', '--culturas', 'soja', '--passo', '2')
+    assert len(dados['curvas']['theta_deg']) == 181
+    assert set(dados['culturas']) == {'soja'}
+
+
+def test_sweep_csv(tmp_path):
+    saida = tmp_path / 'sweep.csv'
+    argv = ['sweep', '--r', '80', '84.01', '--omega', '20', '30',
+            '--formato', 'csv', '--saida', str(saida)]
+    assert cli.main(argv) == 0
+    with open(saida, encoding='utf-8') as f:
+        linhas = list(csv.DictReader(f))
+    assert len(linhas) == 4
+    assert float(linhas[2]['tau_max_abs']) == pytest.approx(12.0015, abs=1e-4)
+
+
+def test_erro_retorna_codigo_1(tmp_path):
+    assert cli.main(['torque', '--fvs', 'constante', '--saida', str(tmp_path / 'x')]) == 1
+    # Distância curta demais para uma semente: divisão por zero vira erro
+    assert cli.main(['spacing', '--distancia', '0.01', '--saida', str(tmp_path / 'x')]) == 1
+    for argv in (['spacing', '--distancia', '0'], ['kinematics', '--passo', '-5'],
+                 ['kinematics', '--passo', '0'], ['kinematics', '--passo', '91']):
+        with pytest.raises(SystemExit) as e:
+            cli.main(argv)
+        assert e.value.code == 2
+
+
+def test_main_nao_le_stdin():
+    proc = subprocess.run([sys.executable, 'main.py', 'spacing', '--resumo'],
+                          cwd=RAIZ, stdin=subprocess.DEVNULL, capture_output=True,
+                          text=True, timeout=120)
+    assert proc.returncode == 0
+    assert 'soja' in json.loads(proc.stdout)['culturas']
+
+
+def test_torque_nao_importa_matplotlib_nem_pandas():
+    codigo = (
+        "import os, sys\n"
+        "import main\n"
+        "from pipeline import cli\n"
+        "cli.main(['torque', '--resumo', '--saida', os.devnull])\n"
+        "print(','.join(m for m in ('matplotlib', 'pandas', 'scipy') if m in sys.modules))\n"
+    )
+    proc = subprocess.run([sys.executable, '-c', codigo], cwd=RAIZ, capture_output=True,
+                          text=True, timeout=120)
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip() == ''
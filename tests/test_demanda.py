@@ -0,0 +1,67 @@
+"""
+Testes da capacidade de campo (core.capacidade) e da demanda de semeadoras (data.demanda).
+"""
+
+import sys
+import os
+
+import numpy as np
+import pytest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from core import capacidade
+from data import demanda, ibge_loader
+
+
+def test_capacidade_campo():
+    # 5 km/h, 10 linhas a 0,5 m (5 m), 65% -> 5 · 5 · 0,65 / 10 ha/h
+    assert capacidade.capacidade_campo(5.0, 0.5, 10, 0.65) == pytest.approx(1.625)
+    grade = capacidade.capacidade_campo(np.array([4.0, 6.0])[:, None], 0.45, np.array([7, 9]))
+    assert grade.shape == (2, 2)
+    with pytest.raises(ValueError):
+        capacidade.capacidade_campo(5.0, 0.5, 10, 1.5)
+
+
+def test_maquinas_necessarias():
+    horas = capacidade.horas_maquina(1000.0, 2.0)
+    assert horas == 500.0
+    # 500 h em 20 dias de 10 h -> 2,5 -> 3 máquinas
+    assert capacidade.maquinas_necessarias(horas, 20, 10) == 3
+    assert np.isnan(capacidade.maquinas_necessarias(np.nan, 20))
+    with pytest.raises(ValueError):
+        capacidade.maquinas_necessarias(horas, 0)
+
+
+def test_faixa_velocidades():
+    v = capacidade.faixa_velocidades([4.0, 5.0, 6.0], [6.0, 5.0, 7.0], [1.0, 0.0, 0.5])
+    np.testing.assert_array_equal(v[0], [4.0, 5.0, 6.0])
+    assert v[1, 0] == 5.0 and np.isnan(v[1, 1:]).all()
+    np.testing.assert_array_equal(v[2], [6.0, 6.5, 7.0])
+
+
+def test_estimar_demanda():
+    estados = ibge_loader.processar_tabela_estados()
+    resultado = demanda.estimar_demanda(estados, n_linhas=(9, 13), janela_dias={'soja': 20})
+    S, C = resultado.area_ha.shape
+    assert S == len(estados) and 'Amendoim' not in resultado.culturas
+    assert resultado.horas_maquina.shape[:2] == (S, C)
+    assert resultado.horas_maquina.shape[-1] == 2
+
+    tabela = resultado.tabela()
+    assert len(tabela) == np.count_nonzero(~np.isnan(resultado.horas_maquina))
+    linha = tabela.iloc[0]
+    esperado = capacidade.capacidade_campo(linha['velocidade_kmh'], linha['espacamento_m'],
+                                           linha['n_linhas'])
+    assert linha['capacidade_ha_h'] == pytest.approx(esperado)
+    assert linha['horas_maquina'] == pytest.approx(linha['area_ha'] / esperado)
+
+    resumo = resultado.resumo()
+    assert len(resumo) == S * C
+    assert (resumo['maquinas_min'] <= resumo['maquinas_max']).all()
+    # Janela menor para a soja -> mais máquinas que com a janela padrão
+    padrao = demanda.estimar_demanda(estados, n_linhas=(9, 13)).resumo()
+    soja = resumo['cultura'] == 'Soja'
+    assert (resumo.loc[soja, 'maquinas_max'].to_numpy()
+            >= padrao.loc[soja, 'maquinas_max'].to_numpy()).all()
@@ -0,0 +1,71 @@
+"""
+Testes da energia no eixo da manivela (core.energia e data.demanda.estimar_energia).
+"""
+
+import sys
+import os
+
+import numpy as np
+import pytest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from core import energia
+from core.sessao import SessaoAnalise, THETA_TORQUE_DEG
+from data import demanda
+from pipeline import cli
+
+
+def test_trabalho_acumulado():
+    theta = np.linspace(0.0, 2 * np.pi, 721)
+    tau = np.stack([np.full_like(theta, 2.0), np.sin(theta)])
+    W = energia.trabalho_acumulado(theta, tau)
+    assert W.shape == tau.shape and (W[:, 0] == 0).all()
+    np.testing.assert_allclose(W[0], 2.0 * theta)
+    np.testing.assert_allclose(W[1], 1 - np.cos(theta), atol=1e-4)
+    # Parte positiva de sin θ em uma volta = 2 J
+    np.testing.assert_allclose(energia.energia_ciclo(theta, tau), [4 * np.pi, 2.0], rtol=1e-5)
+    assert abs(energia.energia_ciclo(theta, tau[1], regenerativo=True)) < 1e-12
+    with pytest.raises(ValueError):
+        energia.energia_ciclo(theta[:361], tau)
+
+
+def test_energia_por_hectare():
+    # 10 J por cova, 5 covas/m, linhas a 0,5 m -> 10 · 5 · 20 000 J/ha
+    assert energia.energia_por_hectare(10.0, 5.0, 0.5) == pytest.approx(1e6 / 3.6e6)
+
+
+def test_energia_ciclo_sessao():
+    sessao = SessaoAnalise()
+    omegas = np.array([10.0, 20.0, 30.0])
+    # Sem solo, inércia e peso se anulam na volta completa
+    np.testing.assert_allclose(sessao.energia_ciclo(omegas, {'tipo': 'zero'}, regenerativo=True),
+                               0.0, atol=1e-9)
+    # Com solo, o trabalho líquido é o do solo: -∮ F_VS dy (y_solo em mm)
+    F_VS, _, _, _ = sessao.modelo_F_VS()
+    y = sessao.posicao_solo(THETA_TORQUE_DEG) / 1000.0
+    solo = -np.sum(0.5 * (F_VS[1:] + F_VS[:-1]) * np.diff(y))
+    liquido = sessao.energia_ciclo(omegas, {'tipo': 'variavel'}, regenerativo=True)
+    np.testing.assert_allclose(liquido, solo, rtol=0.02)
+    # A parte positiva cresce com ω (inércia)
+    positivo = sessao.energia_ciclo(omegas, {'tipo': 'variavel'})
+    assert (positivo >= liquido).all() and (np.diff(positivo) > 0).all()
+
+
+def test_estimar_energia(tmp_path):
+    resultado = demanda.estimar_energia()
+    S, C = resultado.area_ha.shape
+    assert resultado.energia_kwh.shape[:2] == (S, C)
+    tabela = resultado.tabela()
+    assert len(tabela) == np.count_nonzero(~np.isnan(resultado.energia_kwh))
+    np.testing.assert_allclose(tabela['energia_kwh'], tabela['area_ha'] * tabela['energia_kwh_ha'])
+
+    estados = resultado.tabela_estados()
+    assert list(estados.columns) == ['Estado', *resultado.culturas, 'Total']
+    np.testing.assert_allclose(estados['Total'], estados[list(resultado.culturas)].sum(axis=1))
+
+    saida = tmp_path / 'energia.csv'
+    assert cli.main(['energia', '--tabela', 'culturas', '--formato', 'csv',
+                     '--saida', str(saida)]) == 0
+    assert saida.read_text(encoding='utf-8').startswith('Estado,cultura,area_ha,kwh_ha_min')
@@ -0,0 +1,46 @@
+"""
+Testes do cache local de geometrias (visualization.geometrias).
+
+A leitura e a simplificação exigem geopandas/shapely; aqui são testados
+só o empacotamento do WKB e a organização dos arquivos.
+"""
+
+import sys
+import os
+
+import numpy as np
+import pytest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from visualization import geometrias
+
+
+def test_empacotamento_wkb_ida_e_volta():
+    blobs = [b'\x01\x03abc', b'', b'\x01\x06' + bytes(range(200))]
+    dados, deslocamentos = geometrias.empacotar_wkb(blobs)
+    assert dados.dtype == np.uint8 and deslocamentos.tolist() == [0, 5, 5, 207]
+    assert geometrias.desempacotar_wkb(dados, deslocamentos) == blobs
+
+
+def test_arquivos_por_nivel_e_tolerancia(tmp_path):
+    cache = geometrias.CacheGeometrias(tmp_path, ano=2020)
+    assert cache.tolerancias('uf') == []
+    for tolerancia in (0.0, 0.01, 0.002):
+        dados, deslocamentos = geometrias.empacotar_wkb([b'x'])
+        np.savez(cache.arquivo('uf', tolerancia), wkb=dados, deslocamentos=deslocamentos)
+    assert cache.arquivo('uf', 0.01).name == 'uf_2020_t0.01.npz'
+    assert cache.tolerancias('uf') == [0.0, 0.002, 0.01]
+    # Temporários (inclusive do formato antigo) não contam como tolerâncias
+    (tmp_path / 'uf_2020_t0.02.npz.tmp.npz').write_bytes(b'')
+    (tmp_path / '.uf_2020_t0.02_abc.tmp').write_bytes(b'')
+    assert cache.tolerancias('uf') == [0.0, 0.002, 0.01]
+    assert cache.tolerancias('regiao') == []
+    with pytest.raises(ValueError):
+        cache.obter('pais')
+
+
+def test_diretorio_fora_do_cache_disco():
+    from utils.cache_disco import DIRETORIO_PADRAO
+    assert DIRETORIO_PADRAO not in geometrias.DIRETORIO_PADRAO.parents
@@ -0,0 +1,100 @@
+"""
+Testes da malha de ângulos com trigonometria em cache (core.grade).
+"""
+
+import sys
+import os
+
+import numpy as np
+import pytest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from core import cinematica as cin
+from core import forcas_torque as ft
+from core.grade import ThetaGrid
+from core.sessao import SessaoAnalise, THETA_TORQUE_DEG
+
+
+THETA_DEG = np.linspace(0.0, 360.0, 721)
+THETA_RAD = np.deg2rad(THETA_DEG)
+
+
+def test_termos_calculados_uma_vez_e_somente_leitura():
+    grade = ThetaGrid.de_graus(THETA_DEG)
+    assert grade.sin is grade.sin
+    assert not grade.cos2.flags.writeable
+    np.testing.assert_allclose(grade.rad, THETA_RAD)
+    np.testing.assert_allclose(grade.sin_quad, np.sin(THETA_RAD)**2)
+    np.testing.assert_allclose(np.asarray(grade), THETA_RAD)
+    with pytest.raises(ValueError):
+        ThetaGrid()
+
+
+def test_kernels_equivalentes_com_array_e_grade():
+    grade = ThetaGrid.de_graus(THETA_DEG)
+    r, L, h = 80.0, 148.0, 100.0
+    for f, args in ((cin.espaco, (r, L, h)),
+                    (cin.velocidade, (20.0, r, L)),
+                    (cin.aceleracao, (20.0, r, L, 3.0)),
+                    (cin.jerk, (20.0, 3.0, r, L, 1.0))):
+        np.testing.assert_allclose(f(grade, *args), f(THETA_RAD, *args), rtol=1e-13)
+
+    geo = (0.08, 0.148, 0.1)
+    massas = (0.5, 0.2, 0.5 * 9.81, 0.2 * 9.81)
+    F_VS = np.full(THETA_DEG.shape, 150.0)
+    # limites fora da malha: com o array, a máscara usa rad2deg(deg2rad(θ)),
+    # que pode errar o ponto exato da borda; a grade usa os graus originais
+    faixa = (120.2, 179.8)
+    tau_arr = ft.torque(THETA_RAD, *geo, *massas, F_VS, 20.0, faixa)
+    tau_grade = ft.torque(grade, *geo, *massas, F_VS, 20.0, faixa)
+    np.testing.assert_allclose(tau_grade, tau_arr, rtol=1e-12, atol=1e-12)
+
+    # sin(theta - beta) algébrico coincide com o cálculo via arctan2
+    beta = ft.beta_theta(THETA_RAD, 0.08, 0.148)
+    bases = ft.bases_torque(grade, *geo)
+    np.testing.assert_allclose(bases['sin_phi'], np.sin(THETA_RAD - beta), atol=1e-14)
+
+
+def test_sessao_compartilha_grade_entre_geometrias():
+    sessao = SessaoAnalise()
+    outra = sessao.com_parametros(r_mm=70.0)
+    assert sessao.grade(THETA_TORQUE_DEG) is outra.grade(THETA_TORQUE_DEG)
+    sessao.bases_torque()
+    outra.bases_torque()
+    assert sessao.estatisticas_cache()['falhas'] == 3
+
+
+def test_out_e_area_de_trabalho_sem_alocacao():
+    import tracemalloc
+    from core.grade import AreaTrabalho
+
+    theta_deg = np.linspace(0.0, 360.0, 36001)
+    grade = ThetaGrid.de_graus(theta_deg)
+    ws = AreaTrabalho()
+    args = (0.084, 0.21, 0.347, 0.5, 0.2, 0.5 * 9.81, 0.2 * 9.81)
+    F_VS = 150.0
+    tau = np.empty(theta_deg.shape)
+    ref = ft.torque(np.deg2rad(theta_deg), *args, F_VS, 20.0, (120.2, 179.8))
+
+    ft.torque(grade, *args, F_VS, 20.0, (120.2, 179.8), out=tau, trabalho=ws)
+    np.testing.assert_allclose(tau, ref, rtol=1e-12, atol=1e-12)
+
+    tracemalloc.start()
+    resultado = ft.torque(grade, *args, F_VS, 20.0, (120.2, 179.8), out=tau, trabalho=ws)
+    pico = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert resultado is tau
+    assert pico < tau.nbytes / 4  # nenhum array do tamanho da malha
+
+
+def test_theta_escalar_devolve_escalar():
+    r, L, h = 84.01, 210.0, 347.46
+    valores = [cin.espaco(0.3, r, L, h), cin.y_solo_mm(0.3, r, L, h, 591.47),
+               cin.velocidade(0.3, 20.0, r, L), cin.aceleracao(0.3, 20.0, r, L),
+               cin.jerk(0.3, 20.0, 0.0, r, L),
+               ft.torque(0.3, r / 1000, L / 1000, h / 1000, 1.0, 0.5, 9.81, 4.9, 10.0, 20.0),
+               *ft.forcas_FB_FM(0.3, r / 1000, L / 1000, h / 1000, 1.0, 0.5, 9.81, 4.9, 10.0, 20.0)]
+    assert all(isinstance(v, np.float64) for v in valores)
+    assert isinstance(cin.espaco(np.array([0.3]), r, L, h), np.ndarray)
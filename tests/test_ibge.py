@@ -0,0 +1,50 @@
+"""
+Testes das tabelas e rankings do IBGE (data.ibge_loader).
+"""
+
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from data import ibge_loader
+
+
+def test_ranking_igual_a_ordenacao_completa():
+    t2 = ibge_loader.processar_tabela_estados()
+    for coluna in ibge_loader.CULTURAS:
+        top = ibge_loader.obter_top_estados(coluna, 10)
+        esperado = t2[coluna].sort_values(ascending=False).head(10)
+        assert top[coluna].tolist() == esperado.tolist()
+    total = ibge_loader.obter_top_estados_total(5)
+    assert total["Estado"].iloc[0] == "Mato Grosso"
+    assert total["Total"].is_monotonic_decreasing
+    with pytest.raises(ValueError):
+        ibge_loader.obter_top_estados("Trigo")
+
+
+def test_tabela_em_cache_nao_e_alterada_pelo_chamador():
+    t2 = ibge_loader.processar_tabela_estados()
+    original = t2.loc[0, "Soja"]
+    t2.loc[0, "Soja"] = -1
+    t2["nova"] = 0
+    nova = ibge_loader.processar_tabela_estados()
+    assert nova.loc[0, "Soja"] == original and "nova" not in nova.columns
+
+    # Cópias de verdade (sem depender do Copy-on-Write do pandas 3)
+    for copia, cache in ((ibge_loader.processar_tabela_estados(), ibge_loader._tabela_estados()),
+                         (ibge_loader.processar_tabela_sintese(), ibge_loader._tabela_sintese()),
+                         (ibge_loader.obter_top_estados("Soja", 5), ibge_loader._ranking("Soja"))):
+        coluna = copia.columns[-1]
+        assert not np.shares_memory(copia[coluna].to_numpy(), cache[coluna].to_numpy())
+
+
+def test_normalizacao_vetorizada():
+    nomes = pd.Series([" São Paulo", "Espírito Santo", "Goiás ", "Piauí"])
+    assert ibge_loader.normalizar_uf(nomes).tolist() == [
+        "SAO PAULO", "ESPIRITO SANTO", "GOIAS", "PIAUI"]
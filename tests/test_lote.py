@@ -0,0 +1,79 @@
+"""
+Testes da execução de manifestos em lote (pipeline.lote).
+"""
+
+import sys
+import os
+import json
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.sessao import SessaoAnalise
+from pipeline import lote
+
+
+def _manifesto(n_repeticoes):
+    jobs = []
+    for i in range(n_repeticoes):
+        for r in (80.0, 84.01):
+            jobs.append({'id': f'g{r}-{i}', 'geometria': {'r_mm': r},
+                         'culturas': ['soja', 'milho']})
+    jobs.append({'id': 'invalido', 'cultura': 'trigo'})
+    jobs.append({'id': 'cin', 'analise': 'kinematics', 'cultura': 'milho'})
+    return {'padrao': {'fvs': {'tipo': 'variavel'}}, 'jobs': jobs}
+
+
+def test_intermediarios_compartilhados_entre_jobs():
+    sessao = SessaoAnalise()
+    relatorio = lote.executar_manifesto(_manifesto(10), max_workers=4, sessao_base=sessao)
+
+    est = relatorio['estatisticas']
+    assert est['total'] == 42
+    assert est['erro'] == 1
+    # 2 geometrias x (F_VS + y solo + bases de torque) + cinemática (bases, θ solo);
+    # o y solo da cinemática é o mesmo usado pelo F_VS; + 1 ThetaGrid da malha
+    assert est['intermediarios_calculados'] == 9
+
+
+def test_falha_isolada_e_resultados_corretos():
+    relatorio = lote.executar_manifesto(_manifesto(1), max_workers=2)
+    por_id = {j['id']: j for j in relatorio['jobs']}
+
+    assert por_id['invalido']['status'] == 'erro'
+    assert 'trigo' in por_id['invalido']['erro']
+
+    esperado = SessaoAnalise().com_parametros(r_mm=80.0)
+    omega_soja = por_id['g80.0-0-soja']['resumo']['omega_rad_s']
+    tau = esperado.torque(omega_soja, {'tipo': 'variavel'})['estatisticas']['tau_max_abs']
+    assert por_id['g80.0-0-soja']['resumo']['tau_max_abs'] == pytest.approx(tau)
+    assert por_id['cin']['status'] == 'ok'
+
+
+def test_manifesto_json(tmp_path):
+    caminho = tmp_path / 'manifesto.json'
+    caminho.write_text(json.dumps({'jobs': [{'omega': {'politica': 'fixo', 'valor': 20}}]}))
+    relatorio = lote.executar_arquivo(str(caminho), saida=str(tmp_path / 'rel.json'))
+    assert relatorio['jobs'][0]['resumo']['tau_max_abs'] == pytest.approx(12.0015, abs=1e-4)
+    assert json.loads((tmp_path / 'rel.json').read_text())['estatisticas']['ok'] == 1
+
+
+def test_ids_repetidos_unicos():
+    for ids, esperado in ((['a', 'a', 'a-1'], ['a', 'a-1', 'a-1-1']),
+                          (['a', 'a-1', 'a', 'a'], ['a', 'a-1', 'a-2', 'a-3'])):
+        jobs = lote.expandir_jobs({'jobs': [{'id': i} for i in ids]})
+        assert [j['id'] for j in jobs] == esperado
+
+
+def test_kinematics_respeita_omega_do_job():
+    from utils.config_loader import carregar_catalogo_culturas
+    milho = carregar_catalogo_culturas()['milho']
+    jobs = [{'id': 'fixo', 'analise': 'kinematics', 'cultura': 'milho',
+             'omega': {'politica': 'fixo', 'valor': 7.5}},
+            {'id': 'vt', 'analise': 'kinematics', 'cultura': 'milho',
+             'omega': {'politica': 'cultura', 'vt_kmh': 4.0}}]
+    por_id = {j['id']: j for j in lote.executar_manifesto({'jobs': jobs})['jobs']}
+    assert por_id['fixo']['resumo']['omega_rad_s'] == 7.5
+    assert por_id['vt']['resumo']['omega_rad_s'] == pytest.approx(milho.omega(4.0))
+    assert milho.omega(4.0) != pytest.approx(milho.omega())
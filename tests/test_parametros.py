@@ -0,0 +1,68 @@
+"""
+Testes dos parâmetros tipados (Cultura e ParametrosMecanismo).
+"""
+
+import sys
+import os
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import cinematica as cin
+from core.parametros import (
+    Cultura, ParametrosMecanismo, catalogo_para_array, array_para_catalogo,
+    mecanismos_para_array
+)
+from utils import config_loader
+
+
+def test_catalogo_equivale_ao_yaml():
+    culturas_yaml = config_loader.carregar_culturas()
+    catalogo = config_loader.carregar_catalogo_culturas()
+
+    assert set(catalogo) == set(culturas_yaml)
+    for nome, dados in culturas_yaml.items():
+        dens = dados['plant_density_per_hectare']
+        germ = dados['germination_rate']
+        N = cin.sementes_por_metro(dens['min'], dens['max'], germ['min'], germ['max'])
+        assert catalogo[nome].sementes_por_metro == pytest.approx(N)
+        assert catalogo[nome].espacamentos_m == tuple(dados['row_spacing_m'])
+
+
+def test_objetos_imutaveis_e_hasheaveis():
+    p = ParametrosMecanismo()
+    with pytest.raises(AttributeError):
+        p.r_mm = 10.0
+    assert hash(p) == hash(ParametrosMecanismo())
+    assert not hasattr(p, '__dict__')
+
+    soja = config_loader.carregar_catalogo_culturas()['soja']
+    assert {soja: 1}[soja] == 1
+
+
+def test_validacao_no_carregamento():
+    with pytest.raises(ValueError):
+        ParametrosMecanismo(r_mm=300.0, L_mm=210.0)
+    with pytest.raises(ValueError):
+        Cultura.de_dict('x', {'plant_density_per_hectare': {'min': 1}})
+
+
+def test_arrays_estruturados_ida_e_volta():
+    catalogo = config_loader.carregar_catalogo_culturas()
+    arr = catalogo_para_array(catalogo)
+
+    assert arr.flags['C_CONTIGUOUS']
+    assert len(arr) == len(catalogo)
+    assert array_para_catalogo(arr) == catalogo
+
+    # Nomes longos não podem ser truncados (mudariam a chave do catálogo)
+    longa = replace(catalogo['soja'], nome='soja_precoce_safrinha_irrigada')
+    assert list(array_para_catalogo(catalogo_para_array([longa]))) == [longa.nome]
+    with pytest.raises(ValueError):
+        catalogo_para_array([replace(longa, nome='x' * 33)])
+
+    mec = mecanismos_para_array([ParametrosMecanismo(), ParametrosMecanismo(r_mm=80.0)])
+    np.testing.assert_allclose(mec['r_mm'], [84.01, 80.0])
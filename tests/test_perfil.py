@@ -0,0 +1,44 @@
+"""
+Testes da instrumentação por etapa (utils.perfil).
+"""
+
+import sys
+import os
+import json
+
+import numpy as np
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from core.sessao import SessaoAnalise
+from pipeline import cli
+from utils.perfil import Perfilador, etapa, perfilador_ativo
+
+
+def test_etapas_aninhadas_e_memoria():
+    with Perfilador() as perfil:
+        with etapa('externa'):
+            with etapa('interna'):
+                bloco = np.ones(1_000_000)
+            del bloco
+    resumo = perfil.relatorio()['resumo']
+    assert set(resumo) == {'externa', 'externa/interna'}
+    assert resumo['externa/interna']['pico_memoria_bytes'] >= 8_000_000
+    assert resumo['externa']['pico_memoria_bytes'] >= resumo['externa/interna']['pico_memoria_bytes']
+    assert perfilador_ativo() is None
+
+
+def test_sessao_instrumentada():
+    with Perfilador(memoria=False) as perfil:
+        SessaoAnalise().torque(20.0, {'tipo': 'variavel'})
+    assert {'torque', 'torque/F_VS', 'torque/bases_torque'} <= set(perfil.relatorio()['resumo'])
+
+
+def test_cli_profile(tmp_path):
+    relatorio = tmp_path / 'perfil.json'
+    assert cli.main(['torque', '--resumo', '--saida', str(tmp_path / 's.json'),
+                     '--profile', str(relatorio)]) == 0
+    dados = json.loads(relatorio.read_text(encoding='utf-8'))
+    assert 'comando/torque' in dados['resumo']
+    assert dados['total']['parede_s'] > 0
@@ -0,0 +1,55 @@
+"""
+Testes dos resultados calculados sob demanda (core.resultado).
+"""
+
+import sys
+import os
+
+import numpy as np
+import pytest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from core import cinematica as cin
+from core import forcas_torque as ft
+
+
+THETA_DEG = np.linspace(0.0, 360.0, 361)
+GEOMETRIA_MM = (84.01, 210.0, 347.46, 591.47)
+
+
+def test_cinematica_calcula_so_o_que_e_lido():
+    res = cin.calcular_cinematica_completa(THETA_DEG, *GEOMETRIA_MM, omega=20.0,
+                                           alpha=3.0, beta=-40.0)
+    assert res.calculados() == ()
+    pos = res['posicao']
+    assert res.calculados() == ('posicao',)
+    assert res.posicao is pos and not pos.flags.writeable
+
+    theta_rad = np.deg2rad(THETA_DEG)
+    r, L = GEOMETRIA_MM[:2]
+    np.testing.assert_allclose(res['jerk'], cin.jerk(theta_rad, 20.0, 3.0, r, L, -40.0),
+                               rtol=1e-12, atol=1e-6)
+    np.testing.assert_allclose(res['aceleracao'], cin.aceleracao(theta_rad, 20.0, r, L, 3.0),
+                               rtol=1e-12, atol=1e-9)
+    assert set(res.calculados()) == {'posicao', 'jerk', 'aceleracao'}
+
+    assert list(res) == list(cin.ResultadoCinematica.CAMPOS)
+    assert 'velocidade' in res and 'torque' not in res
+    with pytest.raises(KeyError):
+        res['torque']
+
+
+def test_forcas_compartilham_as_bases():
+    F_VS, *_ = ft.construir_F_VS_variavel(THETA_DEG, *GEOMETRIA_MM)
+    args = (0.08401, 0.21, 0.34746, 0.5, 0.2, 9.81, F_VS, 20.0)
+    res = ft.calcular_forcas_completas(THETA_DEG, *args)
+    tau = res['torque']
+    assert set(res.calculados()) == {'F_B', 'F_M', 'torque'}
+
+    P = (0.5 * 9.81, 0.2 * 9.81)
+    theta_rad = np.deg2rad(THETA_DEG)
+    ref = ft.torque(theta_rad, *args[:5], *P, F_VS, 20.0)
+    np.testing.assert_allclose(tau, ref, rtol=1e-12, atol=1e-12)
+    assert dict(res)['theta_deg'] is res.theta_deg
@@ -0,0 +1,74 @@
+"""
+Testes da exportação colunar de resultados (data.resultados).
+"""
+
+import sys
+import os
+
+import numpy as np
+import pytest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from core.sessao import SessaoAnalise
+from data import resultados
+from pipeline import cli
+from utils.config_loader import carregar_catalogo_culturas
+
+
+@pytest.fixture(scope='module')
+def cinematica():
+    catalogo = carregar_catalogo_culturas()
+    return SessaoAnalise().cinematica({k: catalogo[k] for k in ('soja', 'milho')})
+
+
+@pytest.mark.parametrize('formato, nome', [('npy', 'cin'), ('npz', 'cin.npz')])
+def test_ida_e_volta_por_segmento(tmp_path, cinematica, formato, nome):
+    colunas, meta = resultados.tabela_cinematica(cinematica)
+    caminho = resultados.gravar_resultados(tmp_path / nome, colunas, meta, formato)
+
+    lido = resultados.ler_resultados(caminho, segmento='milho')
+    np.testing.assert_array_equal(lido['velocidade_mm_s'],
+                                  cinematica['velocidades']['milho']['velocidade'])
+    assert resultados.ler_metadados(caminho)['omegas_rad_s']['soja'] == cinematica['omegas']['soja']
+
+
+def test_recorte_theta_mapeado(tmp_path, cinematica):
+    caminho = resultados.gravar_resultados(tmp_path / 'cin', *resultados.tabela_cinematica(cinematica))
+    lido = resultados.ler_resultados(caminho, ['theta_deg', 'jerk_mm_s3'], segmento='soja',
+                                     theta_min=90, theta_max=180)
+    assert lido['theta_deg'][0] == 90 and lido['theta_deg'][-1] == 180
+    assert isinstance(lido['jerk_mm_s3'].base, np.memmap)
+
+    with pytest.raises(ValueError):
+        resultados.ler_resultados(caminho, theta_min=90)
+
+
+def test_npy_nao_apaga_diretorio_alheio(tmp_path, cinematica):
+    colunas, meta = resultados.tabela_cinematica(cinematica)
+    alheio = tmp_path / 'meus_dados'
+    alheio.mkdir()
+    (alheio / 'keep.txt').write_text('x')
+    with pytest.raises(ValueError):
+        resultados.gravar_resultados(alheio, colunas, meta)
+    assert (alheio / 'keep.txt').exists()
+
+    arquivo = tmp_path / 'arquivo'
+    arquivo.write_text('x')
+    with pytest.raises(ValueError):
+        resultados.gravar_resultados(arquivo, colunas, meta)
+
+    # Exportação anterior é substituída, sem sobras no diretório pai
+    destino = tmp_path / 'cin'
+    resultados.gravar_resultados(destino, colunas, meta)
+    resultados.gravar_resultados(destino, colunas, meta)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['arquivo', 'cin', 'meus_dados']
+
+
+def test_cli_exportar_torque(tmp_path):
+    destino = tmp_path / 'torque'
+    assert cli.main(['torque', '--omega', '20', '--resumo', '--saida', str(tmp_path / 's.json'),
+                     '--exportar', str(destino)]) == 0
+    lido = resultados.ler_resultados(destino, ['torque_Nm'])
+    assert np.max(np.abs(lido['torque_Nm'])) == pytest.approx(12.0015, abs=1e-4)
@@ -0,0 +1,95 @@
+"""
+Testes do servidor HTTP local (pipeline.servidor).
+"""
+
+import sys
+import os
+import io
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+import numpy as np
+import pytest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from core.sessao import SessaoAnalise
+from pipeline import servidor as srv
+
+
+@pytest.fixture(scope='module')
+def url():
+    servico = srv.ServicoAnalise(janela_s=0.02)
+    s = srv.criar_servidor(porta=0, servico=servico, silencioso=True)
+    threading.Thread(target=s.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{s.server_address[1]}'
+    s.shutdown()
+    s.server_close()
+    servico.fechar()
+
+
+def _json(url):
+    with urlopen(url) as r:
+        return json.loads(r.read())
+
+
+def test_torque_e_cache(url):
+    dados = _json(f'{url}/torque?omega=20')
+    assert dados['estatisticas']['tau_max_abs'] == pytest.approx(12.0015, abs=1e-4)
+    _json(f'{url}/torque?omega=20')
+    assert _json(f'{url}/saude')['cache_respostas']['acertos'] >= 1
+
+
+def test_micro_lote_agrupa_omegas(url):
+    with ThreadPoolExecutor(8) as pool:
+        respostas = list(pool.map(lambda w: _json(f'{url}/torque?omega={w}&r_mm=80'), range(10, 18)))
+    sessao = SessaoAnalise().com_parametros(r_mm=80)
+    for w, r in zip(range(10, 18), respostas):
+        esperado = sessao.torque(float(w), {'tipo': 'variavel'})['estatisticas']['tau_max_abs']
+        assert r['estatisticas']['tau_max_abs'] == pytest.approx(esperado, rel=1e-12)
+    saude = _json(f'{url}/saude')['micro_lote']
+    assert saude['lotes'] < saude['pedidos']
+
+
+def test_cinematica_npz_e_envelope(url):
+    with urlopen(f'{url}/cinematica?cultura=soja&passo=2&formato=npz') as r:
+        z = np.load(io.BytesIO(r.read()))
+        assert z['theta_deg'].shape == (181,)
+    env = _json(f'{url}/envelope?cultura=milho')
+    assert len(env['curvas']['tau_max_abs']) == len(env['curvas']['vt_kmh'])
+    assert np.all(np.diff(env['curvas']['v_max_abs_mm_s']) > 0)
+
+
+def test_erros(url):
+    with pytest.raises(HTTPError) as e:
+        urlopen(f'{url}/torque?omega=abc')
+    assert e.value.code == 400
+    with pytest.raises(HTTPError) as e:
+        urlopen(f'{url}/inexistente')
+    assert e.value.code == 404
+
+
+def test_cinematica_omega_e_vt(url):
+    from utils.config_loader import carregar_catalogo_culturas
+    soja = carregar_catalogo_culturas()['soja']
+    bases = SessaoAnalise().bases_cinematica()
+
+    dados = _json(f'{url}/cinematica?omega=10')
+    assert dados['omega_rad_s'] == 10.0
+    np.testing.assert_allclose(dados['curvas']['velocidade'], bases['v'] * 10.0)
+    assert _json(f'{url}/cinematica')['omega_rad_s'] == 20.0
+    assert _json(f'{url}/cinematica?cultura=soja&vt=2')['omega_rad_s'] == pytest.approx(soja.omega(2.0))
+
+
+def test_erro_interno_devolve_500(monkeypatch, url):
+    def falhar(self, params):
+        raise RuntimeError('falha')
+    monkeypatch.setattr(srv.ServicoAnalise, 'theta_solo', falhar)
+    with pytest.raises(HTTPError) as e:
+        urlopen(f'{url}/theta_solo?r_mm=81.5')
+    assert e.value.code == 500
+    assert 'RuntimeError' in json.loads(e.value.read())['erro']
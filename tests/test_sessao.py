@@ -0,0 +1,62 @@
+"""
+Testes da SessaoAnalise (parâmetros por sessão e uso concorrente).
+"""
+
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import cinematica as cin
+from core import forcas_torque as ft
+from core.parametros import ParametrosMecanismo
+from core.sessao import SessaoAnalise, THETA_TORQUE_DEG
+
+
+def _torque_direto(p, omega):
+    theta_rad = np.deg2rad(THETA_TORQUE_DEG)
+    F_VS, _, _, _ = ft.construir_F_VS_variavel(THETA_TORQUE_DEG, *p.geometria_mm)
+    return ft.torque(theta_rad, p.r_m, p.L_m, p.h_m, p.m_haste_kg, p.m_biela_kg,
+                     p.P_haste, p.P_biela, F_VS, omega)
+
+
+def test_torque_igual_ao_calculo_direto():
+    sessao = SessaoAnalise()
+    res = sessao.torque(20.0, {'tipo': 'variavel'})
+    np.testing.assert_allclose(res['torque'], _torque_direto(sessao.parametros, 20.0))
+    assert res['estatisticas']['tau_max_abs'] == pytest.approx(np.max(np.abs(res['torque'])))
+
+
+def test_com_parametros_nao_altera_sessao_original():
+    base = SessaoAnalise()
+    outra = base.com_parametros(r_mm=80.0)
+    assert base.parametros.r_mm == 84.01
+    assert outra.parametros.r_mm == 80.0
+    assert base.theta_solo()['descida'] != outra.theta_solo()['descida']
+
+
+def test_cache_somente_leitura():
+    sessao = SessaoAnalise()
+    y = sessao.posicao_solo()
+    assert sessao.posicao_solo() is y
+    with pytest.raises(ValueError):
+        y[0] = 0.0
+
+
+def test_geometrias_diferentes_em_paralelo():
+    base = SessaoAnalise()
+    geometrias = [ParametrosMecanismo(r_mm=r) for r in np.linspace(78.0, 90.0, 8)]
+
+    def rodar(p):
+        sessao = base.com_parametros(r_mm=p.r_mm)
+        return sessao.torque(25.0, {'tipo': 'variavel'})['torque']
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        resultados = list(pool.map(rodar, geometrias * 3))
+
+    for p, tau in zip(geometrias * 3, resultados):
+        np.testing.assert_allclose(tau, _torque_direto(p, 25.0))
@@ -0,0 +1,67 @@
+"""
+Testes da ingestão da PAM/SIDRA (data.sidra), com a amostra em tests/dados.
+"""
+
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from data import ibge_loader, sidra
+from pipeline import cli
+
+AMOSTRA = os.path.join(RAIZ, 'tests', 'dados', 'pam_amostra.csv')
+
+
+def test_leitura_em_blocos_tipos_e_marcadores():
+    inteiro = sidra.ler_pam(AMOSTRA)
+    em_blocos = sidra.ler_pam(AMOSTRA, tamanho_bloco=37)
+    pd.testing.assert_frame_equal(inteiro, em_blocos)
+
+    assert len(inteiro) == 480  # preâmbulo e rodapé descartados
+    assert inteiro['ano'].dtype == np.int16 and inteiro['cod_uf'].dtype == np.int8
+    assert isinstance(inteiro['cultura'].dtype, pd.CategoricalDtype)
+
+    # '-' é zero absoluto; '...' é dado não disponível
+    sp = inteiro[(inteiro['cod_municipio'] == 3550308) & (inteiro['cultura'] == 'Soja (em grão)')]
+    assert (sp['valor'] == 0).all()
+    teresina = inteiro[(inteiro['cod_municipio'] == 2211001) & (inteiro['ano'] == 2022)
+                       & (inteiro['cultura'] == 'Algodão herbáceo (em caroço)')]
+    assert teresina['valor'].isna().all()
+
+    filtrado = sidra.ler_pam(AMOSTRA, anos=[2023], culturas=['Soja'], tamanho_bloco=50)
+    assert set(filtrado['ano']) == {2023} and set(filtrado['cultura']) == {'Soja (em grão)'}
+
+
+def test_tabelas_no_formato_do_ibge_loader():
+    pam = sidra.ler_pam(AMOSTRA)
+    estados = sidra.tabela_estados_pam(pam, 2023)
+    embutida = ibge_loader.processar_tabela_estados()
+    assert len(estados) == 27
+    assert list(estados.columns[:1]) == ['Estado'] and list(estados.columns[-2:]) == ['uf_norm', 'Total']
+    assert set(estados['uf_norm']) == set(embutida['uf_norm'])
+
+    sel = pam[(pam['ano'] == 2023) & (pam['variavel'] == sidra.AREA_PLANTADA)
+              & (pam['cod_uf'] == 51) & (pam['cultura'] == 'Soja (em grão)')]
+    mt = estados.set_index('Estado').loc['Mato Grosso']
+    assert mt['Soja'] == round(sel['valor'].sum())
+    assert mt['Total'] == mt[['Soja', 'Milho', 'Algodão', 'Feijão']].sum()
+
+    sintese = sidra.tabela_sintese_pam(pam)
+    assert list(sintese.columns) == list(ibge_loader.processar_tabela_sintese().columns)
+    assert sintese['Produtos'].tolist() == ['Soja', 'Milho', 'Algodão', 'Feijão']
+
+
+def test_cli_ibge_com_pam(tmp_path):
+    saida = tmp_path / 'top.json'
+    assert cli.main(['ibge', '--pam', AMOSTRA, '--tabela', 'top', '--cultura', 'Soja',
+                     '-n', '3', '--saida', str(saida)]) == 0
+    import json
+    registros = json.loads(saida.read_text(encoding='utf-8'))['registros']
+    assert len(registros) == 3
+    assert registros[0]['Soja'] >= registros[1]['Soja'] >= registros[2]['Soja']
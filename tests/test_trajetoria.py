@@ -0,0 +1,93 @@
+"""
+Testes da trajetória da haste no solo e do rasgo da cova (core.trajetoria).
+"""
+
+import sys
+import os
+
+import numpy as np
+import pytest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from core import trajetoria
+from core.cinematica import encontrar_theta_solo, y_solo_mm
+from core.parametros import ParametrosMecanismo, mecanismos_para_array
+from utils.config_loader import carregar_catalogo_culturas
+
+
+def test_theta_solo_igual_ao_fsolve():
+    r = np.array([70.0, 84.01, 95.0])
+    L = np.array([[200.0], [230.0]])
+    descida, subida = trajetoria.theta_solo(r, L, 347.46, 591.47)
+    assert descida.shape == (2, 3)
+    for i, Li in enumerate(L[:, 0]):
+        for j, rj in enumerate(r):
+            ref = encontrar_theta_solo(rj, Li, 347.46, 591.47)
+            assert descida[i, j] == pytest.approx(ref['descida'], abs=1e-6)
+            assert subida[i, j] == pytest.approx(ref['subida'], abs=1e-6)
+    # Centro alto demais: a haste não chega ao solo
+    assert np.isnan(trajetoria.theta_solo(84.01, 210.0, 347.46, 700.0)[0])
+
+
+def test_theta_solo_escalar_e_sempre_enterrada():
+    descida, subida = trajetoria.theta_solo(84.01, 210.0, 347.46, 591.47)
+    assert type(descida) is type(subida) is np.float64
+    # Centro baixo demais: a haste nunca sai do solo, a volta inteira conta
+    descida, subida = trajetoria.theta_solo(84.01, 210.0, 347.46, 400.0)
+    assert (descida, subida) == (0.0, 360.0)
+    assert trajetoria.profundidade_maxima(84.01, 210.0, 347.46, 400.0) > 0
+    m = trajetoria.rasgo(84.01, 210.0, 347.46, 400.0, vt_kmh=6.0, omega=30.0)
+    assert m['tempo_solo_s'] == pytest.approx(2 * np.pi / 30.0)
+
+
+def test_rasgo_e_trajetoria():
+    p = ParametrosMecanismo()
+    geo = (p.r_mm, p.L_mm, p.h_mm, p.altura_centro_mm)
+    m = trajetoria.rasgo(*geo, vt_kmh=6.0, omega=30.0)
+    tempo = np.deg2rad(m['theta_subida'] - m['theta_descida']) / 30.0
+    assert m['arrasto_mm'] == pytest.approx(6.0 / 3.6 * 1000 * tempo)
+    assert m['alongamento'] == pytest.approx(1 + m['arrasto_mm'] / trajetoria.LARGURA_PONTA_PADRAO_MM)
+
+    x, y = trajetoria.trajetoria_solo(*geo, vt_kmh=np.array([4.0, 8.0]), omega=30.0, n_pontos=41)
+    assert x.shape == y.shape == (2, 41)
+    np.testing.assert_allclose(x[:, -1], [trajetoria.rasgo(*geo, v, 30.0)['arrasto_mm']
+                                          for v in (4.0, 8.0)])
+    np.testing.assert_allclose(y[:, [0, -1]], 0.0, atol=1e-9)
+    assert y.min() == pytest.approx(-trajetoria.profundidade_maxima(*geo))
+    theta = np.deg2rad(np.linspace(m['theta_descida'], m['theta_subida'], 41))
+    np.testing.assert_allclose(y[0], y_solo_mm(theta, *geo))
+
+
+def test_analisar_rasgos():
+    catalogo = carregar_catalogo_culturas()
+    geometrias = [ParametrosMecanismo(r_mm=r, L_mm=L) for r in (70.0, 84.01) for L in (200.0, 220.0)]
+    resultado = trajetoria.analisar_rasgos(geometrias, catalogo, n_pontos=10)
+    G, C, V = resultado.arrasto_mm.shape
+    assert (G, C) == (4, len(catalogo))
+    assert resultado.x_mm.shape == (G, C, V, 10)
+
+    tabela = resultado.tabela()
+    n = len(tabela['r_mm'])
+    assert n == G * np.count_nonzero(~np.isnan(resultado.velocidades_kmh))
+    assert all(len(v) == n for v in tabela.values())
+    assert len(resultado.trajetorias()['x_mm']) == 10 * n
+
+    # Com ω ligado à velocidade (uma cova por volta), o arrasto não depende da velocidade
+    uma = trajetoria.analisar_rasgos(mecanismos_para_array(geometrias[:1]),
+                                     {'soja': catalogo['soja']}, [4.0, 8.0])
+    assert uma.arrasto_mm[0, 0, 0] == pytest.approx(uma.arrasto_mm[0, 0, 1])
+    with pytest.raises(ValueError):
+        trajetoria.analisar_rasgos(geometrias, catalogo, largura_ponta_mm=0)
+
+
+def test_cli_rasgo(tmp_path):
+    from pipeline import cli
+
+    saida = tmp_path / 'rasgo.csv'
+    assert cli.main(['rasgo', '--r', '80', '84.01', '--culturas', 'milho', '--vt', '6',
+                     '--formato', 'csv', '--saida', str(saida)]) == 0
+    linhas = saida.read_text(encoding='utf-8').splitlines()
+    assert linhas[0].startswith('r_mm,L_mm,h_mm,altura_centro_mm,cultura')
+    assert len(linhas) == 3
@@ -0,0 +1,39 @@
+"""
+Testes da validação numérica (core.validacao).
+"""
+
+import sys
+import os
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from core import validacao
+
+
+def test_derivadas_consistentes_com_espaco():
+    # Com alpha e beta não nulos: valida também os termos de aceleração angular
+    erros = validacao.verificar_derivadas(alpha=3.0, beta=-40.0)
+    assert erros['v'] < 1e-7 and erros['a'] < 1e-7 and erros['j'] < 1e-5
+
+
+def test_modos_concordam_com_referencia():
+    relatorio = validacao.avaliar_modos(geometrias=validacao.geometrias_amostra(2),
+                                        n_pontos=181, n_vazao=1000, tempo_min_s=0.01,
+                                        precisao='longdouble')
+    for nome, dados in relatorio['modos'].items():
+        for grandeza, erro in dados['erros'].items():
+            assert erro['max_rel'] < 1e-12, (nome, grandeza, erro)
+    assert validacao.escolher_modo(relatorio, 1e-12, ('v', 'a', 'j', 'tau')) in ('direto', 'bases', 'trabalho')
+
+
+def test_modo_trabalho_sem_estado_global():
+    import numpy as np
+    from core.parametros import ParametrosMecanismo
+
+    theta, p = np.linspace(0.0, 2 * np.pi, 91), ParametrosMecanismo()
+    modo = validacao.MODOS['trabalho']
+    a = modo(theta, p, 20.0, {})
+    b = modo(theta, p, 30.0, {})
+    assert a['v'] is not b['v']
+    np.testing.assert_allclose(b['v'], a['v'] * 1.5)
@@ -2,20 +2,37 @@
 Módulo de Utilitários.
 
 Funções auxiliares para carregamento de configurações e outras utilidades.
+
+As funções de configuração (que dependem de yaml e numpy) são
+importadas sob demanda.
 """
 
-from .config_loader import (
-    carregar_config,
-    carregar_culturas,
-    extrair_faixas_cultura,
-    velocidade_maxima_cultura,
-    normalizar_nome
-)
+from .importacao import exportacao_tardia
+
+_EXPORTACOES = {
+    'carregar_config': '.config_loader',
+    'carregar_culturas': '.config_loader',
+    'carregar_catalogo_culturas': '.config_loader',
+    'carregar_parametros_mecanismo': '.config_loader',
+    'extrair_faixas_cultura': '.config_loader',
+    'velocidade_maxima_cultura': '.config_loader',
+    'normalizar_nome': '.config_loader',
+    'CacheLRU': '.cache',
+    'Perfilador': '.perfil',
+    'etapa': '.perfil',
+}
+
+__getattr__ = exportacao_tardia(__name__, _EXPORTACOES)
 
 __all__ = [
     'carregar_config',
     'carregar_culturas',
+    'carregar_catalogo_culturas',
+    'carregar_parametros_mecanismo',
     'extrair_faixas_cultura',
     'velocidade_maxima_cultura',
     'normalizar_nome',
+    'CacheLRU',
+    'Perfilador',
+    'etapa',
 ]
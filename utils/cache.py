@@ -0,0 +1,163 @@
+"""
+Utilitário de Cache em Memória.
+
+CacheLRU guarda resultados intermediários (ângulos de contato, posições,
+bases normalizadas, modelos F_VS) com tamanho limitado e estatísticas de
+acertos e falhas. As chaves são geradas por chave_geometria(), que resume
+a geometria e a malha de ângulos em um hash estável.
+"""
+
+import hashlib
+import struct
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Hashable
+
+import numpy as np
+
+
+def somente_leitura(valor):
+    """Marca arrays (inclusive dentro de dicts e tuplas) como somente leitura."""
+    if isinstance(valor, np.ndarray):
+        valor.flags.writeable = False
+    elif isinstance(valor, dict):
+        for v in valor.values():
+            somente_leitura(v)
+    elif isinstance(valor, tuple):
+        for v in valor:
+            somente_leitura(v)
+    return valor
+
+
+# id(malha) -> descritor, só para malhas somente leitura donas dos dados
+_DESCRITORES = {}
+
+
+def malha_fixa(theta_deg) -> np.ndarray:
+    """Cópia somente leitura de uma malha; o descritor dela é calculado uma vez só."""
+    arr = np.array(theta_deg, dtype=float)
+    arr.flags.writeable = False
+    return arr
+
+
+def descritor_grade(theta_deg: np.ndarray) -> tuple:
+    """
+    Descritor hasheável de uma malha de ângulos.
+
+    Malhas somente leitura que não são views (ver malha_fixa) são tratadas
+    como imutáveis: o descritor fica guardado enquanto o array existir, e
+    consultas repetidas ao cache não percorrem a malha de novo.
+
+    Retorna:
+        (tamanho, primeiro, último, resumo blake2b dos valores)
+    """
+    fixa = (isinstance(theta_deg, np.ndarray) and theta_deg.base is None
+            and not theta_deg.flags.writeable)
+    if fixa:
+        descritor = _DESCRITORES.get(id(theta_deg))
+        if descritor is not None:
+            return descritor
+
+    arr = np.ascontiguousarray(theta_deg, dtype=float)
+    if arr.ndim != 1 or arr.size == 0:
+        raise ValueError(f"A malha de ângulos deve ser 1-D e não vazia (forma {arr.shape}).")
+    resumo = hashlib.blake2b(arr.tobytes(), digest_size=16).hexdigest()
+    descritor = (len(arr), float(arr[0]), float(arr[-1]), resumo)
+    if fixa:
+        _DESCRITORES[id(theta_deg)] = descritor
+        weakref.finalize(theta_deg, _DESCRITORES.pop, id(theta_deg), None)
+    return descritor
+
+
+def chave_geometria(nome: str, *valores: float, theta_deg: np.ndarray = None) -> tuple:
+    """
+    Chave de cache para um resultado que depende de uma geometria.
+
+    Parâmetros:
+        nome      : tipo do resultado (ex: 'theta_solo')
+        valores   : números que definem o resultado (ex: r, L, h, altura_centro)
+        theta_deg : malha de ângulos (graus), se o resultado depender dela
+
+    Retorna:
+        (nome, hash hexadecimal)
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(struct.pack(f'<{len(valores)}d', *valores))
+    if theta_deg is not None:
+        h.update(repr(descritor_grade(theta_deg)).encode())
+    return (nome, h.hexdigest())
+
+
+class CacheLRU:
+    """
+    Cache LRU thread-safe com cálculo único por chave.
+
+    Parâmetros:
+        tamanho_max : número máximo de resultados guardados
+
+    Cada chave é calculada uma única vez mesmo sob concorrência: a primeira
+    thread calcula (fora do lock) e as demais aguardam o mesmo Future. Em
+    caso de erro a chave é removida. Os arrays guardados ficam somente
+    leitura, pois são compartilhados entre os chamadores.
+    """
+
+    def __init__(self, tamanho_max: int = 512):
+        if tamanho_max < 1:
+            raise ValueError(f"tamanho_max deve ser >= 1 (recebido {tamanho_max}).")
+        self.tamanho_max = tamanho_max
+        self._itens = OrderedDict()
+        self._lock = threading.Lock()
+        self.acertos = 0
+        self.falhas = 0
+        self.remocoes = 0
+
+    def obter_ou_calcular(self, chave: Hashable, calcular: Callable):
+        """Devolve o valor de `chave`, calculando-o com `calcular()` se preciso."""
+        with self._lock:
+            futuro = self._itens.get(chave)
+            dono = futuro is None
+            if dono:
+                self.falhas += 1
+                futuro = self._itens[chave] = Future()
+                while len(self._itens) > self.tamanho_max:
+                    self._itens.popitem(last=False)
+                    self.remocoes += 1
+            else:
+                self.acertos += 1
+                self._itens.move_to_end(chave)
+        if dono:
+            try:
+                futuro.set_result(somente_leitura(calcular()))
+            except BaseException as e:
+                with self._lock:
+                    if self._itens.get(chave) is futuro:
+                        del self._itens[chave]
+                futuro.set_exception(e)
+        return futuro.result()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._itens)
+
+    def __contains__(self, chave) -> bool:
+        with self._lock:
+            return chave in self._itens
+
+    def limpar(self):
+        with self._lock:
+            self._itens.clear()
+
+    def estatisticas(self) -> dict:
+        """Itens, acertos, falhas (cálculos), remoções e taxa de acerto."""
+        with self._lock:
+            total = self.acertos + self.falhas
+            return {
+                'itens': len(self._itens),
+                'tamanho_max': self.tamanho_max,
+                'acertos': self.acertos,
+                'falhas': self.falhas,
+                'remocoes': self.remocoes,
+                'taxa_acerto': self.acertos / total if total else 0.0,
+            }
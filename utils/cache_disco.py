@@ -0,0 +1,296 @@
+"""
+Utilitário de Cache em Disco Endereçado por Conteúdo.
+
+Guarda resultados completos de análises (curvas de torque, linhas de
+varredura, tabelas de espaçamento) entre execuções. A chave de cada
+entrada é o SHA-256 de:
+
+    - tipo da análise e parâmetros de entrada (JSON canônico);
+    - impressão digital do código: conteúdo de core/*.py (fórmulas),
+      pipeline/cli.py (montagem dos resultados dos subcomandos) e
+      utils/config_loader.py (leitura das configurações).
+
+Assim, qualquer mudança nos parâmetros ou nas fórmulas gera uma chave
+nova e o resultado antigo simplesmente deixa de ser usado (e acaba
+removido pela política de tamanho).
+
+Cada entrada é um arquivo .npz (sem pickle): os arrays vão como membros
+do arquivo e a estrutura (dicts, listas, escalares) como JSON. A escrita
+é atômica (arquivo temporário + os.replace), então vários processos podem
+usar o mesmo diretório ao mesmo tempo.
+
+O tamanho ocupado é lido do disco uma vez, ao abrir o cache, e depois
+mantido em memória a cada gravação; o diretório só é percorrido de novo
+quando o limite é ultrapassado (o total de outros processos entra nessa
+nova leitura).
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import zipfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+
+RAIZ_PROJETO = Path(__file__).resolve().parent.parent
+DIRETORIO_PADRAO = RAIZ_PROJETO / 'output' / 'cache'
+
+
+# ========================================================================
+# CHAVES
+# ========================================================================
+
+# Código que determina os valores guardados (padrões relativos à raiz do projeto)
+ARQUIVOS_CODIGO = ('core/*.py', 'pipeline/cli.py', 'utils/config_loader.py')
+
+
+@lru_cache(maxsize=None)
+def impressao_codigo(padroes: tuple = ARQUIVOS_CODIGO) -> str:
+    """
+    SHA-256 do conteúdo dos arquivos de `padroes` (calculado uma vez por processo).
+    """
+    h = hashlib.sha256()
+    for padrao in padroes:
+        for arquivo in sorted(RAIZ_PROJETO.glob(padrao)):
+            h.update(arquivo.relative_to(RAIZ_PROJETO).as_posix().encode())
+            h.update(arquivo.read_bytes())
+    return h.hexdigest()
+
+
+def impressao_arquivo(caminho) -> str:
+    """SHA-256 do conteúdo de um arquivo (ex: config.yaml usado na análise)."""
+    return hashlib.sha256(Path(caminho).read_bytes()).hexdigest()
+
+
+def _canonico(obj):
+    if isinstance(obj, dict):
+        return {str(k): _canonico(v) for k, v in sorted(obj.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(obj, (list, tuple)):
+        return [_canonico(v) for v in obj]
+    if isinstance(obj, np.ndarray):
+        return {'__array__': hashlib.sha256(np.ascontiguousarray(obj).tobytes()).hexdigest(),
+                'dtype': str(obj.dtype), 'forma': list(obj.shape)}
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, float):
+        return repr(obj)  # preserva todos os dígitos
+    return obj
+
+
+def chave_conteudo(tipo: str, parametros: dict) -> str:
+    """Chave hexadecimal de uma análise (parâmetros + versão do código)."""
+    texto = json.dumps({'tipo': tipo, 'parametros': _canonico(parametros),
+                        'codigo': impressao_codigo()}, sort_keys=True)
+    return hashlib.sha256(texto.encode()).hexdigest()
+
+
+# ========================================================================
+# SERIALIZAÇÃO (npz sem pickle)
+# ========================================================================
+
+def _separar_arrays(obj, arrays: dict):
+    if isinstance(obj, np.ndarray):
+        nome = f'a{len(arrays)}'
+        arrays[nome] = obj
+        return {'__array__': nome}
+    if isinstance(obj, dict):
+        return {'__dict__': [[_separar_arrays(k, arrays), _separar_arrays(v, arrays)]
+                             for k, v in obj.items()]}
+    if isinstance(obj, tuple):
+        return {'__tuple__': [_separar_arrays(v, arrays) for v in obj]}
+    if isinstance(obj, list):
+        return [_separar_arrays(v, arrays) for v in obj]
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+    raise TypeError(f'Tipo não suportado no cache em disco: {type(obj).__name__}')
+
+
+def _juntar_arrays(obj, arrays):
+    if isinstance(obj, list):
+        return [_juntar_arrays(v, arrays) for v in obj]
+    if isinstance(obj, dict):
+        if '__array__' in obj:
+            return arrays[obj['__array__']]
+        if '__tuple__' in obj:
+            return tuple(_juntar_arrays(v, arrays) for v in obj['__tuple__'])
+        return {_juntar_arrays(k, arrays): _juntar_arrays(v, arrays) for k, v in obj['__dict__']}
+    return obj
+
+
+# ========================================================================
+# CACHE
+# ========================================================================
+
+def _tamanho(caminho: Path) -> int:
+    """Tamanho do arquivo em bytes (0 se não existir)."""
+    try:
+        return caminho.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+class CacheDisco:
+    """
+    Cache persistente de resultados de análises.
+
+    Parâmetros:
+        diretorio         : diretório das entradas (criado se não existir)
+        tamanho_max_bytes : limite do diretório; ao ser ultrapassado, as
+                            entradas usadas há mais tempo são removidas
+                            até sobrar 90% do limite
+    """
+
+    SUFIXO = '.npz'
+    # Só o que _caminho() grava: <2 hex>/<sha256>.npz com o mesmo prefixo
+    _SUBDIRETORIO = re.compile(r'[0-9a-f]{2}')
+    _ENTRADA = re.compile(r'[0-9a-f]{64}\.npz')
+
+    def __init__(self, diretorio=DIRETORIO_PADRAO, tamanho_max_bytes: int = 512 * 2**20):
+        self.diretorio = Path(diretorio)
+        self.diretorio.mkdir(parents=True, exist_ok=True)
+        self.tamanho_max_bytes = tamanho_max_bytes
+        self.acertos = 0
+        self.falhas = 0
+        self._lock = threading.Lock()
+        self._total = sum(tamanho for _, tamanho, _ in self._entradas())
+
+    def _caminho(self, chave: str) -> Path:
+        return self.diretorio / chave[:2] / (chave + self.SUFIXO)
+
+    # --------------------------------------------------------------------
+    # Leitura e escrita
+    # --------------------------------------------------------------------
+
+    def ler(self, chave: str):
+        """Valor guardado em `chave`, ou None se não houver (ou estiver corrompido)."""
+        caminho = self._caminho(chave)
+        try:
+            with np.load(caminho, allow_pickle=False) as z:
+                estrutura = json.loads(str(z['__estrutura__']))
+                arrays = {k: z[k] for k in z.files if k != '__estrutura__'}
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile, json.JSONDecodeError):
+            # Entrada truncada ou de formato antigo: descarta
+            self._remover(caminho)
+            return None
+        try:
+            os.utime(caminho)  # marca o uso para a remoção por antiguidade
+        except OSError:
+            pass
+        return _juntar_arrays(estrutura, arrays)
+
+    def gravar(self, chave: str, valor):
+        """Grava `valor` (dicts, listas, tuplas, escalares e arrays) de forma atômica."""
+        arrays = {}
+        estrutura = _separar_arrays(valor, arrays)
+        destino = self._caminho(chave)
+        destino.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp = tempfile.mkstemp(prefix='.tmp_', suffix=self.SUFIXO, dir=destino.parent)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, __estrutura__=np.array(json.dumps(estrutura)), **arrays)
+                f.flush()
+                os.fsync(f.fileno())
+                tamanho = f.tell()
+            anterior = _tamanho(destino)
+            os.replace(tmp, destino)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        with self._lock:
+            self._total += tamanho - anterior
+            excedeu = self._total > self.tamanho_max_bytes
+        if excedeu:
+            self._aplicar_limite()
+
+    def obter_ou_calcular(self, tipo: str, parametros: dict, calcular: Callable):
+        """
+        Devolve o resultado guardado para (tipo, parametros) ou calcula e grava.
+
+        Parâmetros:
+            tipo       : nome da análise (ex: 'torque')
+            parametros : tudo que determina o resultado (serializável em JSON;
+                         arrays são resumidos por hash)
+            calcular   : função sem argumentos que produz o resultado
+        """
+        chave = chave_conteudo(tipo, parametros)
+        valor = self.ler(chave)
+        with self._lock:
+            if valor is not None:
+                self.acertos += 1
+            else:
+                self.falhas += 1
+        if valor is not None:
+            return valor
+        valor = calcular()
+        self.gravar(chave, valor)
+        return valor
+
+    # --------------------------------------------------------------------
+    # Manutenção
+    # --------------------------------------------------------------------
+
+    def _entradas(self):
+        """Entradas do cache (mtime, bytes, caminho); ignora qualquer outro arquivo."""
+        for sub in self.diretorio.iterdir():
+            if sub.is_dir() and self._SUBDIRETORIO.fullmatch(sub.name):
+                for arq in os.scandir(sub):
+                    if (self._ENTRADA.fullmatch(arq.name) and arq.name.startswith(sub.name)
+                            and arq.is_file(follow_symlinks=False)):
+                        try:
+                            st = arq.stat()
+                        except FileNotFoundError:
+                            continue  # removida por outro processo
+                        yield st.st_mtime, st.st_size, Path(arq.path)
+
+    def _remover(self, caminho: Path):
+        tamanho = _tamanho(caminho)
+        caminho.unlink(missing_ok=True)
+        with self._lock:
+            self._total -= tamanho
+
+    def tamanho_bytes(self) -> int:
+        """Tamanho das entradas no disco (percorre o diretório)."""
+        return sum(tamanho for _, tamanho, _ in self._entradas())
+
+    def _aplicar_limite(self):
+        """Remove as entradas mais antigas até 90% do limite (relendo o diretório)."""
+        with self._lock:
+            entradas = list(self._entradas())
+            total = sum(tamanho for _, tamanho, _ in entradas)
+            if total > self.tamanho_max_bytes:
+                alvo = 0.9 * self.tamanho_max_bytes
+                for _, tamanho, caminho in sorted(entradas):
+                    caminho.unlink(missing_ok=True)
+                    total -= tamanho
+                    if total <= alvo:
+                        break
+            self._total = total
+
+    def limpar(self):
+        with self._lock:
+            for _, _, caminho in list(self._entradas()):
+                caminho.unlink(missing_ok=True)
+            self._total = 0
+
+    def estatisticas(self) -> dict:
+        entradas = list(self._entradas())
+        return {
+            'diretorio': str(self.diretorio),
+            'entradas': len(entradas),
+            'bytes': sum(t for _, t, _ in entradas),
+            'tamanho_max_bytes': self.tamanho_max_bytes,
+            'acertos': self.acertos,
+            'falhas': self.falhas,
+        }
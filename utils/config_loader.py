@@ -9,6 +9,9 @@ import yaml
 import unicodedata
 from pathlib import Path
 
+from core.parametros import Cultura, ParametrosMecanismo
+from .perfil import perfilar
+
 
 # Caminhos padrão dos arquivos de configuração
 BASE_DIR = Path(__file__).parent.parent
@@ -32,6 +35,7 @@ def normalizar_nome(s: str) -> str:
     return s.strip().lower()
 
 
+@perfilar('config')
 def carregar_config(caminho_arquivo: str = None) -> Dict[str, Any]:
     """
     Carrega o arquivo config.yaml com parâmetros do mecanismo.
@@ -51,6 +55,7 @@ def carregar_config(caminho_arquivo: str = None) -> Dict[str, Any]:
     return config
 
 
+@perfilar('config_culturas')
 def carregar_culturas(caminho_arquivo: str = None) -> Dict[str, Dict[str, Any]]:
     """
     Lê o YAML de culturas e retorna um dicionário indexado pelo nome da cultura.
@@ -165,3 +170,30 @@ def velocidade_maxima_cultura(cultura: str) -> float:
         raise ValueError(f"Cultura '{cultura}': sem chave 'max' em 'planting_speed_kmh'.")
     
     return float(speed["max"])
+
+
+def carregar_catalogo_culturas(caminho_arquivo: str = None) -> Dict[str, Cultura]:
+    """
+    Carrega o YAML de culturas como objetos Cultura validados.
+    
+    Parâmetros:
+        caminho_arquivo : caminho do arquivo (usa padrão se None)
+    
+    Retorna:
+        dict nome -> Cultura
+    """
+    culturas = carregar_culturas(caminho_arquivo)
+    return {nome: Cultura.de_dict(nome, dados) for nome, dados in culturas.items()}
+
+
+def carregar_parametros_mecanismo(caminho_arquivo: str = None) -> ParametrosMecanismo:
+    """
+    Carrega a seção 'mechanics' do config.yaml como ParametrosMecanismo.
+    
+    Parâmetros:
+        caminho_arquivo : caminho do arquivo (usa padrão se None)
+    
+    Retorna:
+        ParametrosMecanismo validado
+    """
+    return ParametrosMecanismo.de_config(carregar_config(caminho_arquivo))
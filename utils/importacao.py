@@ -0,0 +1,58 @@
+"""
+Módulo de Importação Tardia.
+
+Permite referenciar módulos pesados (numpy, scipy, pandas, matplotlib)
+sem pagar o custo de importação até o primeiro uso.
+"""
+
+import importlib
+import importlib.util
+import sys
+
+
+def modulo_tardio(nome: str):
+    """
+    Retorna o módulo `nome` com carregamento adiado até o primeiro acesso
+    a um atributo.
+    
+    Parâmetros:
+        nome : nome absoluto do módulo (ex: "core.cinematica")
+    
+    Retorna:
+        objeto módulo (já importado, se estiver em sys.modules)
+    """
+    if nome in sys.modules:
+        return sys.modules[nome]
+    
+    spec = importlib.util.find_spec(nome)
+    if spec is None:
+        raise ImportError(f"Módulo '{nome}' não encontrado.")
+    
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    modulo = importlib.util.module_from_spec(spec)
+    sys.modules[nome] = modulo
+    loader.exec_module(modulo)
+    return modulo
+
+
+def exportacao_tardia(pacote: str, exportacoes: dict):
+    """
+    Cria o __getattr__ (PEP 562) de um pacote que reexporta nomes de
+    submódulos sem importá-los na carga do pacote.
+    
+    Parâmetros:
+        pacote      : __name__ do pacote
+        exportacoes : dict nome exportado -> submódulo relativo (ex: ".cinematica")
+    
+    Retorna:
+        função __getattr__ para o módulo do pacote
+    """
+    def __getattr__(nome):
+        if nome not in exportacoes:
+            raise AttributeError(f"module '{pacote}' has no attribute '{nome}'")
+        valor = getattr(importlib.import_module(exportacoes[nome], pacote), nome)
+        setattr(sys.modules[pacote], nome, valor)
+        return valor
+    
+    return __getattr__
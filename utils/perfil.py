@@ -0,0 +1,190 @@
+"""
+Utilitário de Instrumentação por Etapa.
+
+Mede tempo de parede, tempo de CPU e pico de memória alocada (tracemalloc)
+de cada etapa do pipeline. A medição é opcional: fora de um Perfilador
+ativo, etapa() e @perfilar não fazem nada além de uma consulta a uma
+ContextVar.
+
+Uso:
+    from utils.perfil import Perfilador, etapa
+
+    with Perfilador() as perfil:
+        with etapa('cinematica'):
+            ...
+    perfil.gravar('perfil.json')
+
+As etapas aninhadas aparecem com o caminho completo ('torque/F_VS').
+Threads de um ThreadPoolExecutor não herdam o perfilador ativo.
+"""
+
+import contextvars
+import functools
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import List
+
+
+_ATIVO = contextvars.ContextVar('perfilador_ativo', default=None)
+
+
+class _Quadro:
+    """Etapa em andamento (uma entrada da pilha do perfilador)."""
+
+    __slots__ = ('caminho', 'parede', 'cpu', 'memoria_base', 'pico_filhos')
+
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+        self.parede = time.perf_counter()
+        self.cpu = time.process_time()
+        self.memoria_base = 0
+        self.pico_filhos = 0
+
+
+class Perfilador:
+    """
+    Coleta as medições das etapas executadas enquanto está ativo.
+
+    Parâmetros:
+        memoria : se True, mede o pico de memória com tracemalloc
+                  (deixa o código alocador bem mais lento)
+    """
+
+    def __init__(self, memoria: bool = True):
+        self.memoria = memoria
+        self.etapas: List[dict] = []
+        self._pilha: List[_Quadro] = []
+        self._token = None
+        self._iniciou_tracemalloc = False
+        self._inicio = None
+        self._total = None
+
+    def __enter__(self):
+        if self.memoria and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._iniciou_tracemalloc = True
+        self._inicio = _Quadro('total')
+        if self.memoria:
+            self._inicio.memoria_base = tracemalloc.get_traced_memory()[0]
+        self._token = _ATIVO.set(self)
+        return self
+
+    def __exit__(self, *exc):
+        _ATIVO.reset(self._token)
+        self._total = self._medir(self._inicio)
+        if self._iniciou_tracemalloc:
+            tracemalloc.stop()
+        return False
+
+    # --------------------------------------------------------------------
+    # Medição
+    # --------------------------------------------------------------------
+
+    def _pai(self) -> _Quadro:
+        return self._pilha[-1] if self._pilha else self._inicio
+
+    def _abrir(self, nome: str) -> _Quadro:
+        prefixo = self._pilha[-1].caminho + '/' if self._pilha else ''
+        quadro = _Quadro(prefixo + nome)
+        if self.memoria:
+            atual, pico = tracemalloc.get_traced_memory()
+            quadro.memoria_base = atual
+            # O pico do tracemalloc é global: guarda o do pai antes de zerá-lo
+            pai = self._pai()
+            pai.pico_filhos = max(pai.pico_filhos, pico)
+            tracemalloc.reset_peak()
+        self._pilha.append(quadro)
+        return quadro
+
+    def _medir(self, quadro: _Quadro) -> dict:
+        medida = {
+            'etapa': quadro.caminho,
+            'parede_s': time.perf_counter() - quadro.parede,
+            'cpu_s': time.process_time() - quadro.cpu,
+        }
+        if self.memoria and tracemalloc.is_tracing():
+            pico = max(tracemalloc.get_traced_memory()[1], quadro.pico_filhos)
+            medida['pico_memoria_bytes'] = max(pico - quadro.memoria_base, 0)
+        return medida
+
+    def _fechar(self, quadro: _Quadro, erro: bool):
+        self._pilha.pop()
+        medida = self._medir(quadro)
+        if erro:
+            medida['erro'] = True
+        self.etapas.append(medida)
+        if self.memoria:
+            pai = self._pai()
+            pai.pico_filhos = max(pai.pico_filhos, quadro.memoria_base + medida['pico_memoria_bytes'])
+
+    # --------------------------------------------------------------------
+    # Relatório
+    # --------------------------------------------------------------------
+
+    def relatorio(self) -> dict:
+        """
+        Relatório estruturado das medições.
+
+        Retorna:
+            dict com 'etapas' (uma entrada por execução, em ordem de término),
+            'resumo' (somas por caminho de etapa) e 'total'
+        """
+        resumo = {}
+        for e in self.etapas:
+            r = resumo.setdefault(e['etapa'], {'chamadas': 0, 'parede_s': 0.0, 'cpu_s': 0.0})
+            r['chamadas'] += 1
+            r['parede_s'] += e['parede_s']
+            r['cpu_s'] += e['cpu_s']
+            if 'pico_memoria_bytes' in e:
+                r['pico_memoria_bytes'] = max(r.get('pico_memoria_bytes', 0), e['pico_memoria_bytes'])
+        total = self._total or self._medir(self._inicio)
+        return {'etapas': self.etapas, 'resumo': resumo, 'total': total}
+
+    def gravar(self, caminho: str):
+        """Grava o relatório em JSON."""
+        Path(caminho).parent.mkdir(parents=True, exist_ok=True)
+        with open(caminho, 'w', encoding='utf-8') as f:
+            json.dump(self.relatorio(), f, ensure_ascii=False, indent=2)
+
+
+# ========================================================================
+# API DE INSTRUMENTAÇÃO
+# ========================================================================
+
+def perfilador_ativo():
+    """Perfilador do contexto atual (None se a medição está desligada)."""
+    return _ATIVO.get()
+
+
+@contextmanager
+def etapa(nome: str):
+    """Mede o bloco como a etapa `nome` se houver um Perfilador ativo."""
+    perfil = _ATIVO.get()
+    if perfil is None:
+        yield
+        return
+    quadro = perfil._abrir(nome)
+    erro = True
+    try:
+        yield
+        erro = False
+    finally:
+        perfil._fechar(quadro, erro)
+
+
+def perfilar(nome: str = None):
+    """Decorador que mede cada chamada da função como uma etapa."""
+    def decorador(funcao):
+        rotulo = nome or funcao.__name__
+
+        @functools.wraps(funcao)
+        def envoltorio(*args, **kwargs):
+            if _ATIVO.get() is None:
+                return funcao(*args, **kwargs)
+            with etapa(rotulo):
+                return funcao(*args, **kwargs)
+        return envoltorio
+    return decorador
@@ -2,31 +2,29 @@
 Módulo de Visualização - Todos os gráficos do projeto.
 
 Contém funções para plotar cinemática, torque, espaçamento e dados do IBGE.
-"""
 
-from .plot_cinematica import (
-    plotar_posicao,
-    plotar_velocidade,
-    plotar_aceleracao,
-    plotar_jerk,
-    plotar_cinematica_completa
-)
+Os módulos de gráficos só são importados quando uma função plotar_*
+é acessada, pois importar matplotlib.pyplot custa centenas de ms.
+"""
 
-from .plot_torque import (
-    plotar_torque,
-    plotar_forcas
-)
+from utils.importacao import exportacao_tardia
 
-from .plot_espacamento import (
-    plotar_distribuicao_sementes
-)
+_EXPORTACOES = {
+    'plotar_posicao': '.plot_cinematica',
+    'plotar_velocidade': '.plot_cinematica',
+    'plotar_aceleracao': '.plot_cinematica',
+    'plotar_jerk': '.plot_cinematica',
+    'plotar_cinematica_completa': '.plot_cinematica',
+    'plotar_torque': '.plot_torque',
+    'plotar_forcas': '.plot_torque',
+    'plotar_distribuicao_sementes': '.plot_espacamento',
+    'plotar_area_culturas': '.plot_ibge',
+    'plotar_ranking_estados': '.plot_ibge',
+    'plotar_mapa_cultura': '.plot_ibge',
+    'plotar_mapa_total': '.plot_ibge',
+}
 
-from .plot_ibge import (
-    plotar_area_culturas,
-    plotar_ranking_estados,
-    plotar_mapa_cultura,
-    plotar_mapa_total
-)
+__getattr__ = exportacao_tardia(__name__, _EXPORTACOES)
 
 __all__ = [
     # Cinemática
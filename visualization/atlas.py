@@ -0,0 +1,258 @@
+"""
+Módulo de Atlas Coroplético em Lote.
+
+Gera os mapas de todas as culturas (e anos) de uma vez. Em vez de uma
+chamada de plotar_mapa_cultura() por mapa, que relê as geometrias, refaz
+a junção e monta uma figura nova a cada vez:
+
+    - as geometrias são lidas, projetadas e convertidas em Paths do
+      matplotlib uma única vez;
+    - os valores de cada mapa são alinhados às geometrias e as quebras
+      de classe de todas as colunas são calculadas (e guardadas em cache,
+      ver visualization.classificacao) antes de desenhar;
+    - cada processo monta uma única figura (PathCollection, título e
+      legenda) e, para cada mapa, só troca o array de cores, o texto do
+      título e a legenda antes do savefig.
+
+Os mapas são repartidos entre os processos de um ProcessPoolExecutor;
+cada processo recebe as geometrias uma vez, na inicialização.
+
+A parte de desenho (renderizar_atlas) só precisa do matplotlib e recebe
+os polígonos como listas de anéis (arrays N x 2); gerar_atlas() faz a
+conversão a partir do cache de geometrias (geopandas/shapely).
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from visualization import classificacao
+
+
+K_PADRAO = classificacao.K_PADRAO
+CORES_PADRAO = 'YlGn'
+PROJECAO_PADRAO = 'EPSG:5880'  # SIRGAS 2000 / Brazil Polyconic
+
+
+# ========================================================================
+# GEOMETRIAS E VALORES
+# ========================================================================
+
+def aneis_de_geometrias(geometrias) -> list:
+    """
+    Converte Polygon/MultiPolygon (shapely) em listas de anéis.
+
+    Os exteriores ficam em sentido anti-horário e os buracos em sentido
+    horário, para o preenchimento pela regra nonzero do matplotlib.
+
+    Retorna:
+        lista (uma entrada por geometria) de listas de arrays (N, 2)
+    """
+    from shapely.geometry.polygon import orient
+
+    poligonos = []
+    for geom in geometrias:
+        aneis = []
+        for parte in getattr(geom, 'geoms', [geom]):
+            if parte is None or parte.is_empty:
+                continue
+            parte = orient(parte, 1.0)
+            aneis.append(np.asarray(parte.exterior.coords)[:, :2])
+            aneis.extend(np.asarray(buraco.coords)[:, :2] for buraco in parte.interiors)
+        poligonos.append(aneis)
+    return poligonos
+
+
+def _valores_alinhados(geo, tabela, coluna: str) -> np.ndarray:
+    """Valores de `coluna` na ordem das geometrias (0 onde a tabela não tem a região)."""
+    chave = 'codigo' if 'codigo' in tabela.columns else 'uf_norm'
+    serie = tabela.drop_duplicates(chave).set_index(chave)[coluna]
+    return serie.reindex(geo[chave].to_numpy()).fillna(0).to_numpy(dtype=float)
+
+
+# ========================================================================
+# DESENHO (uma figura por processo)
+# ========================================================================
+
+def _caminho(aneis):
+    """Path composto de uma região (todos os anéis, com buracos)."""
+    from matplotlib.path import Path as CaminhoMpl
+
+    if not aneis:
+        return CaminhoMpl(np.zeros((1, 2)), [CaminhoMpl.MOVETO])
+    vertices = np.concatenate(aneis)
+    codigos = np.full(len(vertices), CaminhoMpl.LINETO, dtype=CaminhoMpl.code_type)
+    inicio = 0
+    for anel in aneis:
+        codigos[inicio] = CaminhoMpl.MOVETO
+        codigos[inicio + len(anel) - 1] = CaminhoMpl.CLOSEPOLY
+        inicio += len(anel)
+    return CaminhoMpl(vertices, codigos)
+
+
+class _Desenhista:
+    """Figura, coleção de polígonos, título e legenda reaproveitados entre mapas."""
+
+    def __init__(self, poligonos, figsize=(7, 7), dpi=300, cores=CORES_PADRAO,
+                 aspecto='equal', edgecolor='white', linewidth=0.3):
+        from matplotlib import colormaps
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.collections import PathCollection
+        from matplotlib.figure import Figure
+
+        # Figure sem pyplot: nada fica registrado no gerenciador de figuras
+        self.figura = Figure(figsize=figsize)
+        FigureCanvasAgg(self.figura)
+        self.eixo = self.figura.add_subplot()
+        self.colecao = PathCollection([_caminho(aneis) for aneis in poligonos],
+                                      edgecolor=edgecolor, linewidth=linewidth)
+        self.eixo.add_collection(self.colecao)
+
+        todos = [anel for aneis in poligonos for anel in aneis]
+        if todos:
+            vertices = np.concatenate(todos)
+            self.eixo.set_xlim(vertices[:, 0].min(), vertices[:, 0].max())
+            self.eixo.set_ylim(vertices[:, 1].min(), vertices[:, 1].max())
+        self.eixo.set_aspect(aspecto)
+        self.eixo.set_axis_off()
+        self.titulo = self.eixo.set_title('', fontsize=12, fontweight='bold')
+        self.legenda = None
+        self.dpi = dpi
+        self.cores = colormaps[cores]
+
+    def desenhar(self, valores, quebras, titulo: str, arquivo: str) -> str:
+        from matplotlib.patches import Patch
+
+        n_classes = max(len(quebras) - 1, 1)
+        paleta = self.cores(np.linspace(0.15, 1.0, n_classes))
+        self.colecao.set_facecolor(paleta[classificacao.classes(valores, quebras)])
+
+        if self.legenda is not None:
+            self.legenda.remove()
+        rotulos = [f"{quebras[i]:,.0f} – {quebras[min(i + 1, len(quebras) - 1)]:,.0f}"
+                   for i in range(n_classes)]
+        self.legenda = self.eixo.legend([Patch(facecolor=c, edgecolor='0.5') for c in paleta],
+                                        rotulos, loc='lower left', fontsize=8, frameon=False)
+        self.titulo.set_text(titulo)
+        self.figura.savefig(arquivo, dpi=self.dpi, bbox_inches='tight')
+        return arquivo
+
+
+_DESENHISTA = None
+
+
+def _iniciar(poligonos, opcoes):
+    global _DESENHISTA
+    _DESENHISTA = _Desenhista(poligonos, **opcoes)
+
+
+def _desenhar(mapa) -> str:
+    return _DESENHISTA.desenhar(mapa['valores'], mapa['quebras'], mapa['titulo'], mapa['arquivo'])
+
+
+def renderizar_atlas(poligonos, mapas, processos: int = None, **opcoes) -> list:
+    """
+    Desenha uma lista de mapas sobre as mesmas geometrias.
+
+    Parâmetros:
+        poligonos : lista de anéis por região (ver aneis_de_geometrias)
+        mapas     : lista de dicts com 'valores' (um por região), 'titulo',
+                    'arquivo' e, opcionalmente, 'quebras' (padrão: quantis)
+        processos : número de processos (1 = no processo atual; padrão:
+                    os.cpu_count(), limitado ao número de mapas)
+        **opcoes  : figsize, dpi, cores, aspecto, edgecolor, linewidth
+
+    Retorna:
+        lista dos arquivos gravados, na ordem de `mapas`
+    """
+    tarefas = []
+    for mapa in mapas:
+        valores = np.asarray(mapa['valores'], dtype=float)
+        if valores.shape != (len(poligonos),):
+            raise ValueError(f"Mapa '{mapa['titulo']}' com {valores.shape} valores, "
+                             f"esperado ({len(poligonos)},).")
+        quebras = mapa.get('quebras')
+        quebras = (classificacao.quebras_quantis(valores) if quebras is None
+                   else np.asarray(quebras, dtype=float))
+        Path(mapa['arquivo']).parent.mkdir(parents=True, exist_ok=True)
+        tarefas.append({'valores': valores, 'quebras': quebras,
+                        'titulo': mapa['titulo'], 'arquivo': str(mapa['arquivo'])})
+    if not tarefas:
+        return []
+
+    processos = min(processos or os.cpu_count() or 1, len(tarefas))
+    if processos == 1:
+        desenhista = _Desenhista(poligonos, **opcoes)
+        return [desenhista.desenhar(t['valores'], t['quebras'], t['titulo'], t['arquivo'])
+                for t in tarefas]
+
+    blocos = max(1, len(tarefas) // (4 * processos))
+    with ProcessPoolExecutor(max_workers=processos, initializer=_iniciar,
+                             initargs=(poligonos, opcoes)) as pool:
+        return list(pool.map(_desenhar, tarefas, chunksize=blocos))
+
+
+# ========================================================================
+# ATLAS A PARTIR DAS TABELAS DO IBGE
+# ========================================================================
+
+def gerar_atlas(tabelas, culturas=None, nivel: str = 'uf', output_dir='output/images/atlas',
+                k: int = K_PADRAO, esquema: str = 'Quantiles', processos: int = None,
+                tolerancia: float = None,
+                projecao: str = PROJECAO_PADRAO, dpi: int = 300, cores: str = CORES_PADRAO) -> list:
+    """
+    Atlas de área plantada: um mapa por cultura e por ano.
+
+    Requer geopandas (as geometrias vêm de visualization.geometrias).
+
+    Parâmetros:
+        tabelas    : tabela por estado/nível (ibge_loader) ou dict ano -> tabela
+        culturas   : colunas a mapear (padrão: todas as culturas e 'Total')
+        nivel      : 'municipio', 'microrregiao', 'uf' ou 'regiao'
+        output_dir : diretório dos PNG
+        k          : número de classes
+        esquema    : 'Quantiles' ou 'FisherJenks' (ver visualization.classificacao)
+        processos  : número de processos (ver renderizar_atlas)
+        tolerancia : simplificação das geometrias (graus; padrão por nível)
+        projecao   : CRS de destino (None = manter coordenadas geográficas)
+        dpi        : resolução dos PNG
+        cores      : nome do colormap
+
+    Retorna:
+        lista dos arquivos gravados
+    """
+    from visualization.geometrias import obter_geometrias
+    from visualization.plot_ibge import NOMES_NIVEL
+
+    if not isinstance(tabelas, dict):
+        tabelas = {None: tabelas}
+    geo = obter_geometrias(nivel, tolerancia)
+    aspecto = 'equal'
+    if projecao is not None:
+        geo = geo.to_crs(projecao)
+    else:
+        # Mesmo aspecto que o geopandas usa em coordenadas geográficas
+        y0, y1 = geo.total_bounds[[1, 3]]
+        aspecto = 1.0 / np.cos(np.deg2rad((y0 + y1) / 2))
+    poligonos = aneis_de_geometrias(geo.geometry)
+
+    sufixo_nivel = '' if nivel == 'uf' else f'_{nivel}'
+    mapas = []
+    for ano, tabela in tabelas.items():
+        colunas = culturas or [c for c in tabela.columns
+                               if c not in ('codigo', 'uf_norm') and tabela[c].dtype.kind in 'iuf']
+        for coluna in colunas:
+            valores = _valores_alinhados(geo, tabela, coluna)
+            rotulo_ano = '' if ano is None else f' – {ano}'
+            sufixo_ano = '' if ano is None else f'_{ano}'
+            mapas.append({
+                'valores': valores,
+                'quebras': classificacao.quebras(valores, esquema, k,
+                                                 f'{nivel}:{coluna}:{ano}'),
+                'titulo': f"Área plantada de {coluna} (ha) por {NOMES_NIVEL[nivel]}{rotulo_ano}",
+                'arquivo': os.path.join(output_dir,
+                                        f'mapa_{coluna.lower()}{sufixo_nivel}{sufixo_ano}_ha.png'),
+            })
+    return renderizar_atlas(poligonos, mapas, processos, dpi=dpi, cores=cores, aspecto=aspecto)
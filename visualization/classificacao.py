@@ -0,0 +1,192 @@
+"""
+Módulo de Classificação de Valores para Mapas Coropléticos.
+
+Substitui o scheme= do geopandas (mapclassify) nos mapas do IBGE:
+
+    'Quantiles'   : quantis exatos (np.quantile)
+    'FisherJenks' : quebras naturais de Fisher-Jenks por programação
+                    dinâmica sobre os valores ordenados
+
+O Fisher-Jenks trabalha sobre os valores distintos com suas contagens
+(muitos municípios têm área zero) e usa somas acumuladas de w, w·x e
+w·x², de modo que a soma dos quadrados de qualquer classe sai em O(1).
+Cada classe da programação dinâmica é avaliada em blocos vetorizados,
+O(k·m²) com m valores distintos; acima de `amostra` valores distintos
+a classificação é feita sobre uma amostra aleatória (semente fixa), e o
+mínimo e o máximo continuam sendo os dos dados completos.
+
+As quebras ficam em um CacheLRU por (coluna, esquema, k, conteúdo), então
+gerar de novo os mapas de um atlas não reclassifica nada.
+
+Convenção das classes (a mesma do mapclassify): k + 1 limites
+crescentes, e a classe i contém os valores em (q[i], q[i+1]], com a
+primeira classe incluindo q[0].
+"""
+
+import hashlib
+
+import numpy as np
+
+from utils.cache import CacheLRU
+
+
+K_PADRAO = 5
+AMOSTRA_PADRAO = 2000
+_BLOCO = 256
+
+_CACHE = CacheLRU(tamanho_max=1024)
+
+
+# ========================================================================
+# ESQUEMAS
+# ========================================================================
+
+def quebras_quantis(valores: np.ndarray, k: int = K_PADRAO) -> np.ndarray:
+    """
+    Limites de k classes por quantis (k + 1 valores crescentes).
+
+    Limites repetidos (ex: muitos zeros) são fundidos, então o número de
+    classes pode ser menor que k.
+    """
+    valores = _finitos(valores)
+    return np.unique(np.quantile(valores, np.linspace(0.0, 1.0, k + 1)))
+
+
+def quebras_jenks(valores: np.ndarray, k: int = K_PADRAO, amostra: int = AMOSTRA_PADRAO,
+                  semente: int = 0) -> np.ndarray:
+    """
+    Limites de k classes por quebras naturais de Fisher-Jenks.
+
+    Parâmetros:
+        valores : valores a classificar (NaN é ignorado)
+        k       : número de classes
+        amostra : máximo de valores distintos classificados exatamente;
+                  acima disso usa uma amostra desse tamanho (None = sempre exato)
+        semente : semente da amostra
+
+    Retorna:
+        k + 1 limites crescentes (menos se houver menos de k valores distintos)
+    """
+    if k < 1:
+        raise ValueError(f"k deve ser >= 1 (recebido {k}).")
+    valores = _finitos(valores)
+    minimo, maximo = valores.min(), valores.max()
+
+    x, w = np.unique(valores, return_counts=True)
+    if amostra is not None and len(x) > amostra:
+        rng = np.random.default_rng(semente)
+        x, w = np.unique(rng.choice(valores, amostra, replace=False), return_counts=True)
+    if len(x) <= k:
+        return np.unique(np.r_[minimo, x, maximo])
+
+    inicios = _jenks_ordenado(x, w.astype(float), k)
+    # Limite superior de cada classe = último valor antes do início da seguinte
+    return np.r_[minimo, x[inicios[1:] - 1], maximo]
+
+
+def _jenks_ordenado(x: np.ndarray, w: np.ndarray, k: int) -> np.ndarray:
+    """
+    Programação dinâmica de Fisher-Jenks sobre x ordenado (distinto) com pesos w.
+
+    Retorna:
+        índice do primeiro elemento de cada uma das k classes
+    """
+    m = len(x)
+    # Somas acumuladas (posição j = soma dos j primeiros elementos)
+    W = np.r_[0.0, np.cumsum(w)]
+    S1 = np.r_[0.0, np.cumsum(w * x)]
+    S2 = np.r_[0.0, np.cumsum(w * x * x)]
+
+    # custo[c][j]: menor soma dos quadrados dos j primeiros elementos em c classes
+    anterior = np.full(m + 1, np.inf)
+    anterior[0] = 0.0
+    escolhas = np.zeros((k + 1, m + 1), dtype=np.int64)
+    i = np.arange(m + 1)
+    for c in range(1, k + 1):
+        atual = np.full(m + 1, np.inf)
+        for inicio in range(c, m + 1, _BLOCO):
+            j = np.arange(inicio, min(inicio + _BLOCO, m + 1))[:, None]
+            n = W[j] - W[i]
+            soma = S1[j] - S1[i]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                custo = S2[j] - S2[i] - soma * soma / n
+            custo = np.where(i < j, custo + anterior, np.inf)
+            melhor = np.argmin(custo, axis=1)
+            escolhas[c, j[:, 0]] = melhor
+            atual[j[:, 0]] = custo[np.arange(len(j)), melhor]
+        anterior = atual
+
+    inicios = np.zeros(k, dtype=np.int64)
+    fim = m
+    for c in range(k, 0, -1):
+        fim = inicios[c - 1] = escolhas[c, fim]
+    return inicios
+
+
+ESQUEMAS = {
+    'quantiles': quebras_quantis,
+    'fisherjenks': quebras_jenks,
+}
+
+
+def _finitos(valores) -> np.ndarray:
+    valores = np.asarray(valores, dtype=float).ravel()
+    valores = valores[np.isfinite(valores)]
+    if valores.size == 0:
+        raise ValueError("Nenhum valor finito para classificar.")
+    return valores
+
+
+# ========================================================================
+# CLASSIFICAÇÃO COM CACHE
+# ========================================================================
+
+def quebras(valores: np.ndarray, esquema: str = 'FisherJenks', k: int = K_PADRAO,
+            coluna: str = None) -> np.ndarray:
+    """
+    Limites de classe de `valores`, guardados em cache.
+
+    Parâmetros:
+        valores : valores a classificar
+        esquema : 'Quantiles' ou 'FisherJenks' (sem diferenciar maiúsculas)
+        k       : número de classes
+        coluna  : nome da coluna (faz parte da chave do cache)
+
+    Retorna:
+        array somente leitura com os limites (k + 1 ou menos)
+    """
+    funcao = ESQUEMAS.get(esquema.lower())
+    if funcao is None:
+        raise ValueError(f"Esquema inválido: '{esquema}'. Use 'Quantiles' ou 'FisherJenks'.")
+    valores = np.ascontiguousarray(valores, dtype=float)
+    resumo = hashlib.blake2b(valores.tobytes(), digest_size=16).hexdigest()
+    return _CACHE.obter_ou_calcular((coluna, esquema.lower(), k, resumo),
+                                    lambda: funcao(valores, k))
+
+
+def estatisticas_cache() -> dict:
+    """Estatísticas do cache de quebras (ver CacheLRU.estatisticas)."""
+    return _CACHE.estatisticas()
+
+
+def classes(valores: np.ndarray, limites: np.ndarray) -> np.ndarray:
+    """Índice da classe (0..len(limites)-2) de cada valor."""
+    n_classes = max(len(limites) - 1, 1)
+    return np.clip(np.searchsorted(limites[1:-1], valores, side='left'), 0, n_classes - 1)
+
+
+def norma(limites: np.ndarray, cores):
+    """
+    BoundaryNorm do matplotlib com a mesma convenção de classes().
+
+    Os limites internos são deslocados para o próximo float, para que um
+    valor igual ao limite fique na classe de baixo (intervalos fechados à
+    direita, como no mapclassify).
+    """
+    from matplotlib.colors import BoundaryNorm
+
+    limites = np.asarray(limites, dtype=float).copy()
+    limites[1:-1] = np.nextafter(limites[1:-1], np.inf)
+    if len(limites) < 2:
+        limites = np.r_[limites, np.nextafter(limites[-1], np.inf)]
+    return BoundaryNorm(limites, cores.N, clip=True)
@@ -0,0 +1,271 @@
+"""
+Módulo de Cache Local de Geometrias para Mapas Coropléticos.
+
+Os mapas do IBGE precisam das malhas do geobr, que são baixadas da rede
+em resolução completa a cada chamada. Este módulo guarda as malhas em
+disco uma única vez por nível geográfico, já com:
+
+    - a chave de junção pronta: 'codigo' (código IBGE, inteiro), 'nome'
+      e, no nível 'uf', 'uf_norm' (nome normalizado);
+    - versões simplificadas em várias tolerâncias (TOLERANCIAS, em graus
+      do SIRGAS 2000), gravadas junto com a original.
+
+Depois de semeado (a partir de um arquivo local ou de um download do
+geobr), nenhum mapa acessa a rede, e cada malha é lida do disco uma
+única vez por processo.
+
+Para semear sem rede a partir de uma malha baixada manualmente:
+
+    python -m visualization.geometrias uf --origem BR_UF_2020.gpkg
+
+Formato: um .npz por nível e tolerância, sem pickle: as geometrias vão
+como WKB concatenado (bytes + deslocamentos) e as colunas de atributos
+como arrays. GeoParquet exigiria pyarrow; o WKB só precisa do shapely,
+que já acompanha o geopandas.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from utils.cache_disco import RAIZ_PROJETO
+
+
+# Fora de output/cache: o CacheDisco apaga o que está lá dentro, e malhas
+# semeadas com --origem não podem ser baixadas de novo
+DIRETORIO_PADRAO = RAIZ_PROJETO / 'output' / 'geometrias'
+ANO_PADRAO = 2020
+
+# Leitor do geobr, coluna do código e coluna do nome em cada nível
+GEOMETRIAS = {
+    'municipio': ('read_municipality', 'code_muni', 'name_muni'),
+    'microrregiao': ('read_micro_region', 'code_micro', 'name_micro'),
+    'uf': ('read_state', 'code_state', 'name_state'),
+    'regiao': ('read_region', 'code_region', 'name_region'),
+}
+
+# Tolerâncias de simplificação gravadas ao semear (graus; 0 = original)
+TOLERANCIAS = (0.0, 0.002, 0.005, 0.01, 0.02)
+
+# Tolerância usada nos mapas de cada nível (Brasil inteiro em ~7 polegadas)
+TOLERANCIA_PADRAO = {
+    'municipio': 0.002,
+    'microrregiao': 0.005,
+    'uf': 0.01,
+    'regiao': 0.02,
+}
+
+
+def _validar_nivel(nivel: str):
+    if nivel not in GEOMETRIAS:
+        raise ValueError(f"Nível inválido: '{nivel}'. Use {tuple(GEOMETRIAS)}.")
+
+
+# ========================================================================
+# SERIALIZAÇÃO (WKB concatenado, sem pickle)
+# ========================================================================
+
+def empacotar_wkb(blobs) -> tuple:
+    """
+    Junta uma sequência de WKB (bytes) em um único buffer.
+
+    Retorna:
+        (dados uint8, deslocamentos int64 com len(blobs) + 1 posições)
+    """
+    tamanhos = np.fromiter((len(b) for b in blobs), dtype=np.int64, count=len(blobs))
+    deslocamentos = np.zeros(len(blobs) + 1, dtype=np.int64)
+    np.cumsum(tamanhos, out=deslocamentos[1:])
+    dados = np.frombuffer(b''.join(blobs), dtype=np.uint8)
+    return dados, deslocamentos
+
+
+def desempacotar_wkb(dados: np.ndarray, deslocamentos: np.ndarray) -> list:
+    """Inverso de empacotar_wkb(): lista de bytes."""
+    buffer = dados.tobytes()
+    return [buffer[i:j] for i, j in zip(deslocamentos[:-1].tolist(), deslocamentos[1:].tolist())]
+
+
+# ========================================================================
+# CACHE
+# ========================================================================
+
+class CacheGeometrias:
+    """
+    Malhas do geobr em disco, com chaves normalizadas e simplificações.
+
+    Parâmetros:
+        diretorio : diretório dos arquivos (criado ao semear)
+        ano       : ano da malha do geobr
+    """
+
+    def __init__(self, diretorio=DIRETORIO_PADRAO, ano: int = ANO_PADRAO):
+        self.diretorio = Path(diretorio)
+        self.ano = ano
+        self._memoria = {}
+
+    def arquivo(self, nivel: str, tolerancia: float) -> Path:
+        """Arquivo de um nível e tolerância (ex: uf_2020_t0.01.npz)."""
+        return self.diretorio / f'{nivel}_{self.ano}_t{tolerancia:g}.npz'
+
+    def tolerancias(self, nivel: str) -> list:
+        """Tolerâncias já gravadas para `nivel`."""
+        prefixo = f'{nivel}_{self.ano}_t'
+        if not self.diretorio.is_dir():
+            return []
+        encontradas = []
+        for arquivo in self.diretorio.glob(f'{prefixo}*.npz'):
+            try:
+                encontradas.append(float(arquivo.stem[len(prefixo):]))
+            except ValueError:
+                continue  # sobra de uma gravação interrompida
+        return sorted(encontradas)
+
+    def semear(self, nivel: str, origem=None, tolerancias=TOLERANCIAS) -> list:
+        """
+        Grava a malha de `nivel` e suas simplificações.
+
+        Parâmetros:
+            nivel       : 'municipio', 'microrregiao', 'uf' ou 'regiao'
+            origem      : arquivo local lido com geopandas.read_file (com as
+                          colunas do geobr, ex: code_state/name_state), um
+                          GeoDataFrame, ou None para baixar do geobr
+            tolerancias : tolerâncias de simplificação (graus; 0 = original)
+
+        Retorna:
+            lista de arquivos gravados
+        """
+        _validar_nivel(nivel)
+        geo = self._ler_origem(nivel, origem)
+        _, coluna_codigo, coluna_nome = GEOMETRIAS[nivel]
+        atributos = {
+            'codigo': geo[coluna_codigo].to_numpy(dtype=np.int64),
+            'nome': geo[coluna_nome].astype(str).to_numpy(dtype=str),
+        }
+        if nivel == 'uf':
+            from data.ibge_loader import normalizar_uf
+            atributos['uf_norm'] = normalizar_uf(geo[coluna_nome].astype(str)).to_numpy(dtype=str)
+
+        crs = geo.crs.to_string() if geo.crs is not None else ''
+        gravados = []
+        for tolerancia in tolerancias:
+            geometrias = geo.geometry
+            if tolerancia > 0:
+                geometrias = geometrias.simplify(tolerancia, preserve_topology=True)
+            gravados.append(self._gravar(nivel, tolerancia, atributos, geometrias, crs))
+        return gravados
+
+    def _ler_origem(self, nivel: str, origem):
+        if origem is None:
+            import geobr
+            return getattr(geobr, GEOMETRIAS[nivel][0])(year=self.ano)
+        if isinstance(origem, (str, os.PathLike)):
+            import geopandas as gpd
+            return gpd.read_file(origem)
+        return origem
+
+    def _gravar(self, nivel, tolerancia, atributos, geometrias, crs) -> str:
+        import shapely
+        dados, deslocamentos = empacotar_wkb(shapely.to_wkb(np.asarray(geometrias.values)))
+        destino = self.arquivo(nivel, tolerancia)
+        destino.parent.mkdir(parents=True, exist_ok=True)
+        # Arquivo temporário único (fora do padrão *.npz) + os.replace: leitores
+        # nunca veem meio arquivo e gravações simultâneas não colidem
+        fd, tmp = tempfile.mkstemp(prefix=f'.{destino.stem}_', suffix='.tmp', dir=destino.parent)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, wkb=dados, deslocamentos=deslocamentos,
+                         __meta__=np.array(json.dumps({'crs': crs, 'nivel': nivel, 'ano': self.ano,
+                                                       'tolerancia': tolerancia})),
+                         **atributos)
+            os.replace(tmp, destino)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self._memoria.pop((nivel, tolerancia), None)
+        return str(destino)
+
+    def obter(self, nivel: str, tolerancia: float = None):
+        """
+        GeoDataFrame de `nivel` na tolerância pedida.
+
+        Ordem de busca: memória do processo, disco, simplificação da
+        malha original em disco (gravada para as próximas vezes) e, por
+        último, download do geobr (semeando o cache).
+
+        Parâmetros:
+            nivel      : 'municipio', 'microrregiao', 'uf' ou 'regiao'
+            tolerancia : graus (padrão: TOLERANCIA_PADRAO[nivel])
+
+        Retorna:
+            GeoDataFrame com codigo, nome, (uf_norm) e geometry. É
+            compartilhado entre as chamadas: copie antes de alterar.
+        """
+        _validar_nivel(nivel)
+        tolerancia = TOLERANCIA_PADRAO[nivel] if tolerancia is None else tolerancia
+        chave = (nivel, tolerancia)
+        if chave not in self._memoria:
+            if not self.arquivo(nivel, tolerancia).exists():
+                if self.arquivo(nivel, 0.0).exists():
+                    self.semear(nivel, self._ler(nivel, 0.0), (tolerancia,))
+                else:
+                    self.semear(nivel, None, tuple(sorted(set(TOLERANCIAS) | {tolerancia})))
+            self._memoria[chave] = self._ler(nivel, tolerancia)
+        return self._memoria[chave]
+
+    def _ler(self, nivel: str, tolerancia: float):
+        import geopandas as gpd
+        import shapely
+
+        with np.load(self.arquivo(nivel, tolerancia)) as z:
+            meta = json.loads(str(z['__meta__']))
+            geometrias = shapely.from_wkb(desempacotar_wkb(z['wkb'], z['deslocamentos']))
+            colunas = {c: z[c] for c in z.files if c not in ('wkb', 'deslocamentos', '__meta__')}
+        # Nomes das colunas do geobr, para semear de novo a partir desta malha
+        _, coluna_codigo, coluna_nome = GEOMETRIAS[nivel]
+        colunas[coluna_codigo] = colunas['codigo']
+        colunas[coluna_nome] = colunas['nome']
+        return gpd.GeoDataFrame(colunas, geometry=geometrias, crs=meta['crs'] or None)
+
+
+_CACHE = None
+
+
+def cache_padrao() -> CacheGeometrias:
+    """CacheGeometrias do diretório padrão, compartilhado pelo processo."""
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = CacheGeometrias()
+    return _CACHE
+
+
+def obter_geometrias(nivel: str = 'uf', tolerancia: float = None):
+    """Atalho para cache_padrao().obter(nivel, tolerancia)."""
+    return cache_padrao().obter(nivel, tolerancia)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m visualization.geometrias',
+                                     description='Semeia o cache local de geometrias.')
+    parser.add_argument('niveis', nargs='+', choices=list(GEOMETRIAS))
+    parser.add_argument('--origem', help='arquivo local com a malha (padrão: baixar do geobr)')
+    parser.add_argument('--ano', type=int, default=ANO_PADRAO)
+    parser.add_argument('--diretorio', default=str(DIRETORIO_PADRAO))
+    parser.add_argument('--tolerancias', type=float, nargs='+', default=list(TOLERANCIAS))
+    args = parser.parse_args(argv)
+    if args.origem and len(args.niveis) > 1:
+        parser.error('--origem aceita um único nível')
+
+    cache = CacheGeometrias(args.diretorio, args.ano)
+    for nivel in args.niveis:
+        for arquivo in cache.semear(nivel, args.origem, args.tolerancias):
+            print(f"✓ {arquivo}", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
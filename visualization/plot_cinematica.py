@@ -9,6 +9,8 @@ import numpy as np
 import os
 from pathlib import Path
 
+from utils.perfil import etapa, perfilar
+
 
 def _configurar_eixo_x(ax):
     """Configura eixo X com marcadores a cada 45 graus."""
@@ -25,6 +27,7 @@ def _adicionar_linhas_contato(ax, theta_descida, theta_subida):
                label=f'Saída solo (subida): {theta_subida:.1f}°', alpha=0.7)
 
 
+@perfilar()
 def plotar_posicao(theta_deg, y_mm, theta_solo, output_dir='output/images', 
                    mostrar=False, salvar=True):
     """
@@ -63,7 +66,8 @@ def plotar_posicao(theta_deg, y_mm, theta_solo, output_dir='output/images',
     if salvar:
         Path(output_dir).mkdir(parents=True, exist_ok=True)
         caminho = os.path.join(output_dir, 'grafico_posicao_haste.png')
-        plt.savefig(caminho, dpi=300, bbox_inches='tight')
+        with etapa('savefig'):
+            plt.savefig(caminho, dpi=300, bbox_inches='tight')
         print(f"✓ Gráfico salvo: {caminho}")
     
     if mostrar:
@@ -72,6 +76,7 @@ def plotar_posicao(theta_deg, y_mm, theta_solo, output_dir='output/images',
         plt.close()
 
 
+@perfilar()
 def plotar_velocidade(theta_deg, velocidades_dict, theta_solo, 
                       output_dir='output/images', mostrar=False, salvar=True):
     """
@@ -108,7 +113,8 @@ def plotar_velocidade(theta_deg, velocidades_dict, theta_solo,
     if salvar:
         Path(output_dir).mkdir(parents=True, exist_ok=True)
         caminho = os.path.join(output_dir, 'grafico_velocidade_haste.png')
-        plt.savefig(caminho, dpi=300, bbox_inches='tight')
+        with etapa('savefig'):
+            plt.savefig(caminho, dpi=300, bbox_inches='tight')
         print(f"✓ Gráfico salvo: {caminho}")
     
     if mostrar:
@@ -117,6 +123,7 @@ def plotar_velocidade(theta_deg, velocidades_dict, theta_solo,
         plt.close()
 
 
+@perfilar()
 def plotar_aceleracao(theta_deg, aceleracoes_dict, theta_solo, 
                       output_dir='output/images', mostrar=False, salvar=True):
     """
@@ -153,7 +160,8 @@ def plotar_aceleracao(theta_deg, aceleracoes_dict, theta_solo,
     if salvar:
         Path(output_dir).mkdir(parents=True, exist_ok=True)
         caminho = os.path.join(output_dir, 'grafico_aceleracao_haste.png')
-        plt.savefig(caminho, dpi=300, bbox_inches='tight')
+        with etapa('savefig'):
+            plt.savefig(caminho, dpi=300, bbox_inches='tight')
         print(f"✓ Gráfico salvo: {caminho}")
     
     if mostrar:
@@ -162,6 +170,7 @@ def plotar_aceleracao(theta_deg, aceleracoes_dict, theta_solo,
         plt.close()
 
 
+@perfilar()
 def plotar_jerk(theta_deg, jerks_dict, theta_solo, 
                 output_dir='output/images', mostrar=False, salvar=True):
     """
@@ -198,7 +207,8 @@ def plotar_jerk(theta_deg, jerks_dict, theta_solo,
     if salvar:
         Path(output_dir).mkdir(parents=True, exist_ok=True)
         caminho = os.path.join(output_dir, 'grafico_jerk_haste.png')
-        plt.savefig(caminho, dpi=300, bbox_inches='tight')
+        with etapa('savefig'):
+            plt.savefig(caminho, dpi=300, bbox_inches='tight')
         print(f"✓ Gráfico salvo: {caminho}")
     
     if mostrar:
@@ -207,6 +217,7 @@ def plotar_jerk(theta_deg, jerks_dict, theta_solo,
         plt.close()
 
 
+@perfilar()
 def plotar_cinematica_completa(theta_deg, y_mm, velocidades_dict, 
                                aceleracoes_dict, jerks_dict, theta_solo,
                                output_dir='output/images', mostrar=False, salvar=True):
@@ -286,7 +297,8 @@ def plotar_cinematica_completa(theta_deg, y_mm, velocidades_dict,
     if salvar:
         Path(output_dir).mkdir(parents=True, exist_ok=True)
         caminho = os.path.join(output_dir, 'grafico_cinematica_completo.png')
-        plt.savefig(caminho, dpi=300, bbox_inches='tight')
+        with etapa('savefig'):
+            plt.savefig(caminho, dpi=300, bbox_inches='tight')
         print(f"✓ Gráfico consolidado salvo: {caminho}")
     
     if mostrar:
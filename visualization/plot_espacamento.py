@@ -8,7 +8,10 @@ import matplotlib.pyplot as plt
 import os
 from pathlib import Path
 
+from utils.perfil import etapa, perfilar
 
+
+@perfilar()
 def plotar_distribuicao_sementes(espacamentos_dict, distancia_metros=3.0,
                                  output_dir='output/images', mostrar=False, salvar=True):
     """
@@ -54,7 +57,8 @@ def plotar_distribuicao_sementes(espacamentos_dict, distancia_metros=3.0,
     if salvar:
         Path(output_dir).mkdir(parents=True, exist_ok=True)
         caminho = os.path.join(output_dir, 'distribuicao_sementes.png')
-        plt.savefig(caminho, dpi=300, bbox_inches='tight')
+        with etapa('savefig'):
+            plt.savefig(caminho, dpi=300, bbox_inches='tight')
         print(f"✓ Gráfico salvo: {caminho}")
     
     if mostrar:
@@ -8,7 +8,12 @@ import matplotlib.pyplot as plt
 import os
 from pathlib import Path
 
+from utils.perfil import etapa, perfilar
+from visualization import classificacao
+from visualization.geometrias import obter_geometrias
 
+
+@perfilar()
 def plotar_area_culturas(tabela_sintese, output_dir='output/images', 
                         mostrar=False, salvar=True):
     """
@@ -32,7 +37,8 @@ def plotar_area_culturas(tabela_sintese, output_dir='output/images',
     if salvar:
         Path(output_dir).mkdir(parents=True, exist_ok=True)
         caminho = os.path.join(output_dir, 'area_culturas_brasil.png')
-        plt.savefig(caminho, dpi=300, bbox_inches='tight')
+        with etapa('savefig'):
+            plt.savefig(caminho, dpi=300, bbox_inches='tight')
         print(f"✓ Gráfico salvo: {caminho}")
     
     if mostrar:
@@ -41,6 +47,7 @@ def plotar_area_culturas(tabela_sintese, output_dir='output/images',
         plt.close()
 
 
+@perfilar()
 def plotar_ranking_estados(top_df, cultura, output_dir='output/images',
                           mostrar=False, salvar=True):
     """
@@ -65,7 +72,8 @@ def plotar_ranking_estados(top_df, cultura, output_dir='output/images',
         Path(output_dir).mkdir(parents=True, exist_ok=True)
         nome_arquivo = f'ranking_estados_{cultura.lower()}.png'
         caminho = os.path.join(output_dir, nome_arquivo)
-        plt.savefig(caminho, dpi=300, bbox_inches='tight')
+        with etapa('savefig'):
+            plt.savefig(caminho, dpi=300, bbox_inches='tight')
         print(f"✓ Gráfico salvo: {caminho}")
     
     if mostrar:
@@ -74,52 +82,97 @@ def plotar_ranking_estados(top_df, cultura, output_dir='output/images',
         plt.close()
 
 
+NOMES_NIVEL = {
+    'municipio': 'município',
+    'microrregiao': 'microrregião',
+    'uf': 'estado',
+    'regiao': 'região',
+}
+
+
+def _juntar_geometrias(tabela, coluna, nivel, tolerancia=None):
+    """
+    Geometrias do nível (cache local) com a coluna da tabela, ou None sem geopandas.
+    
+    Tabelas com a coluna 'codigo' (data.agregacao) são juntadas pelo
+    código IBGE; a tabela por estado, pelo nome normalizado (já gravado
+    no cache).
+    """
+    if nivel not in NOMES_NIVEL:
+        raise ValueError(f"Nível inválido: '{nivel}'. Use {tuple(NOMES_NIVEL)}.")
+    try:
+        import geopandas as gpd
+    except ImportError:
+        print("⚠ geopandas e/ou geobr não estão instalados. Mapa não será gerado.")
+        return None
+    
+    chave = "codigo" if "codigo" in tabela.columns else "uf_norm"
+    if chave == "uf_norm" and nivel != 'uf':
+        raise ValueError(f"A tabela do nível '{nivel}' precisa da coluna 'codigo'.")
+    
+    with etapa('geometrias'):
+        geo = obter_geometrias(nivel, tolerancia)
+    g = geo[[chave, "geometry"]].merge(tabela[[chave, coluna]], on=chave, how="left")
+    g[coluna] = g[coluna].fillna(0)
+    return g
+
+
+def _plotar_classes(g, coluna, ax, scheme, k, nivel):
+    """
+    Desenha `coluna` em classes (visualization.classificacao) com BoundaryNorm.
+    
+    As quebras ficam em cache por (nível, coluna, esquema, k), então
+    redesenhar o mesmo mapa não reclassifica os valores.
+    """
+    with etapa('classificacao'):
+        limites = classificacao.quebras(g[coluna].to_numpy(), scheme, k, f'{nivel}:{coluna}')
+    cores = plt.get_cmap()
+    g.plot(column=coluna, ax=ax, cmap=cores, norm=classificacao.norma(limites, cores),
+           legend=True, edgecolor="white", linewidth=0.3,
+           legend_kwds={'ticks': limites, 'format': '{x:,.0f}', 'shrink': 0.6})
+
+
+@perfilar()
 def plotar_mapa_cultura(tabela_estados, cultura, scheme="Quantiles", k=5,
-                       output_dir='output/images', mostrar=False, salvar=True):
+                       output_dir='output/images', mostrar=False, salvar=True,
+                       nivel='uf', tolerancia=None):
     """
-    Plota mapa coroplético por estado para uma cultura específica.
+    Plota mapa coroplético por estado (ou outro nível) para uma cultura.
     
-    Requer geopandas e geobr instalados.
+    Requer geopandas (e geobr enquanto o cache de geometrias não for semeado).
     
     Parâmetros:
-        tabela_estados : DataFrame com dados por estado
+        tabela_estados : DataFrame com dados por estado, ou a tabela do
+                         nível (ibge_loader.carregar_tabela_nivel)
         cultura        : nome da cultura para plotar
-        scheme         : esquema de classificação ("Quantiles", "FisherJenks", etc)
+        scheme         : esquema de classificação ("Quantiles" ou "FisherJenks")
         k              : número de classes
         output_dir     : diretório de saída
         mostrar        : se True, exibe o gráfico
         salvar         : se True, salva o gráfico
+        nivel          : 'municipio', 'microrregiao', 'uf' ou 'regiao'
+        tolerancia     : simplificação das geometrias em graus (padrão
+                         por nível, ver visualization.geometrias)
     """
-    try:
-        import geopandas as gpd
-        from geobr import read_state
-        from unidecode import unidecode
-    except ImportError:
-        print("⚠ geopandas e/ou geobr não estão instalados. Mapa não será gerado.")
+    g = _juntar_geometrias(tabela_estados, cultura, nivel, tolerancia)
+    if g is None:
         return
     
-    # Carregar shape dos estados
-    br = read_state(year=2020)
-    br["uf_norm"] = br["name_state"].apply(lambda x: unidecode(x).upper())
-    
-    # Juntar com dados
-    g = br.merge(tabela_estados[["uf_norm", cultura]], on="uf_norm", how="left")
-    g[cultura] = g[cultura].fillna(0)
-    
     # Plotar
     fig, ax = plt.subplots(figsize=(7, 7))
-    g.plot(column=cultura, ax=ax, scheme=scheme, k=k, legend=True,
-           edgecolor="white", linewidth=0.3)
+    _plotar_classes(g, cultura, ax, scheme, k, nivel)
     ax.set_axis_off()
-    ax.set_title(f"Área plantada de {cultura} (ha) por estado – Brasil",
+    ax.set_title(f"Área plantada de {cultura} (ha) por {NOMES_NIVEL[nivel]} – Brasil",
                 fontsize=12, fontweight='bold')
     plt.tight_layout()
     
     if salvar:
         Path(output_dir).mkdir(parents=True, exist_ok=True)
-        nome_arquivo = f'mapa_{cultura.lower()}_ha.png'
+        sufixo = '' if nivel == 'uf' else f'_{nivel}'
+        nome_arquivo = f'mapa_{cultura.lower()}{sufixo}_ha.png'
         caminho = os.path.join(output_dir, nome_arquivo)
-        plt.savefig(caminho, dpi=300, bbox_inches='tight')
+        with etapa('savefig'):
+            plt.savefig(caminho, dpi=300, bbox_inches='tight')
         print(f"✓ Mapa salvo: {caminho}")
     
     if mostrar:
@@ -128,50 +181,44 @@ def plotar_mapa_cultura(tabela_estados, cultura, scheme="Quantiles", k=5,
         plt.close()
 
 
+@perfilar()
 def plotar_mapa_total(tabela_estados, scheme="FisherJenks", k=5,
-                     output_dir='output/images', mostrar=False, salvar=True):
+                     output_dir='output/images', mostrar=False, salvar=True,
+                     nivel='uf', tolerancia=None):
     """
-    Plota mapa coroplético por estado para área total plantada.
+    Plota mapa coroplético por estado (ou outro nível) para área total plantada.
     
-    Requer geopandas e geobr instalados.
+    Requer geopandas (e geobr enquanto o cache de geometrias não for semeado).
     
     Parâmetros:
-        tabela_estados : DataFrame com dados por estado
-        scheme         : esquema de classificação
+        tabela_estados : DataFrame com dados por estado, ou a tabela do nível
+        scheme         : esquema de classificação ("Quantiles" ou "FisherJenks")
         k              : número de classes
         output_dir     : diretório de saída
         mostrar        : se True, exibe o gráfico
         salvar         : se True, salva o gráfico
+        nivel          : 'municipio', 'microrregiao', 'uf' ou 'regiao'
+        tolerancia     : simplificação das geometrias em graus (padrão
+                         por nível, ver visualization.geometrias)
     """
-    try:
-        import geopandas as gpd
-        from geobr import read_state
-        from unidecode import unidecode
-    except ImportError:
-        print("⚠ geopandas e/ou geobr não estão instalados. Mapa não será gerado.")
+    g = _juntar_geometrias(tabela_estados, "Total", nivel, tolerancia)
+    if g is None:
         return
     
-    # Carregar shape dos estados
-    br = read_state(year=2020)
-    br["uf_norm"] = br["name_state"].apply(lambda x: unidecode(x).upper())
-    
-    # Juntar com dados
-    g = br.merge(tabela_estados[["uf_norm", "Total"]], on="uf_norm", how="left")
-    g["Total"] = g["Total"].fillna(0)
-    
     # Plotar
     fig, ax = plt.subplots(figsize=(7, 7))
-    g.plot(column="Total", ax=ax, scheme=scheme, k=k, legend=True,
-           edgecolor="white", linewidth=0.3)
+    _plotar_classes(g, "Total", ax, scheme, k, nivel)
     ax.set_axis_off()
-    ax.set_title("Total de hectares plantados por estado (todas as culturas)",
+    ax.set_title(f"Total de hectares plantados por {NOMES_NIVEL[nivel]} (todas as culturas)",
                 fontsize=12, fontweight='bold')
     plt.tight_layout()
     
     if salvar:
         Path(output_dir).mkdir(parents=True, exist_ok=True)
-        caminho = os.path.join(output_dir, 'mapa_total_ha.png')
-        plt.savefig(caminho, dpi=600, bbox_inches='tight')
+        sufixo = '' if nivel == 'uf' else f'_{nivel}'
+        caminho = os.path.join(output_dir, f'mapa_total{sufixo}_ha.png')
+        with etapa('savefig'):
+            plt.savefig(caminho, dpi=600, bbox_inches='tight')
         print(f"✓ Mapa salvo: {caminho}")
     
     if mostrar:
@@ -9,7 +9,10 @@ import numpy as np
 import os
 from pathlib import Path
 
+from utils.perfil import etapa, perfilar
 
+
+@perfilar()
 def plotar_torque(theta_deg, tau_vals, theta_range=None, F_VS_max=None,
                   output_dir='output/images', mostrar=False, salvar=True):
     """
@@ -64,7 +67,8 @@ def plotar_torque(theta_deg, tau_vals, theta_range=None, F_VS_max=None,
     if salvar:
         Path(output_dir).mkdir(parents=True, exist_ok=True)
         caminho = os.path.join(output_dir, 'grafico_torque.png')
-        plt.savefig(caminho, dpi=300, bbox_inches='tight')
+        with etapa('savefig'):
+            plt.savefig(caminho, dpi=300, bbox_inches='tight')
         print(f"✓ Gráfico salvo: {caminho}")
     
     if mostrar:
@@ -73,6 +77,7 @@ def plotar_torque(theta_deg, tau_vals, theta_range=None, F_VS_max=None,
         plt.close()
 
 
+@perfilar()
 def plotar_forcas(theta_deg, F_B_vals, F_M_vals, theta_range=None,
                   output_dir='output/images', mostrar=False, salvar=True):
     """
@@ -128,7 +133,8 @@ def plotar_forcas(theta_deg, F_B_vals, F_M_vals, theta_range=None,
     if salvar:
         Path(output_dir).mkdir(parents=True, exist_ok=True)
         caminho = os.path.join(output_dir, 'grafico_forcas_FB_FM.png')
-        plt.savefig(caminho, dpi=300, bbox_inches='tight')
+        with etapa('savefig'):
+            plt.savefig(caminho, dpi=300, bbox_inches='tight')
         print(f"✓ Gráfico salvo: {caminho}")
     
     if mostrar: